@@ -25,9 +25,9 @@ def check_module_availability(module_name, purpose):
 #
 print('Required:')
 
-# Python >= 3.4.
+# Python >= 3.7.
 python_version = sys.version_info
-if python_version.major < 3 or python_version.minor < 4:
+if python_version < (3, 7):
     status = 'FAIL, only {}.{}.{}'.format(
         python_version.major,
         python_version.minor,
@@ -35,7 +35,7 @@ if python_version.major < 3 or python_version.minor < 4:
     )
 else:
     status = 'OK'
-print_status('Python >= 3.4', 'interpreter', status)
+print_status('Python >= 3.7', 'interpreter', status)
 
 print()
 
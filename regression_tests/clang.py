@@ -6,6 +6,7 @@ import os
 
 import clang
 
+from regression_tests.utils import memoize
 from regression_tests.utils.os import on_windows
 from regression_tests.utils.os import on_macos
 
@@ -49,3 +50,37 @@ def setup_clang_bindings(clang_dir):
     clang_include_dir = os.path.join(clang_dir, 'include')
     assert os.path.exists(clang_include_dir), '{}: no such directory'.format(clang_include_dir)
     INCLUDE_PATHS.append(clang_include_dir)
+
+
+def get_libclang_id():
+    """Returns a string identifying the used libclang library.
+
+    Results of parsing (e.g. precompiled headers or summaries of parsed
+    modules) can be reused only with the same library, so the identification
+    should be a part of keys under which they are cached.
+    """
+    library_file = clang.cindex.conf.get_filename()
+    try:
+        library_stat = os.stat(library_file)
+    except OSError:
+        return library_file
+    return '{}:{}:{}'.format(
+        library_file,
+        library_stat.st_size,
+        library_stat.st_mtime
+    )
+
+
+@memoize
+def get_raw_func(name, argtypes, restype):
+    """Returns a function from libclang with the given signature.
+
+    The functions from :mod:`clang.cindex` check their arguments and convert
+    their results into objects, which is needlessly slow when they are called
+    for every node or token of a translation unit. When `argtypes` is
+    ``None``, the arguments are passed as they are.
+    """
+    func = clang.cindex.conf.lib[name]
+    func.argtypes = argtypes
+    func.restype = restype
+    return func
@@ -2,21 +2,178 @@
     A runner of external commands.
 """
 
+import codecs
+import collections
 import os
 import re
 import signal
 import subprocess
 import sys
+import threading
 
 from regression_tests import io
+from regression_tests.filesystem.compression import find_compressed_file
+from regression_tests.filesystem.compression import open_compressed_file
+from regression_tests.resource_limits import ResourceLimiter
+from regression_tests.resource_limits import ResourceLimits
 from regression_tests.utils.os import on_windows
 
 
+class CmdResult(tuple):
+    """A result of a run command.
+
+    Instances of this class behave like a triple (`output`, `return_code`,
+    `timeouted`) with additional properties.
+    """
+
+    def __new__(cls, output, return_code, timeouted, oom_killed=False):
+        """
+        :param output: Output from the command.
+        :param int return_code: Return code of the command.
+        :param bool timeouted: Has the command timeouted?
+        :param bool oom_killed: Has the command been killed because it exceeded
+                                the memory limit?
+        """
+        result = tuple.__new__(cls, (output, return_code, timeouted))
+        result._oom_killed = oom_killed
+        return result
+
+    @property
+    def output(self):
+        """Output from the command."""
+        return self[0]
+
+    @property
+    def return_code(self):
+        """Return code of the command (`int`)."""
+        return self[1]
+
+    @property
+    def timeouted(self):
+        """Has the command timeouted?"""
+        return self[2]
+
+    @property
+    def oom_killed(self):
+        """Has the command been killed because it exceeded the memory limit?
+        """
+        return self._oom_killed
+
+
+class CapturedOutput:
+    """An output from a command that was captured into a file.
+
+    The output is not kept in memory. Only a few of its last lines are kept,
+    so :meth:`end()` is cheap. The full output is loaded from the file when it
+    is requested (:attr:`text`).
+
+    Leading and trailing whitespace of the output is kept in memory, so the
+    file contains only the stripped output. This allows to copy the output
+    into logs without any further processing.
+    """
+
+    def __init__(self, path, offset, size, leading, trailing, tail_lines,
+                 lines_count):
+        """
+        :param str path: Path to the file with the stripped output.
+        :param int offset: Offset of the stripped output in the file.
+        :param int size: Size of the stripped output in the file (in bytes).
+        :param str leading: Leading whitespace of the output.
+        :param str trailing: Trailing whitespace of the output.
+        :param list tail_lines: Last lines of the output.
+        :param int lines_count: Total number of lines in the output.
+        """
+        self._path = path
+        self._offset = offset
+        self._size = size
+        self._leading = leading
+        self._trailing = trailing
+        self._tail_lines = tail_lines
+        self._lines_count = lines_count
+
+    @property
+    def path(self):
+        """Path to the file with the stripped output (`str`)."""
+        return self._path
+
+    @property
+    def text(self):
+        """The full output (`str`)."""
+        with self._open() as f:
+            f.seek(self._offset)
+            data = f.read(self._size)
+        return self._leading + data.decode('utf-8') + self._trailing
+
+    def end(self, lines):
+        """Returns the last `lines` of the output.
+
+        Returns ``None`` when not enough lines are kept in memory.
+        """
+        if lines <= 0 or (lines > len(self._tail_lines) and
+                          self._lines_count > len(self._tail_lines)):
+            return None
+        return '\n'.join(self._tail_lines[-lines:])
+
+    def copy_stripped_output_to(self, file):
+        """Copies the stripped output into the given file (opened in binary
+        mode).
+        """
+        with self._open() as f:
+            f.seek(self._offset)
+            remaining = self._size
+            while remaining > 0:
+                chunk = f.read(min(remaining, _OUTPUT_CHUNK_SIZE))
+                if not chunk:
+                    break
+                file.write(chunk)
+                remaining -= len(chunk)
+
+    def move_to(self, path, offset):
+        """Records that the stripped output has been copied into the given
+        file at the given offset and removes the original file.
+        """
+        if path != self._path:
+            os.remove(self._path)
+        self._path = path
+        self._offset = offset
+
+    def __str__(self):
+        return self.text
+
+    def _open(self):
+        """Opens the file with the output.
+
+        When the file has been compressed, its compressed variant is opened.
+        """
+        if not os.path.isfile(self._path):
+            compressed_path = find_compressed_file(self._path)
+            if compressed_path is not None:
+                return open_compressed_file(compressed_path, 'rb')
+        return open(self._path, 'rb')
+
+
 class CmdRunner:
     """A runner of external commands."""
 
+    def __init__(self, resource_limiter=None):
+        """
+        :param ResourceLimiter resource_limiter: Limiter of resources for the
+            run commands. When ``None``, the resources are not limited.
+        """
+        self._resource_limiter = resource_limiter or ResourceLimiter(
+            ResourceLimits()
+        )
+
+    @property
+    def resource_limiter(self):
+        """Limiter of resources for the run commands
+        (:class:`~regression_tests.resource_limits.ResourceLimiter`).
+        """
+        return self._resource_limiter
+
     def run_cmd(self, cmd, input=b'', timeout=None, input_encoding='utf-8',
-                output_encoding='utf-8', strip_shell_colors=True):
+                output_encoding='utf-8', strip_shell_colors=True,
+                output_file=None):
         """Runs the given command (synchronously).
 
         :param list cmd: Command to be run as a list of arguments (strings).
@@ -27,8 +184,11 @@ class CmdRunner:
         :param str output_encoding: Decode the command's output in this encoding.
         :param bool strip_shell_colors: Should shell colors be stripped from
                                         the output?
+        :param str output_file: Path to a file into which the output is
+                                captured instead of keeping it in memory.
 
-        :returns: A triple (`output`, `return_code`, `timeouted`).
+        :returns: A triple (`output`, `return_code`, `timeouted`) as
+                  :class:`CmdResult`.
 
         The meaning of the items in the return value are:
 
@@ -38,6 +198,10 @@ class CmdRunner:
         * `timeouted` is either `True` or `False`, depending on whether the
           command has timeouted.
 
+        Moreover, the ``oom_killed`` property of the result says whether the
+        command has been killed because it exceeded the memory limit (see
+        :class:`~regression_tests.resource_limits.ResourceLimiter`).
+
         If `input` is a string (`str`), not `bytes`, it is decoded into `bytes`
         by using `input_encoding`.
 
@@ -51,7 +215,23 @@ class CmdRunner:
 
         If the timeout expires before the command finishes, the value of `output`
         is the command's output generated up to the timeout.
+
+        When `output_file` is given, the output is streamed into that file as
+        it is generated and `output` is a :class:`CapturedOutput`, which loads
+        the output from the file only when it is needed. This bounds the memory
+        used for commands with huge outputs. `output_encoding` cannot be
+        ``None`` in this case.
         """
+        if output_file is not None:
+            assert output_encoding is not None, \
+                'captured output has to be decoded'
+            if not isinstance(input, bytes):
+                input = input.encode(input_encoding)
+            return self._run_cmd_with_captured_output(
+                cmd, input, timeout, output_encoding, strip_shell_colors,
+                output_file
+            )
+
         def decode(output):
             if output_encoding is not None:
                 output = output.decode(output_encoding, errors='replace')
@@ -65,28 +245,83 @@ class CmdRunner:
         if not isinstance(input, bytes):
             input = input.encode(input_encoding)
 
+        p = self.start(cmd, timeout=timeout)
         try:
-            p = self.start(cmd)
             output, _ = p.communicate(input, timeout)
-            return decode(output), p.returncode, False
+            timeouted = False
         except subprocess.TimeoutExpired:
             # Kill the process, along with all its child processes.
             p.kill()
             # Finish the communication to obtain the output.
             output, _ = p.communicate()
-            return decode(output), p.returncode, True
+            timeouted = True
+        finally:
+            oom_killed = p.limited_run.was_oom_killed()
+            p.limited_run.release()
+        return CmdResult(decode(output), p.returncode, timeouted, oom_killed)
+
+    def _run_cmd_with_captured_output(self, cmd, input, timeout,
+                                      output_encoding, strip_shell_colors,
+                                      output_file):
+        """Runs the given command and captures its output into the given
+        file.
+        """
+        capture = _OutputCapture(output_file, output_encoding,
+                                 strip_shell_colors)
+        p = self.start(cmd, timeout=timeout)
+        # Both the input and the output are handled in threads so that the
+        # timeout is enforced even when the command does not read its input.
+        reader = threading.Thread(
+            target=capture.read_from,
+            args=(p.stdout,),
+            daemon=True
+        )
+        reader.start()
+        writer = threading.Thread(
+            target=_write_input,
+            args=(p.stdin, input),
+            daemon=True
+        )
+        writer.start()
+        try:
+            p.wait(timeout)
+            timeouted = False
+        except subprocess.TimeoutExpired:
+            # Kill the process, along with all its child processes.
+            p.kill()
+            p.wait()
+            timeouted = True
+        finally:
+            oom_killed = p.limited_run.was_oom_killed()
+            p.limited_run.release()
+        reader.join()
+        writer.join()
+        p.stdout.close()
+        return CmdResult(capture.finish(), p.returncode, timeouted, oom_killed)
 
-    def start(self, cmd, discard_output=False):
+    def start(self, cmd, discard_output=False, timeout=None):
         """Starts the given command and returns a handler to it.
 
         :param list cmd: Command to be run as a list of arguments (strings).
         :param bool discard_output: Should the output be discarded instead of
                                     being buffered so it can be obtained later?
+        :param int timeout: Expected timeout of the command (in seconds). It is
+                            used only to compute resource limits; the caller
+                            is responsible for enforcing the timeout.
 
         :returns: A handler to the started command (``subprocess.Popen``).
 
         If the output is irrelevant for you, you should set `discard_output` to
         ``True``.
+
+        The command runs with limited resources (see :attr:`resource_limiter`).
+        Information about the limited run is available in the ``limited_run``
+        attribute of the returned handler
+        (:class:`~regression_tests.resource_limits.LimitedRun`). After the
+        command finishes, the caller has to release the run by calling its
+        ``release()`` method (:meth:`run_cmd()` does that automatically). When
+        the command cannot be started, the run is released before the
+        exception is propagated.
         """
         # The implementation is platform-specific because we want to be able to
         # kill the children alongside with the process.
@@ -96,26 +331,157 @@ class CmdRunner:
             stdout=subprocess.DEVNULL if discard_output else subprocess.PIPE,
             stderr=subprocess.DEVNULL if discard_output else subprocess.STDOUT
         )
-        if on_windows():
-            p = _WindowsProcess(**kwargs)
-        else:
-            p = _LinuxProcess(**kwargs)
+        limited_run = self._resource_limiter.new_run(timeout)
+        try:
+            if on_windows():
+                p = _WindowsProcess(**kwargs)
+            else:
+                p = _LinuxProcess(limited_run, **kwargs)
+        except BaseException:
+            # E.g. the command does not exist, so nobody would release the run.
+            limited_run.release()
+            raise
+        p.limited_run = limited_run
 
         # We have to catch SIGTERM and terminate the subprocess to ensure that
         # we do not leave running processes behind when forcibly killing the
-        # runner (= main process).
+        # runner (= main process). We cannot use sys.exit() to exit because
+        # when the signal arrives while tests are running, unittest catches
+        # SystemExit and the process would continue.
         def handler(signum, frame):
             p.kill()
-            sys.exit(1)
+            os._exit(1)
         signal.signal(signal.SIGTERM, handler)
 
         return p
 
 
+#: Size of chunks in which outputs of commands are read and copied.
+_OUTPUT_CHUNK_SIZE = 64 * 1024
+
+#: Number of last lines of a captured output that are kept in memory.
+_OUTPUT_TAIL_LINES = 100
+
+
+class _OutputCapture:
+    """Captures an output from a command into a file.
+
+    The output is processed in the same way as in :meth:`CmdRunner.run_cmd()`
+    (decoding, conversion of line endings, stripping of shell colors), but
+    incrementally, so only a bounded part of it is kept in memory.
+    """
+
+    def __init__(self, path, encoding, strip_shell_colors):
+        self._path = path
+        self._file = open(path, 'wb')
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self._strip_shell_colors = strip_shell_colors
+        # Text that cannot be processed yet because it ends with a part of a
+        # line ending or of a shell color.
+        self._pending = ''
+        self._size = 0
+        self._leading = ''
+        self._trailing = ''
+        self._seen_non_whitespace = False
+        self._tail_lines = collections.deque(maxlen=_OUTPUT_TAIL_LINES - 1)
+        self._last_line = ''
+        self._lines_count = 1
+
+    def read_from(self, stream):
+        """Reads the whole output from the given stream."""
+        while True:
+            data = stream.read1(_OUTPUT_CHUNK_SIZE)
+            if not data:
+                break
+            self._feed(self._decoder.decode(data))
+        self._feed(self._decoder.decode(b'', final=True), final=True)
+
+    def finish(self):
+        """Finishes the capture and returns the captured output
+        (:class:`CapturedOutput`).
+        """
+        self._file.close()
+        return CapturedOutput(
+            self._path,
+            0,
+            self._size,
+            self._leading,
+            self._trailing,
+            list(self._tail_lines) + [self._last_line],
+            self._lines_count
+        )
+
+    def _feed(self, text, final=False):
+        text = self._pending + text
+        self._pending = ''
+        if not final:
+            # Postpone the processing of '\r' (it may be followed by '\n')
+            # and of unfinished shell colors (they end with 'm').
+            end = len(text)
+            if self._strip_shell_colors:
+                color_start = text.find('\x1b', text.rfind('m') + 1)
+                if color_start != -1:
+                    end = color_start
+            if end == len(text) and text.endswith('\r'):
+                end -= 1
+            text, self._pending = text[:end], text[end:]
+
+        text = re.sub(r'\r\n?', '\n', text)
+        if self._strip_shell_colors:
+            text = io.strip_shell_colors(text)
+        self._update_tail(text)
+        self._write(text)
+
+    def _update_tail(self, text):
+        lines = text.split('\n')
+        self._last_line += lines[0]
+        for line in lines[1:]:
+            self._tail_lines.append(self._last_line)
+            self._last_line = line
+        self._lines_count += len(lines) - 1
+
+    def _write(self, text):
+        # Only the stripped output is written. The leading and trailing
+        # whitespace is kept aside.
+        if not self._seen_non_whitespace:
+            stripped_text = text.lstrip()
+            self._leading += text[:len(text) - len(stripped_text)]
+            if not stripped_text:
+                return
+            text = stripped_text
+            self._seen_non_whitespace = True
+
+        body = text.rstrip()
+        if not body:
+            self._trailing += text
+            return
+        data = (self._trailing + body).encode('utf-8')
+        self._file.write(data)
+        self._size += len(data)
+        self._trailing = text[len(body):]
+
+
+def _write_input(stdin, input):
+    """Writes the given input into the standard input of a command and closes
+    it.
+    """
+    try:
+        if input:
+            stdin.write(input)
+    except BrokenPipeError:
+        # The command does not read its input.
+        pass
+    finally:
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+
 class _LinuxProcess(subprocess.Popen):
     """An internal wrapper around ``subprocess.Popen`` for Linux."""
 
-    def __init__(self, **kwargs):
+    def __init__(self, limited_run, **kwargs):
         # To ensure that all the process' children terminate when the process
         # is killed, we use a process group so as to enable sending a signal to
         # all the processes in the group. For that, we attach a session ID to
@@ -124,16 +490,25 @@ class _LinuxProcess(subprocess.Popen):
         # process group leader, it's transmitted to all of the child processes
         # of this group.
         #
-        # os.setsid is passed in the argument preexec_fn so it's run after
-        # fork() and before exec().
+        # os.setsid is called from the function passed in the argument
+        # preexec_fn so it's run after fork() and before exec(). Resource limits
+        # are applied at the same place so that they also cover the process'
+        # children.
         #
         # This solution is based on http://stackoverflow.com/a/4791612.
-        kwargs['preexec_fn'] = os.setsid
+        def preexec_fn():
+            os.setsid()
+            limited_run.apply_to_current_process()
+        kwargs['preexec_fn'] = preexec_fn
         super().__init__(**kwargs)
 
     def kill(self):
         """Kills the process, including its children."""
-        os.killpg(self.pid, signal.SIGTERM)
+        try:
+            os.killpg(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            # The process (and its children) have already finished.
+            pass
 
         # Ensure that when kill() is called for the second time, it does not do
         # anything. This is needed to prevent killing of a random process when
@@ -0,0 +1,171 @@
+"""
+    Pinning of processes to CPUs.
+"""
+
+import multiprocessing as mp
+import os
+import queue
+
+
+def is_cpu_pinning_supported():
+    """Is pinning of processes to CPUs supported on the current system?"""
+    return hasattr(os, 'sched_getaffinity') and hasattr(os, 'sched_setaffinity')
+
+
+def get_available_cpus():
+    """Returns a sorted list of CPUs the current process may run on."""
+    return sorted(os.sched_getaffinity(0))
+
+
+def get_physical_cores(cpus):
+    """Groups the given CPUs into physical cores.
+
+    :param list cpus: CPUs (their numbers) to be grouped.
+
+    :returns: A list of physical cores, where each core is represented by a
+              sorted list of its CPUs (SMT siblings) that are in `cpus`.
+
+    When the CPU topology cannot be obtained, every CPU is considered to be a
+    separate physical core.
+    """
+    cores = []
+    seen_cpus = set()
+    for cpu in sorted(cpus):
+        if cpu in seen_cpus:
+            continue
+        siblings = [s for s in _get_smt_siblings(cpu) if s in cpus]
+        if cpu not in siblings:
+            siblings = [cpu]
+        cores.append(sorted(siblings))
+        seen_cpus.update(siblings)
+    return cores
+
+
+def split_cpus_for_workers(cpus, num_of_workers, reserved_cores=0):
+    """Splits the given CPUs into disjoint sets for workers.
+
+    :param list cpus: CPUs (their numbers) to be split.
+    :param int num_of_workers: Requested number of workers.
+    :param int reserved_cores: Number of physical cores to be reserved for the
+                               runner itself.
+
+    :returns: A pair (`runner_cpus`, `worker_cpu_sets`), where `runner_cpus` is
+              a set of CPUs reserved for the runner (empty when no cores are
+              reserved) and `worker_cpu_sets` is a list of sets of CPUs, one
+              set per worker.
+
+    Every worker gets whole physical cores so that no two workers share SMT
+    siblings. When there are fewer physical cores than workers, fewer sets are
+    returned, so the caller should lower the number of workers accordingly.
+    """
+    cores = get_physical_cores(cpus)
+
+    # Always leave at least one core for the workers.
+    reserved_cores = min(reserved_cores, len(cores) - 1)
+    runner_cpus = set()
+    for core in cores[:reserved_cores]:
+        runner_cpus.update(core)
+    cores = cores[reserved_cores:]
+
+    num_of_workers = min(num_of_workers, len(cores))
+    worker_cpu_sets = []
+    # Distribute the cores as evenly as possible. When the cores cannot be
+    # divided evenly, the first workers get one more core.
+    cores_per_worker, extra_cores = divmod(len(cores), num_of_workers)
+    i = 0
+    for n in range(num_of_workers):
+        num_of_cores = cores_per_worker + (1 if n < extra_cores else 0)
+        worker_cpus = set()
+        for core in cores[i:i + num_of_cores]:
+            worker_cpus.update(core)
+        worker_cpu_sets.append(worker_cpus)
+        i += num_of_cores
+    return runner_cpus, worker_cpu_sets
+
+
+def pin_current_process(cpus):
+    """Pins the current process to the given CPUs.
+
+    Processes started by the current process afterwards inherit the pinning.
+    """
+    os.sched_setaffinity(0, cpus)
+
+
+class WorkerCpuSets:
+    """Sets of CPUs for workers of a pool.
+
+    Every worker takes a set when it starts (:func:`take()`) and gives it back
+    when it exits (:func:`give_back()`), so the worker replacing it can take
+    the set. A killed worker cannot give its set back, so the runner does it
+    instead (:func:`give_back_set_of_killed()`). For that, the runner has to
+    record which set each worker took (:func:`record()`).
+    """
+
+    #: Time (in seconds) for which a worker waits for a free set of CPUs.
+    take_timeout = 5
+
+    def __init__(self, cpu_sets):
+        """
+        :param list cpu_sets: Sets of CPUs, one set per worker.
+        """
+        self._free_cpu_sets = mp.Queue()
+        for cpu_set in cpu_sets:
+            self._free_cpu_sets.put(cpu_set)
+        self._cpu_sets_by_pid = {}
+
+    def take(self):
+        """Takes a free set of CPUs (called in a worker).
+
+        :returns: The set or ``None`` when no set becomes free in
+                  :attr:`take_timeout` seconds. The worker then has to run
+                  without pinning.
+        """
+        try:
+            return self._free_cpu_sets.get(timeout=self.take_timeout)
+        except queue.Empty:
+            return None
+
+    def give_back(self, cpu_set):
+        """Gives back the given set of CPUs (called in a worker)."""
+        self._free_cpu_sets.put(cpu_set)
+
+    def record(self, pid, cpu_set):
+        """Records that the worker with the given PID has taken the given set
+        of CPUs (called in the runner).
+        """
+        self._cpu_sets_by_pid[pid] = cpu_set
+
+    def give_back_set_of_killed(self, pid):
+        """Gives back the set of CPUs taken by the killed worker with the given
+        PID (called in the runner).
+        """
+        cpu_set = self._cpu_sets_by_pid.pop(pid, None)
+        if cpu_set is not None:
+            self.give_back(cpu_set)
+
+
+def _get_smt_siblings(cpu):
+    """Returns a list of SMT siblings of the given CPU (including the CPU).
+    """
+    path = '/sys/devices/system/cpu/cpu{}/topology/thread_siblings_list'.format(cpu)
+    try:
+        with open(path, 'r') as f:
+            return _parse_cpu_list(f.read())
+    except (OSError, ValueError):
+        return [cpu]
+
+
+def _parse_cpu_list(cpu_list):
+    """Parses the given list of CPUs in the format used by the Linux kernel
+    (e.g. ``0-3,8,10-11``).
+    """
+    cpus = []
+    for part in cpu_list.strip().split(','):
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        if last:
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(first))
+    return cpus
@@ -0,0 +1,160 @@
+"""
+    Compression of outputs of tools.
+"""
+
+import gzip
+import lzma
+import os
+import shutil
+
+try:
+    import zstandard
+except ImportError:
+    # zstd compression is available only when the zstandard package is
+    # installed.
+    zstandard = None
+
+
+#: Supported compression methods and extensions of files compressed by them.
+COMPRESSION_METHODS = {
+    'gzip': '.gz',
+    'xz': '.xz',
+    'zstd': '.zst',
+}
+
+#: Extensions of outputs that are compressed by default (they are large and
+#: textual, so they compress well).
+DEFAULT_COMPRESSED_EXTENSIONS = ('.ll', '.dsm', '.config.json', '.log')
+
+
+def is_compression_method_supported(method):
+    """Checks whether the given compression method can be used.
+
+    :param str method: Name of the method (see :data:`COMPRESSION_METHODS`).
+    """
+    if method not in COMPRESSION_METHODS:
+        return False
+    if method == 'zstd':
+        return zstandard is not None
+    return True
+
+
+def open_compressed_file(path, mode='rb', **kwargs):
+    """Opens the given compressed file.
+
+    :param str path: Path to the file. The compression method is determined
+                     from its extension.
+    :param str mode: Mode in which the file is opened (``'rb'``, ``'wb'``,
+                     ``'rt'``, or ``'wt'``).
+
+    Other keyword arguments (e.g. `encoding` or `errors`) are passed to the
+    underlying function when the file is opened in text mode.
+    """
+    if path.endswith(COMPRESSION_METHODS['gzip']):
+        return gzip.open(path, mode, **kwargs)
+    elif path.endswith(COMPRESSION_METHODS['xz']):
+        return lzma.open(path, mode, **kwargs)
+    elif path.endswith(COMPRESSION_METHODS['zstd']) and zstandard is not None:
+        return zstandard.open(path, mode, **kwargs)
+    raise ValueError('unsupported compressed file: {}'.format(path))
+
+
+def find_compressed_file(path):
+    """Returns a path to a compressed variant of the given file.
+
+    :param str path: Path to the (uncompressed) file.
+
+    :returns: Path to the compressed file or ``None`` if there is no such
+              file.
+    """
+    for extension in COMPRESSION_METHODS.values():
+        compressed_path = path + extension
+        if os.path.isfile(compressed_path):
+            return compressed_path
+    return None
+
+
+def compress_file(path, method):
+    """Compresses the given file by using the given method.
+
+    :param str path: Path to the file.
+    :param str method: Compression method (see :data:`COMPRESSION_METHODS`).
+
+    :returns: Path to the compressed file.
+
+    The compressed file is stored next to the original file, with the
+    extension of the method appended. The original file is removed.
+    """
+    compressed_path = path + COMPRESSION_METHODS[method]
+    tmp_path = compressed_path + '.tmp'
+    with open(path, 'rb') as input_file, open(tmp_path, 'wb') as output_file:
+        with _compressing_writer(output_file, method) as writer:
+            shutil.copyfileobj(input_file, writer, _CHUNK_SIZE)
+    os.replace(tmp_path, compressed_path)
+    os.remove(path)
+    return compressed_path
+
+
+class OutputCompressor:
+    """Compresses outputs of tools after they finish."""
+
+    def __init__(self, method, extensions=DEFAULT_COMPRESSED_EXTENSIONS):
+        """
+        :param str method: Compression method (see
+                           :data:`COMPRESSION_METHODS`).
+        :param tuple extensions: Extensions of files to be compressed.
+
+        :raises ValueError: When the method is not supported.
+        """
+        if not is_compression_method_supported(method):
+            raise ValueError(
+                'unsupported compression method: {}'.format(method)
+            )
+        self._method = method
+        self._extensions = tuple(extensions)
+
+    @property
+    def method(self):
+        """Compression method (`str`)."""
+        return self._method
+
+    @property
+    def extensions(self):
+        """Extensions of files to be compressed (`tuple`)."""
+        return self._extensions
+
+    def compress_outputs(self, dir):
+        """Compresses outputs in the given directory (including its
+        subdirectories).
+
+        :param Directory dir: Directory with outputs of a tool.
+        """
+        for dir_path, _, file_names in os.walk(dir.path):
+            for file_name in file_names:
+                if file_name.endswith(self._extensions):
+                    compress_file(os.path.join(dir_path, file_name), self._method)
+
+
+#: Size of chunks in which files are compressed (in bytes).
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _compressing_writer(file, method):
+    """Returns a writer that writes data compressed by the given method into
+    the given binary file. The file is not closed when the writer is closed.
+    """
+    if method == 'gzip':
+        # The default level (9) is too slow for outputs of hundreds of
+        # megabytes while compressing only slightly better. Do not store the
+        # name and modification time of the file in the header so that
+        # identical outputs are compressed into identical files.
+        return gzip.GzipFile(
+            filename='',
+            mode='wb',
+            compresslevel=6,
+            fileobj=file,
+            mtime=0
+        )
+    elif method == 'xz':
+        return lzma.LZMAFile(file, 'wb', preset=3)
+    return zstandard.ZstdCompressor().stream_writer(file, closefd=False)
@@ -5,6 +5,8 @@
 import os
 import shutil
 
+from regression_tests.filesystem.compression import find_compressed_file
+from regression_tests.filesystem.compression import open_compressed_file
 from regression_tests.filesystem.file import CFile
 from regression_tests.filesystem.file import ConfigFile
 from regression_tests.filesystem.file import TextFile
@@ -90,8 +92,12 @@ class Directory:
         :para str name: Name of the file.
 
         :returns: ``True`` if the file exists, ``False`` otherwise.
+
+        A compressed variant of the file (e.g. ``file.ll.gz`` for
+        ``file.ll``) is also considered.
         """
-        return os.path.isfile(self._path_to(name))
+        path = self._path_to(name)
+        return os.path.isfile(path) or find_compressed_file(path) is not None
 
     def store_file(self, name, content, encoding='utf-8'):
         """Stores a file under the given name with the given content.
@@ -145,7 +151,15 @@ class Directory:
         """Returns the contents of the given binary file as raw bytes.
 
         :param str name: Name of the file.
+
+        When the file does not exist but there is its compressed variant, the
+        variant is transparently decompressed.
         """
+        compressed_path = self._compressed_path_to(name)
+        if compressed_path is not None:
+            with open_compressed_file(compressed_path, 'rb') as f:
+                return f.read()
+
         with open(self._path_to(name), 'rb') as f:
             return f.read()
 
@@ -154,9 +168,18 @@ class Directory:
 
         :param str name: Name of the file.
         :param str encoding: Encoding of the file.
+
+        When the file does not exist but there is its compressed variant, the
+        variant is transparently decompressed.
         """
         # Replace malformed data by a replacement marker (such as '?') so that
         # the file can be read even if there are encoding errors.
+        compressed_path = self._compressed_path_to(name)
+        if compressed_path is not None:
+            with open_compressed_file(compressed_path, 'rt', encoding=encoding,
+                                      errors='replace') as f:
+                return f.read()
+
         with open(self._path_to(name), 'r', encoding=encoding,
                   errors='replace') as f:
             return f.read()
@@ -184,6 +207,15 @@ class Directory:
         """Returns an absolute path to the given file or directory."""
         return path if os.path.isabs(path) else os.path.join(self.path, path)
 
+    def _compressed_path_to(self, name):
+        """Returns a path to a compressed variant of the given file when the
+        file itself does not exist, ``None`` otherwise.
+        """
+        path = self._path_to(name)
+        if os.path.isfile(path):
+            return None
+        return find_compressed_file(path)
+
     def _file_named(self, name):
         """Returns a file with the given name."""
         if name.endswith('.c'):
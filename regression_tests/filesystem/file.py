@@ -4,11 +4,17 @@
 
 import os
 
-from regression_tests.parsers.c_parser import parse as parse_c
+from regression_tests.parsers.c_parser.tokenized import TokenizedModule
+from regression_tests.parsers.c_parser.tokenized import parse_tokenized
 from regression_tests.parsers.config_parser import parse as parse_config
+from regression_tests.parsers.text_parser import MappedText
 from regression_tests.parsers.text_parser import parse as parse_text
 from regression_tests.parsers.yara_parser import parse as parse_yara
+from regression_tests.phases import OUTPUT_PARSING
+from regression_tests.phases import measure_phase
 from regression_tests.utils import memoize
+from regression_tests.utils.background import run_in_background
+from regression_tests.utils.background import wait_for_result
 
 
 class File:
@@ -60,7 +66,9 @@ class File:
         )
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        # Do not compare the whole __dict__ because it also contains results
+        # of memoized methods.
+        return self.name == other.name and self.dir == other.dir
 
     def __ne__(self, other):
         return not self == other
@@ -69,14 +77,83 @@ class File:
         return hash(self.path)
 
 
+#: Minimal size of a text file (in bytes) for its text to be mapped into memory
+#: instead of being read.
+MAPPED_TEXT_MIN_SIZE = 32 * 1024 * 1024
+
+
 class TextFile(File):
     """An abstraction of a text file."""
 
+    #: Future of the parsed text of the file when its parsing was started in
+    #: the background (see :func:`prefetch_text()`).
+    _prefetched_text = None
+
     @property
     @memoize
     def text(self):
-        """Text of the file (:class:`.Text`, which is a `str`-like object)."""
-        return parse_text(self.dir.read_text_file(self.name))
+        """Text of the file (:class:`.Text`, which is a `str`-like object).
+
+        The text of a large file (at least :data:`MAPPED_TEXT_MIN_SIZE` bytes)
+        is mapped into memory (:class:`.MappedText`), so it is decoded only
+        when needed.
+        """
+        if self._should_be_mapped():
+            return MappedText(self.path)
+        return self._get_parsed_text()
+
+    def prefetch_text(self):
+        """Starts parsing of the file in the background.
+
+        The file is read right away, so it can be e.g. compressed afterwards.
+        :attr:`text` then waits until the parsing finishes. Nothing is done
+        when the file does not exist.
+        """
+        if not self.exists():
+            return
+        self._prefetched_text = run_in_background(
+            self._parse_prefetched_text,
+            self._read_text()
+        )
+
+    def _read_text(self):
+        """Reads the text of the file (`str`)."""
+        return self.dir.read_text_file(self.name)
+
+    def _parse_text(self, text):
+        """Parses the given text of the file."""
+        return parse_text(text)
+
+    def _parse_prefetched_text(self, text):
+        """Parses the given text of the file in the background (see
+        :func:`prefetch_text()`).
+        """
+        return self._parse_text(text)
+
+    def _get_parsed_text(self):
+        """Returns the parsed text of the file.
+
+        When the parsing was started in the background (see
+        :func:`prefetch_text()`), it waits until the parsing finishes. When the
+        waiting is interrupted (e.g. by a time limit) while the parsing runs,
+        the parsing is abandoned so that it does not block parsing of other
+        files (see :func:`.wait_for_result()`).
+        """
+        if self._prefetched_text is not None:
+            with measure_phase(OUTPUT_PARSING):
+                return wait_for_result(self._prefetched_text)
+
+        text = self._read_text()
+        with measure_phase(OUTPUT_PARSING):
+            return self._parse_text(text)
+
+    def _should_be_mapped(self):
+        """Should the text of the file be mapped into memory?"""
+        try:
+            return os.path.getsize(self.path) >= MAPPED_TEXT_MIN_SIZE
+        except OSError:
+            # The file does not exist (e.g. it has been compressed).
+            return False
 
 
 class CFile(TextFile):
@@ -87,8 +164,30 @@ class CFile(TextFile):
     def text(self):
         """Parsed contents of the file (:class:`.Module`, which is a `str`-like
         object).
+
+        By default, text-level queries (e.g. comments, includes, or string
+        literals) are answered from tokens of the contents and the contents
+        are parsed by libclang only when a query needs it (see
+        :func:`~regression_tests.parsers.c_parser.tokenized.parse_tokenized()`).
+        When the file is prefetched (see :func:`prefetch_text()`), the
+        contents are both tokenized and parsed in the background.
+        When a summary of the contents is cached, queries are answered from
+        the summary (see
+        :func:`~regression_tests.parsers.c_parser.summary.parse_cached()`).
         """
-        return parse_c(super().text, self.name)
+        return self._get_parsed_text()
+
+    def _parse_text(self, text):
+        return parse_tokenized(text, self.name)
+
+    def _parse_prefetched_text(self, text):
+        module = self._parse_text(text)
+        # Without tokenizing and parsing the code in advance, the
+        # prefetching would only create the tokenized module and all the work
+        # would be left for assertions.
+        if isinstance(module, TokenizedModule):
+            module.prefetch()
+        return module
 
 
 class ConfigFile(TextFile):
@@ -100,7 +199,10 @@ class ConfigFile(TextFile):
         """Parsed contents of the file (:class:`.Config`, which is a `str`-like
         object).
         """
-        return parse_config(super().text)
+        return self._get_parsed_text()
+
+    def _parse_text(self, text):
+        return parse_config(text)
 
 
 class YaraFile(TextFile):
@@ -112,7 +214,10 @@ class YaraFile(TextFile):
         """Parsed contents of the file (:class:`.Yara`, which is a `str`-like
         object).
         """
-        return parse_yara(super().text)
+        return self._get_parsed_text()
+
+    def _parse_text(self, text):
+        return parse_yara(text)
 
 
 class StandaloneFile:
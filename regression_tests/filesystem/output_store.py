@@ -0,0 +1,148 @@
+"""
+    A content-addressed store of outputs of tools.
+"""
+
+import hashlib
+import os
+
+
+#: Name of the manifest that lists hashes of outputs in a directory.
+MANIFEST_FILE_NAME = 'outputs.sha256'
+
+
+class OutputStore:
+    """A content-addressed store of outputs of tools.
+
+    Every output is stored only once, under its SHA-256 hash. Outputs in the
+    directories of test cases are replaced with hard links to the stored
+    blobs, so byte-identical outputs of different test cases (or of different
+    runs) share a single copy on the disk. Since the outputs are hard links,
+    they can be read as ordinary files. They must not be modified in place,
+    though (removing them is fine).
+
+    Moreover, the hashes of all outputs of a directory are written into its
+    manifest (:data:`MANIFEST_FILE_NAME`, in the format of ``sha256sum``), which
+    allows to quickly check whether two runs produced identical outputs.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path: Path to the directory of the store. It should be on
+                         the same filesystem as the tests. Otherwise, outputs
+                         cannot be hard-linked and are kept as they are.
+        """
+        self._path = path
+
+    @property
+    def path(self):
+        """Path to the directory of the store (`str`)."""
+        return self._path
+
+    def blob_path(self, hash):
+        """Returns a path to the blob with the given hash."""
+        return os.path.join(self._path, hash[:2], hash)
+
+    def store_outputs(self, dir):
+        """Stores outputs in the given directory (including its
+        subdirectories) and writes the manifest of the directory.
+
+        :param Directory dir: Directory with outputs of a tool.
+
+        :returns: A dictionary mapping relative paths of the outputs to their
+                  hashes.
+        """
+        hashes = {}
+        for dir_path, _, file_names in os.walk(dir.path):
+            for file_name in file_names:
+                path = os.path.join(dir_path, file_name)
+                if path == os.path.join(dir.path, MANIFEST_FILE_NAME):
+                    continue
+                hashes[os.path.relpath(path, dir.path)] = self._store_file(path)
+        self._write_manifest(dir, hashes)
+        return hashes
+
+    def prune(self):
+        """Removes blobs that are not referenced by any output.
+
+        :returns: Number of removed blobs.
+        """
+        removed = 0
+        for dir_path, _, file_names in os.walk(self._path):
+            for file_name in file_names:
+                path = os.path.join(dir_path, file_name)
+                try:
+                    if os.stat(path).st_nlink == 1:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    # The blob is being stored or removed in parallel.
+                    pass
+        return removed
+
+    def _store_file(self, path):
+        """Stores the given file and replaces it with a link to its blob.
+
+        Returns the hash of the file.
+        """
+        hash = _compute_file_hash(path)
+        blob_path = self.blob_path(hash)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        try:
+            os.link(path, blob_path)
+        except FileExistsError:
+            # There already is an identical output, so use it instead.
+            self._replace_with_link(path, blob_path)
+        except OSError:
+            # Hard links are not supported (e.g. the store is on a different
+            # filesystem), so keep the output as it is.
+            pass
+        return hash
+
+    def _replace_with_link(self, path, blob_path):
+        """Atomically replaces the given file with a link to the given blob."""
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            os.link(blob_path, tmp_path)
+        except OSError:
+            return
+        os.replace(tmp_path, path)
+
+    def _write_manifest(self, dir, hashes):
+        """Writes the manifest of the given directory."""
+        with open(os.path.join(dir.path, MANIFEST_FILE_NAME), 'w',
+                  encoding='utf-8') as f:
+            for rel_path, hash in sorted(hashes.items()):
+                f.write('{}  {}\n'.format(hash, rel_path.replace(os.sep, '/')))
+
+
+def read_manifest(dir):
+    """Returns hashes of outputs in the given directory from its manifest.
+
+    :param Directory dir: Directory with outputs of a tool.
+
+    :returns: A dictionary mapping relative paths of the outputs to their
+              hashes or ``None`` when there is no manifest.
+    """
+    path = os.path.join(dir.path, MANIFEST_FILE_NAME)
+    if not os.path.isfile(path):
+        return None
+
+    hashes = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            hash, _, rel_path = line.rstrip('\n').partition('  ')
+            hashes[rel_path.replace('/', os.sep)] = hash
+    return hashes
+
+
+def _compute_file_hash(path):
+    """Computes the SHA-256 hash of the given file."""
+    hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            hash.update(chunk)
+    return hash.hexdigest()
+
+
+#: Size of chunks in which files are read when computing their hashes.
+_CHUNK_SIZE = 1024 * 1024
@@ -49,25 +49,38 @@ def print_error(msg, stream=sys.stderr):
     print_with_color_reset('error: {}'.format(msg), stream)
 
 
-def print_prologue(tests_root_dir, test_cases,
+def print_prologue(tests_root_dir, test_cases, resumed_test_cases=0,
                    stream=sys.stdout):
-    """Prints a prologue for the tests to the given stream."""
+    """Prints a prologue for the tests to the given stream.
+
+    :param int resumed_test_cases: Number of test cases whose results are taken
+                                   from a previous (interrupted) run.
+    """
     print_with_color_reset(
-        'Running {} test case{} in {}...\n'.format(
+        'Running {} test case{} in {}{}...\n'.format(
             len(test_cases),
             's' if len(test_cases) != 1 else '',
             tests_root_dir,
+            ' ({} resumed from the previous run)'.format(resumed_test_cases)
+            if resumed_test_cases else ''
         ),
         stream
     )
 
 
-def print_test_results(test_results, stream=sys.stdout):
+def print_test_results(test_results, stream=sys.stdout,
+                       show_phase_durations=False):
     """Prints the given test results to the given stream.
+
+    :param bool show_phase_durations: Should durations of phases of the test
+                                      case be printed as well?
     """
     # Name and status.
     normal_color = colorama.Fore.WHITE + colorama.Style.BRIGHT
-    if test_results.skipped:
+    if test_results.timeouted:
+        status_color = colorama.Fore.RED + colorama.Style.BRIGHT
+        status = 'TIME'
+    elif test_results.skipped:
         status_color = colorama.Fore.YELLOW + colorama.Style.BRIGHT
         status = 'SKIP'
     elif test_results.succeeded:
@@ -94,6 +107,17 @@ def print_test_results(test_results, stream=sys.stdout):
     )
     print_with_color_reset(text, stream)
 
+    # Durations of phases.
+    if show_phase_durations and test_results.phase_durations:
+        print('  Phases: {}'.format(', '.join(
+            '{} {:.2f}s'.format(phase, duration)
+            for phase, duration in sorted(
+                test_results.phase_durations.items(),
+                key=lambda item: item[1],
+                reverse=True
+            )
+        )), file=stream)
+
     # Output.
     if test_results.failed:
         output_color = colorama.Fore.WHITE + colorama.Style.NORMAL
@@ -142,6 +166,27 @@ def print_summary(tests_results, stream=sys.stdout):
             stream
         )
 
+    print_phase_durations(tests_results.phase_durations, stream)
+
+
+def print_phase_durations(phase_durations, stream=sys.stdout):
+    """Prints the given durations of phases (`dict`, phase name => seconds)
+    to the given stream, from the longest phase to the shortest one.
+    """
+    if not phase_durations:
+        return
+
+    total_duration = sum(phase_durations.values())
+    print('', file=stream)
+    print('Time spent in phases:', file=stream)
+    for phase, duration in sorted(phase_durations.items(),
+                                  key=lambda item: item[1], reverse=True):
+        print('  {:<24}{:>10.2f}s  ({:5.1f}%)'.format(
+            phase + ':',
+            duration,
+            100 * duration / total_duration if total_duration > 0 else 0
+        ), file=stream)
+
 
 def print_with_color_reset(text, stream):
     """Prints the given text into the given stream and resets color
@@ -3,40 +3,101 @@
 """
 
 import os
+import threading
 
 from clang import cindex
 
 from regression_tests.clang import INCLUDE_PATHS
+from regression_tests.parsers.c_parser.precompiled_headers import get_precompiled_header
+from regression_tests.parsers.c_parser.precompiled_headers import remove_precompiled_header
 from regression_tests.parsers.c_parser.utils import get_parse_errors
 from regression_tests.parsers.c_parser.utils import print_parse_errors
 
 
-def parse(code, file_name='dummy.c', print_errors=False):
+def parse(code, file_name='dummy.c', print_errors=False,
+          skip_function_bodies=None):
     """Parses the given C code.
 
     :param str code: C code to be parsed.
     :param str file_name: Optional name of the original file.
     :param bool print_errors: Should parse errors be printed?
+    :param bool skip_function_bodies: Should bodies of functions be skipped?
+                                      When ``None``, the default set by
+                                      :func:`set_skip_function_bodies()` is
+                                      used.
 
     :returns: Parsed representation of the given file (:class:`Module`).
+
+    Standard headers included at the beginning of the code are not parsed
+    over and over again. Instead, they are precompiled into a header that is
+    shared by all parsed files including the same headers.
+
+    When bodies of functions are skipped, a
+    :class:`~regression_tests.parsers.c_parser.declarations_only.DeclarationsOnlyModule`
+    is returned. It answers queries about top-level declarations (e.g.
+    functions, global variables, or structures) and parses the code again,
+    with the bodies, when a query needs them for the first time.
     """
-    index = cindex.Index.create()
-    tu = index.parse(
-        file_name,
-        # We have to use proper include paths. Without them, Clang cannot find
-        # some of the standard headers, such as stddef.h.
-        args=['-std=c99'] + ['-I{}'.format(path) for path in INCLUDE_PATHS],
-        unsaved_files=[(file_name, code)]
-    )
+    if skip_function_bodies is None:
+        skip_function_bodies = _skip_function_bodies
+
+    index = get_index()
+    # We have to use proper include paths. Without them, Clang cannot find
+    # some of the standard headers, such as stddef.h.
+    args = ['-std=c99'] + ['-I{}'.format(path) for path in INCLUDE_PATHS]
+    options = 0
+    if skip_function_bodies:
+        options |= cindex.TranslationUnit.PARSE_SKIP_FUNCTION_BODIES
+
+    tu = None
+    pch_path = get_precompiled_header(index, code, args)
+    if pch_path is not None:
+        tu = _parse_with_precompiled_header(
+            index, code, file_name, args, options, pch_path
+        )
+    if tu is None:
+        tu = index.parse(
+            file_name,
+            args=args,
+            unsaved_files=[(file_name, code)],
+            options=options
+        )
 
     if print_errors:
         parse_errors = get_parse_errors(tu.diagnostics)
         if parse_errors:
             print_parse_errors(parse_errors, file_name)
 
+    if skip_function_bodies:
+        return DeclarationsOnlyModule(code, tu, print_errors)
     return Module(code, tu)
 
 
+def set_skip_function_bodies(skip):
+    """Sets whether bodies of functions are skipped by default when parsing C
+    code (see :func:`parse()`).
+
+    :param bool skip: Should the bodies be skipped?
+    """
+    global _skip_function_bodies
+    _skip_function_bodies = skip
+
+
+def get_index():
+    """Returns an index to be used to parse C code (`cindex.Index`).
+
+    The index is created only once per process and thread and then reused.
+    An index must not be used by several threads at once, so code parsed in
+    the background (e.g. prefetched outputs) uses its own index.
+    """
+    # An index created before a fork must not be used in the child process.
+    if getattr(_indexes, 'index', None) is None or \
+            _indexes.pid != os.getpid():
+        _indexes.index = cindex.Index.create()
+        _indexes.pid = os.getpid()
+    return _indexes.index
+
+
 def parse_file(file_path, encoding='utf-8', print_errors=False):
     """Parses the given C file.
 
@@ -54,4 +115,43 @@ def parse_file(file_path, encoding='utf-8', print_errors=False):
         )
 
 
+#: Indexes shared by all parsing in the process, one per thread (see
+#: :func:`get_index()`). Every index is stored together with the ID of the
+#: process that created it.
+_indexes = threading.local()
+
+#: Should bodies of functions be skipped by default (see
+#: :func:`set_skip_function_bodies()`)?
+_skip_function_bodies = False
+
+
+def _parse_with_precompiled_header(index, code, file_name, args, options,
+                                   pch_path):
+    """Parses the given C code by using the given precompiled header.
+
+    :returns: Translation unit or ``None`` when the precompiled header cannot
+              be used (e.g. because the included headers have changed since it
+              was built). Such a header is removed.
+    """
+    try:
+        tu = index.parse(
+            file_name,
+            args=args + ['-include-pch', pch_path],
+            unsaved_files=[(file_name, code)],
+            options=options
+        )
+    except cindex.TranslationUnitLoadError:
+        tu = None
+    # Problems with precompiled headers are reported as fatal errors that are
+    # not bound to any file.
+    if tu is None or any(
+            diag.severity == cindex.Diagnostic.Fatal and
+            diag.location.file is None
+            for diag in tu.diagnostics):
+        remove_precompiled_header(pch_path)
+        return None
+    return tu
+
+
+from regression_tests.parsers.c_parser.declarations_only import DeclarationsOnlyModule
 from regression_tests.parsers.c_parser.module import Module
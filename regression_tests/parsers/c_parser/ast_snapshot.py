@@ -0,0 +1,366 @@
+"""
+    A compact snapshot of the AST of a translation unit.
+"""
+
+from array import array
+from ctypes import byref
+from ctypes import c_uint
+from ctypes import c_void_p
+from ctypes import cast
+from ctypes import sizeof
+
+from clang import cindex
+
+from regression_tests.clang import get_raw_func
+from regression_tests.utils import memoize
+
+
+class AstSnapshot:
+    """A snapshot of the AST of nodes from the main file of a translation
+    unit.
+
+    The snapshot is built in a single traversal of the translation unit. The
+    nodes are stored in pre-order in parallel arrays, so a node is represented
+    by its index. Top-level nodes from other files (e.g. from included headers)
+    are not stored. Their subtrees are not even traversed.
+
+    The following information is stored for every node:
+
+    * the kind of the node (:attr:`kind_ids`),
+    * the index of its parent (:attr:`parents`, ``-1`` for top-level nodes),
+    * the index that follows the last node from its subtree
+      (:attr:`subtree_ends`),
+    * start and end offsets of its extent (:attr:`start_offsets` and
+      :attr:`end_offsets`),
+    * the spelling of the node (:attr:`spelling_ids`, an index into
+      :attr:`spellings`),
+    * the kind of its type (:attr:`type_kind_ids`),
+    * the file in which it is located (:attr:`file_ids`, an index into
+      :attr:`file_names`, ``-1`` when it is not located in any file),
+    * the raw contents of the node (a ``CXCursor``), from which the node is
+      created when it is needed (:meth:`node()`).
+    """
+
+    def __init__(self, tu):
+        """
+        :param cindex.TranslationUnit tu: Translation unit to be captured.
+        """
+        self.kind_ids = array('i')
+        self.parents = array('i')
+        self.subtree_ends = array('i')
+        self.start_offsets = array('i')
+        self.end_offsets = array('i')
+        self.spelling_ids = array('i')
+        self.type_kind_ids = array('i')
+        self.file_ids = array('i')
+        self.spellings = []
+        self.file_names = []
+        self._tu = tu
+        # Raw contents of the nodes (_CURSOR_SIZE bytes per node).
+        self._raw_nodes = bytearray()
+        # ID of the spelling of nodes whose spelling was returned as None.
+        self._none_spelling_id = -1
+        self._top_level_indexes_by_key = None
+        self._indexes_by_key = None
+        self._build(tu)
+
+    def __len__(self):
+        return len(self.kind_ids)
+
+    def node(self, i):
+        """Returns the `i`-th node (``cindex.Cursor``).
+
+        A new node is created upon every call. Its spelling is taken from the
+        snapshot, so it is not obtained from libclang again.
+        """
+        node = self._raw_node(i)
+        node._tu = self._tu
+        spelling_id = self.spelling_ids[i]
+        node._spelling = None if spelling_id == self._none_spelling_id \
+            else self.spellings[spelling_id]
+        node._ast_index = i
+        return node
+
+    def index_of(self, node):
+        """Returns the index of the given node or ``None`` if the node is not
+        a part of the snapshot.
+        """
+        index = getattr(node, '_ast_index', None)
+        if index is not None:
+            return index
+
+        # The node was obtained in another way than from the snapshot (e.g. by
+        # node.get_children()), so find it by its key. Such nodes are mostly
+        # top-level nodes (e.g. functions), so try them first to avoid
+        # computing keys of all the nodes.
+        key = _get_node_key(node)
+        if self._top_level_indexes_by_key is None:
+            self._top_level_indexes_by_key = self._build_indexes_by_key(
+                i for i, parent in enumerate(self.parents) if parent == -1
+            )
+        index = self._top_level_indexes_by_key.get(key)
+        if index is not None:
+            return index
+        if self._indexes_by_key is None:
+            self._indexes_by_key = self._build_indexes_by_key(
+                range(len(self))
+            )
+        return self._indexes_by_key.get(key)
+
+    @memoize
+    def indexes_of_kinds(self, kind_ids):
+        """Returns indexes of nodes of the given kinds in pre-order (`list`).
+
+        :param frozenset kind_ids: IDs of the kinds.
+        """
+        return [i for i, kind_id in enumerate(self.kind_ids)
+                if kind_id in kind_ids]
+
+    def spelling(self, i):
+        """Returns the spelling of the `i`-th node."""
+        return self.spellings[self.spelling_ids[i]]
+
+    def children(self, i):
+        """Returns indexes of children of the `i`-th node."""
+        children = []
+        j = i + 1
+        end = self.subtree_ends[i]
+        while j < end:
+            children.append(j)
+            j = self.subtree_ends[j]
+        return children
+
+    def children_from_same_file(self, i):
+        """Returns indexes of children of the `i`-th node that are located in
+        the same file as the node.
+        """
+        file_id = self.file_ids[i]
+        if file_id == -1:
+            return []
+        return [j for j in self.children(i) if self.file_ids[j] == file_id]
+
+    def subtree_from_same_file(self, i):
+        """Returns indexes of nodes from the subtree of the `i`-th node
+        (including the node) in pre-order.
+
+        A child that is not located in the same file as its parent is skipped
+        together with its subtree.
+        """
+        subtree = [i]
+        file_ids = self.file_ids
+        subtree_ends = self.subtree_ends
+        # All the nodes in the subtree that are not skipped are from the same
+        # file as the i-th node, so it suffices to compare with its file.
+        file_id = file_ids[i]
+        if file_id == -1:
+            return subtree
+        j = i + 1
+        end = subtree_ends[i]
+        while j < end:
+            if file_ids[j] == file_id:
+                subtree.append(j)
+                j += 1
+            else:
+                j = subtree_ends[j]
+        return subtree
+
+    def _build_indexes_by_key(self, indexes):
+        """Builds a mapping of keys of nodes with the given indexes into their
+        indexes.
+        """
+        indexes_by_key = {}
+        for i in indexes:
+            indexes_by_key.setdefault(_get_node_key(self._raw_node(i)), i)
+        return indexes_by_key
+
+    def _raw_node(self, i):
+        """Returns the `i`-th node without any cached information."""
+        return cindex.Cursor.from_buffer_copy(self._raw_nodes, i * _CURSOR_SIZE)
+
+    def _raw_node_bytes(self, i):
+        """Returns the raw contents of the `i`-th node (`bytes`)."""
+        return bytes(self._raw_nodes[i * _CURSOR_SIZE:(i + 1) * _CURSOR_SIZE])
+
+    def _build(self, tu):
+        main_file_name = tu.spelling
+        tu_kind_id = cindex.CursorKind.TRANSLATION_UNIT.value
+        spelling_ids = {}
+        # Files are identified by their names, which are obtained only once
+        # per file pointer.
+        file_ids_by_name = {}
+        file_ids = {}
+        # A stack of indexes of the ancestors of the currently visited node
+        # and a mapping of the ancestors (as raw bytes) into their positions
+        # in the stack.
+        ancestors = []
+        ancestor_positions = {}
+        lib = cindex.conf.lib
+        # Conversions of arguments are slower than the call itself, so let
+        # the arguments be passed as they are.
+        get_instantiation_location = get_raw_func(
+            'clang_getInstantiationLocation', None, None
+        )
+        get_cursor_type = get_raw_func(
+            'clang_getCursorType', (cindex.Cursor,), cindex.Type
+        )
+        file, offset = c_void_p(), c_uint()
+        file_ref, offset_ref = byref(file), byref(offset)
+
+        def get_file_id(file_ptr):
+            if file_ptr is None:
+                return -1
+            file_id = file_ids.get(file_ptr)
+            if file_id is None:
+                file_name = cindex.File(cast(file, cindex.c_object_p)).name
+                file_id = file_ids_by_name.get(file_name)
+                if file_id is None:
+                    file_id = len(self.file_names)
+                    file_ids_by_name[file_name] = file_id
+                    self.file_names.append(file_name)
+                file_ids[file_ptr] = file_id
+            return file_id
+
+        def get_parent_position(parent):
+            if parent._kind_id == tu_kind_id:
+                return -1
+            position = ancestor_positions.get(bytes(parent))
+            if position is not None:
+                return position
+            # The parent is not bitwise equal to the node that was visited,
+            # so let libclang compare them.
+            for position in reversed(range(len(ancestors))):
+                if self._raw_node(ancestors[position]) == parent:
+                    return position
+            return -1
+
+        def visit(node, parent, _):
+            raw_node = bytes(node)
+            if raw_node == bytes(parent):
+                # When the children are visited recursively, some nodes (e.g.
+                # constant expressions in case statements) are visited twice.
+                # Skip the second visit, so the children of the node are the
+                # same as when obtained by node.get_children().
+                return 2
+
+            parent_position = get_parent_position(parent)
+            while len(ancestors) > parent_position + 1:
+                i = ancestors.pop()
+                del ancestor_positions[self._raw_node_bytes(i)]
+                self.subtree_ends[i] = len(self)
+
+            extent = lib.clang_getCursorExtent(node)
+            get_instantiation_location(
+                lib.clang_getRangeStart(extent),
+                file_ref, None, None, offset_ref
+            )
+            file_id = get_file_id(file.value)
+            if not ancestors and (file_id == -1 or
+                                  self.file_names[file_id] != main_file_name):
+                # A top-level node from another file.
+                return 1
+            start_offset = offset.value
+            get_instantiation_location(
+                lib.clang_getRangeEnd(extent),
+                file_ref, None, None, offset_ref
+            )
+            end_offset = offset.value
+
+            # An empty spelling is returned as None.
+            spelling = lib.clang_getCursorSpelling(node)
+            spelling_id = spelling_ids.get(spelling)
+            if spelling_id is None:
+                spelling_id = len(self.spellings)
+                spelling_ids[spelling] = spelling_id
+                self.spellings.append(spelling or '')
+                if spelling is None:
+                    self._none_spelling_id = spelling_id
+
+            # Only the raw contents of the node are stored, not the node
+            # itself. A node object (and its cached information) would occupy
+            # several times more memory than all the arrays together.
+            index = len(self)
+            self.kind_ids.append(node._kind_id)
+            self.parents.append(ancestors[-1] if ancestors else -1)
+            self.subtree_ends.append(-1)
+            self.start_offsets.append(start_offset)
+            self.end_offsets.append(end_offset)
+            self.spelling_ids.append(spelling_id)
+            self.type_kind_ids.append(get_cursor_type(node)._kind_id)
+            self.file_ids.append(file_id)
+            self._raw_nodes += raw_node
+            ancestor_positions[raw_node] = len(ancestors)
+            ancestors.append(index)
+            return 2
+
+        # Exceptions raised in the callback are not propagated by ctypes, so
+        # remember them, stop the traversal, and re-raise them afterwards.
+        errors = []
+
+        def visit_or_stop(node, parent, data):
+            try:
+                return visit(node, parent, data)
+            except Exception as ex:
+                errors.append(ex)
+                return 0
+
+        lib.clang_visitChildren(
+            tu.cursor, cindex.callbacks['cursor_visit'](visit_or_stop), []
+        )
+        if errors:
+            raise errors[0]
+        for i in ancestors:
+            self.subtree_ends[i] = len(self)
+
+
+def _get_node_key(node):
+    """Returns a key identifying the given node.
+
+    Unlike ``clang_equalCursors()``, the key does not depend on the way in
+    which the node was obtained. For example, a statement obtained from its
+    parent by ``node.get_children()`` does not know in which declaration it is
+    located, while the same statement visited recursively does.
+    """
+    # Statements and expressions are identified by data[1] (data[0] is the
+    # declaration in which they are located), other nodes by data[0] and
+    # data[1]. The fields are read through the ctypes structure of the cursor,
+    # so the key does not depend on its memory layout.
+    data = node.data
+    if _is_stmt_or_expr_kind(node._kind_id):
+        return node._kind_id, data[1]
+    return node._kind_id, data[0], data[1]
+
+
+@memoize
+def _is_stmt_or_expr_kind(kind_id):
+    kind = cindex.CursorKind.from_id(kind_id)
+    return kind.is_statement() or kind.is_expression()
+
+
+#: Size of the raw contents of a node (``CXCursor``).
+_CURSOR_SIZE = sizeof(cindex.Cursor)
+
+
+def get_ast_snapshot(tu):
+    """Returns a snapshot of the AST of the given translation unit.
+
+    The snapshot is built only once per translation unit.
+    """
+    snapshot = getattr(tu, '_ast_snapshot', None)
+    if snapshot is None:
+        snapshot = tu._ast_snapshot = AstSnapshot(tu)
+    return snapshot
+
+
+def locate_node(node):
+    """Returns a pair ``(snapshot, index)`` of the given node in the snapshot
+    of its translation unit or ``None`` if the node is not a part of the
+    snapshot.
+    """
+    tu = getattr(node, '_tu', None)
+    if tu is None:
+        return None
+    snapshot = get_ast_snapshot(tu)
+    index = snapshot.index_of(node)
+    if index is None:
+        return None
+    return snapshot, index
@@ -0,0 +1,129 @@
+"""
+    Modules parsed without bodies of functions.
+"""
+
+import re
+
+from clang import cindex
+
+from regression_tests.parsers.c_parser.function import Function
+from regression_tests.parsers.c_parser.module import Module
+from regression_tests.parsers.c_parser.utils import get_parse_errors
+from regression_tests.parsers.c_parser.utils import print_parse_errors
+from regression_tests.utils import memoize
+from regression_tests.utils.list import NamedObjectList
+
+
+class DeclarationsOnlyModule(Module):
+    """A module whose code was parsed without bodies of functions.
+
+    Queries about top-level declarations (e.g. names of functions, global
+    variables, or structures) are answered from the parsed declarations.
+    Queries that need bodies of functions (e.g. called functions or loops) are
+    answered by a module parsed with the bodies, which is created when it is
+    needed for the first time.
+    """
+
+    def __new__(cls, code, tu, print_errors=False):
+        """Constructs a new C code parsed without bodies of functions.
+
+        :param str code: The original C code.
+        :param clang.TranslationUnit tu: The underlying translation unit
+                                         (without bodies of functions).
+        :param bool print_errors: Should parse errors be printed when the code
+                                  is parsed with the bodies?
+        """
+        return Module.__new__(cls, code, tu)
+
+    def __init__(self, code, tu, print_errors=False):
+        """
+        :param str code: The original C code.
+        :param clang.TranslationUnit tu: The underlying translation unit
+                                         (without bodies of functions).
+        :param bool print_errors: Should parse errors be printed when the code
+                                  is parsed with the bodies?
+        """
+        super().__init__(code, tu)
+        self._print_errors = print_errors
+
+    @property
+    @memoize
+    def _full_module(self):
+        """The module parsed with bodies of functions (the code is parsed when
+        it is needed for the first time).
+        """
+        module = parse(self._code, self.file_name, skip_function_bodies=False)
+        if self._print_errors:
+            # Errors outside of bodies of functions have already been printed.
+            printed_errors = set(get_parse_errors(self._tu.diagnostics))
+            parse_errors = [
+                error for error in get_parse_errors(module._tu.diagnostics)
+                if error not in printed_errors
+            ]
+            if parse_errors:
+                print_parse_errors(parse_errors, self.file_name)
+        return module
+
+    def has_parse_errors(self):
+        # There may be errors in the skipped bodies.
+        return self._full_module.has_parse_errors()
+
+    @property
+    @memoize
+    def funcs(self):
+        func_nodes = self._top_level_nodes[cindex.CursorKind.FUNCTION_DECL]
+        return NamedObjectList(
+            DeclarationsOnlyFunction(self, node) for node in func_nodes
+        )
+
+    @property
+    def string_literal_values(self):
+        return self._full_module.string_literal_values
+
+    def find_all(self, query):
+        return self._full_module.find_all(query)
+
+    @property
+    @memoize
+    def _encoded_code(self):
+        """The code in the encoding that was passed to libclang (`bytes`)."""
+        return self._code.encode('utf-8')
+
+    def _is_func_definition(self, node):
+        # libclang considers functions with skipped bodies to be just
+        # declarations, so check that the function is followed by a body.
+        # Offsets from libclang are offsets into the encoded code.
+        return _BODY_START_RE.match(
+            self._encoded_code, node.extent.end.offset
+        ) is not None
+
+
+class DeclarationsOnlyFunction(Function):
+    """A function from a module parsed without bodies of functions.
+
+    Queries that need the body of the function are answered from the function
+    in the module parsed with the bodies.
+    """
+
+    __slots__ = ('_module',)
+
+    def __init__(self, module, node):
+        """
+        :param DeclarationsOnlyModule module: Module containing the function.
+        :param node: Internal node representing the function (without its
+                     body).
+        """
+        self._module = module
+        super().__init__(node)
+
+    @property
+    def _body_node(self):
+        return self._module._full_module.funcs[self.name]._node
+
+
+# The beginning of a body of a function, which may be preceded by whitespace
+# and comments.
+_BODY_START_RE = re.compile(rb'(?:\s+|/\*.*?\*/|//[^\n]*)*{', re.DOTALL)
+
+
+from regression_tests.parsers.c_parser import parse
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.binary_ops.binary_op_expr import Bi
 class AddOpExpr(BinaryOpExpr):
     """An add operator (``+``)."""
 
+    __slots__ = ()
+
     def is_add_op(self):
         """Returns ``True``."""
         return True
@@ -9,6 +9,8 @@ from regression_tests.parsers.c_parser.utils import remove_whitespace
 class AssignOpExpr(BinaryOpExpr):
     """An assignment operator (``=``)."""
 
+    __slots__ = ()
+
     def is_assign_op(self):
         """Returns ``True``."""
         return True
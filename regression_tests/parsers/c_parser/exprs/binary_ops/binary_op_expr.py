@@ -3,7 +3,7 @@
 """
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
-from regression_tests.parsers.c_parser.utils import nth_item
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.parsers.c_parser.utils import remove_whitespace
 from regression_tests.parsers.c_parser.utils import string_from_tokens
 
@@ -11,16 +11,18 @@ from regression_tests.parsers.c_parser.utils import string_from_tokens
 class BinaryOpExpr(Expression):
     """A base class for all binary operators."""
 
+    __slots__ = ()
+
     @property
     def lhs(self):
         """Expression on the left side of operator (:class:`.Expression`)."""
-        return Expression._from_clang_node(next(self._node.get_children()))
+        return Expression._from_clang_node(get_children(self._node)[0])
 
     @property
     def rhs(self):
         """Expression on the right side of operator (:class:`.Expression`)."""
         return Expression._from_clang_node(
-            nth_item(1, self._node.get_children()))
+            get_children(self._node)[1])
 
     def __eq__(self, other):
         if isinstance(other, str):
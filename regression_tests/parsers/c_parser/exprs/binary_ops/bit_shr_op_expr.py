@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.binary_ops.binary_op_expr import Bi
 class BitShrOpExpr(BinaryOpExpr):
     """A bit right shift operator (``>>``)."""
 
+    __slots__ = ()
+
     def is_bit_shr_op(self):
         """Returns ``True``."""
         return True
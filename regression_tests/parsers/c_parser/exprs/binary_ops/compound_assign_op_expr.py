@@ -4,6 +4,7 @@
 """
 
 from regression_tests.parsers.c_parser.exprs.binary_ops.binary_op_expr import BinaryOpExpr
+from regression_tests.parsers.c_parser.utils import get_operator_token
 from regression_tests.parsers.c_parser.utils import remove_whitespace
 from regression_tests.utils import memoize
 
@@ -13,6 +14,8 @@ class CompoundAssignOpExpr(BinaryOpExpr):
     >>=``).
     """
 
+    __slots__ = ()
+
     def is_compound_assign_op(self):
         """Returns ``True``."""
         return True
@@ -25,6 +28,9 @@ class CompoundAssignOpExpr(BinaryOpExpr):
     @property
     @memoize
     def _operator(self):
+        operator = get_operator_token(self._node)
+        if operator is not None:
+            return operator[0]
         return list(self._node.get_tokens())[1].spelling
 
     def __str__(self):
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.binary_ops.binary_op_expr import Bi
 class GtEqOpExpr(BinaryOpExpr):
     """A greater than or equal operator (``>=``)."""
 
+    __slots__ = ()
+
     def is_gt_eq_op(self):
         """Returns ``True``."""
         return True
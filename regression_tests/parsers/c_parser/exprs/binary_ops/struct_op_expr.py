@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.binary_ops.binary_op_expr import Bi
 class StructOpExpr(BinaryOpExpr):
     """A base class for structure operators."""
 
+    __slots__ = ()
+
     @property
     def lhs(self):
         return next(self._node.get_tokens()).spelling
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.binary_ops.struct_op_expr import St
 class StructRefOpExpr(StructOpExpr):
     """A structure reference operator (``.``)."""
 
+    __slots__ = ()
+
     def is_struct_ref_op(self):
         """Returns ``True``."""
         return True
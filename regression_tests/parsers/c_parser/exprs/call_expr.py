@@ -3,6 +3,7 @@
 """
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.parsers.c_parser.utils import remove_whitespace
 from regression_tests.parsers.c_parser.utils import string_from_tokens
 
@@ -10,6 +11,8 @@ from regression_tests.parsers.c_parser.utils import string_from_tokens
 class CallExpr(Expression):
     """A call expression."""
 
+    __slots__ = ()
+
     def is_call(self):
         """Returns ``True``."""
         return True
@@ -26,8 +29,7 @@ class CallExpr(Expression):
     @property
     def args(self):
         """Arguments of the call expression (tuple of :class:`.Expression`)."""
-        children = self._node.get_children()
-        next(children)  # Advance to the second child.
+        children = get_children(self._node)[1:]  # Skip the called function.
         return tuple(map(Expression._from_clang_node, children))
 
     def __eq__(self, other):
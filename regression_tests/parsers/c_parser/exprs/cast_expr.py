@@ -11,6 +11,8 @@ from regression_tests.parsers.c_parser.utils import string_from_tokens
 class CastExpr(Expression):
     """A cast expression."""
 
+    __slots__ = ()
+
     def is_cast(self):
         """Returns ``True``."""
         return True
@@ -8,6 +8,7 @@ from abc import abstractmethod
 from clang import cindex
 
 from regression_tests.parsers.c_parser.utils import first_child_node
+from regression_tests.parsers.c_parser.utils import get_operator_token
 from regression_tests.parsers.c_parser.utils import has_token
 from regression_tests.parsers.c_parser.utils import has_token_in_position
 
@@ -15,6 +16,8 @@ from regression_tests.parsers.c_parser.utils import has_token_in_position
 class Expression(metaclass=ABCMeta):
     """A base class of all expressions."""
 
+    __slots__ = ('_node', '_memoize_cache')
+
     def __init__(self, node):
         """
         :param node: Internal node representing the expression.
@@ -206,6 +209,11 @@ class Expression(metaclass=ABCMeta):
         elif node.kind == cindex.CursorKind.COMPOUND_ASSIGNMENT_OPERATOR:
             return CompoundAssignOpExpr(node)
         elif node.kind == cindex.CursorKind.BINARY_OPERATOR:
+            op_expr_class = _get_op_expr_class(node, {}, _BINARY_OP_EXPRS)
+            if op_expr_class is not None:
+                return op_expr_class(node)
+            # The operator could not be located (e.g. because the expression
+            # comes from a macro expansion), so search for it in the tokens.
             if has_token(node, '='):
                 return AssignOpExpr(node)
             elif has_token(node, '=='):
@@ -249,6 +257,9 @@ class Expression(metaclass=ABCMeta):
         elif node.kind == cindex.CursorKind.ARRAY_SUBSCRIPT_EXPR:
             return ArrayIndexOpExpr(node)
         elif node.kind == cindex.CursorKind.MEMBER_REF_EXPR:
+            op_expr_class = _get_op_expr_class(node, {}, _STRUCT_OP_EXPRS)
+            if op_expr_class is not None:
+                return op_expr_class(node)
             if has_token(node, '.'):
                 return StructRefOpExpr(node)
             elif has_token(node, '->'):
@@ -256,6 +267,11 @@ class Expression(metaclass=ABCMeta):
 
         # Unary operators.
         elif node.kind == cindex.CursorKind.UNARY_OPERATOR:
+            op_expr_class = _get_op_expr_class(
+                node, _PREFIX_UNARY_OP_EXPRS, _POSTFIX_UNARY_OP_EXPRS
+            )
+            if op_expr_class is not None:
+                return op_expr_class(node)
             if has_token(node, '!'):
                 return NotOpExpr(node)
             elif has_token(node, '-'):
@@ -302,6 +318,24 @@ class Expression(metaclass=ABCMeta):
         return node
 
 
+def _get_op_expr_class(node, prefix_op_exprs, op_exprs):
+    """Returns a class of the operator expression represented by the given
+    node or ``None`` when the operator cannot be located or is not supported.
+
+    :param dict prefix_op_exprs: Classes of operator expressions by operators
+                                 that precede all the operands.
+    :param dict op_exprs: Classes of operator expressions by operators that
+                          follow the first operand.
+    """
+    operator = get_operator_token(node)
+    if operator is None:
+        return None
+    spelling, precedes_operands = operator
+    if precedes_operands:
+        return prefix_op_exprs.get(spelling)
+    return op_exprs.get(spelling)
+
+
 #: Nodes that cannot be converted into expressions.
 _UNCONVERTABLE_NODES = [
     cindex.CursorKind.UNEXPOSED_EXPR,
@@ -352,3 +386,50 @@ from regression_tests.parsers.c_parser.exprs.unary_ops.post_increment_op_expr im
 from regression_tests.parsers.c_parser.exprs.unary_ops.pre_decrement_op_expr import PreDecrementOpExpr
 from regression_tests.parsers.c_parser.exprs.unary_ops.pre_increment_op_expr import PreIncrementOpExpr
 from regression_tests.parsers.c_parser.types.type import Type
+
+
+#: Binary operator expressions by their operators.
+_BINARY_OP_EXPRS = {
+    '=': AssignOpExpr,
+    '==': EqOpExpr,
+    '!=': NeqOpExpr,
+    '>': GtOpExpr,
+    '>=': GtEqOpExpr,
+    '<': LtOpExpr,
+    '<=': LtEqOpExpr,
+    '+': AddOpExpr,
+    '-': SubOpExpr,
+    '*': MulOpExpr,
+    '%': ModOpExpr,
+    '/': DivOpExpr,
+    '&&': AndOpExpr,
+    '||': OrOpExpr,
+    '&': BitAndOpExpr,
+    '|': BitOrOpExpr,
+    '^': BitXorOpExpr,
+    '<<': BitShlOpExpr,
+    '>>': BitShrOpExpr,
+    ',': CommaOpExpr,
+}
+
+#: Structure operator expressions by their operators.
+_STRUCT_OP_EXPRS = {
+    '.': StructRefOpExpr,
+    '->': StructDerefOpExpr,
+}
+
+#: Unary operator expressions by their operators preceding the operand.
+_PREFIX_UNARY_OP_EXPRS = {
+    '!': NotOpExpr,
+    '-': NegOpExpr,
+    '&': AddressOpExpr,
+    '*': DerefOpExpr,
+    '++': PreIncrementOpExpr,
+    '--': PreDecrementOpExpr,
+}
+
+#: Unary operator expressions by their operators following the operand.
+_POSTFIX_UNARY_OP_EXPRS = {
+    '++': PostIncrementOpExpr,
+    '--': PostDecrementOpExpr,
+}
@@ -3,6 +3,7 @@
 """
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
+from regression_tests.parsers.c_parser.utils import get_children
 
 
 class InitListExpr(Expression):
@@ -19,10 +20,12 @@ class InitListExpr(Expression):
     :raises IndexError: When the initializer is empty.
     """
 
+    __slots__ = ()
+
     @property
     def values(self):
         """A list of values in the initializer expression."""
-        return list(map(self._from_clang_node, self._node.get_children()))
+        return list(map(self._from_clang_node, get_children(self._node)))
 
     def __getitem__(self, item):
         return self.values[item]
@@ -9,6 +9,8 @@ from regression_tests.parsers.c_parser.utils import first_token
 class CharacterLiteral(Literal):
     """A character literal."""
 
+    __slots__ = ()
+
     @property
     def value(self):
         """Value of the literal (`str`)."""
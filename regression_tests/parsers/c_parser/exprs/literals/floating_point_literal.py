@@ -16,6 +16,8 @@ class FloatingPointLiteral(Literal):
     It represents literals of all floating-point types.
     """
 
+    __slots__ = ()
+
     @property
     def value(self):
         """Value of the literal (`float`)."""
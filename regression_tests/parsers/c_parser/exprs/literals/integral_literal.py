@@ -16,6 +16,8 @@ class IntegralLiteral(Literal):
     It represents literals of all integral types.
     """
 
+    __slots__ = ()
+
     @property
     def value(self):
         """Value of the literal (`int`)."""
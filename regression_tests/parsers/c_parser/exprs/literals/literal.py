@@ -10,6 +10,8 @@ from regression_tests.parsers.c_parser.exprs.expression import Expression
 class Literal(Expression):
     """A literal (a constant)."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def value(self):
@@ -11,9 +11,11 @@ from regression_tests.parsers.c_parser.utils import first_token
 class StringLiteral(Literal):
     """A string literal."""
 
+    __slots__ = ()
+
     @property
     def value(self):
         """Value of the literal (`str`)."""
-        # Remove a wide-string-literal prefix (L, if any) and strip the leading
-        # and ending quotes (").
-        return re.sub(r'L?"(.*)"', r'\1', first_token(self._node).spelling)
+        # Remove an encoding prefix (u8, u, U, or L, if any) and strip the
+        # leading and ending quotes (").
+        return re.sub(r'(?:u8|u|U|L)?"(.*)"', r'\1', first_token(self._node).spelling)
@@ -3,7 +3,7 @@
 """
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
-from regression_tests.parsers.c_parser.utils import nth_item
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.parsers.c_parser.utils import remove_whitespace
 from regression_tests.parsers.c_parser.utils import string_from_tokens
 
@@ -11,6 +11,8 @@ from regression_tests.parsers.c_parser.utils import string_from_tokens
 class TernaryOpExpr(Expression):
     """A ternary operator (?:)."""
 
+    __slots__ = ()
+
     def is_ternary_op(self):
         """Returns ``True``."""
         return True
@@ -18,19 +20,19 @@ class TernaryOpExpr(Expression):
     @property
     def cond(self):
         """Condition of the ternary operator (:class:`.Expression`)."""
-        return Expression._from_clang_node(next(self._node.get_children()))
+        return Expression._from_clang_node(get_children(self._node)[0])
 
     @property
     def true_value(self):
         """True value of the ternary operator (:class:`.Expression`)."""
         return Expression._from_clang_node(
-            nth_item(1, self._node.get_children()))
+            get_children(self._node)[1])
 
     @property
     def false_value(self):
         """False value of the ternary operator (:class:`.Expression`)."""
         return Expression._from_clang_node(
-            nth_item(2, self._node.get_children()))
+            get_children(self._node)[2])
 
     def __eq__(self, other):
         if isinstance(other, str):
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.unary_ops.unary_op_expr import Unar
 class AddressOpExpr(UnaryOpExpr):
     """An address operator (``&``)."""
 
+    __slots__ = ()
+
     def is_address_op(self):
         """Returns ``True``."""
         return True
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.unary_ops.unary_op_expr import Unar
 class DerefOpExpr(UnaryOpExpr):
     """A dereference operator (``*``)."""
 
+    __slots__ = ()
+
     def is_deref_op(self):
         """Returns ``True``."""
         return True
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.unary_ops.unary_op_expr import Unar
 class NotOpExpr(UnaryOpExpr):
     """A not operator (``!``)."""
 
+    __slots__ = ()
+
     def is_not_op(self):
         """Returns ``True``."""
         return True
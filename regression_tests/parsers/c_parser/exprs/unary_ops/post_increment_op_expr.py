@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.unary_ops.unary_op_expr import Unar
 class PostIncrementOpExpr(UnaryOpExpr):
     """A post increment operator (``i++``)."""
 
+    __slots__ = ()
+
     def is_post_increment_op(self):
         """Returns ``True``."""
         return True
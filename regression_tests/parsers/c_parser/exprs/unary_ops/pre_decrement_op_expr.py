@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.exprs.unary_ops.unary_op_expr import Unar
 class PreDecrementOpExpr(UnaryOpExpr):
     """A pre decrement operator (``--i``)."""
 
+    __slots__ = ()
+
     def is_pre_decrement_op(self):
         """Returns ``True``."""
         return True
@@ -11,6 +11,8 @@ from regression_tests.parsers.c_parser.utils import string_from_tokens
 class UnaryOpExpr(Expression):
     """A base class for all unary operators."""
 
+    __slots__ = ()
+
     @property
     def op(self):
         """Operand (:class:`.Expression`)."""
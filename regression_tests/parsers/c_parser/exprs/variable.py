@@ -5,6 +5,7 @@
 from clang import cindex
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.parsers.c_parser.utils import is_array_kind
 from regression_tests.parsers.c_parser.utils import remove_whitespace
 
@@ -12,6 +13,8 @@ from regression_tests.parsers.c_parser.utils import remove_whitespace
 class Variable(Expression):
     """A variable."""
 
+    __slots__ = ()
+
     @property
     def name(self):
         """Name of the variable (`str`)."""
@@ -28,7 +31,7 @@ class Variable(Expression):
             int i = 1;  // The initializer is 1.
             int j;      // No initializer.
         """
-        children = list(self._node.get_children())
+        children = get_children(self._node)
         if self._no_children_or_only_one_that_is_not_initializer(children):
             return None
         return Expression._from_clang_node(children[-1])
@@ -3,19 +3,20 @@
 """
 
 import sys
-from functools import partial
 
 from clang import cindex
 
+from regression_tests.parsers.c_parser.ast_snapshot import locate_node
 from regression_tests.parsers.c_parser.exprs.expression import Expression
 from regression_tests.parsers.c_parser.exprs.variable import Variable
 from regression_tests.parsers.c_parser.stmts.statement import Statement
 from regression_tests.parsers.c_parser.types.type import Type
 from regression_tests.parsers.c_parser.utils import IdentifiedObjectList
-from regression_tests.parsers.c_parser.utils import from_same_file
+from regression_tests.parsers.c_parser.utils import get_children_from_same_file
 from regression_tests.parsers.c_parser.utils import get_set_of_names
 from regression_tests.parsers.c_parser.utils import remove_whitespace
 from regression_tests.parsers.c_parser.utils import underline
+from regression_tests.parsers.c_parser.utils import unify_called_func_name
 from regression_tests.parsers.c_parser.utils import visit_node
 from regression_tests.utils import memoize
 from regression_tests.utils.list import NamedObjectList
@@ -27,22 +28,18 @@ from regression_tests.utils.list import names_to_set
 class Function:
     """A function."""
 
+    __slots__ = (
+        '_node', '_assignments', '_for_loops', '_while_loops',
+        '_do_while_loops', '_if_stmts', '_var_def_stmts', '_return_stmts',
+        '_empty_stmts', '_switch_stmts', '_goto_stmts', '_labels',
+        '_memoize_cache'
+    )
+
     def __init__(self, node):
         """
         :param node: Internal node representing the function.
         """
         self._node = node
-        self._assignments = []
-        self._for_loops = []
-        self._while_loops = []
-        self._do_while_loops = []
-        self._if_stmts = []
-        self._var_def_stmts = []
-        self._return_stmts = []
-        self._empty_stmts = []
-        self._switch_stmts = []
-        self._goto_stmts = []
-        self._labels = []
 
     @property
     def name(self):
@@ -169,15 +166,30 @@ class Function:
         """
         calls = set()
 
+        located = locate_node(self._body_node)
+        if located is not None:
+            # Work directly with the columns of the snapshot, so no nodes have
+            # to be touched.
+            snapshot, i = located
+            call_expr_kind_id = cindex.CursorKind.CALL_EXPR.value
+            for j in snapshot.subtree_from_same_file(i):
+                if snapshot.kind_ids[j] == call_expr_kind_id:
+                    # There may be empty function names in the presence of
+                    # errors. We do not want to consider these as calls.
+                    name = snapshot.spelling(j)
+                    if name:
+                        calls.add(unify_called_func_name(name))
+            return calls
+
         def add_to_calls_if_call(node):
             if node.kind == cindex.CursorKind.CALL_EXPR:
                 # There may be empty function names in the presence of errors.
                 # We do not want to consider these as calls, so ensure that the
                 # spelling (= function name) is non-empty.
                 if node.spelling:
-                    calls.add(self._unify_called_func_name(node.spelling))
+                    calls.add(unify_called_func_name(node.spelling))
 
-        visit_node(self._node, add_to_calls_if_call)
+        visit_node(self._body_node, add_to_calls_if_call)
 
         return calls
 
@@ -584,6 +596,34 @@ class Function:
         self._parse_function_body()
         return IdentifiedObjectList(self._labels)
 
+    @memoize
+    def find_all(self, query):
+        """Returns nodes inside the function's body found by the given query
+        (a `list` of :class:`.Statement` or :class:`.Expression`, depending on
+        the query).
+
+        :param query: The query (see :mod:`.query`).
+
+        Example:
+
+        .. code-block:: python
+
+            func.find_all(calls('printf').with_arg(0, string_literals('%d')))
+        """
+        located = locate_node(self._body_node)
+        if located is None:
+            return []
+        snapshot, i = located
+        return query._find(self._body_node._tu, i + 1, snapshot.subtree_ends[i])
+
+    def has_any(self, query):
+        """Is there at least one node inside the function's body found by the
+        given query?
+
+        :param query: The query (see :mod:`.query`).
+        """
+        return bool(self.find_all(query))
+
     def dump(self):
         """Dumps information about the function to ``stdout``.
 
@@ -653,6 +693,20 @@ class Function:
 
     @memoize
     def _parse_function_body(self):
+        # The lists are created only when the body is parsed because many
+        # functions are never queried for their statements.
+        self._assignments = []
+        self._for_loops = []
+        self._while_loops = []
+        self._do_while_loops = []
+        self._if_stmts = []
+        self._var_def_stmts = []
+        self._return_stmts = []
+        self._empty_stmts = []
+        self._switch_stmts = []
+        self._goto_stmts = []
+        self._labels = []
+
         def get_statement(node):
             try:
                 return Statement._from_clang_node(node)
@@ -684,11 +738,6 @@ class Function:
                     self._goto_stmts.append(statement)
             return statement
 
-        def get_children_from_same_file(node):
-            same_file_as_node = partial(from_same_file, node)
-            children = filter(same_file_as_node, node.get_children())
-            return list(children)
-
         def link_items(items_list):
             if len(items_list) > 1:
                 for i, stmt in enumerate(items_list[:-1]):
@@ -699,43 +748,38 @@ class Function:
             this_level_items = []
             for node in get_children_from_same_file(parent_node):
                 item = None
-                if node.kind == cindex.CursorKind.LABEL_STMT:
+                kind = node.kind
+                if kind == cindex.CursorKind.LABEL_STMT:
                     item = Label(node)
                     self._labels.append(item)
-                elif node.kind == cindex.CursorKind.BINARY_OPERATOR:
+                elif kind == cindex.CursorKind.BINARY_OPERATOR:
                     op = Expression._from_clang_node(node)
                     if op.is_assign_op():
                         self._assignments.append(op)
-                elif node.kind == cindex.CursorKind.COMPOUND_ASSIGNMENT_OPERATOR:
+                elif kind == cindex.CursorKind.COMPOUND_ASSIGNMENT_OPERATOR:
                     op = Expression._from_clang_node(node)
                     self._assignments.append(op)
-                else:
+                elif kind.is_statement():
+                    # Other nodes (e.g. expressions) cannot be statements, so
+                    # do not even try to create statements from them.
                     item = save_statement(node)
                 this_level_items.append(item)
                 visit_children(node)
             link_items(this_level_items)
 
         # Visit nodes from same file and link the statements together.
-        visit_children(self._node)
+        visit_children(self._body_node)
+
+    @property
+    def _body_node(self):
+        """Internal node representing the function, including its body."""
+        return self._node
 
     @property
     @memoize
     def _params_as_str(self):
         return ', '.join(map(lambda p: p.str_with_type(), self.params))
 
-    def _unify_called_func_name(self, name):
-        # We have to unify names of builtins, such as memset(). For example,
-        # memset() is sometimes parsed as memset() but sometimes as
-        # __builtin___memset_chk(). This makes our regression tests easier to
-        # write and read as we can assume that e.g. memset() is always memset()
-        # and not __builtin___memset_chk().
-        BUILTINS = {
-            '__builtin___memset_chk': 'memset',
-            '__builtin___memcpy_chk': 'memcpy',
-            '__builtin___memmove_chk': 'memmove',
-        }
-        return BUILTINS.get(name, name)
-
     def _search(self, items, property, items_name):
         if not items:
             raise AssertionError(
@@ -10,6 +10,7 @@ from clang import cindex
 
 from regression_tests.parsers.c_parser.comment import Comment
 from regression_tests.parsers.c_parser.include import Include
+from regression_tests.parsers.c_parser.token_table import get_token_table
 from regression_tests.parsers.c_parser.types.enum_type import EnumType
 from regression_tests.parsers.c_parser.types.struct_type import StructType
 from regression_tests.parsers.c_parser.types.union_type import UnionType
@@ -79,7 +80,7 @@ class Module(Text):
 
         When there is no such global variable, it raises ``IndexError``.
         """
-        var_nodes = filter(self._is_global_var, self._tu.cursor.get_children())
+        var_nodes = self._top_level_nodes[cindex.CursorKind.VAR_DECL]
         return NamedObjectList(map(Variable, var_nodes))
 
     @property
@@ -150,7 +151,7 @@ class Module(Text):
 
         :param var: Variable name or instance of :class:`.Variable`.
         """
-        return get_name(var) in self.global_var_names
+        return get_name(var) in self._global_vars_by_name
 
     @property
     @memoize
@@ -167,7 +168,7 @@ class Module(Text):
 
         When there is no such function, it raises ``IndexError``.
         """
-        func_nodes = filter(self._is_func, self._tu.cursor.get_children())
+        func_nodes = self._top_level_nodes[cindex.CursorKind.FUNCTION_DECL]
         return NamedObjectList(map(Function, func_nodes))
 
     @property
@@ -201,9 +202,9 @@ class Module(Text):
             raise AssertionError('at least one function name has to be given')
 
         for name in map(get_name, functions):
-            for func in self.funcs:
-                if func.name == name:
-                    return func
+            func = self._funcs_by_name.get(name)
+            if func is not None:
+                return func
 
         raise AssertionError('no such function')
 
@@ -256,7 +257,7 @@ class Module(Text):
 
     def has_func(self, name):
         """Is there a function with the given name (`str`)?"""
-        return name in self.func_names
+        return name in self._funcs_by_name
 
     def has_func_matching(self, regexp):
         """Is there a function with a name matching the given regular
@@ -274,11 +275,8 @@ class Module(Text):
     @memoize
     def comments(self):
         """Comments in the code (list of :class:`.Comment`)."""
-        comments = []
-        for token in self._tu.cursor.get_tokens():
-            if token.kind == cindex.TokenKind.COMMENT:
-                comments.append(Comment(token.spelling))
-        return comments
+        tokens = get_token_table(self._tu)
+        return [Comment(tokens.spellings[i]) for i in tokens.comment_indexes]
 
     def has_comment_matching(self, regexp):
         """Is there a comment matching the given regular expression?
@@ -306,13 +304,12 @@ class Module(Text):
         #
         # (2) file inclusions from self._tu.get_includes() have just
         #     absolute paths to the included files.
+        tokens = get_token_table(self._tu)
         includes = []
-        tokens = list(self._tu.cursor.get_tokens())
-        i = 0
-        while i < len(tokens):
-            include, i = self._try_read_next_include(tokens, i)
-            if include is not None:
-                includes.append(include)
+        for include_range in tokens.include_ranges:
+            # #  include  FILE
+            file = ''.join(tokens.spellings[i] for i in include_range[2:])
+            includes.append(Include('#include ' + file))
         return includes
 
     def has_include_of_file(self, file):
@@ -342,8 +339,8 @@ class Module(Text):
             values.add(StringLiteral(node).value)
 
         # We have to visit all the global variables and functions.
-        for node in self._tu.cursor.get_children():
-            if self._is_func(node) or self._is_global_var(node):
+        for kind in (cindex.CursorKind.FUNCTION_DECL, cindex.CursorKind.VAR_DECL):
+            for node in self._top_level_nodes[kind]:
                 visit_node(node, add_to_values_if_string_literal)
 
         return values
@@ -360,17 +357,20 @@ class Module(Text):
 
             module.has_string_literal('Result is: %d')
 
-        When the literal is not found in :attr:`string_literal_values`,
-        :func:`~regression_tests.parsers.text_parser.Text.contains()`
-        is called to check whether the literal exists in the
-        module. This behavior is needed because there may be a syntax error
-        near the string literal. In such cases, the literal is not present in
-        the module because the code that contains it is skipped during parsing.
+        When the literal is not found in :attr:`string_literal_values`, string
+        literals among the tokens of the module are checked. This behavior is
+        needed because there may be a syntax error near the string literal. In
+        such cases, the literal is not present in the module because the code
+        that contains it is skipped during parsing. Finally, comments are
+        checked for the literal enclosed in quotes.
         """
         if value in self.string_literal_values:
             return True
 
-        return self.contains('"{}"'.format(re.escape(value)))
+        if value in self._string_literal_token_values:
+            return True
+
+        return self._comments_contain('"{}"'.format(re.escape(value)))
 
     def has_string_literal_matching(self, regexp):
         """Is there a string literal matching the given regular expression?
@@ -378,17 +378,24 @@ class Module(Text):
         `regexp` can be either a string or a compiled regular expression.
         The standard function ``re.fullmatch()`` is used to perform the matching.
 
-        When the literal is not found in :attr:`string_literal_values`,
-        :func:`~regression_tests.parsers.text_parser.Text.contains()`
-        is called to check whether a matching literal exists
-        in the module. See the description of :func:`has_string_literal()` for
-        the reason.
+        When the literal is not found in :attr:`string_literal_values`, string
+        literals among the tokens of the module and comments are checked. See
+        the description of :func:`has_string_literal()` for the reason.
         """
         if self._has_string_literal_value_matching(regexp):
             return True
 
         return self._contains_string_literal_matching(regexp)
 
+    def has_identifier(self, name):
+        """Is there an identifier of the given name (`str`) in the code?
+
+        All identifiers in the code are considered (e.g. names of functions,
+        variables, types, or macros, also those in preprocessor directives).
+        Keywords are not identifiers.
+        """
+        return name in self._identifiers
+
     @property
     @memoize
     def structs(self):
@@ -397,7 +404,7 @@ class Module(Text):
         The returned type is plain list, not
         :class:`~regression_tests.utils.list.NamedObjectList`.
         """
-        struct_nodes = filter(self._is_struct, self._tu.cursor.get_children())
+        struct_nodes = self._top_level_nodes[cindex.CursorKind.STRUCT_DECL]
         return [StructType(node.type) for node in struct_nodes]
 
     @property
@@ -531,7 +538,7 @@ class Module(Text):
         The returned type is plain list, not
         :class:`~regression_tests.utils.list.NamedObjectList`.
         """
-        union_nodes = filter(self._is_union, self._tu.cursor.get_children())
+        union_nodes = self._top_level_nodes[cindex.CursorKind.UNION_DECL]
         return [UnionType(node.type) for node in union_nodes]
 
     @property
@@ -665,7 +672,7 @@ class Module(Text):
         The returned type is plain list, not
         :class:`~regression_tests.utils.list.NamedObjectList`.
         """
-        enum_nodes = filter(self._is_enum, self._tu.cursor.get_children())
+        enum_nodes = self._top_level_nodes[cindex.CursorKind.ENUM_DECL]
         return [EnumType(node.type, node) for node in enum_nodes]
 
     @property
@@ -796,10 +803,8 @@ class Module(Text):
     def enum_item_names(self):
         """Items in enums (list of `str`)."""
         enum_item_names = []
-        for node in self._tu.cursor.get_children():
-            if self._is_enum(node):
-                enum = EnumType(node.type, node)
-                enum_item_names += enum.item_names
+        for enum in self.enums:
+            enum_item_names += enum.item_names
         return enum_item_names
 
     @property
@@ -825,6 +830,32 @@ class Module(Text):
         """Are there no empty enums?"""
         return self.empty_enum_count == 0
 
+    @memoize
+    def find_all(self, query):
+        """Returns nodes found by the given query (a `list` of
+        :class:`.Function`, :class:`.Statement`, or :class:`.Expression`,
+        depending on the query).
+
+        :param query: The query (see :mod:`.query`).
+
+        Example:
+
+        .. code-block:: python
+
+            module.find_all(calls('printf').inside(loops()))
+
+        The results are memoized, so the query is evaluated only once per
+        module.
+        """
+        return query._find(self._tu)
+
+    def has_any(self, query):
+        """Is there at least one node found by the given query?
+
+        :param query: The query (see :mod:`.query`).
+        """
+        return bool(self.find_all(query))
+
     def dump(self, verbose=False):
         """Dumps information about the module to ``stdout``.
 
@@ -885,116 +916,88 @@ class Module(Text):
 
         stream.write('\n'.join(s))
 
-    def _is_global_var(self, node):
-        """Checks if the given node is a global variable.
+    @property
+    @memoize
+    def _top_level_nodes(self):
+        """Top-level nodes from the current file, classified by their kinds.
 
-        External global variables (coming from included headers) are not
-        considered to be global variables.
+        It is a dictionary mapping :data:`_TOP_LEVEL_KINDS` into lists of
+        nodes. All the nodes are classified in a single traversal of the
+        translation unit. Nodes coming from included files and function
+        declarations (i.e. functions without a body) are not included.
         """
-        return (
-            self._is_from_current_file(node) and
-            node.kind == cindex.CursorKind.VAR_DECL
-        )
-
-    def _is_func(self, node):
-        """Checks if the given node is a function.
-
-        External functions or function declarations are not considered to be
-        functions.
+        nodes = {kind: [] for kind in _TOP_LEVEL_KINDS}
+        # The name of the file is obtained from libclang, so obtain it only
+        # once.
+        file_name = self.file_name
+        for node in self._tu.cursor.get_children():
+            # Check the kind first as it is cheaper than obtaining the
+            # location of the node.
+            kind = node.kind
+            kind_nodes = nodes.get(kind)
+            if kind_nodes is None:
+                continue
+            file = node.location.file
+            if file is None or file.name != file_name:
+                continue
+            if kind == cindex.CursorKind.FUNCTION_DECL and \
+                    not self._is_func_definition(node):
+                continue
+            kind_nodes.append(node)
+        return nodes
+
+    def _is_func_definition(self, node):
+        """Is the given function node a definition (i.e. a function with a
+        body)?
         """
-        return (
-            self._is_from_current_file(node) and
-            node.kind == cindex.CursorKind.FUNCTION_DECL and
-            node.is_definition()
-        )
+        return node.is_definition()
 
-    def _is_struct(self, node):
-        """Checks if the given node is a structure.
-
-        External structures (coming from included headers) are not
-        considered to be structures.
-        """
-        return (
-            self._is_from_current_file(node) and
-            node.kind == cindex.CursorKind.STRUCT_DECL
-        )
-
-    def _is_union(self, node):
-        """Checks if the given node is a union.
-
-        External unions (coming from included headers) are not
-        considered to be unions.
-        """
-        return (
-            self._is_from_current_file(node) and
-            node.kind == cindex.CursorKind.UNION_DECL
-        )
+    @property
+    @memoize
+    def _global_vars_by_name(self):
+        """Global variables by their names (`dict`)."""
+        return _index_by_name(self.global_vars)
 
-    def _is_enum(self, node):
-        """Checks if the given node is an enum.
+    @property
+    @memoize
+    def _funcs_by_name(self):
+        """Functions by their names (`dict`)."""
+        return _index_by_name(self.funcs)
 
-        External enums (coming from included headers) are not
-        considered to be enums.
-        """
-        return (
-            self._is_from_current_file(node) and
-            node.kind == cindex.CursorKind.ENUM_DECL
-        )
+    @property
+    @memoize
+    def _string_literal_token_values(self):
+        """Values of string literals among the tokens of the module (a set of
+        `str`).
 
-    def _is_from_current_file(self, node):
-        """Checks if the node is in the current file, i.e. not coming from an
-        included file.
+        Unlike :attr:`string_literal_values`, it also contains literals from
+        code that was skipped during parsing (e.g. due to a syntax error).
         """
-        return (
-            node.location.file is not None and
-            node.location.file.name == self.file_name
-        )
-
-    def _try_read_next_include(self, tokens, i):
-        """Tries to read the next include from the given list of tokens,
-        starting at index `i`.
+        tokens = get_token_table(self._tu)
+        return {
+            tokens.string_literal_value(i)
+            for i in tokens.string_literal_indexes
+        }
 
-        :returns: A pair (include or ``None``, next `i`).
+    @property
+    @memoize
+    def _identifiers(self):
+        """Identifiers among the tokens of the module (a set of `str`)."""
+        tokens = get_token_table(self._tu)
+        identifier_kind = cindex.TokenKind.IDENTIFIER.value
+        return {
+            tokens.spellings[i] for i, kind in enumerate(tokens.kinds)
+            if kind == identifier_kind
+        }
+
+    def _comments_contain(self, regexp):
+        """Checks if any of the comments contains the given regular
+        expression.
         """
-        # There are two possible formats:
-        #
-        # (1)  #  include  <      FILE     >
-        #      i  i + 1    i + 2  i + 3    i + X
-        #
-        # (2)  #  include  "file"
-        #      i  i + 1    i + 2
-        #
-        # where FILE may be composed of identifiers and punctuation (e.g.
-        # "stdio.h" is composed of two identifiers and a punctuation) and X
-        # depends on the number of tokens in FILE.
-
-        # Try format (1) first.
-        if (i + 4 < len(tokens) and
-                tokens[i].kind == cindex.TokenKind.PUNCTUATION and
-                tokens[i].spelling == '#' and
-                tokens[i + 1].kind == cindex.TokenKind.IDENTIFIER and
-                tokens[i + 1].spelling == 'include' and
-                tokens[i + 2].kind == cindex.TokenKind.PUNCTUATION and
-                tokens[i + 2].spelling == '<'):
-            include_text = '#include ' + tokens[i + 2].spelling
-            i += 3  # for  #  include  ["|<]
-            while (tokens[i].kind != cindex.TokenKind.PUNCTUATION or
-                    tokens[i].spelling not in ['"', '>']):
-                include_text += tokens[i].spelling
-                i += 1
-            include_text += tokens[i].spelling
-            return Include(include_text), i + 1
-        # Try format (2).
-        elif (i + 2 < len(tokens) and
-                tokens[i].kind == cindex.TokenKind.PUNCTUATION and
-                tokens[i].spelling == '#' and
-                tokens[i + 1].kind == cindex.TokenKind.IDENTIFIER and
-                tokens[i + 1].spelling == 'include' and
-                tokens[i + 2].kind == cindex.TokenKind.LITERAL):
-            include_text = '#include ' + tokens[i + 2].spelling
-            return Include(include_text), i + 3
-        # No include.
-        return (None, i + 1)
+        for comment in self.comments:
+            if re.search(regexp, comment) is not None:
+                return True
+        return False
 
     def _has_string_literal_value_matching(self, regexp):
         """Checks if :attr:`string_literal_values` contains a string literal
@@ -1006,9 +1009,14 @@ class Module(Text):
         return False
 
     def _contains_string_literal_matching(self, regexp):
-        """Checks if the module contains a string literal matching the given
-        regular expression by calling :func:`contains()`.
+        """Checks if string literals among the tokens of the module or
+        comments contain a string literal matching the given regular
+        expression.
         """
+        for value in self._string_literal_token_values:
+            if re.fullmatch(regexp, value) is not None:
+                return True
+
         regexp = self._get_pattern_from(regexp)
 
         # We need to correctly handle situations when the regular expression
@@ -1020,7 +1028,7 @@ class Module(Text):
         if regexp.endswith('$'):
             regexp = regexp[:-1]
 
-        return self.contains('"{}"'.format(regexp))
+        return self._comments_contain('"{}"'.format(regexp))
 
     def _get_pattern_from(self, regexp):
         """Returns the pattern (`str`) from the given regular expression
@@ -1037,6 +1045,28 @@ class Module(Text):
         )
 
 
+#: Kinds of top-level nodes that are classified in
+#: :attr:`Module._top_level_nodes`.
+_TOP_LEVEL_KINDS = (
+    cindex.CursorKind.VAR_DECL,
+    cindex.CursorKind.FUNCTION_DECL,
+    cindex.CursorKind.STRUCT_DECL,
+    cindex.CursorKind.UNION_DECL,
+    cindex.CursorKind.ENUM_DECL,
+)
+
+
+def _index_by_name(objects):
+    """Returns a dictionary mapping names of the given objects into the
+    objects. When there are more objects of the same name, the first one is
+    used.
+    """
+    objects_by_name = {}
+    for obj in objects:
+        objects_by_name.setdefault(obj.name, obj)
+    return objects_by_name
+
+
 from regression_tests.parsers.c_parser.exprs.literals.string_literal import StringLiteral
 from regression_tests.parsers.c_parser.exprs.variable import Variable
 from regression_tests.parsers.c_parser.function import Function
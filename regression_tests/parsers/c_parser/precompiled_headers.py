@@ -0,0 +1,180 @@
+"""
+    Precompiled headers for standard headers included in parsed C code.
+"""
+
+import getpass
+import hashlib
+import os
+import stat
+import re
+import tempfile
+
+from clang import cindex
+
+from regression_tests.clang import get_libclang_id
+
+
+def _get_user_id():
+    """Returns an identifier of the current user (`str`)."""
+    if hasattr(os, 'getuid'):
+        return str(os.getuid())
+    return getpass.getuser()
+
+
+#: Directory into which precompiled headers are stored. It is shared by all
+#: processes of the current user, so a precompiled header is built only once.
+#: Other users cannot access it (see :func:`_ensure_cache_dir()`).
+PCH_CACHE_DIR = os.path.join(
+    tempfile.gettempdir(),
+    'regression-tests-pch-{}'.format(_get_user_id())
+)
+
+
+def get_precompiled_header(index, code, args):
+    """Returns a path to a precompiled header of the standard headers included
+    at the beginning of the given C code.
+
+    :param cindex.Index index: Index to be used to build the header.
+    :param str code: C code to be parsed.
+    :param list args: Arguments that will be used to parse the code.
+
+    :returns: Path to the precompiled header or ``None`` when the code does
+              not start with includes of standard headers or when the header
+              cannot be built.
+
+    The header is built only when it does not exist yet. Headers that cannot
+    be built are remembered, so there is only a single attempt per process.
+    When the directory with precompiled headers is accessible by other users,
+    no header is used.
+    """
+    includes = get_standard_includes(code)
+    if not includes:
+        return None
+
+    key = _compute_key(includes, args)
+    if key in _unbuildable_headers or not _ensure_cache_dir():
+        return None
+
+    pch_path = os.path.join(PCH_CACHE_DIR, '{}.pch'.format(key))
+    if os.path.isfile(pch_path):
+        return pch_path
+
+    if _build_precompiled_header(index, includes, args, pch_path):
+        return pch_path
+    _unbuildable_headers.add(key)
+    return None
+
+
+def remove_precompiled_header(pch_path):
+    """Removes the given precompiled header (e.g. when it cannot be used
+    because the included headers have changed). It will be rebuilt when it is
+    needed again.
+    """
+    try:
+        os.remove(pch_path)
+    except OSError:
+        pass
+
+
+def get_standard_includes(code):
+    """Returns a list of includes of standard headers (``#include <...>``) at
+    the beginning of the given C code.
+
+    Only blank lines and line comments may precede or be placed between the
+    includes. The returned includes are in the order in which they appear in
+    the code.
+    """
+    includes = []
+    for line in code.splitlines():
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        match = _STANDARD_INCLUDE_REGEXP.fullmatch(line)
+        if match is None:
+            break
+        includes.append(match.group(1))
+    return includes
+
+
+#: A regular expression matching an include of a standard header.
+_STANDARD_INCLUDE_REGEXP = re.compile(r'#\s*include\s*(<[^<>]+>)')
+
+#: Keys of precompiled headers that could not be built.
+_unbuildable_headers = set()
+
+#: Directories with precompiled headers that were checked by
+#: :func:`_ensure_cache_dir()`.
+_checked_cache_dirs = set()
+
+
+def _ensure_cache_dir():
+    """Creates the directory with precompiled headers when it does not exist.
+
+    :returns: ``True`` when the directory can be used, ``False`` otherwise.
+
+    The directory is in a shared location, so it could have been created by
+    another user, who could then replace the stored headers. Therefore, it
+    can be used only when it is owned by the current user and other users
+    cannot write into it.
+    """
+    if PCH_CACHE_DIR in _checked_cache_dirs:
+        return True
+
+    try:
+        os.makedirs(PCH_CACHE_DIR, mode=0o700, exist_ok=True)
+        dir_stat = os.lstat(PCH_CACHE_DIR)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(dir_stat.st_mode):
+        return False
+    if hasattr(os, 'getuid') and (dir_stat.st_uid != os.getuid() or
+                                  dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        return False
+    _checked_cache_dirs.add(PCH_CACHE_DIR)
+    return True
+
+
+def _compute_key(includes, args):
+    """Computes a key of a precompiled header of the given includes that is
+    built with the given arguments.
+    """
+    # Precompiled headers can be used only by the same version of libclang,
+    # so the library is a part of the key as well.
+    key_data = '\n'.join([get_libclang_id()] + args + includes)
+    return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+
+def _build_precompiled_header(index, includes, args, pch_path):
+    """Builds a precompiled header of the given includes and stores it into
+    the given path.
+
+    :returns: ``True`` when the header was built, ``False`` otherwise.
+    """
+    header_name = 'standard_headers.h'
+    header = ''.join('#include {}\n'.format(include) for include in includes)
+    try:
+        tu = index.parse(
+            header_name,
+            args=args + ['-x', 'c-header'],
+            unsaved_files=[(header_name, header)],
+            options=cindex.TranslationUnit.PARSE_INCOMPLETE
+        )
+    except cindex.TranslationUnitLoadError:
+        return False
+    if any(diag.severity >= cindex.Diagnostic.Error for diag in tu.diagnostics):
+        return False
+
+    # Other processes and threads may build the same header in parallel, so
+    # store it under a unique name and then atomically move it into its place.
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=PCH_CACHE_DIR)
+        os.close(fd)
+    except OSError:
+        return False
+    try:
+        tu.save(tmp_path)
+        os.replace(tmp_path, pch_path)
+    except (cindex.TranslationUnitSaveError, OSError):
+        remove_precompiled_header(tmp_path)
+        return False
+    return True
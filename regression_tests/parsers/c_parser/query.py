@@ -0,0 +1,328 @@
+"""
+    Structural queries over parsed C code.
+
+    A query describes nodes to be found (e.g. calls of ``printf()`` inside
+    loops). Queries are created by functions from this module and refined by
+    methods of :class:`Query`. They are evaluated by
+    :func:`.Module.find_all()` or :func:`.Function.find_all()`:
+
+    .. code-block:: python
+
+        from regression_tests.parsers.c_parser.query import calls
+        from regression_tests.parsers.c_parser.query import loops
+        from regression_tests.parsers.c_parser.query import string_literals
+
+        query = calls('printf').with_arg(
+            0, string_literals(r'.*%d.*')
+        ).inside(loops())
+
+        # Calls of printf() whose first argument is a string literal
+        # containing %d, located inside a loop in any function.
+        self.out_c.find_all(query)
+        # The same, but only inside main().
+        self.out_c.funcs['main'].find_all(query)
+        # Is there at least one such call?
+        assert self.out_c.has_any(query)
+"""
+
+import re
+from bisect import bisect_left
+
+from clang import cindex
+
+from regression_tests.parsers.c_parser.ast_snapshot import get_ast_snapshot
+from regression_tests.parsers.c_parser.exprs.expression import Expression
+from regression_tests.parsers.c_parser.function import Function
+from regression_tests.parsers.c_parser.stmts.statement import Statement
+from regression_tests.parsers.c_parser.token_table import get_token_table
+from regression_tests.parsers.c_parser.utils import get_operator_token
+from regression_tests.parsers.c_parser.utils import unify_called_func_name
+
+
+class Query:
+    """A query for nodes of parsed C code.
+
+    Queries are immutable. Methods refining a query return a new query, so a
+    query can be shared and refined in several ways. Queries can be compared
+    and hashed, so their results can be memoized.
+
+    A query is evaluated in a single pass over the nodes of the queried kinds
+    in the snapshot of the AST (see :mod:`.ast_snapshot`). Queries nested in
+    the query (e.g. those given to :func:`inside()`) are evaluated only once
+    per evaluation.
+    """
+
+    def __init__(self, kinds, names=(), value_regexp=None, args=(),
+                 containers=(), is_assign_op=False):
+        """
+        :param kinds: Kinds of nodes to be found (`cindex.CursorKind`).
+        :param names: If non-empty, only nodes with these names are found.
+        :param str value_regexp: If not ``None``, only string literals whose
+                                 value matches the regular expression are
+                                 found.
+        :param args: Pairs ``(position, query)`` that arguments of found calls
+                     have to match.
+        :param containers: Queries that nodes containing found nodes have to
+                           match.
+        :param bool is_assign_op: Should only assignment operators be found?
+        """
+        self._kind_ids = frozenset(kind.value for kind in kinds)
+        self._names = frozenset(names)
+        self._value_regexp = value_regexp
+        self._args = tuple(args)
+        self._containers = tuple(containers)
+        self._is_assign_op = is_assign_op
+
+    def inside(self, *containers):
+        """Returns a query that finds only nodes located inside nodes found by
+        all the given queries.
+
+        Example:
+
+        .. code-block:: python
+
+            calls('rand').inside(loops(), funcs('main'))
+        """
+        return self._refined(containers=self._containers + containers)
+
+    def with_arg(self, position, query):
+        """Returns a query that finds only calls whose argument on the given
+        position (indexed from 0) is found by the given query.
+
+        Example:
+
+        .. code-block:: python
+
+            calls('printf').with_arg(0, string_literals('%d\\n'))
+        """
+        return self._refined(args=self._args + ((position, query),))
+
+    def _refined(self, **kwargs):
+        """Returns a copy of the query with the given attributes replaced."""
+        query = Query.__new__(Query)
+        query.__dict__.update(self.__dict__)
+        for name, value in kwargs.items():
+            setattr(query, '_' + name, value)
+        return query
+
+    def _find(self, tu, start=0, end=None):
+        """Returns wrappers of nodes of the given translation unit that are
+        found by the query (`list`).
+
+        When `end` is not ``None``, only nodes whose indexes in the snapshot
+        of the AST lie in ``range(start, end)`` are returned.
+        """
+        snapshot = get_ast_snapshot(tu)
+        return [
+            _wrap(snapshot.node(i))
+            for i in self._indexes(tu, snapshot, start, end)
+        ]
+
+    def _indexes(self, tu, snapshot, start=0, end=None):
+        """Returns indexes of nodes in the snapshot that are found by the
+        query (`list`).
+        """
+        indexes = snapshot.indexes_of_kinds(self._kind_ids)
+        if end is not None:
+            indexes = indexes[bisect_left(indexes, start):
+                              bisect_left(indexes, end)]
+        matches = self._compile(tu, snapshot)
+        return [i for i in indexes if matches(i)]
+
+    def _compile(self, tu, snapshot):
+        """Compiles the query into a function that checks whether the node
+        with the given index in the snapshot is found by the query.
+        """
+        kind_ids = self._kind_ids
+        names = self._names
+        value_regexp = self._value_regexp
+        is_assign_op = self._is_assign_op
+        file_ids = snapshot.file_ids
+        parents = snapshot.parents
+        # Top-level nodes in the snapshot are only from the main file, so the
+        # first node is from it.
+        main_file_id = file_ids[0] if len(snapshot) else -1
+        # String literals are checked in the tokens, the same way as their
+        # values are obtained in StringLiteral.value.
+        tokens = get_token_table(tu) \
+            if _STRING_LITERAL_KIND_ID in kind_ids else None
+        arg_matchers = [
+            (position, query._compile(tu, snapshot))
+            for position, query in self._args
+        ]
+        # Nodes found by nested queries are the same for all checked nodes,
+        # so find them only once.
+        containers = [
+            set(query._indexes(tu, snapshot)) for query in self._containers
+        ]
+
+        def matches(i):
+            if snapshot.kind_ids[i] not in kind_ids:
+                return False
+            if file_ids[i] != main_file_id:
+                return False
+            if names and \
+                    unify_called_func_name(snapshot.spelling(i)) not in names:
+                return False
+            if snapshot.kind_ids[i] == _STRING_LITERAL_KIND_ID:
+                # Some string literals have no tokens (e.g. in the expansion
+                # of NAN), so they are not considered to be string literals.
+                value = tokens.string_literal_value_at(
+                    snapshot.start_offsets[i]
+                )
+                if value is None:
+                    return False
+                if value_regexp is not None and \
+                        re.fullmatch(value_regexp, value) is None:
+                    return False
+            if is_assign_op and \
+                    snapshot.kind_ids[i] == _BINARY_OPERATOR_KIND_ID:
+                operator = get_operator_token(snapshot.node(i))
+                if operator is None or operator[0] != '=':
+                    return False
+            for position, arg_matches in arg_matchers:
+                # The first child is the called function.
+                args = snapshot.children(i)[1:]
+                if position >= len(args):
+                    return False
+                if not arg_matches(_skip_unconvertable(snapshot, args[position])):
+                    return False
+            for container in containers:
+                j = parents[i]
+                while j != -1 and j not in container:
+                    j = parents[j]
+                if j == -1:
+                    return False
+            return True
+        return matches
+
+    def _key(self):
+        return (
+            self._kind_ids,
+            self._names,
+            self._value_regexp,
+            self._args,
+            self._containers,
+            self._is_assign_op
+        )
+
+    def __eq__(self, other):
+        return isinstance(other, Query) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return '<{} kinds={} names={}>'.format(
+            self.__class__.__name__,
+            sorted(cindex.CursorKind.from_id(id).name for id in self._kind_ids),
+            sorted(self._names)
+        )
+
+
+def funcs(*names):
+    """Returns a query that finds definitions of functions with the given
+    names (or of all functions when no name is given).
+    """
+    return Query([cindex.CursorKind.FUNCTION_DECL], names=names)
+
+
+def calls(*names):
+    """Returns a query that finds calls of functions with the given names (or
+    all calls when no name is given).
+
+    Names of builtins are unified in the same way as in
+    :func:`.Function.calls()` (e.g. ``__builtin___memset_chk`` is
+    ``memset``).
+    """
+    return Query([cindex.CursorKind.CALL_EXPR], names=names)
+
+
+def string_literals(regexp=None):
+    """Returns a query that finds string literals whose value fully matches
+    the given regular expression (or all string literals when no regular
+    expression is given).
+    """
+    return Query([cindex.CursorKind.STRING_LITERAL], value_regexp=regexp)
+
+
+def assign_ops():
+    """Returns a query that finds assignment operators (``=``, ``+=``,
+    etc.).
+    """
+    return Query(
+        [cindex.CursorKind.BINARY_OPERATOR,
+         cindex.CursorKind.COMPOUND_ASSIGNMENT_OPERATOR],
+        is_assign_op=True
+    )
+
+
+def loops():
+    """Returns a query that finds loops (``for``, ``while``, ``do while``)."""
+    return Query([
+        cindex.CursorKind.FOR_STMT,
+        cindex.CursorKind.WHILE_STMT,
+        cindex.CursorKind.DO_STMT
+    ])
+
+
+def for_loops():
+    """Returns a query that finds ``for`` loops."""
+    return Query([cindex.CursorKind.FOR_STMT])
+
+
+def while_loops():
+    """Returns a query that finds ``while`` loops."""
+    return Query([cindex.CursorKind.WHILE_STMT])
+
+
+def do_while_loops():
+    """Returns a query that finds ``do while`` loops."""
+    return Query([cindex.CursorKind.DO_STMT])
+
+
+def if_stmts():
+    """Returns a query that finds ``if`` statements."""
+    return Query([cindex.CursorKind.IF_STMT])
+
+
+def switch_stmts():
+    """Returns a query that finds ``switch`` statements."""
+    return Query([cindex.CursorKind.SWITCH_STMT])
+
+
+def return_stmts():
+    """Returns a query that finds ``return`` statements."""
+    return Query([cindex.CursorKind.RETURN_STMT])
+
+
+def _skip_unconvertable(snapshot, i):
+    """Skips nodes that are skipped when expressions are created (see
+    :func:`.Expression._skip_unconvertable_nodes()`) and returns the index of
+    the first node that is not skipped.
+    """
+    while snapshot.kind_ids[i] in _UNCONVERTABLE_KIND_IDS and \
+            snapshot.subtree_ends[i] > i + 1:
+        i += 1
+    return i
+
+
+def _wrap(node):
+    """Returns a wrapper of the given node."""
+    if node.kind == cindex.CursorKind.FUNCTION_DECL:
+        return Function(node)
+    if node.kind.is_statement():
+        return Statement._from_clang_node(node)
+    return Expression._from_clang_node(node)
+
+
+_BINARY_OPERATOR_KIND_ID = cindex.CursorKind.BINARY_OPERATOR.value
+
+_STRING_LITERAL_KIND_ID = cindex.CursorKind.STRING_LITERAL.value
+
+_UNCONVERTABLE_KIND_IDS = frozenset(
+    kind.value for kind in (
+        cindex.CursorKind.UNEXPOSED_EXPR,
+        cindex.CursorKind.PAREN_EXPR,
+    )
+)
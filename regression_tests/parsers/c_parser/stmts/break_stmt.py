@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.stmts.statement import Statement
 class BreakStmt(Statement):
     """A representation of a ``break`` statement."""
 
+    __slots__ = ()
+
     def is_break_stmt(self):
         """Returns ``True``."""
         return True
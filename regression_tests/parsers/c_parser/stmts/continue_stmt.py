@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.stmts.statement import Statement
 class ContinueStmt(Statement):
     """A representation of a ``continue`` statement."""
 
+    __slots__ = ()
+
     def is_continue_stmt(self):
         """Returns ``True``."""
         return True
@@ -4,13 +4,15 @@
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
 from regression_tests.parsers.c_parser.stmts.loop import Loop
-from regression_tests.parsers.c_parser.utils import nth_item
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.utils import memoize
 
 
 class DoWhileLoop(Loop):
     """A representation of a ``do while`` loop."""
 
+    __slots__ = ()
+
     def is_do_while_loop(self):
         """Returns ``True``."""
         return True
@@ -19,7 +21,7 @@ class DoWhileLoop(Loop):
     @memoize
     def condition(self):
         """Condition of the statement (:class:`.Expression`)."""
-        cond = nth_item(1, self._node.get_children())
+        cond = get_children(self._node)[1]
         return Expression._from_clang_node(cond)
 
     def __repr__(self):
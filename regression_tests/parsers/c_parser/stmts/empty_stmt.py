@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.stmts.statement import Statement
 class EmptyStmt(Statement):
     """A representation of an empty statement."""
 
+    __slots__ = ()
+
     def is_empty_stmt(self):
         """Returns ``True``."""
         return True
@@ -6,12 +6,15 @@ import itertools
 import re
 
 from regression_tests.parsers.c_parser.stmts.loop import Loop
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.utils import memoize
 
 
 class ForLoop(Loop):
     """A representation of a ``for`` loop."""
 
+    __slots__ = ()
+
     def is_for_loop(self):
         """Returns ``True``."""
         return True
@@ -33,10 +36,7 @@ class ForLoop(Loop):
         Note that the whitespace may not 100% correspond to the original loop
         (the header is reconstructed from tokens).
         """
-        parts = self._node.get_children()
-        decl = next(parts)
-        cond = next(parts)
-        step = next(parts)
+        decl, cond, step = get_children(self._node)[:3]
 
         decl_tokens = self._tokens_until(decl.get_tokens(), ';')
         cond_tokens = self._tokens_until(cond.get_tokens(), ';')
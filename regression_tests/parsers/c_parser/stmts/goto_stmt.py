@@ -3,12 +3,15 @@
 """
 
 from regression_tests.parsers.c_parser.stmts.statement import Statement
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.utils import memoize
 
 
 class GotoStmt(Statement):
     """A representation of a ``goto`` statement."""
 
+    __slots__ = ()
+
     def is_goto_stmt(self):
         """Returns ``True``."""
         return True
@@ -17,7 +20,7 @@ class GotoStmt(Statement):
     @memoize
     def target(self):
         """Name of targeted label."""
-        return next(self._node.get_children()).spelling
+        return get_children(self._node)[0].spelling
 
     def __eq__(self, other):
         return id(self) == id(other)
@@ -38,6 +41,9 @@ class GotoStmt(Statement):
 class Label:
     """A representation of a ``label``."""
 
+    # next_stmt is set when statements of a function are linked together.
+    __slots__ = ('_node', 'next_stmt', '_memoize_cache')
+
     def __init__(self, node):
         """
         :param node: Internal node representing the label.
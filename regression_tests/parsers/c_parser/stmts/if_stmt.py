@@ -4,6 +4,7 @@
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
 from regression_tests.parsers.c_parser.stmts.statement import Statement
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.utils import memoize
 
 
@@ -40,6 +41,8 @@ class IfStmt(Statement):
         for ``else if`` clauses.
     """
 
+    __slots__ = ()
+
     def is_if_stmt(self):
         """Returns ``True``."""
         return True
@@ -48,12 +51,12 @@ class IfStmt(Statement):
     @memoize
     def condition(self):
         """Condition of the statement (:class:`.Expression`)."""
-        cond = next(self._node.get_children())
+        cond = get_children(self._node)[0]
         return Expression._from_clang_node(cond)
 
     def has_else_clause(self):
         """Has the statement an ``else`` clause?"""
-        return len(list(self._node.get_children())) == 3
+        return len(get_children(self._node)) == 3
 
     def __repr__(self):
         return '<{} condition={}>'.format(
@@ -5,12 +5,15 @@
 from clang import cindex
 
 from regression_tests.parsers.c_parser.stmts.statement import Statement
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.utils import memoize
 
 
 class Loop(Statement):
     """A base class for loops (``for``, ``while``, ``do while``)."""
 
+    __slots__ = ('_break_stmts', '_continue_stmts')
+
     def __init__(self, node):
         super().__init__(node)
         self._break_stmts = []
@@ -47,7 +50,7 @@ class Loop(Statement):
     @memoize
     def _parse_loop_body(self):
         def visit_children(parent_node):
-            for node in parent_node.get_children():
+            for node in get_children(parent_node):
                 if node.kind in (cindex.CursorKind.FOR_STMT,
                                  cindex.CursorKind.WHILE_STMT,
                                  cindex.CursorKind.DO_STMT):
@@ -4,12 +4,15 @@
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
 from regression_tests.parsers.c_parser.stmts.statement import Statement
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.utils import memoize
 
 
 class ReturnStmt(Statement):
     """A representation of a ``return`` statement."""
 
+    __slots__ = ()
+
     def is_return_stmt(self):
         """Returns ``True``."""
         return True
@@ -22,8 +25,9 @@ class ReturnStmt(Statement):
     @memoize
     def return_expr(self):
         """Returned expression (:class:`.Expression`) or ``None``."""
-        if any(self._node.get_children()):
-            ret_expr = next(self._node.get_children())
+        children = get_children(self._node)
+        if children:
+            ret_expr = children[0]
             return Expression._from_clang_node(ret_expr)
         return None
 
@@ -6,19 +6,21 @@ from abc import ABCMeta
 
 from clang import cindex
 
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.parsers.c_parser.utils import remove_whitespace
 
 
 class Statement(metaclass=ABCMeta):
     """A base class of all statements."""
 
+    __slots__ = ('_node', '_next_stmt', '_memoize_cache')
+
     def __init__(self, node):
         """
         :param node: Internal node representing the statement.
         """
         self._node = node
         self._next_stmt = None
-        self._children = []
 
     @property
     def identification(self):
@@ -94,29 +96,30 @@ class Statement(metaclass=ABCMeta):
 
         :raises AssertionError: If the statement is not supported.
         """
-        if node.kind == cindex.CursorKind.FOR_STMT:
+        kind = node.kind
+        if kind == cindex.CursorKind.FOR_STMT:
             return ForLoop(node)
-        elif node.kind == cindex.CursorKind.WHILE_STMT:
+        elif kind == cindex.CursorKind.WHILE_STMT:
             return WhileLoop(node)
-        elif node.kind == cindex.CursorKind.DO_STMT:
+        elif kind == cindex.CursorKind.DO_STMT:
             return DoWhileLoop(node)
-        elif node.kind == cindex.CursorKind.IF_STMT:
+        elif kind == cindex.CursorKind.IF_STMT:
             return IfStmt(node)
-        elif node.kind == cindex.CursorKind.DECL_STMT:
-            child = next(node.get_children())
+        elif kind == cindex.CursorKind.DECL_STMT:
+            child = get_children(node)[0]
             if child.kind == cindex.CursorKind.VAR_DECL:
                 return VarDefStmt(child)
-        elif node.kind == cindex.CursorKind.RETURN_STMT:
+        elif kind == cindex.CursorKind.RETURN_STMT:
             return ReturnStmt(node)
-        elif node.kind == cindex.CursorKind.NULL_STMT:
+        elif kind == cindex.CursorKind.NULL_STMT:
             return EmptyStmt(node)
-        elif node.kind == cindex.CursorKind.BREAK_STMT:
+        elif kind == cindex.CursorKind.BREAK_STMT:
             return BreakStmt(node)
-        elif node.kind == cindex.CursorKind.CONTINUE_STMT:
+        elif kind == cindex.CursorKind.CONTINUE_STMT:
             return ContinueStmt(node)
-        elif node.kind == cindex.CursorKind.SWITCH_STMT:
+        elif kind == cindex.CursorKind.SWITCH_STMT:
             return SwitchStmt(node)
-        elif node.kind == cindex.CursorKind.GOTO_STMT:
+        elif kind == cindex.CursorKind.GOTO_STMT:
             return GotoStmt(node)
 
         raise AssertionError('unsupported statement `{}` of kind {}'.format(
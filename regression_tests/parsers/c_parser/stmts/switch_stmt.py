@@ -6,15 +6,17 @@ from clang import cindex
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
 from regression_tests.parsers.c_parser.stmts.statement import Statement
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.parsers.c_parser.utils import INDENT
 from regression_tests.parsers.c_parser.utils import first_child_node
-from regression_tests.parsers.c_parser.utils import nth_item
 from regression_tests.utils import memoize
 
 
 class SwitchStmt(Statement):
     """A representation of a ``switch`` statement."""
 
+    __slots__ = ('_cases', '_default_case')
+
     def __init__(self, node):
         """
         :param node: Internal node representing the switch.
@@ -63,8 +65,8 @@ class SwitchStmt(Statement):
 
     @memoize
     def _parse_switch_body(self):
-        body_node = nth_item(1, self._node.get_children())
-        for child in body_node.get_children():
+        body_node = get_children(self._node)[1]
+        for child in get_children(body_node):
             if child.kind == cindex.CursorKind.CASE_STMT:
                 self._cases.append(Case(child))
             elif child.kind == cindex.CursorKind.DEFAULT_STMT:
@@ -97,6 +99,8 @@ class SwitchStmt(Statement):
 class Case:
     """A representation of a ``case``."""
 
+    __slots__ = ('_node', '_memoize_cache')
+
     def __init__(self, node):
         """
         :param node: Internal node representing the case.
@@ -120,6 +124,8 @@ class Case:
 class DefaultCase:
     """A representation of a ``default`` case."""
 
+    __slots__ = ('_node', '_memoize_cache')
+
     def __init__(self, node):
         """
         :param node: Internal node representing the default case.
@@ -10,6 +10,8 @@ from regression_tests.parsers.c_parser.utils import remove_whitespace
 class VarDefStmt(Statement):
     """A representation of a variable definition."""
 
+    __slots__ = ()
+
     def is_var_def(self):
         """Returns ``True``."""
         return True
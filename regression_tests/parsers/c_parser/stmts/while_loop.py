@@ -4,12 +4,15 @@
 
 from regression_tests.parsers.c_parser.exprs.expression import Expression
 from regression_tests.parsers.c_parser.stmts.loop import Loop
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.utils import memoize
 
 
 class WhileLoop(Loop):
     """A representation of a ``while`` loop."""
 
+    __slots__ = ()
+
     def is_while_loop(self):
         """Returns ``True``."""
         return True
@@ -18,7 +21,7 @@ class WhileLoop(Loop):
     @memoize
     def condition(self):
         """Condition of the statement (:class:`.Expression`)."""
-        cond = next(self._node.get_children())
+        cond = get_children(self._node)[0]
         return Expression._from_clang_node(cond)
 
     def __repr__(self):
@@ -0,0 +1,502 @@
+"""
+    Summaries of parsed C modules that are cached on the disk.
+"""
+
+import hashlib
+import json
+import os
+
+from regression_tests.clang import get_libclang_id
+from regression_tests.parsers.c_parser import parse
+from regression_tests.parsers.c_parser.comment import Comment
+from regression_tests.parsers.c_parser.function import Function
+from regression_tests.parsers.c_parser.include import Include
+from regression_tests.parsers.c_parser.module import Module
+from regression_tests.parsers.c_parser.utils import get_name
+from regression_tests.utils import memoize
+from regression_tests.utils.list import NamedObjectList
+
+
+#: Version of the format of summaries. It has to be increased whenever the
+#: format changes.
+SUMMARY_FORMAT_VERSION = 2
+
+#: Statements of functions that are included in summaries, as pairs
+#: (property of :class:`.Function`, name used in error messages).
+SUMMARIZED_STMTS = (
+    ('for_loops', 'for loop'),
+    ('while_loops', 'while loop'),
+    ('do_while_loops', 'do while loop'),
+    ('assignments', 'assignment'),
+    ('if_stmts', 'if statement'),
+    ('var_def_stmts', 'variable definition'),
+    ('return_stmts', 'return statement'),
+    ('empty_stmts', 'empty statement'),
+    ('switch_stmts', 'switch statement'),
+    ('goto_stmts', 'goto statement'),
+    ('labels', 'label'),
+)
+
+
+def set_summary_cache_dir(path):
+    """Sets the directory into which summaries of parsed C modules are cached.
+
+    :param str path: Path to the directory or ``None`` to disable the cache.
+    """
+    global _summary_cache_dir
+    _summary_cache_dir = path
+
+
+def get_summary_cache_dir():
+    """Returns the directory into which summaries of parsed C modules are
+    cached (``None`` when the cache is disabled).
+    """
+    return _summary_cache_dir
+
+
+def parse_cached(code, file_name='dummy.c'):
+    """Parses the given C code by using the cache of summaries.
+
+    :param str code: C code to be parsed.
+    :param str file_name: Optional name of the original file.
+
+    :returns: Parsed representation of the given file (:class:`.Module`).
+
+    When a summary of the code is cached, a :class:`SummarizedModule` is
+    returned. It answers queries from the summary and parses the code only
+    for queries the summary cannot answer. Otherwise, the code is parsed and
+    its summary is stored into the cache. When the cache is disabled (see
+    :func:`set_summary_cache_dir()`), it just parses the code.
+    """
+    if _summary_cache_dir is None:
+        return parse(code, file_name)
+
+    summary_path = os.path.join(
+        _summary_cache_dir,
+        '{}.json'.format(_compute_key(code, file_name))
+    )
+    summary = _load_summary(summary_path)
+    if summary is not None:
+        return SummarizedModule(code, file_name, summary)
+
+    module = parse(code, file_name)
+    try:
+        summary = summarize_module(module)
+    except Exception:
+        # Some parts of the module cannot be summarized (e.g. due to an
+        # unsupported construct in the code). Tests querying these parts fail
+        # by themselves, so just do not cache the summary.
+        return module
+    _store_summary(summary, summary_path)
+    return module
+
+
+def summarize_module(module):
+    """Creates a summary of the given module.
+
+    :param Module module: Module to be summarized.
+
+    :returns: A JSON-serializable `dict`, which does not depend on libclang.
+    """
+    return {
+        'format_version': SUMMARY_FORMAT_VERSION,
+        'file_name': module.file_name,
+        'has_parse_errors': module.has_parse_errors(),
+        'global_var_names': module.global_var_names,
+        'funcs': [summarize_function(func) for func in module.funcs],
+        'comments': [str(comment) for comment in module.comments],
+        'includes': [str(include) for include in module.includes],
+        'string_literal_values': sorted(module.string_literal_values),
+        'string_literal_token_values': sorted(
+            module._string_literal_token_values
+        ),
+        'struct_names': module.struct_names,
+        'unnamed_struct_count': module.unnamed_struct_count,
+        'union_names': module.union_names,
+        'unnamed_union_count': module.unnamed_union_count,
+        'enum_names': module.enum_names,
+        'unnamed_enum_count': module.unnamed_enum_count,
+        'enum_item_names': module.enum_item_names,
+        'empty_enum_count': module.empty_enum_count,
+    }
+
+
+def summarize_function(func):
+    """Creates a summary of the given function.
+
+    :param Function func: Function to be summarized.
+
+    :returns: A JSON-serializable `dict`, which does not depend on libclang.
+    """
+    return {
+        'name': func.name,
+        'str': str(func),
+        'repr': repr(func),
+        'param_names': func.param_names,
+        'called_func_names': sorted(func.called_func_names),
+        'stmts': {
+            stmts: [str(stmt) for stmt in getattr(func, stmts)]
+            for stmts, _ in SUMMARIZED_STMTS
+        },
+    }
+
+
+class SummarizedModule(Module):
+    """A module whose queries are answered from its summary.
+
+    Queries that cannot be answered from the summary (e.g. types of global
+    variables) are answered by the parsed module, which is created when it is
+    needed for the first time.
+    """
+
+    def __new__(cls, code, file_name, summary):
+        """Constructs a new summarized C code.
+
+        :param str code: The original C code.
+        :param str file_name: Name of the original file.
+        :param dict summary: Summary of the module (see
+                             :func:`summarize_module()`).
+        """
+        return Module.__new__(cls, code, None)
+
+    def __init__(self, code, file_name, summary):
+        """
+        :param str code: The original C code.
+        :param str file_name: Name of the original file.
+        :param dict summary: Summary of the module (see
+                             :func:`summarize_module()`).
+        """
+        self._code = code
+        self._file_name = file_name
+        self._summary = summary
+
+    @property
+    def _tu(self):
+        """The underlying translation unit (the code is parsed when it is
+        needed for the first time).
+        """
+        return self._parsed_module._tu
+
+    @property
+    @memoize
+    def _parsed_module(self):
+        return parse(self._code, self._file_name)
+
+    @property
+    def file_name(self):
+        return self._summary['file_name']
+
+    def has_parse_errors(self):
+        return self._summary['has_parse_errors']
+
+    @property
+    def global_var_names(self):
+        return self._summary['global_var_names']
+
+    @property
+    def global_var_count(self):
+        return len(self.global_var_names)
+
+    def has_global_var(self, var):
+        return get_name(var) in self.global_var_names
+
+    @property
+    @memoize
+    def funcs(self):
+        return NamedObjectList(
+            SummarizedFunction(self, func_summary)
+            for func_summary in self._summary['funcs']
+        )
+
+    @property
+    def func_names(self):
+        return [func['name'] for func in self._summary['funcs']]
+
+    @property
+    @memoize
+    def comments(self):
+        return [Comment(comment) for comment in self._summary['comments']]
+
+    @property
+    @memoize
+    def includes(self):
+        return [Include(include) for include in self._summary['includes']]
+
+    @property
+    @memoize
+    def string_literal_values(self):
+        return set(self._summary['string_literal_values'])
+
+    @property
+    @memoize
+    def _string_literal_token_values(self):
+        return set(self._summary['string_literal_token_values'])
+
+    def find_all(self, query):
+        return self._parsed_module.find_all(query)
+
+    @property
+    def struct_names(self):
+        return self._summary['struct_names']
+
+    @property
+    def struct_count(self):
+        return self.named_struct_count + self.unnamed_struct_count
+
+    @property
+    def unnamed_struct_count(self):
+        return self._summary['unnamed_struct_count']
+
+    @property
+    def named_struct_count(self):
+        return len(self.struct_names)
+
+    @property
+    def union_names(self):
+        return self._summary['union_names']
+
+    @property
+    def union_count(self):
+        return self.named_union_count + self.unnamed_union_count
+
+    @property
+    def unnamed_union_count(self):
+        return self._summary['unnamed_union_count']
+
+    @property
+    def named_union_count(self):
+        return len(self.union_names)
+
+    @property
+    def enum_names(self):
+        return self._summary['enum_names']
+
+    @property
+    def enum_count(self):
+        return self.named_enum_count + self.unnamed_enum_count
+
+    @property
+    def unnamed_enum_count(self):
+        return self._summary['unnamed_enum_count']
+
+    @property
+    def named_enum_count(self):
+        return len(self.enum_names)
+
+    @property
+    def enum_item_names(self):
+        return self._summary['enum_item_names']
+
+    @property
+    def empty_enum_count(self):
+        return self._summary['empty_enum_count']
+
+
+class SummarizedFunction(Function):
+    """A function whose queries are answered from its summary.
+
+    Queries that cannot be answered from the summary (e.g. types or
+    statements as objects) are answered by the parsed function, which is
+    obtained from the parsed module when it is needed for the first time.
+    """
+
+    __slots__ = ('_module', '_summary', '_parsed_node')
+
+    def __init__(self, module, summary):
+        """
+        :param SummarizedModule module: Module containing the function.
+        :param dict summary: Summary of the function (see
+                             :func:`summarize_function()`).
+        """
+        self._module = module
+        self._summary = summary
+        super().__init__(node=None)
+
+    @property
+    def _node(self):
+        """Internal node representing the function (the module is parsed
+        when it is needed for the first time).
+        """
+        if self._parsed_node is None:
+            parsed_module = self._module._parsed_module
+            self._parsed_node = parsed_module.funcs[self.name]._node
+        return self._parsed_node
+
+    @_node.setter
+    def _node(self, node):
+        self._parsed_node = node
+
+    @property
+    def _body_node(self):
+        # The parsed module may have been parsed without bodies of functions.
+        return self._module._parsed_module.funcs[self.name]._body_node
+
+    @property
+    def name(self):
+        return self._summary['name']
+
+    @property
+    def param_names(self):
+        return self._summary['param_names']
+
+    @property
+    def param_count(self):
+        return len(self.param_names)
+
+    def has_param(self, name):
+        return name in self.param_names
+
+    @property
+    @memoize
+    def called_func_names(self):
+        return set(self._summary['called_func_names'])
+
+    def has_any_for_loops(self):
+        return self._has_any_stmts('for_loops')
+
+    def has_for_loops(self, *for_loops):
+        return self._has_stmts('for_loops', for_loops)
+
+    def has_any_while_loops(self):
+        return self._has_any_stmts('while_loops')
+
+    def has_while_loops(self, *while_loops):
+        return self._has_stmts('while_loops', while_loops)
+
+    def has_any_do_while_loops(self):
+        return self._has_any_stmts('do_while_loops')
+
+    def has_do_while_loops(self, *do_while_loops):
+        return self._has_stmts('do_while_loops', do_while_loops)
+
+    def has_any_assignments(self):
+        return self._has_any_stmts('assignments')
+
+    def has_assignments(self, *assignments):
+        return self._has_stmts('assignments', assignments)
+
+    def has_any_if_stmts(self):
+        return self._has_any_stmts('if_stmts')
+
+    def has_if_stmts(self, *if_stmts):
+        return self._has_stmts('if_stmts', if_stmts)
+
+    def has_any_var_def_stmts(self):
+        return self._has_any_stmts('var_def_stmts')
+
+    def has_var_def_stmts(self, *var_def_stmts):
+        return self._has_stmts('var_def_stmts', var_def_stmts)
+
+    def has_any_return_stmts(self):
+        return self._has_any_stmts('return_stmts')
+
+    def has_return_stmts(self, *return_stmts):
+        return self._has_stmts('return_stmts', return_stmts)
+
+    def has_any_empty_stmts(self):
+        return self._has_any_stmts('empty_stmts')
+
+    def has_any_switch_stmts(self):
+        return self._has_any_stmts('switch_stmts')
+
+    def has_switch_stmts(self, *switch_stmts):
+        return self._has_stmts('switch_stmts', switch_stmts)
+
+    def has_any_goto_stmts(self):
+        return self._has_any_stmts('goto_stmts')
+
+    def has_goto_stmts(self, *goto_stmts):
+        return self._has_stmts('goto_stmts', goto_stmts)
+
+    def has_any_labels(self):
+        return self._has_any_stmts('labels')
+
+    def has_labels(self, *labels):
+        return self._has_stmts('labels', labels)
+
+    def _has_any_stmts(self, stmts):
+        return bool(self._summary['stmts'][stmts])
+
+    def _has_stmts(self, stmts, searched_stmts):
+        return self._search(
+            searched_stmts,
+            self._summary['stmts'][stmts],
+            dict(SUMMARIZED_STMTS)[stmts]
+        )
+
+    def __repr__(self):
+        return self._summary['repr']
+
+    def __str__(self):
+        return self._summary['str']
+
+
+#: Directory into which summaries are cached (``None`` = no cache).
+_summary_cache_dir = None
+
+
+def _compute_key(code, file_name):
+    """Computes a key of a summary of the given code."""
+    key = hashlib.sha256()
+    for part in (str(SUMMARY_FORMAT_VERSION), _get_parser_version(),
+                 get_libclang_id(), file_name):
+        key.update(part.encode('utf-8'))
+        key.update(b'\0')
+    key.update(code.encode('utf-8', errors='surrogateescape'))
+    return key.hexdigest()
+
+
+def _get_parser_version():
+    """Returns a version of the C parser.
+
+    It is a hash of the sources of the parser, so summaries created by an
+    older version of the parser are not used.
+    """
+    global _parser_version
+    if _parser_version is None:
+        parser_dir = os.path.dirname(os.path.abspath(__file__))
+        version = hashlib.sha256()
+        for dir_path, dir_names, file_names in os.walk(parser_dir):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                if file_name.endswith('.py'):
+                    with open(os.path.join(dir_path, file_name), 'rb') as f:
+                        version.update(f.read())
+        _parser_version = version.hexdigest()
+    return _parser_version
+
+
+#: Cached version of the C parser (see :func:`_get_parser_version()`).
+_parser_version = None
+
+
+def _load_summary(path):
+    """Loads a summary from the given file (``None`` when there is no valid
+    summary).
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if summary.get('format_version') != SUMMARY_FORMAT_VERSION:
+        return None
+    return summary
+
+
+def _store_summary(summary, path):
+    """Stores the given summary into the given file."""
+    # Other processes may store the same summary in parallel, so store it
+    # under a unique name and then atomically move it into its place.
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is only an optimization, so a failure is not fatal.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
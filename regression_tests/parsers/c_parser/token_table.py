@@ -0,0 +1,221 @@
+"""
+    A table of tokens of a translation unit.
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from ctypes import POINTER
+from ctypes import byref
+from ctypes import c_uint
+from ctypes import c_void_p
+from ctypes import cast
+
+from clang import cindex
+
+from regression_tests.clang import get_raw_func
+from regression_tests.utils import memoize
+
+
+class TokenTable:
+    """Tokens of the main file of a translation unit, sorted by their offsets.
+
+    The tokens are obtained by a single tokenization of the translation unit.
+    They are stored in parallel arrays, so a token is represented by its index.
+    The following information is stored for every token:
+
+    * the kind of the token (:attr:`kinds`, values of
+      :class:`cindex.TokenKind`),
+    * the spelling of the token (:attr:`spellings`),
+    * start and end offsets of the token (:attr:`start_offsets` and
+      :attr:`end_offsets`).
+
+    Moreover, indexes of comments, include directives, and string literals
+    are derived from the tokens when they are needed for the first time.
+    """
+
+    def __init__(self, tu):
+        """
+        :param cindex.TranslationUnit tu: Translation unit to be tokenized.
+        """
+        self.kinds = array('b')
+        self.spellings = []
+        self.start_offsets = array('i')
+        self.end_offsets = array('i')
+        self._build(tu)
+
+    def __len__(self):
+        return len(self.spellings)
+
+    def index_at_or_after(self, offset):
+        """Returns the index of the first token that starts at the given
+        offset or after it.
+
+        When there is no such token, it returns the number of tokens.
+        """
+        return bisect_left(self.start_offsets, offset)
+
+    def indexes_between(self, start_offset, end_offset):
+        """Returns indexes of tokens that lie between the given offsets
+        (`range`).
+        """
+        start = self.index_at_or_after(start_offset)
+        end = start
+        while end < len(self) and self.end_offsets[end] <= end_offset:
+            end += 1
+        return range(start, end)
+
+    @property
+    @memoize
+    def comment_indexes(self):
+        """Indexes of comments (`list`)."""
+        comment_kind = cindex.TokenKind.COMMENT.value
+        return [i for i, kind in enumerate(self.kinds) if kind == comment_kind]
+
+    @property
+    @memoize
+    def include_ranges(self):
+        """Ranges of indexes of tokens forming include directives (a `list` of
+        `range`).
+
+        For example, ``#include <stdio.h>`` is formed by tokens ``#``,
+        ``include``, ``<``, ``stdio``, ``.``, ``h``, and ``>``.
+        """
+        ranges = []
+        i = 0
+        while i < len(self):
+            end = self._include_end(i)
+            if end is not None:
+                ranges.append(range(i, end))
+                i = end
+            else:
+                i += 1
+        return ranges
+
+    @property
+    @memoize
+    def string_literal_indexes(self):
+        """Indexes of string literals (`list`)."""
+        literal_kind = cindex.TokenKind.LITERAL.value
+        return [
+            i for i, kind in enumerate(self.kinds)
+            if kind == literal_kind and
+            _STRING_LITERAL_RE.fullmatch(self.spellings[i]) is not None
+        ]
+
+    def string_literal_value(self, i):
+        """Returns the value of the `i`-th token, which is a string literal.
+
+        The value is the same as
+        :attr:`~regression_tests.parsers.c_parser.exprs.literals.string_literal.StringLiteral.value`.
+        """
+        return _STRING_LITERAL_RE.fullmatch(self.spellings[i]).group(1)
+
+    def string_literal_value_at(self, offset):
+        """Returns the value of the string literal that starts at the given
+        offset or ``None`` if no string literal starts there.
+        """
+        i = self.index_at_or_after(offset)
+        if (i == len(self) or
+                self.start_offsets[i] != offset or
+                self.kinds[i] != cindex.TokenKind.LITERAL.value):
+            return None
+        m = _STRING_LITERAL_RE.fullmatch(self.spellings[i])
+        return m.group(1) if m is not None else None
+
+    def _include_end(self, i):
+        """Returns the index that follows the include directive starting at
+        the `i`-th token or ``None`` if no include directive starts there.
+        """
+        # There are two possible formats:
+        #
+        # (1)  #  include  <      FILE     >
+        #      i  i + 1    i + 2  i + 3    i + X
+        #
+        # (2)  #  include  "file"
+        #      i  i + 1    i + 2
+        #
+        # where FILE may be composed of identifiers and punctuation (e.g.
+        # "stdio.h" is composed of two identifiers and a punctuation) and X
+        # depends on the number of tokens in FILE.
+        punctuation_kind = cindex.TokenKind.PUNCTUATION.value
+        if (i + 2 >= len(self) or
+                self.kinds[i] != punctuation_kind or
+                self.spellings[i] != '#' or
+                self.kinds[i + 1] != cindex.TokenKind.IDENTIFIER.value or
+                self.spellings[i + 1] != 'include'):
+            return None
+
+        # Format (1).
+        if (i + 4 < len(self) and
+                self.kinds[i + 2] == punctuation_kind and
+                self.spellings[i + 2] == '<'):
+            end = i + 3
+            while end < len(self) and (self.kinds[end] != punctuation_kind or
+                                       self.spellings[end] not in ('"', '>')):
+                end += 1
+            return end + 1 if end < len(self) else None
+        # Format (2).
+        if self.kinds[i + 2] == cindex.TokenKind.LITERAL.value:
+            return i + 3
+        return None
+
+    def _build(self, tu):
+        lib = cindex.conf.lib
+        tokens_memory = POINTER(cindex.Token)()
+        tokens_count = c_uint()
+        lib.clang_tokenize(
+            tu, tu.cursor.extent, byref(tokens_memory), byref(tokens_count)
+        )
+        count = tokens_count.value
+        if count == 0:
+            return
+
+        # Conversions of arguments are slower than the calls themselves, so
+        # let the arguments be passed as they are.
+        get_token_kind = get_raw_func('clang_getTokenKind', None, c_uint)
+        get_token_extent = get_raw_func(
+            'clang_getTokenExtent', None, cindex.SourceRange
+        )
+        get_instantiation_location = get_raw_func(
+            'clang_getInstantiationLocation', None, None
+        )
+        file, offset = c_void_p(), c_uint()
+        file_ref, offset_ref = byref(file), byref(offset)
+        tu_ptr = tu.from_param()
+
+        try:
+            tokens = cast(
+                tokens_memory, POINTER(cindex.Token * count)
+            ).contents
+            for token in tokens:
+                extent = get_token_extent(tu_ptr, token)
+                get_instantiation_location(
+                    lib.clang_getRangeStart(extent),
+                    file_ref, None, None, offset_ref
+                )
+                self.start_offsets.append(offset.value)
+                get_instantiation_location(
+                    lib.clang_getRangeEnd(extent),
+                    file_ref, None, None, offset_ref
+                )
+                self.end_offsets.append(offset.value)
+                self.kinds.append(get_token_kind(token))
+                self.spellings.append(lib.clang_getTokenSpelling(tu, token))
+        finally:
+            lib.clang_disposeTokens(tu, tokens_memory, tokens_count)
+
+
+# A string literal (possibly with an encoding prefix) and its value.
+_STRING_LITERAL_RE = re.compile(r'(?:u8|u|U|L)?"(.*)"')
+
+
+def get_token_table(tu):
+    """Returns a table of tokens of the given translation unit.
+
+    The translation unit is tokenized only once.
+    """
+    table = getattr(tu, '_token_table', None)
+    if table is None:
+        table = tu._token_table = TokenTable(tu)
+    return table
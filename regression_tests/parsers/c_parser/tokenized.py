@@ -0,0 +1,425 @@
+"""
+    Modules whose text-level queries are answered without libclang.
+"""
+
+import re
+
+from ply import cpp
+from ply import ctokens
+from ply import lex
+
+from regression_tests.parsers.c_parser.comment import Comment
+from regression_tests.parsers.c_parser.include import Include
+from regression_tests.parsers.c_parser.module import Module
+from regression_tests.parsers.c_parser.summary import parse_cached
+from regression_tests.phases import OUTPUT_PARSING
+from regression_tests.phases import measure_phase
+from regression_tests.utils import memoize
+from regression_tests.utils.background import run_in_background
+from regression_tests.utils.background import wait_for_result
+
+
+def set_tokenized_mode(enabled):
+    """Sets whether C code is parsed in the tokenized mode (see
+    :func:`parse_tokenized()`).
+
+    :param bool enabled: Should the tokenized mode be used?
+    """
+    global _tokenized_mode
+    _tokenized_mode = enabled
+
+
+def parse_tokenized(code, file_name='dummy.c'):
+    """Parses the given C code in the tokenized mode.
+
+    :param str code: C code to be parsed.
+    :param str file_name: Optional name of the original file.
+
+    :returns: Parsed representation of the given file (:class:`.Module`).
+
+    In the tokenized mode, a :class:`TokenizedModule` is returned. It answers
+    text-level queries (comments, includes, string literals, and identifiers)
+    from tokens of the code and parses the code
+    by libclang only when a query needs it for the first time. When the mode
+    is disabled (see :func:`set_tokenized_mode()`), it just parses the code
+    (see :func:`~regression_tests.parsers.c_parser.summary.parse_cached()`).
+    """
+    if not _tokenized_mode:
+        return parse_cached(code, file_name)
+    return TokenizedModule(code, file_name)
+
+
+def summarize_tokens(code):
+    """Creates a summary of the given C code from its tokens.
+
+    :param str code: C code to be summarized.
+
+    :returns: A `dict` with comments, includes, values of string literals,
+              and identifiers in the code.
+
+    The code is only tokenized, not preprocessed, so everything in the code is
+    considered, including code in preprocessor directives and in conditional
+    blocks. The same holds for tokens obtained from libclang (see
+    :mod:`.token_table`).
+    """
+    comments = []
+    includes = []
+    string_literal_values = set()
+    identifiers = set()
+
+    # Tokens of the currently processed preprocessor directive or None when
+    # no directive is processed.
+    directive = None
+    at_line_start = True
+
+    lexer = _get_lexer()
+    lexer.input(code)
+    for token in iter(lexer.token, None):
+        type, value = token.type, token.value
+        if type in ('COMMENT', 'CPPCOMMENT'):
+            comments.append(value)
+            continue
+        if type == 'NEWLINE':
+            if directive is not None:
+                _add_include(directive, includes)
+                directive = None
+            at_line_start = True
+            continue
+        if type == 'STRING':
+            string_literal_values.add(_get_string_literal_value(value))
+        elif type == 'ID' and value not in _KEYWORDS:
+            identifiers.add(value)
+
+        if type == 'POUND' and at_line_start:
+            directive = []
+        at_line_start = False
+        if directive is not None:
+            directive.append(token)
+    if directive is not None:
+        _add_include(directive, includes)
+
+    return {
+        'comments': comments,
+        'includes': includes,
+        'string_literal_values': string_literal_values,
+        'identifiers': identifiers,
+    }
+
+
+class _DelegatedToParsedModule:
+    """An attribute of :class:`TokenizedModule` that returns the attribute of
+    the same name of the parsed module.
+
+    The documentation is taken from the attribute of :class:`.Module`.
+    """
+
+    def __set_name__(self, owner, name):
+        self._name = name
+        self.__doc__ = getattr(Module, name).__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance._parsed_module, self._name)
+
+
+class TokenizedModule(Module):
+    """A module whose text-level queries are answered from tokens of its code.
+
+    The code is tokenized by a lexer built from token rules of the vendored
+    PLY (see :func:`summarize_tokens()`), which is considerably faster than
+    parsing it by libclang together with the included headers. Comments,
+    includes, string literals, and identifiers are obtained from the tokens.
+    Other queries (e.g. functions, global variables, or bodies of functions)
+    are answered by the parsed module, which is created when it is needed for
+    the first time. Functions cannot be reliably recognized from tokens (e.g.
+    functions generated by macros or in disabled conditional blocks), so they
+    are always obtained from the parsed module.
+    """
+
+    #: Future of the parsed module when its parsing was started in the
+    #: background (see :func:`prefetch()`).
+    _prefetched_parsed_module = None
+
+    def __new__(cls, code, file_name):
+        """Constructs a new tokenized C code.
+
+        :param str code: The original C code.
+        :param str file_name: Name of the original file.
+        """
+        return Module.__new__(cls, code, None)
+
+    def __init__(self, code, file_name):
+        """
+        :param str code: The original C code.
+        :param str file_name: Name of the original file.
+        """
+        self._code = code
+        self._file_name = file_name
+
+    @property
+    def _tu(self):
+        """The underlying translation unit (the code is parsed when it is
+        needed for the first time).
+        """
+        return self._parsed_module._tu
+
+    def prefetch(self):
+        """Tokenizes the code right away and starts parsing of the code in
+        the background.
+
+        It is used when the module itself is created in the background (see
+        :func:`.TextFile.prefetch_text()`), so that neither the tokenization
+        nor the parsing is left for assertions. Queries that need the parsed
+        module then wait until the parsing finishes.
+        """
+        self._token_summary
+        self._prefetched_parsed_module = run_in_background(
+            parse_cached,
+            self._code,
+            self._file_name
+        )
+
+    @property
+    @memoize
+    def _parsed_module(self):
+        # The code is parsed lazily, e.g. when assertions are evaluated, so
+        # the parsing (or waiting for it) has to be measured here to be
+        # included in the duration of parsing of outputs.
+        with measure_phase(OUTPUT_PARSING):
+            if self._prefetched_parsed_module is not None:
+                return wait_for_result(self._prefetched_parsed_module)
+            return parse_cached(self._code, self._file_name)
+
+    @property
+    @memoize
+    def _token_summary(self):
+        """Summary of the code obtained from its tokens (see
+        :func:`summarize_tokens()`).
+        """
+        return summarize_tokens(self._code)
+
+    @property
+    def file_name(self):
+        return self._file_name
+
+    @property
+    @memoize
+    def comments(self):
+        return [Comment(comment) for comment in self._token_summary['comments']]
+
+    @property
+    @memoize
+    def includes(self):
+        return [Include(include) for include in self._token_summary['includes']]
+
+    def has_string_literal(self, value):
+        # All string literals in the module are among the tokens, so there is
+        # no need to check string_literal_values, which needs the parsed
+        # module.
+        if value in self._string_literal_token_values:
+            return True
+
+        return self._comments_contain('"{}"'.format(re.escape(value)))
+
+    def has_string_literal_matching(self, regexp):
+        return self._contains_string_literal_matching(regexp)
+
+    def has_identifier(self, name):
+        return name in self._token_summary['identifiers']
+
+    @property
+    def _string_literal_token_values(self):
+        return self._token_summary['string_literal_values']
+
+    # All the other public attributes of Module, except for code,
+    # has_comment_matching(), and has_include_of_file(), which only use the
+    # attributes above, are obtained from the parsed module. Queries are then
+    # answered in the same way as without the tokenized mode (e.g. from a
+    # summary or from a module parsed without bodies of functions).
+    has_parse_errors = _DelegatedToParsedModule()
+    global_vars = _DelegatedToParsedModule()
+    global_var_names = _DelegatedToParsedModule()
+    global_var_count = _DelegatedToParsedModule()
+    has_any_global_vars = _DelegatedToParsedModule()
+    has_global_vars = _DelegatedToParsedModule()
+    has_no_global_vars = _DelegatedToParsedModule()
+    has_just_global_vars = _DelegatedToParsedModule()
+    has_global_var = _DelegatedToParsedModule()
+    funcs = _DelegatedToParsedModule()
+    func_names = _DelegatedToParsedModule()
+    func_count = _DelegatedToParsedModule()
+    func = _DelegatedToParsedModule()
+    has_funcs = _DelegatedToParsedModule()
+    has_no_funcs = _DelegatedToParsedModule()
+    has_just_funcs = _DelegatedToParsedModule()
+    has_func = _DelegatedToParsedModule()
+    has_func_matching = _DelegatedToParsedModule()
+    string_literal_values = _DelegatedToParsedModule()
+    structs = _DelegatedToParsedModule()
+    unnamed_structs = _DelegatedToParsedModule()
+    named_structs = _DelegatedToParsedModule()
+    struct_names = _DelegatedToParsedModule()
+    struct_count = _DelegatedToParsedModule()
+    unnamed_struct_count = _DelegatedToParsedModule()
+    named_struct_count = _DelegatedToParsedModule()
+    has_any_structs = _DelegatedToParsedModule()
+    has_any_unnamed_structs = _DelegatedToParsedModule()
+    has_any_named_structs = _DelegatedToParsedModule()
+    has_named_structs = _DelegatedToParsedModule()
+    has_no_structs = _DelegatedToParsedModule()
+    has_no_unnamed_structs = _DelegatedToParsedModule()
+    has_no_named_structs = _DelegatedToParsedModule()
+    has_just_named_structs = _DelegatedToParsedModule()
+    has_named_struct = _DelegatedToParsedModule()
+    unions = _DelegatedToParsedModule()
+    unnamed_unions = _DelegatedToParsedModule()
+    named_unions = _DelegatedToParsedModule()
+    union_names = _DelegatedToParsedModule()
+    union_count = _DelegatedToParsedModule()
+    unnamed_union_count = _DelegatedToParsedModule()
+    named_union_count = _DelegatedToParsedModule()
+    has_any_unions = _DelegatedToParsedModule()
+    has_any_unnamed_unions = _DelegatedToParsedModule()
+    has_any_named_unions = _DelegatedToParsedModule()
+    has_named_unions = _DelegatedToParsedModule()
+    has_no_unions = _DelegatedToParsedModule()
+    has_no_unnamed_unions = _DelegatedToParsedModule()
+    has_no_named_unions = _DelegatedToParsedModule()
+    has_just_named_unions = _DelegatedToParsedModule()
+    has_named_union = _DelegatedToParsedModule()
+    enums = _DelegatedToParsedModule()
+    unnamed_enums = _DelegatedToParsedModule()
+    named_enums = _DelegatedToParsedModule()
+    enum_names = _DelegatedToParsedModule()
+    enum_count = _DelegatedToParsedModule()
+    unnamed_enum_count = _DelegatedToParsedModule()
+    named_enum_count = _DelegatedToParsedModule()
+    has_any_enums = _DelegatedToParsedModule()
+    has_any_unnamed_enums = _DelegatedToParsedModule()
+    has_any_named_enums = _DelegatedToParsedModule()
+    has_named_enums = _DelegatedToParsedModule()
+    has_no_enums = _DelegatedToParsedModule()
+    has_no_unnamed_enums = _DelegatedToParsedModule()
+    has_no_named_enums = _DelegatedToParsedModule()
+    has_just_named_enums = _DelegatedToParsedModule()
+    has_named_enum = _DelegatedToParsedModule()
+    enum_item_names = _DelegatedToParsedModule()
+    enum_item_count = _DelegatedToParsedModule()
+    empty_enums = _DelegatedToParsedModule()
+    empty_enum_count = _DelegatedToParsedModule()
+    has_any_empty_enums = _DelegatedToParsedModule()
+    has_no_empty_enums = _DelegatedToParsedModule()
+    find_all = _DelegatedToParsedModule()
+    has_any = _DelegatedToParsedModule()
+    dump = _DelegatedToParsedModule()
+    dump_to = _DelegatedToParsedModule()
+
+
+class _TokenRules:
+    """Rules of the lexer used in :func:`summarize_tokens()`.
+
+    Identifiers, literals, and comments are recognized by rules from
+    ``ply.ctokens``. Punctuation is recognized in the same way as in
+    ``ply.cpp``. Unlike in ``ply.cpp``, comments and ends of lines are kept
+    because they are needed to find comments and preprocessor directives.
+    """
+
+    tokens = (
+        'ID', 'NUMBER', 'STRING', 'CHARACTER',
+        'COMMENT', 'CPPCOMMENT', 'POUND', 'NEWLINE',
+    )
+    literals = cpp.literals
+
+    t_ID = ctokens.t_ID
+    # A preprocessing number, which includes all the numeric constants (e.g.
+    # 0x1F, 1.5e-3f, or 10ULL).
+    t_NUMBER = r'\.?\d([\w.]|[eEpP][+-])*'
+    # A string literal, possibly with an encoding prefix (the same as in
+    # token_table).
+    t_STRING = r'(?:u8|u|U|L)?' + ctokens.t_STRING
+    t_CHARACTER = ctokens.t_CHARACTER
+    t_COMMENT = ctokens.t_COMMENT
+    # Unlike in ply.ctokens, the comment does not include the end of the line
+    # (the same as in libclang) and it may be at the end of the code.
+    t_CPPCOMMENT = r'//[^\r\n]*'
+    t_POUND = r'\#'
+    t_ignore = ' \t\r\f\v'
+    # Lines ending with a backslash continue on the next line.
+    t_ignore_LINE_CONTINUATION = r'\\\r?\n'
+    t_error = cpp.t_error
+
+    def t_NEWLINE(t):
+        r'\n+'
+        t.lexer.lineno += len(t.value)
+        return t
+
+
+def _get_lexer():
+    """Returns a lexer used in :func:`summarize_tokens()`.
+
+    The lexer is built only once. Every call returns its clone, so the lexer
+    can be used by several threads at once.
+    """
+    global _lexer
+    if _lexer is None:
+        # lex.lex() makes the built lexer the default one, which is used by
+        # parsers that are not given a lexer (e.g. the one in plyara), so
+        # restore the previous default lexer.
+        default_lexer = [getattr(lex, name, None)
+                         for name in ('lexer', 'token', 'input')]
+        try:
+            _lexer = lex.lex(module=_TokenRules)
+        finally:
+            lex.lexer, lex.token, lex.input = default_lexer
+    return _lexer.clone()
+
+
+def _add_include(directive, includes):
+    """Adds the given preprocessor directive into `includes` when it is an
+    include directive.
+
+    :param list directive: Tokens of the directive (without comments).
+    """
+    # #  include  "file"
+    # #  include  <  FILE  >
+    if len(directive) < 3 or directive[1].type != 'ID' or \
+            directive[1].value != 'include':
+        return
+    if directive[2].type == 'STRING':
+        file = directive[2].value
+    elif directive[2].type == '<':
+        end = next(
+            (i for i in range(3, len(directive))
+             if directive[i].type == '>'),
+            None
+        )
+        if end is None:
+            return
+        file = ''.join(token.value for token in directive[2:end + 1])
+    else:
+        return
+    includes.append('#include ' + file)
+
+
+def _get_string_literal_value(literal):
+    """Returns the value of the given string literal."""
+    return literal[literal.index('"') + 1:-1]
+
+
+#: Keywords of C, which are not considered to be identifiers.
+_KEYWORDS = frozenset([
+    'auto', 'break', 'case', 'char', 'const', 'continue', 'default', 'do',
+    'double', 'else', 'enum', 'extern', 'float', 'for', 'goto', 'if',
+    'inline', 'int', 'long', 'register', 'restrict', 'return', 'short',
+    'signed', 'sizeof', 'static', 'struct', 'switch', 'typedef', 'union',
+    'unsigned', 'void', 'volatile', 'while', '_Bool', '_Complex',
+    '_Imaginary',
+])
+
+#: The lexer from which lexers used in :func:`summarize_tokens()` are cloned
+#: (see :func:`_get_lexer()`).
+_lexer = None
+
+#: Is the tokenized mode enabled (see :func:`set_tokenized_mode()`)?
+_tokenized_mode = True
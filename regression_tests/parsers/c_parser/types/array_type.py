@@ -9,6 +9,8 @@ from regression_tests.parsers.c_parser.utils import is_array_kind
 class ArrayType(Type):
     """A representation of an array type."""
 
+    __slots__ = ()
+
     def is_array(self):
         """Returns ``True``."""
         return True
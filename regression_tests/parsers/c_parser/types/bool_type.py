@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.integral_type import IntegralType
 class BoolType(IntegralType):
     """A ``bool`` type."""
 
+    __slots__ = ()
+
     def is_bool(self):
         """Returns ``True``."""
         return True
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.integral_type import IntegralType
 class CharType(IntegralType):
     """A ``char`` type."""
 
+    __slots__ = ()
+
     def __init__(self, type, size=8):
         """
         :param clang.cindex.Type type: Internal type.
@@ -16,6 +16,8 @@ from regression_tests.utils.list import names_of
 class CompositeType(Type):
     """A base class for composite types (``struct``, ``union``)."""
 
+    __slots__ = ()
+
     def is_composite_type(self):
         """Returns ``True``."""
         return True
@@ -5,6 +5,7 @@
 import collections
 
 from regression_tests.parsers.c_parser.types.type import Type
+from regression_tests.parsers.c_parser.utils import get_children
 from regression_tests.parsers.c_parser.utils import INDENT
 from regression_tests.utils import memoize
 
@@ -12,6 +13,8 @@ from regression_tests.utils import memoize
 class EnumType(Type):
     """A representation of an ``enum``."""
 
+    __slots__ = ()
+
     def is_enum(self):
         """Returns ``True``."""
         return True
@@ -34,7 +37,7 @@ class EnumType(Type):
     def items(self):
         """Constants declared in the enum and their values (`dict`)."""
         return collections.OrderedDict(
-            (node.spelling, node.enum_value) for node in self._node.get_children()
+            (node.spelling, node.enum_value) for node in get_children(self._node)
         )
 
     @property
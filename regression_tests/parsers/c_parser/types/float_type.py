@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.floating_point_type import Floating
 class FloatType(FloatingPointType):
     """A ``float`` type."""
 
+    __slots__ = ()
+
     def is_float(self, size=None):
         """Returns ``True`` if `size` matches.
 
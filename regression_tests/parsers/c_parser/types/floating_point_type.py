@@ -9,6 +9,8 @@ class FloatingPointType(NumericType):
     """A base class for all floating-point types (``float``, ``double``, etc.).
     """
 
+    __slots__ = ()
+
     def is_floating_point(self, size=None):
         """Returns ``True`` if `size` matches.
 
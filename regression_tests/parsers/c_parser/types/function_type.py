@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.type import Type
 class FunctionType(Type):
     """A function type."""
 
+    __slots__ = ()
+
     def is_function(self):
         """Returns ``True``."""
         return True
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.integral_type import IntegralType
 class IntType(IntegralType):
     """An ``int`` type."""
 
+    __slots__ = ()
+
     def is_int(self, size=None):
         """Returns ``True`` if `size` matches.
 
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.numeric_type import NumericType
 class IntegralType(NumericType):
     """A base class for all integral types (``int``, ``long int``, etc.)."""
 
+    __slots__ = ()
+
     def is_integral(self, size=None):
         """Returns ``True`` if `size` matches.
 
@@ -11,6 +11,8 @@ class NumericType(Type):
     etc.).
     """
 
+    __slots__ = ('_size',)
+
     def __init__(self, type, size=None):
         """
         :param clang.cindex.Type type: Internal type.
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.type import Type
 class PointerType(Type):
     """A pointer type."""
 
+    __slots__ = ()
+
     def is_pointer(self):
         """Returns ``True``."""
         return True
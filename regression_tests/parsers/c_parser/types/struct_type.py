@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.composite_type import CompositeType
 class StructType(CompositeType):
     """A representation of a structure."""
 
+    __slots__ = ()
+
     @property
     def _type_name(self):
         return 'struct'
@@ -16,6 +16,8 @@ from regression_tests.parsers.c_parser.utils import is_char_kind
 class Type(metaclass=ABCMeta):
     """A base class of all types."""
 
+    __slots__ = ('_type', '_node', '_memoize_cache')
+
     def __init__(self, type, complex_type_node=None):
         """
         :param clang.cindex.Type type: Internal type.
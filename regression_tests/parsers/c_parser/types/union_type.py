@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.composite_type import CompositeType
 class UnionType(CompositeType):
     """A representation of a union."""
 
+    __slots__ = ()
+
     @property
     def _type_name(self):
         return 'union'
@@ -8,6 +8,8 @@ from regression_tests.parsers.c_parser.types.type import Type
 class VoidType(Type):
     """A ``void`` type."""
 
+    __slots__ = ()
+
     def is_void(self):
         """Returns ``True``."""
         return True
@@ -4,6 +4,8 @@
 
 from clang import cindex
 
+from regression_tests.parsers.c_parser.ast_snapshot import locate_node
+from regression_tests.parsers.c_parser.token_table import get_token_table
 from regression_tests.utils.list import items_to_set
 from regression_tests.utils.list import StrPropertyList
 
@@ -77,16 +79,41 @@ def is_array_kind(type):
     }
 
 
+def get_children(node):
+    """Returns a list of child nodes of the given node.
+
+    The children are taken from the AST snapshot of the node's translation
+    unit (see :mod:`.ast_snapshot`) when the node is a part of it.
+    """
+    located = locate_node(node)
+    if located is None:
+        return list(node.get_children())
+    snapshot, i = located
+    return [snapshot.node(j) for j in snapshot.children(i)]
+
+
+def get_children_from_same_file(node):
+    """Returns a list of child nodes of the given node that are from the same
+    file as the node.
+    """
+    located = locate_node(node)
+    if located is None:
+        return [child for child in node.get_children()
+                if from_same_file(child, node)]
+    snapshot, i = located
+    return [snapshot.node(j) for j in snapshot.children_from_same_file(i)]
+
+
 def first_child_node(node):
     """Returns the first child node of the given node."""
-    children = list(node.get_children())
+    children = get_children(node)
     assert children, 'there are no children in node {}'.format(node)
     return children[0]
 
 
 def last_child_node(node):
     """Returns the last child node of the given node."""
-    children = list(node.get_children())
+    children = get_children(node)
     assert children, 'there are no children in node {}'.format(node)
     return children[-1]
 
@@ -111,6 +138,44 @@ def has_token_in_position(node, token, pos):
     return tokens[pos].spelling == token
 
 
+def get_operator_token(node):
+    """Returns the operator of the given operator node (e.g. a binary or unary
+    operator) as a pair ``(spelling, precedes_operands)``.
+
+    The operator is located in the token table of the translation unit (see
+    :mod:`.token_table`) between the extents of the operands, so tokens of the
+    operands are never mistaken for the operator. When the operator cannot be
+    located (e.g. because the node comes from a macro expansion), it returns
+    ``None``.
+    """
+    located = locate_node(node)
+    if located is None:
+        return None
+    snapshot, i = located
+    operands = snapshot.children(i)
+    if not operands:
+        return None
+
+    tokens = get_token_table(node._tu)
+    node_start = snapshot.start_offsets[i]
+    first_operand = operands[0]
+    precedes_operands = snapshot.start_offsets[first_operand] > node_start
+    if precedes_operands:
+        # For example, -x.
+        j = tokens.index_at_or_after(node_start)
+        operator_end = snapshot.start_offsets[first_operand]
+    else:
+        # For example, x + y or x++.
+        j = tokens.index_at_or_after(snapshot.end_offsets[first_operand])
+        if len(operands) > 1:
+            operator_end = snapshot.start_offsets[operands[1]]
+        else:
+            operator_end = snapshot.end_offsets[i]
+    if j == len(tokens) or tokens.end_offsets[j] > operator_end:
+        return None
+    return tokens.spellings[j], precedes_operands
+
+
 def string_from_tokens(node):
     """Creates string from tokens. Omits semicolon."""
     return ''.join(map(lambda t: t.spelling, node.get_tokens()))[:-1]
@@ -145,10 +210,18 @@ def visit_node(node, callback):
 
     Only the nodes that are from the same file as the given node are visited.
     """
+    located = locate_node(node)
+    if located is None:
+        callback(node)
+        for child in node.get_children():
+            if from_same_file(child, node):
+                visit_node(child, callback)
+        return
+
+    snapshot, i = located
     callback(node)
-    for child in node.get_children():
-        if from_same_file(child, node):
-            visit_node(child, callback)
+    for j in snapshot.subtree_from_same_file(i)[1:]:
+        callback(snapshot.node(j))
 
 
 def from_same_file(node1, node2):
@@ -198,6 +271,26 @@ def get_set_of_names(items):
     return {get_name(item) for item in items_to_set(items)}
 
 
+def unify_called_func_name(name):
+    """Returns the unified name of a called function.
+
+    We have to unify names of builtins, such as memset(). For example,
+    memset() is sometimes parsed as memset() but sometimes as
+    __builtin___memset_chk(). This makes our regression tests easier to write
+    and read as we can assume that e.g. memset() is always memset() and not
+    __builtin___memset_chk().
+    """
+    return _BUILTINS.get(name, name)
+
+
+# Names of builtins and the names of functions to which they are unified.
+_BUILTINS = {
+    '__builtin___memset_chk': 'memset',
+    '__builtin___memcpy_chk': 'memcpy',
+    '__builtin___memmove_chk': 'memmove',
+}
+
+
 def underline(text):
     """Returns `text` and another line of the same length composed of dashes.
 
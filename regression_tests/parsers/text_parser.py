@@ -2,6 +2,7 @@
     Parsing of arbitrary text files.
 """
 
+import mmap
 import re
 
 
@@ -27,3 +28,145 @@ class Text(str):
         ``re.search()`` is used to perform the searching.
         """
         return re.search(regexp, self) is not None
+
+
+class MappedText:
+    """Text of a file that is mapped into memory.
+
+    This class is meant for very large files (e.g. LLVM IR of huge binaries).
+    :meth:`contains()` and the ``in`` operator search directly in the mapped
+    file, so the file does not have to be decoded. The text is decoded only
+    when it is needed, e.g. when a string method is called or when the text
+    is compared with a string. Then, the instance behaves like :class:`Text`.
+    Use ``str(text)`` to obtain the text as a string (e.g. to pass it into
+    functions from the :mod:`re` module).
+
+    The searching in the mapped file is used only when the file is ASCII text
+    without ``'\\r'`` characters (i.e. there is no need to convert line endings)
+    and the searched pattern is ASCII, so the results are the same as when the
+    text is searched as a string.
+    """
+
+    def __init__(self, path, encoding='utf-8'):
+        """
+        :param str path: Path to the file. It must not be empty.
+        :param str encoding: Encoding of the file.
+        """
+        self._path = path
+        self._encoding = encoding
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._is_searchable = None
+        self._text = None
+
+    @property
+    def path(self):
+        """Path to the file (`str`)."""
+        return self._path
+
+    @property
+    def text(self):
+        """Decoded text of the file (:class:`Text`)."""
+        if self._text is None:
+            text = self._data[:].decode(self._encoding, errors='replace')
+            if '\r' in text:
+                text = re.sub(r'\r\n?', '\n', text)
+            self._text = Text(text)
+        return self._text
+
+    def contains(self, regexp):
+        """Checks that the given regular expression can be found in the text.
+
+        See :meth:`Text.contains()`.
+        """
+        if self._text is None and self._can_be_searched_in_data():
+            bytes_regexp = _to_bytes_regexp(regexp)
+            if bytes_regexp is not None:
+                return bytes_regexp.search(self._data) is not None
+        return self.text.contains(regexp)
+
+    def __contains__(self, substring):
+        if (self._text is None and substring.isascii() and
+                self._can_be_searched_in_data()):
+            return self._data.find(substring.encode('ascii')) != -1
+        return substring in self.text
+
+    def __getattr__(self, name):
+        # Called only when the attribute was not found in the instance, so
+        # other attributes of strings are taken from the decoded text.
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.text, name)
+
+    def __str__(self):
+        return str(self.text)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._path)
+
+    def __len__(self):
+        return len(self.text)
+
+    def __iter__(self):
+        return iter(self.text)
+
+    def __getitem__(self, key):
+        return self.text[key]
+
+    def __eq__(self, other):
+        if isinstance(other, MappedText):
+            other = other.text
+        return self.text == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.text)
+
+    def __add__(self, other):
+        return self.text + other
+
+    def __radd__(self, other):
+        return other + self.text
+
+    def _can_be_searched_in_data(self):
+        """Can the mapped data be searched instead of the decoded text?"""
+        if self._is_searchable is None:
+            self._is_searchable = (
+                self._encoding.lower().replace('-', '') in ('utf8', 'ascii') and
+                self._data.find(b'\r') == -1 and
+                _is_ascii(self._data)
+            )
+        return self._is_searchable
+
+
+#: Size of chunks in which mapped data are checked (in bytes).
+_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def _is_ascii(data):
+    """Checks whether the given mapped data contain only ASCII characters."""
+    for offset in range(0, len(data), _CHUNK_SIZE):
+        if not data[offset:offset + _CHUNK_SIZE].isascii():
+            return False
+    return True
+
+
+def _to_bytes_regexp(regexp):
+    """Converts the given regular expression into a compiled regular
+    expression for searching in ASCII bytes.
+
+    Returns ``None`` when the conversion is not possible.
+    """
+    if isinstance(regexp, re.Pattern):
+        pattern, flags = regexp.pattern, regexp.flags & ~re.UNICODE
+    else:
+        pattern, flags = regexp, 0
+    if not isinstance(pattern, str) or not pattern.isascii():
+        return None
+    try:
+        return re.compile(pattern.encode('ascii'), flags)
+    except re.error:
+        # E.g. escape sequences that are invalid in bytes patterns (\u).
+        return None
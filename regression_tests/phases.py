@@ -0,0 +1,113 @@
+"""
+    Measurement of durations of phases of test cases.
+"""
+
+import contextlib
+import time
+
+
+#: Preparation of the directory for outputs of the tool.
+TOOL_DIR_PREPARATION = 'tool-dir preparation'
+
+#: Execution of the tool.
+TOOL_EXECUTION = 'tool execution'
+
+#: Creation and writing of the log of the tool.
+LOG_WRITING = 'log writing'
+
+#: Compression of outputs of the tool.
+OUTPUT_COMPRESSION = 'output compression'
+
+#: Storing of outputs of the tool into a content-addressed store.
+OUTPUT_STORING = 'output storing'
+
+#: Parsing of outputs of the tool (C, configuration, YARA).
+OUTPUT_PARSING = 'output parsing'
+
+#: Creation and evaluation of the tests (without nested phases).
+ASSERTIONS = 'assertions'
+
+#: Compilation of output C files and runs of the compiled programs.
+C_COMPILATION_AND_RUN = 'C compilation and run'
+
+
+class PhaseTimer:
+    """Measures durations of phases.
+
+    Phases may be nested. The time spent in a nested phase is not included in
+    the duration of the enclosing phase, so the durations of all phases sum up
+    to the total measured time.
+
+    >>> timer = PhaseTimer()
+    >>> with timer.phase(ASSERTIONS):
+    ...     with timer.phase(OUTPUT_PARSING):
+    ...         parse()
+    >>> timer.durations
+    {'assertions': 0.2, 'output parsing': 1.5}
+    """
+
+    def __init__(self):
+        self._durations = {}
+        # A stack of [phase name, time when the phase was (re)started].
+        self._running_phases = []
+
+    @property
+    def durations(self):
+        """Durations of the measured phases (`dict`, phase name => seconds).
+        """
+        return dict(self._durations)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """A context manager measuring the duration of its body as the given
+        phase.
+
+        When the body is executed repeatedly, the durations are summed up.
+        """
+        now = time.perf_counter()
+        if self._running_phases:
+            self._pause(self._running_phases[-1], now)
+        self._running_phases.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._pause(self._running_phases.pop(), now)
+            if self._running_phases:
+                self._running_phases[-1][1] = now
+
+    def reset(self):
+        """Forgets all the measured durations."""
+        self._durations.clear()
+        self._running_phases.clear()
+
+    def _pause(self, running_phase, now):
+        name, start = running_phase
+        self._durations[name] = self._durations.get(name, 0.0) + now - start
+
+
+# A timer used by the framework. Every worker has its own timer, and since a
+# worker runs a single test case at once, the timer measures the currently run
+# test case.
+_timer = PhaseTimer()
+
+
+def measure_phase(name):
+    """A context manager measuring the duration of its body as the given phase
+    of the currently run test case.
+    """
+    return _timer.phase(name)
+
+
+def reset_phase_durations():
+    """Forgets durations of phases measured so far (e.g. in a previous test
+    case).
+    """
+    _timer.reset()
+
+
+def get_phase_durations():
+    """Returns durations of phases of the currently run test case (`dict`,
+    phase name => seconds).
+    """
+    return _timer.durations
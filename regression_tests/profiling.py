@@ -0,0 +1,150 @@
+"""
+    Profiling of the regression tests framework itself.
+"""
+
+import cProfile
+import gc
+import json
+import os
+import pstats
+import sys
+
+from regression_tests.utils import get_memoize_stats
+
+
+class NoProfiler:
+    """A profiler that does not profile anything.
+
+    Implements the Null object design pattern. It provides the same
+    interface as `cProfile.Profile` (as far as it is used in the framework).
+    """
+
+    def enable(self):
+        pass
+
+    def disable(self):
+        pass
+
+
+def create_profiler(enabled):
+    """Creates a profiler.
+
+    :param bool enabled: Should the profiler really profile?
+
+    :returns: `cProfile.Profile` when `enabled` is ``True``,
+              :class:`NoProfiler` otherwise.
+    """
+    return cProfile.Profile() if enabled else NoProfiler()
+
+
+def save_profile(profiler, profiles_dir, name):
+    """Saves data gathered by the given profiler into the given directory.
+
+    :param cProfile.Profile profiler: Profiler whose data should be saved.
+    :param str profiles_dir: Directory into which the data should be saved.
+    :param str name: Name of the profile (it has to be unique in the
+                     directory).
+    """
+    profiler.dump_stats(os.path.join(profiles_dir, '{}.prof'.format(name)))
+
+
+def merge_profiles(profiles_dir):
+    """Merges all profiles in the given directory.
+
+    :returns: The merged profile (`pstats.Stats`) or ``None`` if there are no
+              profiles in the directory.
+    """
+    profile_files = sorted(
+        os.path.join(profiles_dir, file_name)
+        for file_name in os.listdir(profiles_dir)
+        if file_name.endswith('.prof')
+    )
+    if not profile_files:
+        return None
+    return pstats.Stats(*profile_files)
+
+
+def print_profile_report(stats, limit=30, stream=sys.stdout):
+    """Prints a report for the given profile to the given stream.
+
+    :param pstats.Stats stats: Profile to be reported.
+    :param int limit: Maximal number of functions to be included.
+
+    The functions are sorted by their cumulative time.
+    """
+    stats.stream = stream
+    stats.sort_stats(pstats.SortKey.CUMULATIVE, pstats.SortKey.TIME)
+    stats.print_stats(limit)
+
+
+def save_memoize_stats(profiles_dir, name):
+    """Saves statistics of memoized functions of the current process into the
+    given directory.
+
+    :param str profiles_dir: Directory into which the statistics should be
+                             saved.
+    :param str name: Name of the statistics (it has to be unique in the
+                     directory). Since the statistics are cumulative, a
+                     process should always use the same name.
+    """
+    # Release unreachable objects (and thus their cached results) so that
+    # only results that are really kept in memory are reported.
+    gc.collect()
+    path = os.path.join(profiles_dir, '{}.memoize.json'.format(name))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(get_memoize_stats(), f)
+
+
+def merge_memoize_stats(profiles_dir):
+    """Merges all statistics of memoized functions in the given directory.
+
+    :returns: A dictionary in the format of
+              :func:`regression_tests.utils.get_memoize_stats()`.
+    """
+    merged_stats = {}
+    for file_name in sorted(os.listdir(profiles_dir)):
+        if not file_name.endswith('.memoize.json'):
+            continue
+        path = os.path.join(profiles_dir, file_name)
+        with open(path, 'r', encoding='utf-8') as f:
+            for func_name, stats in json.load(f).items():
+                merged = merged_stats.setdefault(
+                    func_name, dict.fromkeys(stats, 0)
+                )
+                for key, value in stats.items():
+                    merged[key] += value
+    return merged_stats
+
+
+def print_memoize_report(stats, limit=30, stream=sys.stdout):
+    """Prints a report for the given statistics of memoized functions to the
+    given stream.
+
+    :param dict stats: Statistics to be reported (see
+                       :func:`merge_memoize_stats()`).
+    :param int limit: Maximal number of functions to be included.
+
+    The functions are sorted by the size of results they keep in memory and
+    by the number of calls.
+    """
+    func_names = sorted(
+        stats,
+        key=lambda name: (
+            stats[name]['cached_bytes'],
+            stats[name]['hits'] + stats[name]['misses']
+        ),
+        reverse=True
+    )
+    print('{:>10} {:>9} {:>10} {:>12}  {}'.format(
+        'calls', 'hit rate', 'cached', 'cached bytes', 'function'
+    ), file=stream)
+    for name in func_names[:limit]:
+        func_stats = stats[name]
+        calls = func_stats['hits'] + func_stats['misses']
+        print('{:>10} {:>8.1f}% {:>10} {:>12}  {}'.format(
+            calls,
+            100 * func_stats['hits'] / calls if calls else 0,
+            func_stats['cached_entries'],
+            func_stats['cached_bytes'],
+            name
+        ), file=stream)
@@ -0,0 +1,424 @@
+"""
+    Limits of resources (memory, CPU) for run tools.
+"""
+
+import itertools
+import math
+import os
+import re
+import time
+
+try:
+    import resource
+except ImportError:
+    # The resource module is not available on Windows.
+    resource = None
+
+from regression_tests.utils.os import on_linux
+
+
+class ResourceLimits:
+    """Limits of resources for a single run of a tool."""
+
+    def __init__(self, memory_limit=None, cpu_limit=None):
+        """
+        :param int memory_limit: Maximal amount of memory (in bytes) that the
+                                 tool (including its children) may use.
+        :param float cpu_limit: Maximal number of CPUs that the tool
+                                (including its children) may utilize.
+
+        ``None`` means no limit.
+        """
+        self.memory_limit = memory_limit
+        self.cpu_limit = cpu_limit
+
+    def has_limits(self):
+        """Is at least one of the resources limited?"""
+        return self.memory_limit is not None or self.cpu_limit is not None
+
+    def __repr__(self):
+        return '{}(memory_limit={!r}, cpu_limit={!r})'.format(
+            self.__class__.__name__,
+            self.memory_limit,
+            self.cpu_limit
+        )
+
+    def __eq__(self, other):
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not self == other
+
+
+def create_resource_limiter(limits):
+    """Creates the best resource limiter available on the current system.
+
+    :param ResourceLimits limits: Limits to be applied.
+
+    When cgroup v2 is delegated to the current user, the returned limiter runs
+    every tool in its own cgroup (:class:`CgroupResourceLimiter`). Otherwise,
+    it falls back to per-process resource limits
+    (:class:`RlimitResourceLimiter`). When there are no limits or the system
+    supports neither of them, it returns a limiter that does not limit
+    anything (:class:`ResourceLimiter`).
+    """
+    if not limits.has_limits():
+        return ResourceLimiter(limits)
+
+    cgroup_dir = find_delegated_cgroup_dir()
+    if cgroup_dir is not None:
+        limiter = CgroupResourceLimiter(limits, cgroup_dir)
+        if limiter.setup():
+            return limiter
+
+    if resource is not None:
+        return RlimitResourceLimiter(limits)
+
+    return ResourceLimiter(limits)
+
+
+def find_delegated_cgroup_dir():
+    """Returns a path to the cgroup v2 directory of the current process if it
+    has been delegated to us (i.e. we can create sub-cgroups in it with the
+    memory and cpu controllers), ``None`` otherwise.
+    """
+    if not on_linux():
+        return None
+
+    try:
+        mount_dir = _get_cgroup2_mount_dir()
+        if mount_dir is None:
+            return None
+
+        cgroup_path = _get_cgroup2_path_of_current_process()
+        if cgroup_path is None:
+            return None
+
+        cgroup_dir = os.path.join(mount_dir, cgroup_path.lstrip('/'))
+        controllers = _read_file(
+            os.path.join(cgroup_dir, 'cgroup.controllers')
+        ).split()
+    except OSError:
+        return None
+
+    if 'memory' not in controllers or 'cpu' not in controllers:
+        return None
+
+    if not os.access(cgroup_dir, os.W_OK) or \
+            not os.access(os.path.join(cgroup_dir, 'cgroup.subtree_control'), os.W_OK):
+        return None
+
+    return cgroup_dir
+
+
+class ResourceLimiter:
+    """A resource limiter that does not limit anything.
+
+    It is also a base class of other limiters.
+    """
+
+    def __init__(self, limits):
+        """
+        :param ResourceLimits limits: Limits to be applied.
+        """
+        self._limits = limits
+
+    @property
+    def limits(self):
+        """Limits to be applied (:class:`ResourceLimits`)."""
+        return self._limits
+
+    def new_run(self, timeout=None):
+        """Prepares limits for a new run of a tool.
+
+        :param int timeout: Timeout of the run (in seconds).
+
+        :returns: The prepared run (:class:`LimitedRun`).
+        """
+        return LimitedRun()
+
+
+class LimitedRun:
+    """A single run of a tool with limited resources.
+
+    This class does not limit anything. Subclasses override its methods to
+    apply concrete limits.
+    """
+
+    def apply_to_current_process(self):
+        """Applies the limits to the current process.
+
+        It is called in the child process, after ``fork()`` and before
+        ``exec()``.
+        """
+        pass
+
+    def was_oom_killed(self):
+        """Has the tool been killed because it exceeded the memory limit?
+
+        It has to be called after the tool finishes.
+        """
+        return False
+
+    def release(self):
+        """Releases resources associated with the run."""
+        pass
+
+
+class RlimitResourceLimiter(ResourceLimiter):
+    """A resource limiter that uses per-process resource limits (``setrlimit()``).
+
+    The memory limit is applied as ``RLIMIT_AS`` to the tool and, separately,
+    to each of its children. The CPU limit is applied as ``RLIMIT_CPU``, where
+    the CPU-time budget is ``cpu_limit * timeout`` seconds; without a timeout,
+    the CPU limit cannot be applied.
+
+    A process that exceeds ``RLIMIT_AS`` merely gets failed allocations, so
+    unlike :class:`CgroupResourceLimiter`, this limiter cannot tell OOM kills
+    from other failures.
+    """
+
+    def new_run(self, timeout=None):
+        return _RlimitRun(self.limits, timeout)
+
+
+class _RlimitRun(LimitedRun):
+    """A run limited by ``setrlimit()``."""
+
+    def __init__(self, limits, timeout):
+        self._limits = limits
+        self._timeout = timeout
+
+    def apply_to_current_process(self):
+        if self._limits.memory_limit is not None:
+            resource.setrlimit(
+                resource.RLIMIT_AS,
+                (self._limits.memory_limit, self._limits.memory_limit)
+            )
+
+        if self._limits.cpu_limit is not None and self._timeout is not None:
+            cpu_time = max(1, math.ceil(self._limits.cpu_limit * self._timeout))
+            # When the soft limit is reached, the process receives SIGXCPU.
+            # When the hard limit is reached, it receives SIGKILL.
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_time, cpu_time + 1))
+
+
+class CgroupResourceLimiter(ResourceLimiter):
+    """A resource limiter that runs every tool in its own cgroup (v2).
+
+    The memory limit is written into ``memory.max`` and the CPU limit into
+    ``cpu.max`` of the cgroup. Since the limits apply to the cgroup as a whole,
+    they also cover all the children of the tool. When the kernel kills a
+    process in the cgroup because the memory limit has been exceeded, it is
+    recorded in ``memory.events``, so OOM kills can be told from other
+    failures.
+    """
+
+    #: Name of the cgroup into which the runner (and its workers) are moved.
+    runner_cgroup_name = 'regression-tests-runner'
+
+    #: Period for ``cpu.max`` (in microseconds).
+    cpu_period = 100000
+
+    def __init__(self, limits, cgroup_dir):
+        """
+        :param ResourceLimits limits: Limits to be applied.
+        :param str cgroup_dir: Delegated cgroup directory in which cgroups for
+                               the tools are created.
+        """
+        super().__init__(limits)
+        self._cgroup_dir = cgroup_dir
+        self._run_ids = itertools.count()
+
+    @property
+    def cgroup_dir(self):
+        """Delegated cgroup directory (`str`)."""
+        return self._cgroup_dir
+
+    def setup(self):
+        """Prepares the delegated cgroup so that sub-cgroups with limits can be
+        created in it.
+
+        :returns: ``True`` if the setup succeeded, ``False`` otherwise.
+
+        Due to the "no internal processes" rule of cgroup v2, controllers can
+        be enabled for children only when there are no processes in the cgroup
+        itself. Therefore, the current process is moved into a leaf sub-cgroup
+        first. It has to be called in the main process before any workers are
+        started so that the workers inherit the leaf cgroup.
+        """
+        try:
+            runner_cgroup_dir = os.path.join(
+                self._cgroup_dir,
+                self.runner_cgroup_name
+            )
+            os.makedirs(runner_cgroup_dir, exist_ok=True)
+            _write_file(
+                os.path.join(runner_cgroup_dir, 'cgroup.procs'),
+                str(os.getpid())
+            )
+            _write_file(
+                os.path.join(self._cgroup_dir, 'cgroup.subtree_control'),
+                '+memory +cpu'
+            )
+        except OSError:
+            return False
+        self._remove_stale_run_cgroups()
+        return True
+
+    def _remove_stale_run_cgroups(self):
+        """Removes cgroups of runs that were left behind by runners that no
+        longer exist (e.g. because they were killed).
+        """
+        try:
+            names = os.listdir(self._cgroup_dir)
+        except OSError:
+            return
+        for name in names:
+            m = _RUN_CGROUP_NAME_RE.fullmatch(name)
+            if m is None or _process_exists(int(m.group(1))):
+                continue
+            _CgroupRun(os.path.join(self._cgroup_dir, name)).release()
+
+    def new_run(self, timeout=None):
+        run_cgroup_dir = os.path.join(
+            self._cgroup_dir,
+            'tool-{}-{}'.format(os.getpid(), next(self._run_ids))
+        )
+        os.makedirs(run_cgroup_dir, exist_ok=True)
+
+        if self.limits.memory_limit is not None:
+            _write_file(
+                os.path.join(run_cgroup_dir, 'memory.max'),
+                str(self.limits.memory_limit)
+            )
+            # Without disabling swap, the tool would start swapping instead of
+            # being killed, slowing down other tests.
+            swap_max_file_path = os.path.join(run_cgroup_dir, 'memory.swap.max')
+            if os.path.exists(swap_max_file_path):
+                _write_file(swap_max_file_path, '0')
+
+        if self.limits.cpu_limit is not None:
+            quota = max(1000, int(self.limits.cpu_limit * self.cpu_period))
+            _write_file(
+                os.path.join(run_cgroup_dir, 'cpu.max'),
+                '{} {}'.format(quota, self.cpu_period)
+            )
+
+        return _CgroupRun(run_cgroup_dir)
+
+
+class _CgroupRun(LimitedRun):
+    """A run in its own cgroup."""
+
+    def __init__(self, cgroup_dir):
+        self._cgroup_dir = cgroup_dir
+
+    def apply_to_current_process(self):
+        _write_file(
+            os.path.join(self._cgroup_dir, 'cgroup.procs'),
+            str(os.getpid())
+        )
+
+    def was_oom_killed(self):
+        try:
+            events = _read_file(os.path.join(self._cgroup_dir, 'memory.events'))
+        except OSError:
+            return False
+        return _parse_events(events).get('oom_kill', 0) > 0
+
+    #: Maximal time (in seconds) to wait for killed processes to leave the
+    #: cgroup before it is removed.
+    release_timeout = 5
+
+    def release(self):
+        # Kill any processes that are left behind (e.g. daemons spawned by the
+        # tool) so that the cgroup can be removed.
+        kill_file_path = os.path.join(self._cgroup_dir, 'cgroup.kill')
+        try:
+            if os.path.exists(kill_file_path):
+                _write_file(kill_file_path, '1')
+            # The killed processes are still exiting, and a cgroup with
+            # processes cannot be removed (EBUSY).
+            self._wait_until_unpopulated()
+            os.rmdir(self._cgroup_dir)
+        except OSError:
+            pass
+
+    def _wait_until_unpopulated(self):
+        """Waits until there are no processes in the cgroup (or until
+        :attr:`release_timeout` elapses).
+        """
+        events_file_path = os.path.join(self._cgroup_dir, 'cgroup.events')
+        deadline = time.monotonic() + self.release_timeout
+        while time.monotonic() < deadline:
+            try:
+                events = _read_file(events_file_path)
+            except OSError:
+                return
+            if _parse_events(events).get('populated', 0) == 0:
+                return
+            time.sleep(0.01)
+
+
+def _get_cgroup2_mount_dir():
+    """Returns the directory where the cgroup v2 hierarchy is mounted (or
+    ``None``).
+    """
+    for line in _read_file('/proc/mounts').splitlines():
+        fields = line.split()
+        if len(fields) >= 3 and fields[2] == 'cgroup2':
+            return fields[1]
+    return None
+
+
+def _get_cgroup2_path_of_current_process():
+    """Returns the path of the current process in the cgroup v2 hierarchy (or
+    ``None``).
+    """
+    # The cgroup v2 entry has the form "0::/path".
+    for line in _read_file('/proc/self/cgroup').splitlines():
+        if line.startswith('0::'):
+            return line[3:]
+    return None
+
+
+def _parse_events(events):
+    """Parses the contents of ``memory.events`` or ``cgroup.events`` into a
+    dictionary.
+    """
+    parsed_events = {}
+    for line in events.splitlines():
+        name, _, value = line.partition(' ')
+        if value.strip().isdigit():
+            parsed_events[name] = int(value)
+    return parsed_events
+
+
+def _process_exists(pid):
+    """Does a process with the given PID exist?"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # E.g. the process exists but belongs to another user.
+        return True
+    return True
+
+
+# A name of a cgroup of a run (see CgroupResourceLimiter.new_run()), with the
+# PID of the process that created it.
+_RUN_CGROUP_NAME_RE = re.compile(r'tool-(\d+)-\d+')
+
+
+def _read_file(path):
+    """Returns the contents of the given file."""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def _write_file(path, content):
+    """Writes the given content into the given file."""
+    with open(path, 'w') as f:
+        f.write(content)
@@ -0,0 +1,294 @@
+"""
+    A journal of results of a run of regression tests.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from regression_tests.filesystem.file import File
+from regression_tests.test_results import TestResults
+from regression_tests.test_settings import TestSettings
+
+
+#: Options from the ``[runner]`` section of the configuration that may change
+#: results of test cases. When any of them changes, results from the journal
+#: are not reused.
+RESULT_AFFECTING_OPTIONS = (
+    'clang_dir',
+    'retdec_install_dir',
+    'skip_c_compilation_tests',
+    'tool_memory_limit',
+    'tool_cpu_limit',
+    'assertions_timeout',
+    'c_skip_function_bodies',
+    'c_tokenized_mode',
+    'idaplugin_tests_enabled',
+    'idaplugin_ida_dir',
+    'idaplugin_script',
+    'r2plugin_tests_enabled',
+    'r2plugin_script',
+)
+
+
+class RunJournal:
+    """A journal of results of a run of regression tests.
+
+    Every finished test case is appended to the journal as a single line of
+    JSON and the journal is flushed to disk immediately, so the results survive
+    an interruption of the run. Every entry contains a cache key of the test
+    case (see :func:`compute_cache_key()`), so when a run is resumed, only test
+    cases whose cache key has not changed are skipped.
+    """
+
+    def __init__(self, path, tools_dir, runner_config=None):
+        """
+        :param str path: Path to the journal.
+        :param Directory tools_dir: Directory where the tested tools are
+                                    located.
+        :param runner_config: The ``[runner]`` section of the configuration
+                              (a mapping of options to their values).
+        """
+        self._path = path
+        self._tools_signature = compute_tools_signature(
+            tools_dir,
+            runner_config
+        )
+        self._cache_keys = {}
+        self._file = None
+
+    @property
+    def path(self):
+        """Path to the journal (`str`)."""
+        return self._path
+
+    def cache_key(self, test_case):
+        """Returns the cache key of the given test case (`str`)."""
+        if test_case.full_name not in self._cache_keys:
+            self._cache_keys[test_case.full_name] = compute_cache_key(
+                test_case,
+                self._tools_signature
+            )
+        return self._cache_keys[test_case.full_name]
+
+    def load(self):
+        """Loads results from the journal.
+
+        :returns: A dictionary mapping cache keys to results
+                  (:class:`.TestResults`). When the journal does not exist, the
+                  dictionary is empty.
+
+        Incomplete entries (e.g. when the runner was killed while writing an
+        entry) are ignored.
+        """
+        results = {}
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        results[entry['cache_key']] = _test_results_from_dict(
+                            entry['results']
+                        )
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        return results
+
+    def open(self, keep_entries=False):
+        """Opens the journal for recording of results.
+
+        :param bool keep_entries: Should the existing entries be kept? If not,
+                                  the journal is emptied.
+        """
+        dir = os.path.dirname(self._path)
+        if dir:
+            os.makedirs(dir, exist_ok=True)
+        self._file = open(
+            self._path,
+            'a' if keep_entries else 'w',
+            encoding='utf-8'
+        )
+
+    def record(self, test_case, test_results):
+        """Records the given results of the given test case into the journal.
+        """
+        entry = {
+            'cache_key': self.cache_key(test_case),
+            'results': _test_results_to_dict(test_results),
+        }
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """Closes the journal."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def compute_tools_signature(tools_dir, runner_config=None):
+    """Computes a signature of the tested tools in the given directory and of
+    the way they are run.
+
+    :param Directory tools_dir: Directory where the tested tools are located.
+    :param runner_config: The ``[runner]`` section of the configuration (a
+                          mapping of options to their values).
+
+    The signature changes whenever a file in the directory (or in any of its
+    subdirectories) is added, removed, or modified, when sources of the
+    framework change, or when an option from :data:`RESULT_AFFECTING_OPTIONS`
+    changes.
+    """
+    signature = hashlib.sha256()
+    signature.update(os.path.abspath(tools_dir.path).encode('utf-8'))
+    _update_hash_from_tree(signature, tools_dir.path)
+    signature.update(_get_framework_version().encode('utf-8'))
+    if runner_config is not None:
+        for option in RESULT_AFFECTING_OPTIONS:
+            signature.update('{}={}\n'.format(
+                option,
+                runner_config.get(option, '')
+            ).encode('utf-8'))
+    return signature.hexdigest()
+
+
+def compute_cache_key(test_case, tools_signature):
+    """Computes a cache key of the given test case.
+
+    :param TestCase test_case: Test case for which the key is computed.
+    :param str tools_signature: Signature of the tested tools (see
+                                :func:`compute_tools_signature()`).
+
+    The key changes whenever the test case would produce different results:
+    when the tested tools, the framework, or the configuration of the runner
+    change (see :func:`compute_tools_signature()`), when the module with the test case changes,
+    or when the arguments or input files of the tool change.
+    """
+    key = hashlib.sha256()
+    key.update(tools_signature.encode('utf-8'))
+    key.update(test_case.full_name.encode('utf-8'))
+    _update_hash_from_file(key, test_case.test_module.file.path)
+    tool_arguments = test_case.tool_arguments
+    key.update(tool_arguments.as_str.encode('utf-8'))
+    for rel_path, file in _input_files_in(tool_arguments, test_case.dir):
+        key.update(rel_path.encode('utf-8'))
+        _update_hash_from_file(key, file.path)
+    return key.hexdigest()
+
+
+def _input_files_in(tool_arguments, inputs_dir):
+    """Returns existing input files from the given tool arguments.
+
+    :returns: A sorted list of pairs (path relative to `inputs_dir`,
+              :class:`.File`).
+
+    Only files located in `inputs_dir` (or its subdirectories) are considered
+    to be inputs. Files in the directory with outputs are skipped.
+    """
+    files = []
+    for value in vars(tool_arguments).values():
+        candidates = value if isinstance(value, tuple) else (value,)
+        for candidate in candidates:
+            if not isinstance(candidate, File) or \
+                    not os.path.isfile(candidate.path):
+                continue
+            rel_path = os.path.relpath(candidate.path, inputs_dir.path)
+            first_component = rel_path.split(os.sep)[0]
+            if first_component in (os.pardir, TestSettings.outputs_dir_name):
+                continue
+            files.append((rel_path, candidate))
+    return sorted(files, key=lambda item: item[0])
+
+
+def _update_hash_from_tree(hash, dir_path):
+    """Updates the given hash with paths, sizes, and modification times of all
+    files in the given directory and its subdirectories.
+    """
+    for current_dir, dir_names, file_names in os.walk(dir_path):
+        dir_names.sort()
+        for name in sorted(file_names):
+            path = os.path.join(current_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            hash.update('{}:{}:{}\n'.format(
+                os.path.relpath(path, dir_path),
+                stat.st_size,
+                stat.st_mtime_ns
+            ).encode('utf-8'))
+
+
+def _get_framework_version():
+    """Returns a version of the framework.
+
+    It is a hash of the sources of the framework (the ``regression_tests``
+    package and the runner next to it), so results obtained by an older
+    version of the framework are not reused.
+    """
+    global _framework_version
+    if _framework_version is None:
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        version = hashlib.sha256()
+        paths = [os.path.join(os.path.dirname(package_dir), 'runner.py')]
+        for dir_path, dir_names, file_names in os.walk(package_dir):
+            dir_names.sort()
+            paths.extend(
+                os.path.join(dir_path, file_name)
+                for file_name in sorted(file_names)
+                if file_name.endswith('.py')
+            )
+        for path in paths:
+            if os.path.isfile(path):
+                _update_hash_from_file(version, path)
+        _framework_version = version.hexdigest()
+    return _framework_version
+
+
+#: Cached version of the framework (see :func:`_get_framework_version()`).
+_framework_version = None
+
+
+def _update_hash_from_file(hash, path):
+    """Updates the given hash with the contents of the given file."""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hash.update(chunk)
+
+
+def _test_results_to_dict(test_results):
+    """Converts the given test results into a JSON-serializable dictionary."""
+    return {
+        'module_name': test_results.module_name,
+        'case_name': str(test_results.case_name),
+        'start_date': test_results.start_date.isoformat(),
+        'end_date': test_results.end_date.isoformat(),
+        'run_tests': test_results.run_tests,
+        'failed_tests': test_results.failed_tests,
+        'skipped_tests': test_results.skipped_tests,
+        'output': test_results.output,
+        'timeouted': test_results.timeouted,
+        'phase_durations': test_results.phase_durations,
+    }
+
+
+def _test_results_from_dict(d):
+    """Creates test results from the given dictionary (see
+    :func:`_test_results_to_dict()`).
+    """
+    return TestResults(
+        d['module_name'],
+        d['case_name'],
+        datetime.fromisoformat(d['start_date']),
+        datetime.fromisoformat(d['end_date']),
+        d['run_tests'],
+        d['failed_tests'],
+        d['skipped_tests'],
+        d['output'],
+        d['timeouted'],
+        d['phase_durations']
+    )
@@ -0,0 +1,238 @@
+"""
+    Live status of a run of regression tests.
+"""
+
+import http.server
+import json
+import os
+import threading
+import time
+
+
+class RunStatus:
+    """Live status of a run of regression tests.
+
+    The runner updates the status as test cases start and finish. The status
+    can be obtained as a JSON-serializable snapshot at any time, also from
+    other threads (e.g. from :class:`StatusServer`).
+    """
+
+    def __init__(self, test_cases_count, clock=time.monotonic):
+        """
+        :param int test_cases_count: Total number of test cases in the run.
+        :param callable clock: A function returning the current time (in
+                               seconds).
+        """
+        self._test_cases_count = test_cases_count
+        self._clock = clock
+        self._start_time = clock()
+        self._lock = threading.Lock()
+        # Name of a test case => (PID of the worker, phase, start time).
+        self._running_test_cases = {}
+        self._completed = 0
+        self._failed = 0
+        self._resumed = 0
+        # PID of a worker => [busy time of finished test cases, number of
+        # finished test cases].
+        self._workers = {}
+
+    def test_cases_resumed(self, count, failed):
+        """Records that the given number of test cases were taken from a
+        previous run (`failed` of them failed).
+        """
+        with self._lock:
+            self._resumed += count
+            self._completed += count
+            self._failed += failed
+
+    def test_case_started(self, name, pid, phase='tool'):
+        """Records that the given test case started running in the worker with
+        the given PID.
+
+        When the test case is already running, only its phase is updated.
+        """
+        with self._lock:
+            self._workers.setdefault(pid, [0.0, 0])
+            if name in self._running_test_cases:
+                pid, _, start_time = self._running_test_cases[name]
+                self._running_test_cases[name] = (pid, phase, start_time)
+            else:
+                self._running_test_cases[name] = (pid, phase, self._clock())
+
+    def test_case_finished(self, name, failed):
+        """Records that the given test case finished."""
+        with self._lock:
+            self._completed += 1
+            if failed:
+                self._failed += 1
+            running_test_case = self._running_test_cases.pop(name, None)
+            if running_test_case is not None:
+                pid, _, start_time = running_test_case
+                worker = self._workers.setdefault(pid, [0.0, 0])
+                worker[0] += self._clock() - start_time
+                worker[1] += 1
+
+    def snapshot(self):
+        """Returns a snapshot of the status (a JSON-serializable `dict`)."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._start_time
+            running = [
+                {
+                    'name': name,
+                    'pid': pid,
+                    'phase': phase,
+                    'elapsed': round(now - start_time, 2),
+                }
+                for name, (pid, phase, start_time) in sorted(
+                    self._running_test_cases.items(),
+                    key=lambda item: item[1][2]
+                )
+            ]
+            workers = []
+            for pid, (busy_time, finished) in sorted(self._workers.items()):
+                current_busy_time = sum(
+                    now - start_time
+                    for worker_pid, _, start_time in self._running_test_cases.values()
+                    if worker_pid == pid
+                )
+                workers.append({
+                    'pid': pid,
+                    'finished_test_cases': finished,
+                    'busy': round(busy_time + current_busy_time, 2),
+                    'utilization': round(
+                        (busy_time + current_busy_time) / elapsed, 3
+                    ) if elapsed > 0 else 0.0,
+                })
+            return {
+                'pid': os.getpid(),
+                'elapsed': round(elapsed, 2),
+                'total': self._test_cases_count,
+                'completed': self._completed,
+                'failed': self._failed,
+                'resumed': self._resumed,
+                'queued': self._test_cases_count - self._completed - len(running),
+                'running': running,
+                'workers': workers,
+            }
+
+
+def write_status_snapshot(status, path):
+    """Writes a snapshot of the given status into the given file (as JSON).
+
+    The file is replaced atomically, so readers never see a partially written
+    snapshot.
+    """
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(status.snapshot(), f, indent=4)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+class StatusSnapshotWriter:
+    """Writes snapshots of a status into a file upon request.
+
+    Requesting a snapshot only sets a flag, so it can be done from a signal
+    handler. The snapshot is written by a background thread because the
+    interrupted thread may hold the lock of the status.
+    """
+
+    #: How often is the flag checked (in seconds)?
+    polling_interval = 0.1
+
+    def __init__(self, status, path):
+        """
+        :param RunStatus status: Status whose snapshots are written.
+        :param str path: Path to the file into which snapshots are written.
+        """
+        self._status = status
+        self._path = path
+        self._requested = False
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def request(self):
+        """Requests writing of a snapshot."""
+        self._requested = True
+
+    def start(self):
+        """Starts writing of requested snapshots in a background thread."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops writing of requested snapshots."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stopped.wait(self.polling_interval):
+            if self._requested:
+                self._requested = False
+                write_status_snapshot(self._status, self._path)
+
+
+class StatusServer:
+    """An HTTP server providing snapshots of a status on localhost.
+
+    Every ``GET`` request is answered with the current snapshot (as JSON).
+    """
+
+    def __init__(self, status, port):
+        """
+        :param RunStatus status: Status to be provided.
+        :param int port: Port on which the server listens (0 = choose a free
+                         port).
+        """
+        class RequestHandler(_StatusRequestHandler):
+            run_status = status
+
+        self._server = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', port),
+            RequestHandler
+        )
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self):
+        """Port on which the server listens (`int`)."""
+        return self._server.server_address[1]
+
+    def start(self):
+        """Starts the server in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops the server."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+
+class _StatusRequestHandler(http.server.BaseHTTPRequestHandler):
+    """A handler of requests for :class:`StatusServer`."""
+
+    #: Status to be provided (:class:`RunStatus`).
+    run_status = None
+
+    def do_GET(self):
+        body = json.dumps(self.run_status.snapshot(), indent=4).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Do not clutter the output of the runner.
+        pass
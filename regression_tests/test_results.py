@@ -15,7 +15,8 @@ class TestResults:
     __test__ = False
 
     def __init__(self, module_name, case_name, start_date, end_date, run_tests,
-                 failed_tests, skipped_tests, output):
+                 failed_tests, skipped_tests, output, timeouted=False,
+                 phase_durations=None):
         """
         :param str module_name: Name of the module to which the test correspond.
         :param str case_name: Name of the case to which the test correspond.
@@ -25,6 +26,11 @@ class TestResults:
         :param int failed_tests: Number of failed tests.
         :param int skipped_tests: Number of skipped tests.
         :param str output: Output from the tests.
+        :param bool timeouted: Has the test case exceeded its time limit for
+                               running the tests (assertions)?
+        :param dict phase_durations: Durations of phases of the test case (phase
+                                     name => seconds, see
+                                     :mod:`regression_tests.phases`).
         """
         self._module_name = module_name
         self._case_name = TestCaseName(case_name)
@@ -34,6 +40,8 @@ class TestResults:
         self._failed_tests = failed_tests
         self._skipped_tests = skipped_tests
         self._output = output
+        self._timeouted = timeouted
+        self._phase_durations = phase_durations or {}
 
     @property
     def module_name(self):
@@ -72,6 +80,20 @@ class TestResults:
         """Output from the tests (`str`)."""
         return self._output
 
+    @property
+    def timeouted(self):
+        """Has the test case exceeded its time limit for running the tests
+        (assertions)?
+        """
+        return self._timeouted
+
+    @property
+    def phase_durations(self):
+        """Durations of phases of the test case (`dict`, phase name =>
+        seconds).
+        """
+        return self._phase_durations
+
     @property
     def full_name(self):
         """Full name."""
@@ -274,6 +296,17 @@ class TestsResults(list):
                 max_end_date = result.end_date
         return max_end_date
 
+    @property
+    def phase_durations(self):
+        """Durations of phases summed over all the tests (`dict`, phase name =>
+        seconds).
+        """
+        phase_durations = {}
+        for result in self:
+            for phase, duration in result.phase_durations.items():
+                phase_durations[phase] = phase_durations.get(phase, 0.0) + duration
+        return phase_durations
+
     @property
     def runtime(self):
         """Runtime of all the tests (real time, in seconds).
@@ -0,0 +1,84 @@
+"""
+    Limiting of time spent in Python code.
+"""
+
+import contextlib
+import signal
+import threading
+
+
+class TimeLimitExceededError(Exception):
+    """An exception raised when the time limit has been exceeded."""
+    pass
+
+
+class TimeLimit:
+    """A time limit for a block of code.
+
+    The limit is implemented by ``SIGALRM``: when it is exceeded,
+    :class:`TimeLimitExceededError` is raised in the main thread of the
+    current process. The signal is only handled between Python instructions,
+    so a stuck call into native code (e.g. into libclang) cannot be interrupted
+    this way. Such code has to be terminated from the outside, e.g. by killing
+    the process that runs it.
+    """
+
+    def __init__(self, seconds):
+        """
+        :param float seconds: Time limit (in seconds). ``None`` means no limit.
+        """
+        self._seconds = seconds
+        self._expired = False
+
+    @property
+    def seconds(self):
+        """Time limit (in seconds, `float`)."""
+        return self._seconds
+
+    @property
+    def expired(self):
+        """Has the time limit been exceeded?"""
+        return self._expired
+
+    def _on_alarm(self, signum, frame):
+        self._expired = True
+        raise TimeLimitExceededError(
+            'time limit of {} seconds exceeded'.format(self._seconds)
+        )
+
+
+def is_time_limit_supported():
+    """Can time limits be enforced in the current thread?"""
+    return (hasattr(signal, 'SIGALRM') and
+            hasattr(signal, 'setitimer') and
+            threading.current_thread() is threading.main_thread())
+
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """A context manager that limits the time spent in its body.
+
+    :param float seconds: Time limit (in seconds). ``None`` means no limit.
+
+    :returns: The time limit (:class:`TimeLimit`) so that the caller can check
+              whether it has been exceeded.
+
+    When the limit is exceeded, :class:`TimeLimitExceededError` is raised from
+    the currently running code. When time limits are not supported (see
+    :func:`is_time_limit_supported()`), the body runs without a limit.
+
+    >>> with time_limit(10) as limit:
+    ...     do_something()
+    """
+    limit = TimeLimit(seconds)
+    if seconds is None or not is_time_limit_supported():
+        yield limit
+        return
+
+    orig_handler = signal.signal(signal.SIGALRM, limit._on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield limit
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, orig_handler)
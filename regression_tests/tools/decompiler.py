@@ -20,6 +20,7 @@ class Decompiler(Tool):
         return self.args.input_files[0]
 
     @property
+    @memoize
     def out_hll_file(self):
         """Output file in the high-level language (C, Python)."""
         return self._get_file(self.args.output_file.name)
@@ -90,6 +91,7 @@ class Decompiler(Tool):
         return self.out_ll_file.text
 
     @property
+    @memoize
     def out_config_file(self):
         """Output configuration file."""
         return self._get_file(self.out_base_file_name + '.config.json')
@@ -101,6 +103,15 @@ class Decompiler(Tool):
         """
         return self.out_config_file.text
 
+    @overrides(Tool)
+    def prefetch_outputs(self):
+        # The output C file and the output configuration file are used by
+        # nearly all the tests, so parse them while the runner does other
+        # work (e.g. writes the log).
+        if self.out_hll_is_c():
+            self.out_c_file.prefetch_text()
+        self.out_config_file.prefetch_text()
+
     @property
     @overrides(Tool)
     def log_file_name(self):
@@ -140,7 +151,7 @@ class Decompiler(Tool):
                 |
                     \./retdec-decompiler:\ line\ \d+: # Failed (segfault etc.).
                 )
-            """, self.log, re.VERBOSE | re.MULTILINE | re.DOTALL)
+            """, str(self.log), re.VERBOSE | re.MULTILINE | re.DOTALL)
         return [FileinfoOutput(output.strip()) for output in outputs]
 
     def _verify_output_hll_is_c(self):
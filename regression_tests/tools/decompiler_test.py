@@ -5,6 +5,8 @@
 import os
 import re
 
+from regression_tests.phases import C_COMPILATION_AND_RUN
+from regression_tests.phases import measure_phase
 from regression_tests.tools.tool_test import ToolTest
 from regression_tests.utils.os import on_windows, on_macos
 
@@ -59,8 +61,10 @@ class DecompilerTest(ToolTest):
         )
         self.assertFalse(self.decompiler.timeouted, msg=msg)
 
-        msg = '{} failed; output:\n...\n{}'.format(
+        msg = '{} failed{}; output:\n...\n{}'.format(
             self.decompiler.name,
+            ' (killed because it exceeded the memory limit)'
+            if self.decompiler.oom_killed else '',
             self.decompiler.end_of_output()
         )
         self.assertEqual(self.decompiler.return_code, 0, msg=msg)
@@ -169,11 +173,12 @@ class DecompilerTest(ToolTest):
             return
 
         compiler_arch_bitsize = '-m64' if self._use_64_bit_compiler() else '-m32'
-        output, return_code, timeouted = self.decompiler._run_cmd(
-            self._get_compiler_for_out_c() + [
-                '--std=c99', compiler_arch_bitsize, input_file.path, '-o', output_file.path
-            ]
-        )
+        with measure_phase(C_COMPILATION_AND_RUN):
+            output, return_code, timeouted = self.decompiler._run_cmd(
+                self._get_compiler_for_out_c() + [
+                    '--std=c99', compiler_arch_bitsize, input_file.path, '-o', output_file.path
+                ]
+            )
         what = "compilation of file '{}'".format(input_file.path)
         self._verify_not_timeouted(what, timeouted, timeout)
         self._verify_ended_successfully(what, return_code, output)
@@ -267,8 +272,9 @@ class DecompilerTest(ToolTest):
 
     def _run_file(self, file, input, timeout):
         """Runs the given file with the given input and timeout. """
-        output, return_code, timeouted = self.decompiler._run_cmd(
-            [file.path], input, timeout)
+        with measure_phase(C_COMPILATION_AND_RUN):
+            output, return_code, timeouted = self.decompiler._run_cmd(
+                [file.path], input, timeout)
         self._verify_not_timeouted(
             "run of file '{}'".format(file.path),
             timeouted,
@@ -4,6 +4,7 @@
 
 import re
 
+from regression_tests.cmd_runner import CapturedOutput
 from regression_tests.utils import memoize
 from regression_tests.parsers.text_parser import Text
 
@@ -12,15 +13,18 @@ class Tool:
     """A representation of a generic tool that has run."""
 
     def __init__(self, name, dir, args, cmd_runner, output, return_code,
-                 timeouted):
+                 timeouted, oom_killed=False):
         """
         :param str name: Name of the tool.
         :param Directory dir: Base directory for the outputs of the tool.
         :param ToolArguments args: Arguments of the tool.
         :param CmdRunner cmd_runner: Runner of external commands.
-        :param str output: Output from the tool.
+        :param output: Output from the tool (`str` or
+                       :class:`~regression_tests.cmd_runner.CapturedOutput`).
         :param int return_code: Return code of the tool.
         :param bool timeouted: Has the tool timeouted?
+        :param bool oom_killed: Has the tool been killed because it exceeded
+                                the memory limit?
         """
         self._name = name
         self._dir = dir
@@ -29,6 +33,7 @@ class Tool:
         self._output = output
         self._return_code = return_code
         self._timeouted = timeouted
+        self._oom_killed = oom_killed
 
     @property
     def name(self):
@@ -87,11 +92,32 @@ class Tool:
     @property
     @memoize
     def output(self):
-        """Output from the tool (:class:`.Text`)."""
-        return Text(self._output)
+        """Output from the tool (:class:`.Text`).
+
+        When the output was captured into a file, it is loaded on the first
+        access.
+        """
+        return Text(str(self._output))
+
+    @property
+    def captured_output(self):
+        """Output from the tool captured into a file
+        (:class:`~regression_tests.cmd_runner.CapturedOutput`).
+
+        When the output was not captured into a file, it returns ``None``.
+        """
+        if isinstance(self._output, CapturedOutput):
+            return self._output
+        return None
 
     def end_of_output(self, lines=10):
         """Returns the last `lines` from the output."""
+        # Prevent loading of the whole output when it was captured into a
+        # file and its end is available.
+        if self.captured_output is not None:
+            end = self.captured_output.end(lines)
+            if end is not None:
+                return end
         return self._end_of(self.output, lines)
 
     @property
@@ -99,6 +125,15 @@ class Tool:
         """Has the tool timeouted?"""
         return self._timeouted
 
+    @property
+    def oom_killed(self):
+        """Has the tool been killed because it exceeded the memory limit?
+
+        See :class:`~regression_tests.resource_limits.ResourceLimiter` for
+        more details.
+        """
+        return self._oom_killed
+
     @property
     def input_files(self):
         """A tuple of input files (:class:`.File`).
@@ -134,6 +169,15 @@ class Tool:
         """Returns the last `lines` from the log."""
         return self._end_of(self.log, lines)
 
+    def prefetch_outputs(self):
+        """Starts parsing of outputs of the tool in the background.
+
+        It is called right after the tool finishes, so the outputs are ready
+        (or at least being parsed) when the tests access them. By default,
+        there is nothing to prefetch.
+        """
+        pass
+
     def _run_cmd(self, *args, **kwargs):
         """Runs the given command with the given arguments by passing it to the
         command runner.
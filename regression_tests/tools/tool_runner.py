@@ -4,22 +4,47 @@
 
 import os
 
+from regression_tests.phases import LOG_WRITING
+from regression_tests.phases import OUTPUT_COMPRESSION
+from regression_tests.phases import OUTPUT_STORING
+from regression_tests.phases import TOOL_DIR_PREPARATION
+from regression_tests.phases import TOOL_EXECUTION
+from regression_tests.phases import measure_phase
 from regression_tests.tools.tool import Tool
 
 
+def set_output_prefetching(enabled):
+    """Sets whether outputs of tools are parsed in the background right after
+    the tools finish (see :func:`.Tool.prefetch_outputs()`).
+
+    :param bool enabled: Should the outputs be prefetched?
+    """
+    global _prefetch_outputs
+    _prefetch_outputs = enabled
+
+
 class ToolRunner:
     """A generic tool runner."""
 
-    def __init__(self, cmd_runner, tools_dir, test_settings):
+    def __init__(self, cmd_runner, tools_dir, test_settings,
+                 output_compressor=None, output_store=None):
         """
         :param CmdRunner cmd_runner: Runner of external commands to be used.
         :param Directory tools_dir: Directory where the tested tools are
                                     located.
         :param ToolTestSettings test_settings: Settings of the tested tool.
+        :param OutputCompressor output_compressor: Compressor of outputs of
+                                                   the tool (``None`` = do
+                                                   not compress outputs).
+        :param OutputStore output_store: Content-addressed store into which
+                                         outputs of the tool are stored
+                                         (``None`` = do not store outputs).
         """
         self._cmd_runner = cmd_runner
         self._tools_dir = tools_dir
         self._test_settings = test_settings
+        self._output_compressor = output_compressor
+        self._output_store = output_store
 
     def run_tool(self, tool_name, args, dir, timeout):
         """Runs the tool with the given arguments.
@@ -32,13 +57,11 @@ class ToolRunner:
 
         :returns: The run tool (:class:`.Tool`).
         """
-        self._create_tool_dir(dir)
-        args = self._initialize_tool_dir_and_args(dir, args)
-        output, return_code, timeouted = self._run_tool(
-            tool_name,
-            args,
-            timeout
-        )
+        with measure_phase(TOOL_DIR_PREPARATION):
+            self._create_tool_dir(dir)
+            args = self._initialize_tool_dir_and_args(dir, args)
+        result = self._run_tool(tool_name, args, timeout, dir)
+        output, return_code, timeouted = result
         tool = self._get_tool(
             tool_name,
             args,
@@ -46,9 +69,19 @@ class ToolRunner:
             output,
             return_code,
             timeout,
-            timeouted
+            timeouted,
+            result.oom_killed
         )
-        self._create_and_store_log(dir, tool, timeout)
+        if _prefetch_outputs:
+            tool.prefetch_outputs()
+        with measure_phase(LOG_WRITING):
+            self._create_and_store_log(dir, tool, timeout)
+        if self._output_compressor is not None:
+            with measure_phase(OUTPUT_COMPRESSION):
+                self._output_compressor.compress_outputs(dir)
+        if self._output_store is not None:
+            with measure_phase(OUTPUT_STORING):
+                self._output_store.store_outputs(dir)
         return tool
 
     def _create_tool_dir(self, dir):
@@ -63,14 +96,29 @@ class ToolRunner:
         # By default, there is nothing to do.
         return args
 
-    def _run_tool(self, tool_name, args, timeout):
-        """Runs the tool and returns the results."""
+    def _run_tool(self, tool_name, args, timeout, dir):
+        """Runs the tool and returns the results.
+
+        The output of the tool is captured into a file in the given directory
+        so that huge outputs are not kept in memory.
+        """
         executable_name = self._get_tool_executable_name(tool_name)
-        return self._cmd_runner.run_cmd(
-            [os.path.join(self._tools_dir.path, executable_name)] + args.as_list,
-            strip_shell_colors=True,
-            timeout=timeout
-        )
+        with measure_phase(TOOL_EXECUTION):
+            return self._cmd_runner.run_cmd(
+                [os.path.join(self._tools_dir.path, executable_name)] + args.as_list,
+                strip_shell_colors=True,
+                timeout=timeout,
+                output_file=self._get_captured_output_path(tool_name, dir)
+            )
+
+    def _get_captured_output_path(self, tool_name, dir):
+        """Returns a path to the file into which the output of the tool is
+        captured.
+
+        The file exists only until the log is stored (the output is then
+        moved into the log).
+        """
+        return os.path.join(dir.path, '{}.output'.format(tool_name))
 
     @property
     def _tool_class(self):
@@ -84,7 +132,7 @@ class ToolRunner:
         return tool_name
 
     def _get_tool(self, tool_name, args, dir, output, return_code, timeout,
-                  timeouted):
+                  timeouted, oom_killed=False):
         """Creates a tool from the given arguments."""
         return self._tool_class(
             tool_name,
@@ -93,7 +141,8 @@ class ToolRunner:
             self._cmd_runner,
             output,
             return_code,
-            timeouted
+            timeouted,
+            oom_killed
         )
 
     def _create_and_store_log(self, dir, tool, timeout):
@@ -102,12 +151,17 @@ class ToolRunner:
         self._store_log(log, tool, dir)
 
     def _create_log(self, tool, timeout):
-        """Creates a log for the given tool."""
+        """Creates a log for the given tool.
+
+        The log is a list of parts that are either strings or outputs captured
+        into files (:class:`~regression_tests.cmd_runner.CapturedOutput`). The
+        latter are copied into the log file when it is stored, so they never
+        have to be loaded into memory.
+        """
         log_header = self._create_log_header(tool, timeout)
         log_body = self._create_log_body(tool)
         log_footer = self._create_log_footer(tool)
-        log = '\n\n'.join([log_header, log_body, log_footer])
-        return log.strip() + '\n'
+        return [log_header, '\n\n', log_body, '\n\n', log_footer, '\n']
 
     def _create_log_header(self, tool, timeout):
         """Creates the header for the tool log."""
@@ -121,20 +175,48 @@ class ToolRunner:
 
     def _create_log_body(self, tool):
         """Creates the body for the tool log."""
+        # A captured output is already stripped.
+        if tool.captured_output is not None:
+            return tool.captured_output
         return tool.output.strip()
 
     def _create_log_footer(self, tool):
         """Creates the footer for the tool log."""
-        return '\n'.join([
+        footer = [
             '# Return code: {}'.format(tool.return_code),
             '# Timeouted:   {}'.format('yes' if tool.timeouted else 'no'),
-        ])
+        ]
+        # Emit the line only when needed to keep the logs of most runs the
+        # same as before the introduction of memory limits.
+        if tool.oom_killed:
+            footer.append('# OOM killed:  yes')
+        return '\n'.join(footer)
 
     def _combine_logs(self, log1, log2):
         """Combines the given two logs into a single log."""
         separator = '# ' + 78 * '-' + '\n'
-        return '{}\n{}\n{}'.format(log1, separator, log2)
+        return log1 + ['\n', separator, '\n'] + log2
 
     def _store_log(self, log, tool, dir):
         """Stores the log from the given tool into the given directory."""
-        dir.store_file(tool.log_file_name, log)
+        if all(isinstance(part, str) for part in log):
+            dir.store_file(tool.log_file_name, ''.join(log))
+            return
+
+        # Copy captured outputs into the log and then let them be loaded from
+        # the log instead of from the files into which they were captured.
+        log_path = os.path.join(dir.path, tool.log_file_name)
+        moved_outputs = []
+        with open(log_path, 'wb') as f:
+            for part in log:
+                if isinstance(part, str):
+                    f.write(part.encode('utf-8'))
+                else:
+                    moved_outputs.append((part, f.tell()))
+                    part.copy_stripped_output_to(f)
+        for output, offset in moved_outputs:
+            output.move_to(log_path, offset)
+
+
+#: Should outputs of tools be prefetched (see :func:`set_output_prefetching()`)?
+_prefetch_outputs = False
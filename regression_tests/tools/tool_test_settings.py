@@ -88,14 +88,27 @@ class ToolTestSettings(TestSettings):
         """
         return ToolRunner
 
-    def get_tool_runner(self, cmd_runner, tools_dir):
+    def get_tool_runner(self, cmd_runner, tools_dir, output_compressor=None,
+                        output_store=None):
         """Returns a runner for the tool.
 
         :param CmdRunner cmd_runner: Runner of external commands to be used.
         :param Directory tools_dir: Directory where the tested tools are
                                     located.
+        :param OutputCompressor output_compressor: Compressor of outputs of
+                                                   the tool (``None`` = do
+                                                   not compress outputs).
+        :param OutputStore output_store: Content-addressed store into which
+                                         outputs of the tool are stored
+                                         (``None`` = do not store outputs).
         """
-        return self.tool_runner_class(cmd_runner, tools_dir, self)
+        return self.tool_runner_class(
+            cmd_runner,
+            tools_dir,
+            self,
+            output_compressor,
+            output_store
+        )
 
     @property
     def tool_test_class(self):
@@ -26,7 +26,7 @@ class UnpackerRunner(ToolRunner):
 
     @overrides(ToolRunner)
     def _get_tool(self, tool_name, args, dir, output, return_code, timeout,
-                  timeouted):
+                  timeouted, oom_killed=False):
         # The only difference between this method and ToolRunner._get_tool() is
         # that we have to potentially run fileinfo (if it was requested).
         fileinfo = self._run_fileinfo_if_requested(dir, args)
@@ -38,6 +38,7 @@ class UnpackerRunner(ToolRunner):
             output,
             return_code,
             timeouted,
+            oom_killed,
             fileinfo=fileinfo
         )
 
@@ -52,11 +53,13 @@ class UnpackerRunner(ToolRunner):
             input_files=(unpacker_args.output_file,),
             args=self._test_settings.fileinfo_args
         )
-        output, return_code, timeouted = self._run_tool(
+        result = self._run_tool(
             'fileinfo',
             fileinfo_args,
-            self._test_settings.fileinfo_timeout
+            self._test_settings.fileinfo_timeout,
+            dir
         )
+        output, return_code, timeouted = result
         return Fileinfo(
             'fileinfo',
             dir,
@@ -64,7 +67,8 @@ class UnpackerRunner(ToolRunner):
             self._cmd_runner,
             output,
             return_code,
-            timeouted
+            timeouted,
+            result.oom_killed
         )
 
     @overrides(ToolRunner)
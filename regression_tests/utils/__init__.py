@@ -4,6 +4,7 @@
 
 import functools
 import inspect
+import sys
 
 
 def memoize(func):
@@ -12,8 +13,148 @@ def memoize(func):
     It stores the results of function calls and returns the stored result when
     the same inputs occur again. The decorator also works on methods or
     properties.
+
+    Results of methods (functions whose first parameter is ``self``) are stored
+    in the instance on which the method was called (in the
+    ``_memoize_cache`` attribute), so they are released together with the
+    instance. Instances of classes with ``__slots__`` have to provide a slot
+    of this name. Results of other functions are stored in the function
+    itself.
+
+    Statistics of the memoization are available via
+    :func:`get_memoize_stats()`.
     """
-    return functools.lru_cache(maxsize=None)(func)
+    stats = _memoize_stats.setdefault(
+        getattr(func, '__qualname__', repr(func)),
+        _MemoizeStats()
+    )
+
+    if _is_method(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                cache = self._memoize_cache
+            except AttributeError:
+                cache = self._memoize_cache = _InstanceCache()
+            key = _make_key(func, args, kwargs)
+            try:
+                result = cache[key]
+            except KeyError:
+                stats.misses += 1
+                result = cache[key] = func(self, *args, **kwargs)
+                cache.record_size(stats, result)
+            else:
+                stats.hits += 1
+            return result
+        return wrapper
+
+    cache = {}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _make_key(func, args, kwargs)
+        try:
+            result = cache[key]
+        except KeyError:
+            stats.misses += 1
+            result = cache[key] = func(*args, **kwargs)
+            stats.cached_entries += 1
+            stats.cached_bytes += sys.getsizeof(result)
+        else:
+            stats.hits += 1
+        return result
+    return wrapper
+
+
+def get_memoize_stats():
+    """Returns statistics of memoized functions in the current process.
+
+    :returns: A dictionary mapping qualified names of memoized functions into
+              dictionaries with the following keys:
+
+              * ``hits``: number of calls whose result was taken from the
+                cache,
+              * ``misses``: number of calls whose result had to be computed,
+              * ``cached_entries``: number of results that are currently
+                stored,
+              * ``cached_bytes``: approximate size of the currently stored
+                results (``sys.getsizeof()`` of the results, so objects
+                referenced by the results are not included).
+
+              Functions that have not been called are not included.
+    """
+    return {
+        name: stats.as_dict()
+        for name, stats in _memoize_stats.items()
+        if stats.hits or stats.misses
+    }
+
+
+class _MemoizeStats:
+    """Statistics of a single memoized function."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.cached_entries = 0
+        self.cached_bytes = 0
+
+    def as_dict(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'cached_entries': self.cached_entries,
+            'cached_bytes': self.cached_bytes,
+        }
+
+
+class _InstanceCache(dict):
+    """A cache of results of memoized methods of a single instance.
+
+    When the cache is released (together with its instance), the statistics
+    of the cached results are updated.
+    """
+
+    def record_size(self, stats, result):
+        """Records the size of the given result of a function with the given
+        statistics.
+        """
+        size = sys.getsizeof(result)
+        stats.cached_entries += 1
+        stats.cached_bytes += size
+        try:
+            self._sizes.append((stats, size))
+        except AttributeError:
+            self._sizes = [(stats, size)]
+
+    def __del__(self):
+        for stats, size in getattr(self, '_sizes', ()):
+            stats.cached_entries -= 1
+            stats.cached_bytes -= size
+
+
+#: Statistics of memoized functions (qualified name => statistics).
+_memoize_stats = {}
+
+
+def _is_method(func):
+    """Checks whether the given function is a method, i.e. whether its first
+    parameter is ``self``.
+    """
+    # Do not use list() here because the name refers to the
+    # regression_tests.utils.list module in this package.
+    try:
+        parameters = tuple(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return False
+    return bool(parameters) and parameters[0] == 'self'
+
+
+def _make_key(func, args, kwargs):
+    """Creates a key for a cache of results of the given function."""
+    if kwargs:
+        return (func, args, tuple(sorted(kwargs.items())))
+    return (func, args)
 
 
 def overrides(interface_class):
@@ -0,0 +1,157 @@
+"""
+    Running of functions in the background.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+
+def run_in_background(func, *args, **kwargs):
+    """Runs the given function with the given arguments in a background
+    thread.
+
+    :returns: Future of the result (:class:`concurrent.futures.Future`).
+
+    The functions are run one after another in a single thread per process.
+    It pays off for functions that spend most of their time outside of Python
+    code (e.g. in libclang, which releases the GIL while parsing), so they can
+    overlap with the work of the main thread.
+    """
+    return _get_background_thread().submit(func, *args, **kwargs)
+
+
+def wait_for_result(future):
+    """Waits until the function run in the background (see
+    :func:`run_in_background()`) finishes and returns its result.
+
+    :param concurrent.futures.Future future: Future of the result.
+
+    When the waiting is interrupted (e.g. by a time limit), the function is
+    cancelled when it has not started yet, or abandoned when it runs (see
+    :func:`abandon_running_function()`), so that it does not block functions
+    run in the background afterwards.
+    """
+    try:
+        return future.result()
+    except BaseException:
+        if not future.done() and not future.cancel():
+            abandon_running_function()
+        raise
+
+
+def abandon_running_function():
+    """Stops waiting for the function that is currently run in the background.
+
+    A hung function (e.g. stuck in libclang) would otherwise block all the
+    functions run in the background after it. The functions that have not
+    started yet, as well as functions run afterwards, are run in a new thread.
+    The abandoned thread cannot be stopped, but it does not prevent the
+    process from exiting.
+    """
+    global _background_thread, _abandoned_functions
+    if _background_thread is None or _background_thread_pid != os.getpid():
+        return
+    pending_calls = _background_thread.stop()
+    _background_thread = None
+    _abandoned_functions += 1
+    for call in pending_calls:
+        _get_background_thread().resubmit(call)
+
+
+def has_abandoned_functions():
+    """Has a function run in the background in the current process been
+    abandoned (see :func:`abandon_running_function()`)?
+    """
+    return _background_thread_pid == os.getpid() and _abandoned_functions > 0
+
+
+class _BackgroundThread:
+    """A daemon thread running submitted functions one after another.
+
+    Unlike threads of :class:`concurrent.futures.ThreadPoolExecutor`, the
+    thread is not joined when the process exits, so a hung function cannot
+    prevent the process from exiting.
+    """
+
+    def __init__(self):
+        self._calls = queue.SimpleQueue()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name='background',
+            daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, func, *args, **kwargs):
+        """Schedules the given function to be run and returns a future of its
+        result.
+        """
+        future = Future()
+        self.resubmit((future, func, args, kwargs))
+        return future
+
+    def resubmit(self, call):
+        """Schedules a call taken from another thread (see :func:`stop()`)."""
+        self._calls.put(call)
+
+    def stop(self):
+        """Stops taking further calls and returns the calls that have not
+        been started.
+        """
+        self._stopped = True
+        pending_calls = []
+        while True:
+            try:
+                pending_calls.append(self._calls.get_nowait())
+            except queue.Empty:
+                return pending_calls
+
+    def _run(self):
+        # A call taken from the queue is always run because it has not been
+        # returned from stop().
+        while not self._stopped:
+            self._run_call(self._calls.get())
+
+    def _run_call(self, call):
+        future, func, args, kwargs = call
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as ex:
+            future.set_exception(ex)
+        else:
+            future.set_result(result)
+
+
+def _get_background_thread():
+    """Returns a thread running functions in the background.
+
+    The thread is created only once per process (and then again when its
+    running function is abandoned).
+    """
+    global _background_thread, _background_thread_pid, _abandoned_functions
+    # Threads are not inherited by forked processes, so a thread created
+    # before a fork cannot be used in the child process.
+    if _background_thread_pid != os.getpid():
+        _background_thread = None
+        _background_thread_pid = os.getpid()
+        _abandoned_functions = 0
+    if _background_thread is None:
+        _background_thread = _BackgroundThread()
+    return _background_thread
+
+
+#: Thread running functions in the background (see
+#: :func:`_get_background_thread()`).
+_background_thread = None
+
+#: ID of the process that created :data:`_background_thread`.
+_background_thread_pid = None
+
+#: Number of functions abandoned in the current process (see
+#: :func:`abandon_running_function()`).
+_abandoned_functions = 0
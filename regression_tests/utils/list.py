@@ -18,16 +18,70 @@ class StrPropertyList(list):
     property.
 
     For an example of a subclass, see :class:`.NamedObjectList`.
+
+    Objects are looked up in a mapping of values of their properties into
+    indexes, which is built when an object is looked up for the first time.
+    The mapping is discarded whenever the list is modified. However, it is not
+    discarded when the property of an object in the list changes.
     """
 
+    #: Mapping of values of the properties into indexes of the first objects
+    #: having them (``None`` when it has not been built yet, ``_UNHASHABLE``
+    #: when the values are not hashable).
+    _indexes_by_key = None
+
     def __getitem__(self, key):
         return self._delegate_to_list('__getitem__', key)
 
     def __setitem__(self, key, value):
-        return self._delegate_to_list('__setitem__', key, value)
+        result = self._delegate_to_list('__setitem__', key, value)
+        self._indexes_by_key = None
+        return result
 
     def __delitem__(self, key):
-        return self._delegate_to_list('__delitem__', key)
+        result = self._delegate_to_list('__delitem__', key)
+        self._indexes_by_key = None
+        return result
+
+    def __iadd__(self, other):
+        self._indexes_by_key = None
+        return super().__iadd__(other)
+
+    def __imul__(self, n):
+        self._indexes_by_key = None
+        return super().__imul__(n)
+
+    def append(self, item):
+        self._indexes_by_key = None
+        return super().append(item)
+
+    def extend(self, items):
+        self._indexes_by_key = None
+        return super().extend(items)
+
+    def insert(self, index, item):
+        self._indexes_by_key = None
+        return super().insert(index, item)
+
+    def pop(self, *args):
+        self._indexes_by_key = None
+        return super().pop(*args)
+
+    def remove(self, item):
+        self._indexes_by_key = None
+        return super().remove(item)
+
+    def clear(self):
+        self._indexes_by_key = None
+        return super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._indexes_by_key = None
+        return super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._indexes_by_key = None
+        return super().reverse()
 
     def _delegate_to_list(self, method, key, *args):
         """Delegates the given indexing method to the list, possibly after
@@ -52,13 +106,56 @@ class StrPropertyList(list):
         raise NotImplementedError
 
     def _index_of(self, value):
+        if self._indexes_by_key is None:
+            self._indexes_by_key = self._build_indexes_by_key()
+        if self._indexes_by_key is _UNHASHABLE:
+            index = self._find_index_of(value)
+        else:
+            try:
+                index = self._indexes_by_key.get(value)
+            except TypeError:
+                # The looked-up value is not hashable.
+                index = self._find_index_of(value)
+        if index is None:
+            raise IndexError('no object with {!r} equal to {!r}'.format(
+                self.property_name,
+                value
+            ))
+        return index
+
+    def _find_index_of(self, value):
+        """Returns the index of the first object whose property is equal to
+        the given value (``None`` when there is no such object).
+
+        Unlike :meth:`_index_of()`, it goes through all the objects, so it
+        works even for values that are not hashable.
+        """
+        return next(
+            (i for i, item in enumerate(self)
+             if getattr(item, self.property_name) == value),
+            None
+        )
+
+    def _build_indexes_by_key(self):
+        """Builds a mapping of values of the properties into indexes of the
+        first objects having them (``_UNHASHABLE`` when the values are not
+        hashable).
+        """
+        indexes_by_key = {}
         for index, item in enumerate(self):
-            if getattr(item, self.property_name) == value:
-                return index
-        raise IndexError('no object with {!r} equal to {!r}'.format(
-            self.property_name,
-            value
-        ))
+            try:
+                indexes_by_key.setdefault(
+                    getattr(item, self.property_name),
+                    index
+                )
+            except TypeError:
+                return _UNHASHABLE
+        return indexes_by_key
+
+
+#: A marker of :attr:`StrPropertyList._indexes_by_key` meaning that values of
+#: the properties are not hashable, so the mapping cannot be built.
+_UNHASHABLE = object()
 
 
 class NamedObjectList(StrPropertyList):
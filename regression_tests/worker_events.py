@@ -0,0 +1,41 @@
+"""
+    Events sent by workers to the runner.
+"""
+
+import multiprocessing as mp
+
+
+class WorkerEvents:
+    """A queue through which workers notify the runner about events (e.g. that
+    they have started to run a test case).
+
+    Every event is put into the queue while holding :attr:`lock`. The runner
+    acquires the lock before it kills a worker, so the worker is never killed
+    in the middle of writing an event, which would leave the queue in an
+    inconsistent state.
+    """
+
+    def __init__(self):
+        self._queue = mp.SimpleQueue()
+        self._lock = mp.Lock()
+
+    @property
+    def lock(self):
+        """The lock held while an event is put into the queue."""
+        return self._lock
+
+    def put(self, event):
+        """Puts the given event into the queue (called in a worker)."""
+        with self._lock:
+            self._queue.put(event)
+
+    def get(self):
+        """Gets an event from the queue (called in the runner).
+
+        It blocks until an event is available.
+        """
+        return self._queue.get()
+
+    def empty(self):
+        """Is the queue empty?"""
+        return self._queue.empty()
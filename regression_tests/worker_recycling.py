@@ -0,0 +1,53 @@
+"""
+    Recycling of workers that run test cases.
+"""
+
+import os
+import sys
+
+try:
+    import resource
+except ImportError:
+    # The resource module is not available on Windows.
+    resource = None
+
+
+def get_current_rss():
+    """Returns the resident set size of the current process (in bytes).
+
+    When the current resident set size cannot be obtained (e.g. there is no
+    ``/proc``), the peak resident set size is returned instead. When neither
+    of them can be obtained, it returns ``None``.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        if resource is None:
+            return None
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+        return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def should_retire_worker(finished_test_cases, max_rss, rss=None):
+    """Should a worker that finished the given number of test cases be
+    replaced with a new one before it runs another test case?
+
+    :param int finished_test_cases: Number of test cases the worker finished.
+    :param int max_rss: Maximal resident set size of the worker (in bytes) or
+                        ``None`` when it is not limited.
+    :param int rss: Current resident set size of the worker (in bytes). When
+                    it is ``None``, it is obtained by
+                    :func:`get_current_rss()`.
+
+    A worker that has not finished any test case is never retired. Otherwise,
+    a limit lower than the memory inherited from the runner would make the
+    workers to be replaced endlessly.
+    """
+    if max_rss is None or finished_test_cases == 0:
+        return False
+    if rss is None:
+        rss = get_current_rss()
+    return rss is not None and rss > max_rss
@@ -12,24 +12,76 @@ import shutil
 import signal
 import stat
 import sys
+import tempfile
+import time
 import traceback
 import unittest
 from datetime import datetime
+from multiprocessing.util import Finalize
 
 from regression_tests.clang import setup_clang_bindings
 from regression_tests.cmd_runner import CmdRunner
 from regression_tests.config import parse_standard_config_files
+from regression_tests.cpu_pinning import WorkerCpuSets
+from regression_tests.cpu_pinning import get_available_cpus
+from regression_tests.cpu_pinning import is_cpu_pinning_supported
+from regression_tests.cpu_pinning import pin_current_process
+from regression_tests.cpu_pinning import split_cpus_for_workers
+from regression_tests.filesystem.compression import OutputCompressor
+from regression_tests.filesystem.compression import is_compression_method_supported
 from regression_tests.filesystem.directory import Directory
+from regression_tests.filesystem.output_store import OutputStore
 from regression_tests.io import print_error
 from regression_tests.io import print_prologue
 from regression_tests.io import print_summary
 from regression_tests.io import print_test_results
+from regression_tests.io import print_warning
 from regression_tests.logging import setup_logging
+from regression_tests.parsers.c_parser import set_skip_function_bodies
+from regression_tests.parsers.c_parser.summary import set_summary_cache_dir
+from regression_tests.parsers.c_parser.tokenized import set_tokenized_mode
+from regression_tests.phases import ASSERTIONS
+from regression_tests.phases import get_phase_durations
+from regression_tests.phases import measure_phase
+from regression_tests.phases import reset_phase_durations
+from regression_tests.profiling import NoProfiler
+from regression_tests.profiling import create_profiler
+from regression_tests.profiling import merge_memoize_stats
+from regression_tests.profiling import merge_profiles
+from regression_tests.profiling import print_memoize_report
+from regression_tests.profiling import print_profile_report
+from regression_tests.profiling import save_memoize_stats
+from regression_tests.profiling import save_profile
+from regression_tests.resource_limits import ResourceLimits
+from regression_tests.resource_limits import create_resource_limiter
+from regression_tests.run_journal import RunJournal
+from regression_tests.run_status import RunStatus
+from regression_tests.run_status import StatusServer
+from regression_tests.run_status import StatusSnapshotWriter
 from regression_tests.test_finder import find_tests
 from regression_tests.test_finder import get_tests_dir
 from regression_tests.test_results import TestResults
 from regression_tests.test_results import TestsResults
 from regression_tests.test_settings import TestSettings
+from regression_tests.time_limit import TimeLimitExceededError
+from regression_tests.time_limit import time_limit
+from regression_tests.tools.tool_runner import set_output_prefetching
+from regression_tests.utils.background import has_abandoned_functions
+from regression_tests.worker_events import WorkerEvents
+from regression_tests.worker_recycling import should_retire_worker
+
+
+# Time (in seconds) given to a worker to recover after its test case exceeds
+# the assertions timeout. When the worker does not recover in time, it is
+# killed.
+ASSERTIONS_TIMEOUT_GRACE_PERIOD = 10
+
+# Time (in seconds) for which the runner waits for a lock shared with a worker
+# before it kills the worker (see kill_worker()).
+KILL_LOCK_TIMEOUT = 5
+
+# How often (in seconds) should the runner check for finished test cases?
+RESULTS_POLLING_INTERVAL = 0.1
 
 
 def parse_args():
@@ -44,6 +96,19 @@ def parse_args():
     parser.add_argument('--skip-c-compilation-tests', action='store_true',
                         dest='skip_c_compilation_tests',
                         help='Skip tests that compile the output C source code.')
+    parser.add_argument('--pin-cpus', action='store_true', dest='pin_cpus',
+                        help='Pin each worker (and the tools it runs) to dedicated CPUs '
+                             'to get low-noise timing.')
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile the framework itself (everything that runs '
+                             'after the tools finish) and print the most '
+                             'time-consuming functions at the end.')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume an interrupted run: skip test cases that already have '
+                             'results in the run journal (unless they have changed).')
+    parser.add_argument('--phases', action='store_true',
+                        help='Print durations of phases (e.g. tool execution or assertions) '
+                             'of each test case.')
     args = parser.parse_args()
 
     return args
@@ -209,6 +274,197 @@ def get_num_of_procs_for_tests(config):
     return tests_procs if tests_procs > 0 else mp.cpu_count()
 
 
+def get_assertions_timeout(config):
+    """Returns the time limit (in seconds) for running the tests of a single
+    test case after the tool finishes (``None`` means no limit).
+    """
+    assertions_timeout = float(config['runner']['assertions_timeout'])
+    return assertions_timeout if assertions_timeout > 0 else None
+
+
+def get_worker_recycling_limits(config):
+    """Returns a pair (`max_test_cases`, `max_rss`) of limits after which a
+    worker is replaced with a new one (``None`` means no limit).
+
+    `max_rss` is in bytes.
+    """
+    max_test_cases = int(config['runner']['worker_max_test_cases'])
+    max_rss = int(config['runner']['worker_max_rss'])
+    return (
+        max_test_cases if max_test_cases > 0 else None,
+        max_rss * 1024 * 1024 if max_rss > 0 else None
+    )
+
+
+def should_pin_cpus(config, args):
+    """Should we pin the workers to dedicated CPUs?"""
+    return args.pin_cpus or config['runner'].getboolean('pin_cpus')
+
+
+def setup_cpu_pinning(config, procs):
+    """Pins the runner to its reserved CPUs (if any) and returns a pair
+    (`procs`, `worker_cpu_sets`) to be used to run the tests.
+
+    When there are fewer physical cores than requested processes, the number
+    of processes is lowered so that each worker has at least one dedicated
+    core. When the pinning is not supported, it returns the original number of
+    processes and ``None``.
+    """
+    if not is_cpu_pinning_supported():
+        print_warning('pinning of CPUs is not supported on this system, '
+                      'running without it')
+        return procs, None
+
+    runner_cpus, worker_cpu_sets = split_cpus_for_workers(
+        get_available_cpus(),
+        procs,
+        reserved_cores=int(config['runner']['reserved_cores_for_runner'])
+    )
+    if runner_cpus:
+        pin_current_process(runner_cpus)
+    return len(worker_cpu_sets), worker_cpu_sets
+
+
+def get_run_journal_path(config):
+    """Returns a path to the journal with results of the run."""
+    path = config['runner']['run_journal']
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(__file__), path)
+    return path
+
+
+def get_resumed_results(test_cases, journal):
+    """Returns results of the given test cases from the given journal
+    (`dict`, index of a test case => :class:`.TestResults`).
+
+    Only test cases whose cache key has not changed since their results were
+    recorded are included.
+    """
+    recorded_results = journal.load()
+    resumed_results = {}
+    for i, test_case in enumerate(test_cases):
+        results = recorded_results.get(journal.cache_key(test_case))
+        if results is not None:
+            resumed_results[i] = results
+    return resumed_results
+
+
+def get_status_file_path(config):
+    """Returns a path to the file into which a snapshot of the live status is
+    written upon receiving SIGUSR1.
+    """
+    path = config['runner']['status_file']
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(__file__), path)
+    return path
+
+
+def start_status_reporting(status, config):
+    """Starts reporting of the given live status of the run.
+
+    A snapshot of the status is written into the status file whenever the
+    runner receives SIGUSR1. When a status port is configured, the status is
+    also available via HTTP on localhost.
+
+    :returns: A list of started reporters (:class:`.StatusSnapshotWriter` and
+              :class:`.StatusServer`), which have to be stopped after the run.
+    """
+    reporters = []
+    if hasattr(signal, 'SIGUSR1'):
+        snapshot_writer = StatusSnapshotWriter(
+            status,
+            get_status_file_path(config)
+        )
+        snapshot_writer.start()
+        reporters.append(snapshot_writer)
+        runner_pid = os.getpid()
+
+        def handler(signum, frame):
+            # Workers inherit the handler, but only the runner has the status.
+            # The snapshot cannot be written here because the interrupted
+            # thread may be updating the status, so just request it.
+            if os.getpid() == runner_pid:
+                snapshot_writer.request()
+        signal.signal(signal.SIGUSR1, handler)
+
+    status_port = int(config['runner']['status_port'])
+    if status_port <= 0:
+        return reporters
+
+    try:
+        server = StatusServer(status, status_port)
+    except OSError as ex:
+        print_warning('cannot start the status server on port {}: {}'.format(
+            status_port, ex
+        ))
+        return reporters
+    server.start()
+    reporters.append(server)
+    return reporters
+
+
+def get_resource_limits_for_tools(config):
+    """Returns limits of resources for the run tools."""
+    memory_limit = int(config['runner']['tool_memory_limit'])
+    cpu_limit = float(config['runner']['tool_cpu_limit'])
+    return ResourceLimits(
+        memory_limit=memory_limit * 1024 * 1024 if memory_limit > 0 else None,
+        cpu_limit=cpu_limit if cpu_limit > 0 else None
+    )
+
+
+def get_output_compressor(config):
+    """Returns a compressor of outputs of the tools (``None`` when the outputs
+    should not be compressed).
+    """
+    method = config['runner']['output_compression'].strip()
+    if not method:
+        return None
+
+    if not is_compression_method_supported(method):
+        print_warning('compression method {!r} is not supported, outputs '
+                      'will not be compressed'.format(method))
+        return None
+    return OutputCompressor(method)
+
+
+def get_output_store(config):
+    """Returns a content-addressed store of outputs of the tools (``None``
+    when the outputs should not be stored).
+    """
+    path = config['runner']['output_store_dir'].strip()
+    if not path:
+        return None
+
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(__file__), path)
+    return OutputStore(path)
+
+
+def setup_c_summary_cache(config):
+    """Sets up the cache of summaries of parsed C files (if enabled)."""
+    path = config['runner']['c_summary_cache_dir'].strip()
+    if not path:
+        return
+
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(__file__), path)
+    set_summary_cache_dir(path)
+
+
+def setup_c_parsing(config):
+    """Sets up parsing of C files."""
+    set_skip_function_bodies(
+        config['runner'].getboolean('c_skip_function_bodies')
+    )
+    set_tokenized_mode(config['runner'].getboolean('c_tokenized_mode'))
+
+
+def setup_output_prefetching(config):
+    """Sets up prefetching of outputs of the tools."""
+    set_output_prefetching(config['runner'].getboolean('prefetch_outputs'))
+
+
 def remove_results_from_previous_test_runs(tests_dir):
     """Removes results from previous test runs in the given directory.
 
@@ -250,7 +506,8 @@ def get_test_cases_to_run(tests_dir, tests_root_dir, excluded_dirs, config, args
     )
 
 
-def initialize_worker(mp_lock):
+def initialize_worker(mp_lock, worker_cpu_sets, mp_worker_events,
+                      worker_profiles_dir, worker_max_rss=None):
     """Initializes a worker that runs test cases."""
     # The lock has to be made global through an initialization function when
     # creating mp.Pool(). Otherwise, interpreter instances on Windows would not
@@ -260,12 +517,44 @@ def initialize_worker(mp_lock):
     global lock
     lock = mp_lock
 
+    # A queue through which the worker notifies the runner about the test
+    # cases it has started to run and about the start of their tests.
+    global worker_events
+    worker_events = mp_worker_events
+
+    # A directory into which the worker saves profiles of the test cases it
+    # runs (None = no profiling).
+    global profiles_dir
+    profiles_dir = worker_profiles_dir
+
+    # Maximal resident set size of the worker (None = no limit) and the number
+    # of test cases it has finished. A worker exceeding the limit is retired
+    # before it runs another test case.
+    global max_rss
+    max_rss = worker_max_rss
+    global finished_test_cases
+    finished_test_cases = 0
+
     # Block SIGINT in the workers so that Ctrl+C kills only the main process.
     # It then terminates the workers. Otherwise, stack traces from all workers
     # would be printed to the standard error when Ctrl+C is used.
     # Based on http://stackoverflow.com/a/11312948.
     signal.signal(signal.SIGINT, signal.SIG_IGN)
 
+    # Pin the worker to its dedicated CPUs. The tools run by the worker
+    # inherit the pinning.
+    if worker_cpu_sets is not None:
+        cpu_set = worker_cpu_sets.take()
+        if cpu_set is not None:
+            pin_current_process(cpu_set)
+            # Let the runner know which CPUs the worker has, so it can give
+            # them back when it kills the worker.
+            worker_events.put(('pinned', None, os.getpid(), cpu_set))
+            # When the worker is retired, give its CPUs to the worker
+            # replacing it.
+            Finalize(None, worker_cpu_sets.give_back, args=(cpu_set,),
+                     exitpriority=0)
+
 
 def ordered_indexes(test_cases):
     """Returns a list of indexes of the given test cases to run.
@@ -303,12 +592,61 @@ def ordered_indexes(test_cases):
     return sorted(range(len(test_cases)), key=test_case_key)
 
 
-def run_test_cases(test_cases, procs, lock):
-    """Runs the given test cases and returns a list of results."""
+def run_test_cases(test_cases, procs, lock, worker_cpu_sets=None,
+                   assertions_timeout=None, profiles_dir=None, journal=None,
+                   resumed_results=None, status=None,
+                   worker_max_test_cases=None, worker_max_rss=None):
+    """Runs the given test cases and returns a list of results.
+
+    When `worker_cpu_sets` is not ``None``, each worker is pinned to a single
+    set of CPUs from this list. There has to be a set for every worker.
+
+    When `assertions_timeout` is not ``None``, workers that are stuck in the
+    tests of a test case (e.g. in a native call that cannot be interrupted)
+    for longer than the timeout plus a grace period are killed, the test case
+    is reported as timeouted, and the pool replaces the killed workers with
+    new ones.
+
+    When `profiles_dir` is not ``None``, each test case is profiled (without
+    the run of the tool) and its profile is saved into this directory.
+
+    When `journal` is not ``None``, results of finished test cases are
+    continuously recorded into it (:class:`.RunJournal`), so they are not lost
+    when the run is interrupted. Test cases whose indexes are in
+    `resumed_results` (`dict`, index => :class:`.TestResults`) are not run;
+    their results are taken from this dictionary.
+
+    When `status` is not ``None``, it is continuously updated with the live
+    status of the run (:class:`.RunStatus`).
+
+    Workers accumulate memory over time (e.g. translation units of libclang or
+    memoized results), so they can be replaced with new ones. When
+    `worker_max_test_cases` is not ``None``, every worker is replaced after
+    it finishes this number of test cases. When `worker_max_rss` is not
+    ``None``, a worker whose resident set size exceeds this number of bytes
+    after finishing a test case is replaced before it runs the next one. The
+    test case it received is then given to another worker.
+    """
+    resumed_results = resumed_results or {}
+
+    # Every worker takes its set of CPUs during its initialization.
+    cpu_sets = None
+    if worker_cpu_sets is not None:
+        cpu_sets = WorkerCpuSets(worker_cpu_sets)
+
+    worker_events = WorkerEvents()
+
     pool = mp.Pool(
         processes=procs,
         initializer=initialize_worker,
-        initargs=(lock,)
+        initargs=(
+            lock,
+            cpu_sets,
+            worker_events,
+            profiles_dir,
+            worker_max_rss
+        ),
+        maxtasksperchild=worker_max_test_cases
     )
 
     # Ensure that when the runner (= main process) is killed (either via Ctrl-C
@@ -317,55 +655,232 @@ def run_test_cases(test_cases, procs, lock):
     def handler(signum, frame):
         pool.terminate()
         pool.join()
+        if journal is not None:
+            journal.close()
+            print_warning(
+                'the run was interrupted; results of finished test cases are '
+                'stored in {} (use --resume to continue)'.format(journal.path)
+            )
         sys.exit(1)
     signal.signal(signal.SIGINT, handler)
     signal.signal(signal.SIGTERM, handler)
 
+    # Tasks of killed or retired workers never finish.
+    any_task_abandoned = False
     try:
-        run_test_case_on_index_args = ordered_indexes(test_cases)
-        test_results = TestsResults(
-            pool.map(
-                run_test_case_on_index,
-                run_test_case_on_index_args,
-                # Send tasks to processes one by one instead of sending them a
-                # chunk of tasks at once. This speeds up the regression tests.
-                # By default, the chunk size is `len(tasks) / processors`, so
-                # it may happen that a single process gets many long-running
-                # tasks. We don't want that. Instead, by sending them a single
-                # task at once, all processors are utilized during the whole
-                # duration of the regression tests.
-                chunksize=1
-            )
-        )
-        return test_results
+        indexes = ordered_indexes(test_cases)
+        # Send tasks to processes one by one instead of sending them a chunk of
+        # tasks at once. This speeds up the regression tests. If we sent
+        # chunks, it might happen that a single process gets many long-running
+        # tasks. We don't want that. Instead, by sending them a single task at
+        # once, all processors are utilized during the whole duration of the
+        # regression tests.
+        pending_results = {
+            i: pool.apply_async(run_test_case_on_index, (i,))
+            for i in indexes if i not in resumed_results
+        }
+        results = dict(resumed_results)
+
+        def finish_test_case(i, test_results):
+            results[i] = test_results
+            del pending_results[i]
+            running_tests.pop(i, None)
+            if journal is not None:
+                journal.record(test_cases[i], test_results)
+            if status is not None:
+                status.test_case_finished(test_cases[i].full_name, test_results.failed)
+
+        # Index of a test case => (PID of the worker, start date of the test
+        # case, time when the runner was notified that its tests started).
+        running_tests = {}
+        while pending_results:
+            while not worker_events.empty():
+                event, i, pid, data = worker_events.get()
+                if event == 'pinned':
+                    cpu_sets.record(pid, data)
+                    continue
+                start_date = data
+                if event == 'retired':
+                    # The worker exited without running the test case, so
+                    # give it to another worker.
+                    pending_results[i] = pool.apply_async(
+                        run_test_case_on_index,
+                        (i,)
+                    )
+                    any_task_abandoned = True
+                    continue
+                if event == 'assertions':
+                    running_tests[i] = (pid, start_date, time.monotonic())
+                if status is not None:
+                    status.test_case_started(test_cases[i].full_name, pid, event)
+
+            for i, result in list(pending_results.items()):
+                if result.ready():
+                    finish_test_case(i, result.get())
+
+            if assertions_timeout is not None:
+                kill_deadline = assertions_timeout + ASSERTIONS_TIMEOUT_GRACE_PERIOD
+                for i, (pid, start_date, started) in list(running_tests.items()):
+                    if time.monotonic() - started <= kill_deadline or \
+                            pending_results[i].ready():
+                        continue
+                    # The worker must not be killed while it holds a lock
+                    # shared with other processes, which would never be
+                    # released.
+                    if kill_worker(pid, [lock, worker_events.lock]) and \
+                            cpu_sets is not None:
+                        # The killed worker cannot give its CPUs to the worker
+                        # replacing it.
+                        cpu_sets.give_back_set_of_killed(pid)
+                    any_task_abandoned = True
+                    finish_test_case(i, create_timeouted_test_results(
+                        test_cases[i],
+                        start_date,
+                        assertions_timeout
+                    ))
+                    with lock:
+                        print_test_results(
+                            results[i],
+                            show_phase_durations=args.phases
+                        )
+
+            if pending_results:
+                time.sleep(RESULTS_POLLING_INTERVAL)
+
+        return TestsResults(results[i] for i in indexes)
     finally:
-        pool.close()
+        # The task of a killed or retired worker never finishes, so closing
+        # the pool would make it wait for the task forever. All the results
+        # have already been collected, so the remaining workers can be
+        # terminated.
+        if any_task_abandoned:
+            pool.terminate()
+        else:
+            pool.close()
         pool.join()
 
 
+def kill_worker(pid, locks=()):
+    """Kills the worker with the given PID.
+
+    :param list locks: Locks shared with the worker. They are acquired while
+                       the worker is killed, so it is not killed while it holds
+                       one of them. ``None`` items are ignored. When a lock
+                       cannot be acquired in :data:`KILL_LOCK_TIMEOUT` seconds,
+                       the worker is killed anyway.
+
+    :returns: ``True`` if the worker was killed, ``False`` if it had already
+              exited.
+    """
+    acquired_locks = [
+        lock for lock in locks
+        if lock is not None and lock.acquire(timeout=KILL_LOCK_TIMEOUT)
+    ]
+    try:
+        os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+    except ProcessLookupError:
+        return False
+    finally:
+        for lock in acquired_locks:
+            lock.release()
+    return True
+
+
+def create_timeouted_test_results(test_case, start_date, assertions_timeout):
+    """Creates results for the given test case whose worker had to be killed
+    because its tests did not finish in time.
+    """
+    return TestResults(
+        test_case.module_name,
+        test_case.name,
+        start_date,
+        datetime.now(),
+        run_tests=1,
+        failed_tests=1,
+        skipped_tests=0,
+        output=(
+            'The tests did not finish in {} seconds and could not be '
+            'interrupted, so the worker running them was killed.\n'
+        ).format(assertions_timeout),
+        timeouted=True
+    )
+
+
 def run_test_case_on_index(i):
     """Runs a test case on the given index."""
     global cmd_runner
     global lock
     global test_cases
     global tools_dir
+    global assertions_timeout
+    global output_compressor
+    global output_store
+    global worker_events
+    global profiles_dir
+    global max_rss
+    global finished_test_cases
 
     test_case = test_cases[i]
+    start_date = datetime.now()
+
+    def notify_runner(event):
+        worker_events.put((event, i, os.getpid(), start_date))
+
+    def notify_runner_about_assertions_start():
+        notify_runner('assertions')
+
+    # A worker that abandoned a hung parsing in the background (e.g. because
+    # its test case exceeded the assertions timeout) keeps the parsing
+    # running, so it is retired as well.
+    if (should_retire_worker(finished_test_cases, max_rss) or
+            has_abandoned_functions()):
+        # Exit without running the test case. The runner gives it to another
+        # worker and the pool replaces this worker with a new one.
+        notify_runner('retired')
+        sys.exit(0)
+
+    notify_runner('tool')
 
     tool_runner = test_case.test_settings.get_tool_runner(
         cmd_runner,
-        tools_dir
+        tools_dir,
+        output_compressor,
+        output_store
+    )
+    profiler = create_profiler(enabled=profiles_dir is not None)
+    test_results = run_test_case(
+        test_case,
+        tool_runner,
+        assertions_timeout,
+        notify_runner_about_assertions_start,
+        profiler
     )
-    test_results = run_test_case(test_case, tool_runner)
+    if profiles_dir is not None:
+        save_profile(profiler, profiles_dir, '{}-{}'.format(os.getpid(), i))
+        save_memoize_stats(profiles_dir, str(os.getpid()))
     with lock:
-        print_test_results(test_results)
+        print_test_results(test_results, show_phase_durations=args.phases)
+    finished_test_cases += 1
     return test_results
 
 
-def run_test_case(test_case, tool_runner):
-    """Runs the tests in the given test case by using the given runner."""
+def run_test_case(test_case, tool_runner, assertions_timeout=None,
+                  on_assertions_start=None, profiler=NoProfiler()):
+    """Runs the tests in the given test case by using the given runner.
+
+    :param float assertions_timeout: Time limit (in seconds) for creating and
+                                     running the tests after the tool
+                                     finishes. ``None`` means no limit.
+    :param callable on_assertions_start: A function to be called (without
+                                         arguments) after the tool finishes.
+    :param cProfile.Profile profiler: Profiler of the framework. Only the
+                                      part after the tool finishes is
+                                      profiled.
+    """
     # Initialize timing.
     start_date = datetime.now()
+    reset_phase_durations()
+    timeouted = False
 
     try:
         # Run the tool.
@@ -375,13 +890,23 @@ def run_test_case(test_case, tool_runner):
             test_case.tool_dir,
             test_case.tool_timeout
         )
+        profiler.enable()
+        if on_assertions_start is not None:
+            on_assertions_start()
 
-        # Run the tests with redirected output.
-        test_suite = test_case.create_test_suite(tool)
+        # Run the tests with redirected output. The creation of the test suite
+        # (e.g. parsing of the output C file) is also subject to the time
+        # limit.
         test_output = io.StringIO()
-        test_runner = unittest.TextTestRunner(stream=test_output)
-        test_result = test_runner.run(test_suite)
-    except Exception:
+        test_runner = unittest.TextTestRunner(
+            stream=test_output,
+            resultclass=TimeLimitAwareTestResult
+        )
+        with time_limit(assertions_timeout) as limit, measure_phase(ASSERTIONS):
+            test_suite = test_case.create_test_suite(tool)
+            test_result = test_runner.run(test_suite)
+        timeouted = limit.expired
+    except Exception as ex:
         # Create a faked test result to allow uniform construction of
         # TestResults at the end of this function.
         test_output = io.StringIO(traceback.format_exc())
@@ -392,10 +917,20 @@ def run_test_case(test_case, tool_runner):
         test_result.errors = [object()]  # Only the length is important.
         test_result.failures = []
         test_result.skipped = []
+        timeouted = isinstance(ex, TimeLimitExceededError)
+    finally:
+        profiler.disable()
 
     # Finish timing.
     end_date = datetime.now()
 
+    output = test_output.getvalue()
+    if timeouted:
+        output = 'The tests did not finish in {} seconds.\n\n{}'.format(
+            assertions_timeout,
+            output
+        )
+
     # Create the results.
     return TestResults(
         test_case.module_name,
@@ -405,10 +940,23 @@ def run_test_case(test_case, tool_runner):
         test_result.testsRun,
         len(test_result.errors) + len(test_result.failures),
         len(test_result.skipped),
-        test_output.getvalue(),
+        output,
+        timeouted,
+        get_phase_durations()
     )
 
 
+class TimeLimitAwareTestResult(unittest.TextTestResult):
+    """A test result that stops running of other tests when a test exceeds
+    the time limit.
+    """
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        if issubclass(err[0], TimeLimitExceededError):
+            self.stop()
+
+
 try:
     # Config.
     config = parse_standard_config_files()
@@ -426,9 +974,20 @@ try:
     # Arguments.
     args = parse_args()
 
-    # Command runner.
-    cmd_runner = CmdRunner()
+    # Command runner. When resources of the tools are limited via cgroups, the
+    # main process moves itself into a dedicated cgroup, so the workers (forked
+    # later) inherit it.
+    cmd_runner = CmdRunner(
+        create_resource_limiter(get_resource_limits_for_tools(config))
+    )
     tools_dir = Directory(os.path.join(config['runner']['retdec_install_dir'], 'bin'))
+    assertions_timeout = get_assertions_timeout(config)
+    worker_max_test_cases, worker_max_rss = get_worker_recycling_limits(config)
+    output_compressor = get_output_compressor(config)
+    output_store = get_output_store(config)
+    setup_c_summary_cache(config)
+    setup_c_parsing(config)
+    setup_output_prefetching(config)
 
     # Adjustment of the environment (e.g. update of PATH).
     adjust_environment(config, args)
@@ -455,8 +1014,10 @@ try:
         )
 
     if __name__ == '__main__':
-        # The main process.
-        remove_results_from_previous_test_runs(tests_dir)
+        # The main process. When resuming a run, keep the outputs so that the
+        # skipped test cases can still be inspected.
+        if not args.resume:
+            remove_results_from_previous_test_runs(tests_dir)
 
         # Find tests.
         test_cases = get_test_cases_to_run(
@@ -477,13 +1038,65 @@ try:
             sys.exit(1)
 
         # Run them.
-        print_prologue(tests_dir.path, test_cases)
-        tests_results = run_test_cases(
-            test_cases,
-            procs=get_num_of_procs_for_tests(config),
-            lock=lock
+        procs = get_num_of_procs_for_tests(config)
+        worker_cpu_sets = None
+        if should_pin_cpus(config, args):
+            procs, worker_cpu_sets = setup_cpu_pinning(config, procs)
+        profiles_dir = None
+        if args.profile:
+            profiles_dir = tempfile.mkdtemp(prefix='regression-tests-profiles-')
+        journal = RunJournal(
+            get_run_journal_path(config),
+            tools_dir,
+            config['runner']
+        )
+        resumed_results = {}
+        if args.resume:
+            resumed_results = get_resumed_results(test_cases, journal)
+        journal.open(keep_entries=args.resume)
+        status = RunStatus(len(test_cases))
+        status.test_cases_resumed(
+            len(resumed_results),
+            sum(1 for results in resumed_results.values() if results.failed)
         )
+        status_reporters = start_status_reporting(status, config)
+        print_prologue(tests_dir.path, test_cases, len(resumed_results))
+        for reporter in status_reporters:
+            if isinstance(reporter, StatusServer):
+                print('Live status: http://127.0.0.1:{}/\n'.format(reporter.port))
+        try:
+            tests_results = run_test_cases(
+                test_cases,
+                procs=procs,
+                lock=lock,
+                worker_cpu_sets=worker_cpu_sets,
+                assertions_timeout=assertions_timeout,
+                profiles_dir=profiles_dir,
+                journal=journal,
+                resumed_results=resumed_results,
+                status=status,
+                worker_max_test_cases=worker_max_test_cases,
+                worker_max_rss=worker_max_rss
+            )
+        finally:
+            journal.close()
+            for reporter in status_reporters:
+                reporter.stop()
         print_summary(tests_results)
+        if output_store is not None:
+            # Blobs that were referenced only by outputs of previous runs are
+            # no longer needed.
+            output_store.prune()
+        if profiles_dir is not None:
+            profile = merge_profiles(profiles_dir)
+            if profile is not None:
+                print('')
+                print_profile_report(profile)
+            memoize_stats = merge_memoize_stats(profiles_dir)
+            if memoize_stats:
+                print('Memoization:')
+                print_memoize_report(memoize_stats)
+            shutil.rmtree(profiles_dir)
 
         sys.exit(0 if tests_results.succeeded else 1)
 except Exception:
@@ -1,3 +1,198 @@
 """
     Tests for the :mod:`regression_tests.cmd_runner` module.
 """
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from regression_tests.cmd_runner import CapturedOutput
+from regression_tests.cmd_runner import CmdResult
+from regression_tests.cmd_runner import CmdRunner
+from regression_tests.cmd_runner import _OutputCapture
+
+
+class CmdResultTests(unittest.TestCase):
+    """Tests for `CmdResult`."""
+
+    def test_can_be_unpacked_into_triple(self):
+        output, return_code, timeouted = CmdResult('output', 1, True)
+
+        self.assertEqual(output, 'output')
+        self.assertEqual(return_code, 1)
+        self.assertTrue(timeouted)
+
+    def test_properties_return_correct_values(self):
+        result = CmdResult('output', 1, True, oom_killed=True)
+
+        self.assertEqual(result.output, 'output')
+        self.assertEqual(result.return_code, 1)
+        self.assertTrue(result.timeouted)
+        self.assertTrue(result.oom_killed)
+
+    def test_oom_killed_is_false_by_default(self):
+        result = CmdResult('output', 0, False)
+
+        self.assertFalse(result.oom_killed)
+
+    def test_is_equal_to_triple_with_same_values(self):
+        self.assertEqual(CmdResult('output', 0, False), ('output', 0, False))
+
+
+class CmdRunnerStartTests(unittest.TestCase):
+    """Tests for `CmdRunner.start()`."""
+
+    def setUp(self):
+        self.limited_run = mock.Mock()
+        resource_limiter = mock.Mock()
+        resource_limiter.new_run.return_value = self.limited_run
+        self.cmd_runner = CmdRunner(resource_limiter)
+
+    def test_releases_run_when_command_cannot_be_started(self):
+        with self.assertRaises(OSError):
+            self.cmd_runner.start(['/nonexisting/command'])
+
+        self.limited_run.release.assert_called_once_with()
+
+    def test_does_not_release_run_when_command_is_started(self):
+        p = self.cmd_runner.start([sys.executable, '-c', ''], discard_output=True)
+        p.communicate()
+
+        self.assertIs(p.limited_run, self.limited_run)
+        self.assertFalse(self.limited_run.release.called)
+
+
+class CmdRunnerCapturedOutputTests(unittest.TestCase):
+    """Tests for `CmdRunner.run_cmd()` with output captured into a file."""
+
+    OUTPUT = '  \r\nline1\r\n\x1b[31mred\x1b[0m line2\rline3\n\n '
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.output_file = os.path.join(self.dir, 'tool.output')
+        self.cmd_runner = CmdRunner()
+
+    def print_cmd(self, output):
+        return [
+            sys.executable,
+            '-c',
+            'import sys; sys.stdout.buffer.write({!r})'.format(
+                output.encode('utf-8')
+            )
+        ]
+
+    def test_captured_output_is_same_as_output_kept_in_memory(self):
+        cmd = self.print_cmd(self.OUTPUT)
+
+        output, _, _ = self.cmd_runner.run_cmd(cmd)
+        captured_output, return_code, timeouted = self.cmd_runner.run_cmd(
+            cmd,
+            output_file=self.output_file
+        )
+
+        self.assertIsInstance(captured_output, CapturedOutput)
+        self.assertEqual(captured_output.text, output)
+        self.assertEqual(return_code, 0)
+        self.assertFalse(timeouted)
+
+    def test_file_contains_stripped_output(self):
+        self.cmd_runner.run_cmd(
+            self.print_cmd(self.OUTPUT),
+            output_file=self.output_file
+        )
+
+        with open(self.output_file, 'rb') as f:
+            self.assertEqual(f.read(), b'line1\nred line2\nline3')
+
+    def test_end_returns_last_lines_without_loading_output(self):
+        captured_output = self.cmd_runner.run_cmd(
+            self.print_cmd('\n'.join(str(i) for i in range(1000))),
+            output_file=self.output_file
+        ).output
+        os.remove(self.output_file)
+
+        self.assertEqual(captured_output.end(3), '997\n998\n999')
+
+    def test_end_returns_none_when_not_enough_lines_are_kept(self):
+        captured_output = self.cmd_runner.run_cmd(
+            self.print_cmd('\n'.join(str(i) for i in range(1000))),
+            output_file=self.output_file
+        ).output
+
+        self.assertIsNone(captured_output.end(500))
+
+    def test_end_returns_all_lines_when_output_is_short(self):
+        captured_output = self.cmd_runner.run_cmd(
+            self.print_cmd('line1\nline2'),
+            output_file=self.output_file
+        ).output
+
+        self.assertEqual(captured_output.end(10), 'line1\nline2')
+
+    def test_output_generated_up_to_timeout_is_captured(self):
+        cmd = [
+            sys.executable,
+            '-c',
+            'import sys, time; print("started"); sys.stdout.flush(); time.sleep(30)'
+        ]
+
+        result = self.cmd_runner.run_cmd(
+            cmd,
+            timeout=1,
+            output_file=self.output_file
+        )
+
+        self.assertTrue(result.timeouted)
+        self.assertEqual(result.output.text, 'started\n')
+
+    def test_output_can_be_moved_to_other_file(self):
+        captured_output = self.cmd_runner.run_cmd(
+            self.print_cmd(self.OUTPUT),
+            output_file=self.output_file
+        ).output
+        log_path = os.path.join(self.dir, 'tool.log')
+        with open(log_path, 'wb') as f:
+            f.write(b'header\n')
+            offset = f.tell()
+            captured_output.copy_stripped_output_to(f)
+            f.write(b'\nfooter\n')
+
+        captured_output.move_to(log_path, offset)
+
+        self.assertFalse(os.path.exists(self.output_file))
+        self.assertEqual(captured_output.path, log_path)
+        self.assertEqual(
+            captured_output.text,
+            '  \nline1\nred line2\nline3\n\n '
+        )
+
+
+class OutputCaptureTests(unittest.TestCase):
+    """Tests for `_OutputCapture`."""
+
+    class OneByteStream:
+        """A stream that returns its data byte by byte."""
+
+        def __init__(self, data):
+            self._data = data
+
+        def read1(self, size):
+            byte, self._data = self._data[:1], self._data[1:]
+            return byte
+
+    def test_output_split_into_small_chunks_is_processed_correctly(self):
+        dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dir)
+        output = '  \r\nžluť\r\n\x1b[31mred\x1b[0m line2\rline3\n\n '
+        capture = _OutputCapture(os.path.join(dir, 'output'), 'utf-8', True)
+
+        capture.read_from(self.OneByteStream(output.encode('utf-8')))
+
+        self.assertEqual(
+            capture.finish().text,
+            '  \nžluť\nred line2\nline3\n\n '
+        )
@@ -0,0 +1,172 @@
+"""
+    Tests for the :mod:`regression_tests.cpu_pinning` module.
+"""
+
+import multiprocessing as mp
+import os
+import signal
+import unittest
+from unittest import mock
+
+from regression_tests.cpu_pinning import WorkerCpuSets
+from regression_tests.cpu_pinning import _parse_cpu_list
+from regression_tests.cpu_pinning import get_physical_cores
+from regression_tests.cpu_pinning import split_cpus_for_workers
+
+
+def smt_siblings_of_two_way_smt_cpu(cpu):
+    """Returns SMT siblings of the given CPU on a system where CPUs ``N`` and
+    ``N + 4`` share a physical core (a 4-core, 8-thread CPU).
+    """
+    return sorted({cpu % 4, cpu % 4 + 4})
+
+
+def take_cpu_set_and_wait(cpu_sets, conn):
+    """Takes a set of CPUs like a worker, sends it over the given connection,
+    and waits until it is killed.
+    """
+    conn.send(cpu_sets.take())
+    signal.pause()
+
+
+class ParseCpuListTests(unittest.TestCase):
+    """Tests for `_parse_cpu_list()`."""
+
+    def test_returns_correct_cpus_for_single_cpu(self):
+        self.assertEqual(_parse_cpu_list('3\n'), [3])
+
+    def test_returns_correct_cpus_for_ranges_and_single_cpus(self):
+        self.assertEqual(_parse_cpu_list('0-2,5,8-9'), [0, 1, 2, 5, 8, 9])
+
+    def test_returns_empty_list_for_empty_string(self):
+        self.assertEqual(_parse_cpu_list(''), [])
+
+
+@mock.patch('regression_tests.cpu_pinning._get_smt_siblings',
+            side_effect=smt_siblings_of_two_way_smt_cpu)
+class GetPhysicalCoresTests(unittest.TestCase):
+    """Tests for `get_physical_cores()`."""
+
+    def test_groups_smt_siblings_into_single_core(self, _):
+        self.assertEqual(
+            get_physical_cores(list(range(8))),
+            [[0, 4], [1, 5], [2, 6], [3, 7]]
+        )
+
+    def test_ignores_siblings_that_are_not_available(self, _):
+        self.assertEqual(
+            get_physical_cores([0, 1, 4]),
+            [[0, 4], [1]]
+        )
+
+
+@mock.patch('regression_tests.cpu_pinning._get_smt_siblings',
+            side_effect=smt_siblings_of_two_way_smt_cpu)
+class SplitCpusForWorkersTests(unittest.TestCase):
+    """Tests for `split_cpus_for_workers()`."""
+
+    def test_gives_each_worker_whole_physical_core(self, _):
+        runner_cpus, worker_cpu_sets = split_cpus_for_workers(
+            list(range(8)), num_of_workers=4
+        )
+
+        self.assertEqual(runner_cpus, set())
+        self.assertEqual(
+            worker_cpu_sets,
+            [{0, 4}, {1, 5}, {2, 6}, {3, 7}]
+        )
+
+    def test_reserves_requested_number_of_cores_for_runner(self, _):
+        runner_cpus, worker_cpu_sets = split_cpus_for_workers(
+            list(range(8)), num_of_workers=4, reserved_cores=1
+        )
+
+        self.assertEqual(runner_cpus, {0, 4})
+        self.assertEqual(worker_cpu_sets, [{1, 5}, {2, 6}, {3, 7}])
+
+    def test_always_leaves_at_least_one_core_for_workers(self, _):
+        runner_cpus, worker_cpu_sets = split_cpus_for_workers(
+            list(range(8)), num_of_workers=2, reserved_cores=10
+        )
+
+        self.assertEqual(runner_cpus, {0, 4, 1, 5, 2, 6})
+        self.assertEqual(worker_cpu_sets, [{3, 7}])
+
+    def test_distributes_remaining_cores_to_first_workers(self, _):
+        runner_cpus, worker_cpu_sets = split_cpus_for_workers(
+            list(range(8)), num_of_workers=3
+        )
+
+        self.assertEqual(
+            worker_cpu_sets,
+            [{0, 4, 1, 5}, {2, 6}, {3, 7}]
+        )
+
+    def test_returns_fewer_sets_when_there_are_fewer_cores_than_workers(self, _):
+        runner_cpus, worker_cpu_sets = split_cpus_for_workers(
+            list(range(8)), num_of_workers=16
+        )
+
+        self.assertEqual(len(worker_cpu_sets), 4)
+
+
+class WorkerCpuSetsTests(unittest.TestCase):
+    """Tests for `WorkerCpuSets`."""
+
+    def start_worker(self, cpu_sets):
+        """Starts a worker taking a set of CPUs and returns a pair (`process`,
+        `cpu_set`).
+        """
+        parent_conn, child_conn = mp.Pipe()
+        process = mp.Process(
+            target=take_cpu_set_and_wait,
+            args=(cpu_sets, child_conn)
+        )
+        process.start()
+        self.addCleanup(process.join)
+        self.addCleanup(self.kill, process)
+        return process, parent_conn.recv()
+
+    def kill(self, process):
+        if process.is_alive():
+            os.kill(process.pid, signal.SIGKILL)
+
+    def test_worker_takes_free_set(self):
+        cpu_sets = WorkerCpuSets([{0, 1}])
+
+        _, cpu_set = self.start_worker(cpu_sets)
+
+        self.assertEqual(cpu_set, {0, 1})
+
+    def test_replacement_of_killed_worker_takes_its_set_when_runner_gives_it_back(self):
+        cpu_sets = WorkerCpuSets([{0}])
+        process, cpu_set = self.start_worker(cpu_sets)
+        cpu_sets.record(process.pid, cpu_set)
+
+        self.kill(process)
+        process.join()
+        cpu_sets.give_back_set_of_killed(process.pid)
+        _, replacement_cpu_set = self.start_worker(cpu_sets)
+
+        self.assertEqual(replacement_cpu_set, {0})
+
+    def test_worker_runs_without_set_when_no_set_becomes_free_in_time(self):
+        cpu_sets = WorkerCpuSets([{0}])
+        cpu_sets.take_timeout = 0.1
+        process, cpu_set = self.start_worker(cpu_sets)
+        cpu_sets.record(process.pid, cpu_set)
+
+        # The set of the killed worker is not given back.
+        self.kill(process)
+        process.join()
+        _, replacement_cpu_set = self.start_worker(cpu_sets)
+
+        self.assertIsNone(replacement_cpu_set)
+
+    def test_give_back_set_of_killed_does_nothing_for_unknown_worker(self):
+        cpu_sets = WorkerCpuSets([])
+        cpu_sets.take_timeout = 0.1
+
+        cpu_sets.give_back_set_of_killed(12345)
+
+        self.assertIsNone(cpu_sets.take())
@@ -0,0 +1,138 @@
+"""
+    Tests for the :mod:`regression_tests.filesystem.compression` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from regression_tests.filesystem.compression import OutputCompressor
+from regression_tests.filesystem.compression import compress_file
+from regression_tests.filesystem.compression import find_compressed_file
+from regression_tests.filesystem.compression import is_compression_method_supported
+from regression_tests.filesystem.compression import open_compressed_file
+from regression_tests.filesystem.directory import Directory
+
+
+class CompressionTestsBase(unittest.TestCase):
+    """A base class for tests that need files on the disk."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def write_file(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+
+class IsCompressionMethodSupportedTests(unittest.TestCase):
+    """Tests for `is_compression_method_supported()`."""
+
+    def test_returns_true_for_gzip_and_xz(self):
+        self.assertTrue(is_compression_method_supported('gzip'))
+        self.assertTrue(is_compression_method_supported('xz'))
+
+    def test_returns_false_for_unknown_method(self):
+        self.assertFalse(is_compression_method_supported('rar'))
+
+
+class CompressFileTests(CompressionTestsBase):
+    """Tests for `compress_file()`."""
+
+    def test_replaces_file_with_its_compressed_variant(self):
+        path = self.write_file('file.ll', b'content')
+
+        compressed_path = compress_file(path, 'gzip')
+
+        self.assertEqual(compressed_path, path + '.gz')
+        self.assertEqual(os.listdir(self.dir), ['file.ll.gz'])
+
+    def test_compressed_file_can_be_decompressed(self):
+        for method in ('gzip', 'xz'):
+            with self.subTest(method=method):
+                path = self.write_file('file.ll', b'content' * 1000)
+
+                compressed_path = compress_file(path, method)
+
+                with open_compressed_file(compressed_path) as f:
+                    self.assertEqual(f.read(), b'content' * 1000)
+                os.remove(compressed_path)
+
+    def test_identical_files_are_compressed_into_identical_files(self):
+        compressed_data = []
+        for name in ('file1.ll', 'file2.ll'):
+            path = compress_file(self.write_file(name, b'content'), 'gzip')
+            with open(path, 'rb') as f:
+                compressed_data.append(f.read())
+
+        self.assertEqual(compressed_data[0], compressed_data[1])
+
+
+class FindCompressedFileTests(CompressionTestsBase):
+    """Tests for `find_compressed_file()`."""
+
+    def test_returns_path_to_compressed_variant_when_it_exists(self):
+        path = os.path.join(self.dir, 'file.ll')
+        compressed_path = self.write_file('file.ll.xz', b'')
+
+        self.assertEqual(find_compressed_file(path), compressed_path)
+
+    def test_returns_none_when_there_is_no_compressed_variant(self):
+        path = self.write_file('file.ll', b'')
+
+        self.assertIsNone(find_compressed_file(path))
+
+
+class OutputCompressorTests(CompressionTestsBase):
+    """Tests for `OutputCompressor`."""
+
+    def test_raises_exception_when_method_is_not_supported(self):
+        with self.assertRaises(ValueError):
+            OutputCompressor('rar')
+
+    def test_compress_outputs_compresses_only_files_with_given_extensions(self):
+        self.write_file('file.ll', b'')
+        self.write_file('file.c', b'')
+        self.write_file('file.exe.log', b'')
+        compressor = OutputCompressor('gzip', extensions=('.ll', '.log'))
+
+        compressor.compress_outputs(Directory(self.dir))
+
+        self.assertEqual(
+            sorted(os.listdir(self.dir)),
+            ['file.c', 'file.exe.log.gz', 'file.ll.gz']
+        )
+
+
+class DirectoryReadsCompressedFilesTests(CompressionTestsBase):
+    """Tests that `Directory` transparently reads compressed files."""
+
+    def setUp(self):
+        super().setUp()
+        compress_file(self.write_file('file.ll', b'line1\r\nline2\n'), 'gzip')
+        self.directory = Directory(self.dir)
+
+    def test_file_exists_returns_true_for_compressed_file(self):
+        self.assertTrue(self.directory.file_exists('file.ll'))
+
+    def test_read_binary_file_returns_decompressed_data(self):
+        self.assertEqual(
+            self.directory.read_binary_file('file.ll'),
+            b'line1\r\nline2\n'
+        )
+
+    def test_read_text_file_returns_decompressed_text_with_translated_newlines(self):
+        self.assertEqual(
+            self.directory.read_text_file('file.ll'),
+            'line1\nline2\n'
+        )
+
+    def test_text_of_file_is_decompressed(self):
+        self.assertEqual(
+            self.directory.get_file('file.ll').text,
+            'line1\nline2\n'
+        )
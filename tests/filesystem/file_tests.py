@@ -4,16 +4,20 @@
 
 import os
 import unittest
+from concurrent.futures import Future
 from unittest import mock
 
 
 from regression_tests.filesystem.directory import Directory
 from regression_tests.filesystem.file import CFile
 from regression_tests.filesystem.file import ConfigFile
+from regression_tests.filesystem.file import MAPPED_TEXT_MIN_SIZE
 from regression_tests.filesystem.file import File
 from regression_tests.filesystem.file import StandaloneFile
 from regression_tests.filesystem.file import TextFile
 from regression_tests.filesystem.file import YaraFile
+from regression_tests.parsers.c_parser.tokenized import TokenizedModule
+from regression_tests.time_limit import TimeLimitExceededError
 from tests.filesystem.directory_tests import ROOT_DIR
 
 
@@ -144,18 +148,120 @@ class TextFileTests(unittest.TestCase):
         renamed_file = file.renamed('new.txt')
         self.assertEqual(renamed_file.__class__, TextFile)
 
+    @mock.patch('os.path.getsize')
+    def test_text_of_large_file_is_mapped_into_memory(self, getsize_mock):
+        getsize_mock.return_value = MAPPED_TEXT_MIN_SIZE
+        dir = new_dir(TMP_DIR_PATH)
+        file = TextFile('file.ll', dir)
+
+        with mock.patch('regression_tests.filesystem.file.MappedText') as mapped_text_mock:
+            text = file.text
+
+        self.assertIs(text, mapped_text_mock.return_value)
+        mapped_text_mock.assert_called_once_with(file.path)
+        dir.read_text_file.assert_not_called()
+
+    def test_prefetch_text_reads_file_immediately_and_text_returns_parsed_text(self):
+        dir = new_dir(TMP_DIR_PATH)
+        dir.file_exists.return_value = True
+        dir.read_text_file.return_value = 'text of the file'
+        file = TextFile('file.txt', dir)
+
+        file.prefetch_text()
+        dir.read_text_file.assert_called_once_with('file.txt')
+
+        self.assertEqual(file.text, 'text of the file')
+        dir.read_text_file.assert_called_once_with('file.txt')
+
+    def test_prefetch_text_does_nothing_when_file_does_not_exist(self):
+        dir = new_dir(TMP_DIR_PATH)
+        dir.file_exists.return_value = False
+        file = TextFile('file.txt', dir)
+
+        file.prefetch_text()
+
+        dir.read_text_file.assert_not_called()
+
+    def test_text_raises_error_from_prefetched_parsing(self):
+        dir = new_dir(TMP_DIR_PATH)
+        dir.file_exists.return_value = True
+        dir.read_text_file.return_value = '{'
+        file = ConfigFile('config.config.json', dir)
+
+        file.prefetch_text()
+
+        with self.assertRaises(ValueError):
+            file.text
+
+    def create_file_with_interrupted_prefetching(self, started):
+        dir = new_dir(TMP_DIR_PATH)
+        dir.file_exists.return_value = True
+        file = TextFile('file.txt', dir)
+        future = mock.Mock(spec_set=Future)
+        future.result.side_effect = TimeLimitExceededError
+        future.done.return_value = False
+        future.cancel.return_value = not started
+        with mock.patch('regression_tests.filesystem.file.run_in_background',
+                        return_value=future):
+            file.prefetch_text()
+        return file
+
+    @mock.patch('regression_tests.utils.background.abandon_running_function')
+    def test_text_abandons_prefetched_parsing_when_waiting_is_interrupted(
+            self, abandon_running_function_mock):
+        file = self.create_file_with_interrupted_prefetching(started=True)
+
+        with self.assertRaises(TimeLimitExceededError):
+            file.text
+
+        abandon_running_function_mock.assert_called_once_with()
+
+    @mock.patch('regression_tests.utils.background.abandon_running_function')
+    def test_text_cancels_prefetched_parsing_that_has_not_started_when_waiting_is_interrupted(
+            self, abandon_running_function_mock):
+        file = self.create_file_with_interrupted_prefetching(started=False)
+
+        with self.assertRaises(TimeLimitExceededError):
+            file.text
+
+        abandon_running_function_mock.assert_not_called()
+
 
 class CFileTests(unittest.TestCase):
     """Tests for `CFile`."""
 
-    @mock.patch('regression_tests.filesystem.file.parse_c')
-    def test_text_calls_parse_c_and_returns_its_result(self, parse_c_mock):
+    @mock.patch('regression_tests.filesystem.file.parse_tokenized')
+    def test_text_calls_parse_tokenized_and_returns_its_result(self, parse_tokenized_mock):
         dir = new_dir(TMP_DIR_PATH)
         FILE_CODE = 'int main() {}'
         dir.read_text_file.return_value = FILE_CODE
         file = CFile('file.c', dir)
-        self.assertEqual(file.text, parse_c_mock.return_value)
-        parse_c_mock.assert_called_once_with(FILE_CODE, 'file.c')
+        self.assertEqual(file.text, parse_tokenized_mock.return_value)
+        parse_tokenized_mock.assert_called_once_with(FILE_CODE, 'file.c')
+
+    @mock.patch('regression_tests.filesystem.file.parse_tokenized')
+    def test_prefetch_text_parses_code_in_background(self, parse_tokenized_mock):
+        dir = new_dir(TMP_DIR_PATH)
+        dir.file_exists.return_value = True
+        dir.read_text_file.return_value = 'int main() {}'
+        file = CFile('file.c', dir)
+
+        file.prefetch_text()
+
+        self.assertEqual(file.text, parse_tokenized_mock.return_value)
+        parse_tokenized_mock.assert_called_once_with('int main() {}', 'file.c')
+
+    @mock.patch.object(TokenizedModule, 'prefetch')
+    def test_prefetch_text_prefetches_tokenized_module(self, prefetch_mock):
+        dir = new_dir(TMP_DIR_PATH)
+        dir.file_exists.return_value = True
+        dir.read_text_file.return_value = 'int main() {}'
+        file = CFile('file.c', dir)
+
+        file.prefetch_text()
+
+        self.assertIsInstance(file.text, TokenizedModule)
+        prefetch_mock.assert_called_once_with()
 
     def test_text_is_memoized(self):
         dir = new_dir(TMP_DIR_PATH)
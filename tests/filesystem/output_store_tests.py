@@ -0,0 +1,94 @@
+"""
+    Tests for the :mod:`regression_tests.filesystem.output_store` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from regression_tests.filesystem.directory import Directory
+from regression_tests.filesystem.output_store import MANIFEST_FILE_NAME
+from regression_tests.filesystem.output_store import OutputStore
+from regression_tests.filesystem.output_store import read_manifest
+
+
+class OutputStoreTests(unittest.TestCase):
+    """Tests for `OutputStore`."""
+
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root_dir)
+        self.store = OutputStore(os.path.join(self.root_dir, 'store'))
+
+    def create_outputs(self, dir_name, files):
+        dir = Directory(os.path.join(self.root_dir, dir_name))
+        dir.create()
+        for name, content in files.items():
+            dir.store_file(name, content)
+        return dir
+
+    def test_identical_outputs_of_different_dirs_are_same_file(self):
+        dir1 = self.create_outputs('case1', {'file.ll': 'content'})
+        dir2 = self.create_outputs('case2', {'file.ll': 'content'})
+
+        self.store.store_outputs(dir1)
+        self.store.store_outputs(dir2)
+
+        self.assertTrue(os.path.samefile(
+            os.path.join(dir1.path, 'file.ll'),
+            os.path.join(dir2.path, 'file.ll')
+        ))
+        self.assertEqual(dir2.read_text_file('file.ll'), 'content')
+
+    def test_different_outputs_are_not_same_file(self):
+        dir1 = self.create_outputs('case1', {'file.ll': 'content1'})
+        dir2 = self.create_outputs('case2', {'file.ll': 'content2'})
+
+        self.store.store_outputs(dir1)
+        self.store.store_outputs(dir2)
+
+        self.assertFalse(os.path.samefile(
+            os.path.join(dir1.path, 'file.ll'),
+            os.path.join(dir2.path, 'file.ll')
+        ))
+
+    def test_store_outputs_writes_manifest_with_hashes_of_outputs(self):
+        dir = self.create_outputs('case', {'file.ll': 'll', 'file.dsm': 'dsm'})
+
+        hashes = self.store.store_outputs(dir)
+
+        self.assertEqual(sorted(hashes.keys()), ['file.dsm', 'file.ll'])
+        self.assertEqual(read_manifest(dir), hashes)
+        self.assertTrue(os.path.isfile(self.store.blob_path(hashes['file.ll'])))
+
+    def test_store_outputs_does_not_store_manifest_itself(self):
+        dir = self.create_outputs('case', {'file.ll': 'll'})
+        self.store.store_outputs(dir)
+
+        hashes = self.store.store_outputs(dir)
+
+        self.assertNotIn(MANIFEST_FILE_NAME, hashes)
+
+    def test_prune_removes_only_blobs_not_referenced_by_outputs(self):
+        dir1 = self.create_outputs('case1', {'file.ll': 'content1'})
+        dir2 = self.create_outputs('case2', {'file.ll': 'content2'})
+        hashes1 = self.store.store_outputs(dir1)
+        hashes2 = self.store.store_outputs(dir2)
+        dir1.remove()
+
+        removed = self.store.prune()
+
+        self.assertEqual(removed, 1)
+        self.assertFalse(os.path.exists(self.store.blob_path(hashes1['file.ll'])))
+        self.assertTrue(os.path.exists(self.store.blob_path(hashes2['file.ll'])))
+
+
+class ReadManifestTests(unittest.TestCase):
+    """Tests for `read_manifest()`."""
+
+    def test_returns_none_when_there_is_no_manifest(self):
+        dir = Directory(tempfile.mkdtemp())
+        self.addCleanup(dir.remove)
+
+        self.assertIsNone(read_manifest(dir))
@@ -2,9 +2,14 @@
     Tests for the :mod:`regression_tests.io` module.
 """
 
+import io
 import unittest
+from datetime import datetime
 
+from regression_tests.io import print_phase_durations
+from regression_tests.io import print_test_results
 from regression_tests.io import strip_shell_colors
+from regression_tests.test_results import TestResults
 
 
 class StripShellColorsTests(unittest.TestCase):
@@ -17,3 +22,56 @@ class StripShellColorsTests(unittest.TestCase):
     def test_strips_colors_when_there_are_colors(self):
         text = '\x1b[01;33mcolored text\x1b[0m'
         self.assertEqual(strip_shell_colors(text), 'colored text')
+
+
+class PrintPhaseDurationsTests(unittest.TestCase):
+    """Tests for `print_phase_durations()`."""
+
+    def test_prints_nothing_when_there_are_no_durations(self):
+        stream = io.StringIO()
+
+        print_phase_durations({}, stream)
+
+        self.assertEqual(stream.getvalue(), '')
+
+    def test_prints_phases_from_longest_to_shortest(self):
+        stream = io.StringIO()
+
+        print_phase_durations({'assertions': 1.0, 'tool execution': 3.0}, stream)
+
+        self.assertEqual(stream.getvalue(), '\n'.join([
+            '',
+            'Time spent in phases:',
+            '  tool execution:               3.00s  ( 75.0%)',
+            '  assertions:                   1.00s  ( 25.0%)',
+            ''
+        ]))
+
+
+class PrintTestResultsTests(unittest.TestCase):
+    """Tests for `print_test_results()`."""
+
+    def setUp(self):
+        self.test_results = TestResults(
+            'module', 'Test (file.exe)',
+            datetime(2026, 10, 18, 10, 0, 0), datetime(2026, 10, 18, 10, 0, 5),
+            run_tests=1, failed_tests=0, skipped_tests=0, output='',
+            phase_durations={'assertions': 1.0, 'tool execution': 3.5}
+        )
+
+    def test_does_not_print_phase_durations_by_default(self):
+        stream = io.StringIO()
+
+        print_test_results(self.test_results, stream)
+
+        self.assertNotIn('Phases:', stream.getvalue())
+
+    def test_prints_phase_durations_from_longest_to_shortest_when_requested(self):
+        stream = io.StringIO()
+
+        print_test_results(self.test_results, stream, show_phase_durations=True)
+
+        self.assertIn(
+            '  Phases: tool execution 3.50s, assertions 1.00s\n',
+            stream.getvalue()
+        )
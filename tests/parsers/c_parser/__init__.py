@@ -129,3 +129,16 @@ class WithModuleTests(unittest.TestCase):
             }
         """ % (rhs, lhs, lhs, rhs))
         return module.func('func').if_stmts[0].condition
+
+    def assert_defines_slots_in_all_subclasses(self, cls, instance):
+        """Asserts that all subclasses of the given class define
+        ``__slots__``, so the given instance of one of them has no
+        ``__dict__``.
+        """
+        def check_subclasses(cls):
+            for subclass in cls.__subclasses__():
+                self.assertIn('__slots__', vars(subclass), subclass.__name__)
+                check_subclasses(subclass)
+
+        check_subclasses(cls)
+        self.assertFalse(hasattr(instance, '__dict__'))
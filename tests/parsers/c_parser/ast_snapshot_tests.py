@@ -0,0 +1,178 @@
+"""
+    Tests for the :mod:`regression_tests.parsers.c_parser.ast_snapshot`
+    module.
+"""
+
+from unittest import mock
+
+from clang import cindex
+
+from regression_tests.parsers.c_parser.ast_snapshot import get_ast_snapshot
+from regression_tests.parsers.c_parser.ast_snapshot import locate_node
+from regression_tests.parsers.c_parser.utils import get_children
+from regression_tests.parsers.c_parser.utils import visit_node
+from tests.parsers.c_parser import WithModuleTests
+
+
+CODE = """
+#include <stdio.h>
+
+int g = 1;
+
+int main(int argc) {
+    switch (argc) {
+        case 1 + 2:
+            printf("three");
+            break;
+    }
+    return g;
+}
+"""
+
+
+class AstSnapshotTests(WithModuleTests):
+    """Tests for `AstSnapshot`."""
+
+    def setUp(self):
+        self.module = self.parse(CODE)
+        self.snapshot = get_ast_snapshot(self.module._tu)
+
+    def test_contains_only_nodes_from_main_file(self):
+        top_level_names = [
+            self.snapshot.spelling(i) for i in range(len(self.snapshot))
+            if self.snapshot.parents[i] == -1
+        ]
+        self.assertEqual(top_level_names, ['g', 'main'])
+
+    def test_stores_kinds_spellings_and_offsets_of_nodes(self):
+        i = self.snapshot.index_of(self.module.funcs['main']._node)
+
+        self.assertEqual(
+            self.snapshot.kind_ids[i],
+            cindex.CursorKind.FUNCTION_DECL.value
+        )
+        self.assertEqual(self.snapshot.spelling(i), 'main')
+        self.assertEqual(
+            CODE[self.snapshot.start_offsets[i]:self.snapshot.end_offsets[i]],
+            CODE[CODE.index('int main'):CODE.rindex('}') + 1]
+        )
+
+    def test_children_are_same_as_when_obtained_from_libclang(self):
+        def check_children(node):
+            i = self.snapshot.index_of(node)
+            children = list(node.get_children())
+            self.assertEqual(
+                [self.snapshot.index_of(child) for child in children],
+                self.snapshot.children(i)
+            )
+            for child in children:
+                self.assertEqual(self.snapshot.parents[self.snapshot.index_of(child)], i)
+                check_children(child)
+
+        for node in self.module._tu.cursor.get_children():
+            if self.snapshot.index_of(node) is not None:
+                check_children(node)
+
+    def test_index_of_returns_none_for_node_from_other_file(self):
+        node = next(
+            node for node in self.module._tu.cursor.get_children()
+            if node.spelling == 'printf'
+        )
+
+        self.assertIsNone(self.snapshot.index_of(node))
+
+    def test_index_of_finds_top_level_node_without_keys_of_all_nodes(self):
+        node = next(
+            node for node in self.module._tu.cursor.get_children()
+            if node.spelling == 'main'
+        )
+
+        i = self.snapshot.index_of(node)
+
+        self.assertEqual(self.snapshot.spelling(i), 'main')
+        self.assertIsNone(self.snapshot._indexes_by_key)
+
+    def test_node_returns_node_with_given_index(self):
+        func_node = self.module.funcs['main']._node
+        i = self.snapshot.index_of(func_node)
+
+        node = self.snapshot.node(i)
+
+        self.assertEqual(node, func_node)
+        self.assertEqual(node.spelling, 'main')
+        self.assertEqual(self.snapshot.index_of(node), i)
+        self.assertIs(node._tu, self.module._tu)
+
+    def test_node_returns_new_node_upon_every_call(self):
+        i = self.snapshot.index_of(self.module.funcs['main']._node)
+
+        self.assertIsNot(self.snapshot.node(i), self.snapshot.node(i))
+
+    def test_nodes_with_same_spelling_share_it(self):
+        spellings = [
+            self.snapshot.node(i)._spelling for i in range(len(self.snapshot))
+            if self.snapshot.spelling(i) == 'argc'
+        ]
+
+        self.assertGreater(len(spellings), 1)
+        self.assertTrue(all(s is spellings[0] for s in spellings))
+
+    def test_indexes_of_kinds_returns_indexes_of_nodes_of_given_kinds(self):
+        kind_ids = frozenset([cindex.CursorKind.CALL_EXPR.value])
+
+        indexes = self.snapshot.indexes_of_kinds(kind_ids)
+
+        self.assertEqual(indexes, sorted(indexes))
+        self.assertEqual(
+            [self.snapshot.spelling(i) for i in indexes],
+            [self.snapshot.spelling(i) for i in range(len(self.snapshot))
+             if self.snapshot.kind_ids[i] == cindex.CursorKind.CALL_EXPR.value]
+        )
+        self.assertTrue(indexes)
+
+    def test_snapshot_is_built_only_once_per_translation_unit(self):
+        self.assertIs(get_ast_snapshot(self.module._tu), self.snapshot)
+
+
+class LocateNodeTests(WithModuleTests):
+    """Tests for `locate_node()`."""
+
+    def test_returns_snapshot_and_index_of_node(self):
+        module = self.parse(CODE)
+        node = module.funcs['main']._node
+
+        snapshot, i = locate_node(node)
+
+        self.assertIs(snapshot, get_ast_snapshot(module._tu))
+        self.assertEqual(snapshot.spelling(i), 'main')
+
+    def test_returns_none_for_node_without_translation_unit(self):
+        self.assertIsNone(locate_node(mock.Mock(spec=[])))
+
+
+class UsageOfSnapshotTests(WithModuleTests):
+    """Tests that the AST is traversed through the snapshot."""
+
+    def test_visit_node_and_get_children_do_not_call_libclang_get_children(self):
+        module = self.parse(CODE)
+        func_node = module.funcs['main']._node
+        get_ast_snapshot(module._tu)
+
+        with mock.patch.object(cindex.Cursor, 'get_children') as get_children_mock:
+            visited_kinds = []
+            visit_node(func_node, lambda node: visited_kinds.append(node.kind))
+            children = get_children(func_node)
+
+        self.assertFalse(get_children_mock.called)
+        self.assertIn(cindex.CursorKind.CALL_EXPR, visited_kinds)
+        self.assertEqual(
+            [child.kind for child in children],
+            [cindex.CursorKind.PARM_DECL, cindex.CursorKind.COMPOUND_STMT]
+        )
+
+    def test_function_queries_are_answered_from_snapshot(self):
+        func = self.parse(CODE).funcs['main']
+
+        self.assertEqual(func.called_func_names, {'printf'})
+        self.assertEqual(len(func.switch_stmts), 1)
+        self.assertEqual(len(func.return_stmts), 1)
@@ -0,0 +1,103 @@
+"""
+    Tests for the
+    :mod:`regression_tests.parsers.c_parser.declarations_only` module.
+"""
+
+import io
+import unittest
+from unittest import mock
+
+from regression_tests.parsers.c_parser import parse
+
+
+CODE = """
+#include <stdio.h>
+
+struct s { int x; };
+
+int g = 1;
+
+int helper(int a);
+
+int main(int argc) /* A comment. */ {
+    int i;
+    for (i = 0; i < argc; i++) {
+        printf("%d", helper(i));
+    }
+    return 0;
+}
+
+int helper(int a)
+{
+    return a + g;
+}
+"""
+
+
+class DeclarationsOnlyModuleTests(unittest.TestCase):
+    """Tests for `DeclarationsOnlyModule`."""
+
+    def setUp(self):
+        self.module = parse(CODE, 'test.c', skip_function_bodies=True)
+        self.full_module = parse(CODE, 'test.c', skip_function_bodies=False)
+
+    def test_answers_declaration_queries_without_parsing_bodies(self):
+        with mock.patch('regression_tests.parsers.c_parser.declarations_only.parse') as parse_mock:
+            for query in ('func_names', 'global_var_names', 'struct_names',
+                          'includes', 'comments'):
+                with self.subTest(query=query):
+                    self.assertEqual(
+                        getattr(self.module, query),
+                        getattr(self.full_module, query)
+                    )
+            self.assertEqual(
+                str(self.module.funcs['main']),
+                str(self.full_module.funcs['main'])
+            )
+            self.assertEqual(self.module.funcs['helper'].param_names, ['a'])
+
+        self.assertFalse(parse_mock.called)
+
+    def test_answers_body_queries_same_as_fully_parsed_module(self):
+        func = self.module.funcs['main']
+        full_func = self.full_module.funcs['main']
+
+        self.assertEqual(func.called_func_names, full_func.called_func_names)
+        for stmts in ('for_loops', 'var_def_stmts', 'return_stmts'):
+            with self.subTest(stmts=stmts):
+                self.assertEqual(
+                    list(map(str, getattr(func, stmts))),
+                    list(map(str, getattr(full_func, stmts)))
+                )
+        self.assertEqual(
+            self.module.string_literal_values,
+            self.full_module.string_literal_values
+        )
+
+    def test_parses_code_with_bodies_only_once(self):
+        with mock.patch(
+                'regression_tests.parsers.c_parser.declarations_only.parse',
+                return_value=self.full_module) as parse_mock:
+            self.module.funcs['main'].calls('printf')
+            self.module.funcs['helper'].has_any_return_stmts()
+
+        self.assertEqual(parse_mock.call_count, 1)
+
+    def test_has_parse_errors_considers_errors_in_bodies(self):
+        module = parse(
+            'int main() { return undefined; }',
+            skip_function_bodies=True
+        )
+        self.assertTrue(module.has_parse_errors())
+
+    def test_prints_errors_in_bodies_only_once(self):
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            module = parse(
+                'int f(undefined_type a);\nint main() { return undefined; }',
+                print_errors=True,
+                skip_function_bodies=True
+            )
+            module.has_parse_errors()
+
+        self.assertEqual(stdout.getvalue().count('undefined_type'), 1)
+        self.assertEqual(stdout.getvalue().count("'undefined'"), 1)
@@ -62,3 +62,7 @@ class CompoundAssignOpExprTests(WithModuleTests):
     def test_str_returns_correct_str(self):
         assign_op_expr = self.get_expr('a /= 2', 'int')
         self.assertEqual(str(assign_op_expr), 'a /= 2')
+
+    def test_str_returns_correct_str_when_lhs_consists_of_more_tokens(self):
+        assign_op_expr = self.get_expr('*&a <<= 2', 'int')
+        self.assertEqual(str(assign_op_expr), '*&a <<= 2')
@@ -253,6 +253,12 @@ class ExpressionTests(WithModuleTests):
         expr = self.get_struct_deref_op_expr('s', 'x')
         self.assertIsInstance(expr, StructDerefOpExpr)
 
+    def test_from_clang_node_is_not_misled_by_operator_in_operand(self):
+        self.assertIsInstance(self.get_expr('-(a * 2)', 'int'), NegOpExpr)
+        self.assertIsInstance(self.get_expr('!(a - 1)', 'int'), NotOpExpr)
+        self.assertIsInstance(self.get_expr('a == (a = 1)', 'int'), EqOpExpr)
+        self.assertIsInstance(self.get_expr('(a < 1) + 2', 'int'), AddOpExpr)
+
     def test_from_clang_node_skips_parenthesized_expressions(self):
         # The include and NULL have to be there. Otherwise, the expression is
         # not of kind cindex.CursorKind.PAREN_EXPR (the point of this test).
@@ -269,3 +275,9 @@ class ExpressionTests(WithModuleTests):
         unsupported_expr = mock.Mock()
         with self.assertRaisesRegex(AssertionError, r'.*unsupported.*'):
             Expression._from_clang_node(unsupported_expr)
+
+    def test_expressions_define_slots_so_their_instances_have_no_dict(self):
+        self.assert_defines_slots_in_all_subclasses(
+            Expression,
+            self.get_expr('1 + 2', 'int')
+        )
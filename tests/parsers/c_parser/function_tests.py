@@ -7,6 +7,9 @@ import sys
 from textwrap import dedent
 from unittest import mock
 
+from regression_tests.parsers.c_parser.function import Function
+from regression_tests.parsers.c_parser.query import assign_ops
+from regression_tests.parsers.c_parser.query import calls
 from regression_tests.parsers.c_parser.stmts.goto_stmt import Label
 from regression_tests.utils.list import NamedObjectList
 from tests.parsers.c_parser import WithModuleTests
@@ -1553,11 +1556,37 @@ class FunctionTests(WithModuleTests):
         self.assertEqual(func.assignments['b = 2'].lhs, 'b')
         self.assertEqual(func.assignments['b = b + a'].rhs, 'b + a')
 
+    def test_function_has_no_dict(self):
+        func = self.get_func('int func(void) { return 0; }', 'func')
+
+        self.assertEqual(len(func.return_stmts), 1)
+        self.assertFalse(hasattr(func, '__dict__'))
+
+    def test_find_all_returns_only_nodes_inside_function(self):
+        module = self.parse("""
+            void f(int n) { f(n); }
+            void g(int n) { f(n); f(n + 1); }
+        """)
+
+        found = module.funcs['g'].find_all(calls('f'))
+
+        self.assertEqual([str(call) for call in found], ['f(n)', 'f(n + 1)'])
+
+    def test_has_any_checks_only_nodes_inside_function(self):
+        module = self.parse("""
+            int g;
+            void f(void) { g = 1; }
+            void h(void) { f(); }
+        """)
+
+        self.assertTrue(module.funcs['f'].has_any(assign_ops()))
+        self.assertFalse(module.funcs['h'].has_any(assign_ops()))
+
     def test_dump_calls_dump_to_with_stdout(self):
         func = self.get_func('int func(void) {}', 'func')
-        func.dump_to = mock.Mock()
-        func.dump()
-        func.dump_to.assert_called_once_with(sys.stdout)
+        with mock.patch.object(Function, 'dump_to') as dump_to_mock:
+            func.dump()
+        dump_to_mock.assert_called_once_with(sys.stdout)
 
     def test_dump_to(self):
         stream = io.StringIO()
@@ -0,0 +1,131 @@
+"""
+    A benchmark of memory occupied by a large parsed C module.
+
+    Run it from the root of the repository:
+
+    .. code-block:: text
+
+        python -m tests.parsers.c_parser.memory_benchmark [--funcs N] [--groups M]
+
+    It generates a module resembling decompiled code with `N` functions, each
+    of which contains `M` groups of five statements (by default, 1000
+    functions with 20 groups, i.e. 100,000 statements), parses it, and queries
+    assignments, conditions of if statements, loops, and parameters of all the
+    functions. Memory allocated by Python objects (``tracemalloc``) and the
+    resident set size of the process are printed before the parsing, after the
+    parsing, and after the queries. Tracing of allocations makes the queries
+    several times slower, so use e.g. ``--funcs 200`` for a quick comparison.
+"""
+
+import argparse
+import resource
+import sys
+import time
+import tracemalloc
+
+from regression_tests.parsers.c_parser import parse
+
+
+def generate_code(funcs, groups):
+    """Generates C code with the given number of functions, each of which
+    contains the given number of groups of five statements.
+    """
+    lines = []
+    for i in range(funcs):
+        lines.append('int func{}(int a, int b) {{'.format(i))
+        lines.append('    int x = a;')
+        for j in range(groups):
+            lines.append('    x = x + b * {};'.format(j))
+            lines.append('    if (x > {}) x = x - a;'.format(j))
+            lines.append('    while (x < {}) x = x * 2;'.format(j))
+        lines.append('    return x;')
+        lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def query_module(module):
+    """Queries all the functions in the given module the same way as tests
+    usually do.
+    """
+    for func in module.funcs:
+        func.params
+        func.assignments
+        [if_stmt.condition for if_stmt in func.if_stmts]
+        func.while_loops
+        func.for_loops
+
+
+def get_rss():
+    """Returns the current resident set size of the process (in bytes) or
+    ``None`` when it cannot be obtained.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return None
+
+
+def get_peak_rss():
+    """Returns the peak resident set size of the process (in bytes)."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The size is in kilobytes on Linux but in bytes on macOS.
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def print_stage(name, duration=None):
+    """Prints the memory occupied at the given stage of the benchmark."""
+    current, peak = tracemalloc.get_traced_memory()
+    rss = get_rss()
+    print('{:<16}{:>12}{:>12}{:>12}{:>12}{:>10}'.format(
+        name,
+        _mib(current),
+        _mib(peak),
+        _mib(rss) if rss is not None else '-',
+        _mib(get_peak_rss()),
+        '{:.2f}s'.format(duration) if duration is not None else '-'
+    ))
+
+
+def _mib(size):
+    return '{:.1f} MiB'.format(size / 2**20)
+
+
+def parse_args():
+    """Parses command-line arguments and returns them."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark of memory occupied by a large parsed C module.'
+    )
+    parser.add_argument('--funcs', type=int, default=1000,
+                        help='Number of functions in the module.')
+    parser.add_argument('--groups', type=int, default=20,
+                        help='Number of groups of five statements per function.')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    code = generate_code(args.funcs, args.groups)
+    print('Module with {} functions and {} statements ({:.1f} MiB of code).\n'.format(
+        args.funcs,
+        args.funcs * (5 * args.groups + 2),
+        len(code) / 2**20
+    ))
+    print('{:<16}{:>12}{:>12}{:>12}{:>12}{:>10}'.format(
+        'Stage', 'Python', 'Py. peak', 'RSS', 'Peak RSS', 'Time'
+    ))
+
+    tracemalloc.start()
+    print_stage('before parsing')
+
+    start = time.perf_counter()
+    module = parse(code)
+    print_stage('after parsing', time.perf_counter() - start)
+
+    start = time.perf_counter()
+    query_module(module)
+    print_stage('after queries', time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    main()
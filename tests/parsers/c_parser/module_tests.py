@@ -8,6 +8,9 @@ import sys
 from textwrap import dedent
 from unittest import mock
 
+from regression_tests.parsers.c_parser.ast_snapshot import AstSnapshot
+from regression_tests.parsers.c_parser.query import calls
+from regression_tests.parsers.c_parser.query import loops
 from regression_tests.utils.list import NamedObjectList
 from tests.parsers.c_parser import WithModuleTests
 
@@ -33,6 +36,29 @@ class ModuleTests(WithModuleTests):
         module = self.parse('int main() { abcd }')
         self.assertTrue(module.has_parse_errors())
 
+    def test_top_level_nodes_are_traversed_only_once(self):
+        module = self.parse("""
+            #include <stdio.h>
+            struct s { int x; };
+            int g;
+            int main() { return 0; }
+        """)
+        with mock.patch.object(
+                type(module._tu.cursor),
+                'get_children',
+                autospec=True,
+                side_effect=type(module._tu.cursor).get_children) as get_children:
+            module.global_vars
+            module.funcs
+            module.structs
+            module.unions
+            module.enums
+
+        self.assertEqual(get_children.call_count, 1)
+        self.assertEqual(module.global_var_names, ['g'])
+        self.assertEqual(module.func_names, ['main'])
+        self.assertEqual(module.struct_names, ['s'])
+
     def test_global_vars_returns_empty_list_when_no_global_vars(self):
         module = self.parse('')
         self.assertEqual(len(module.global_vars), 0)
@@ -547,6 +573,24 @@ class ModuleTests(WithModuleTests):
         """)
         self.assertEqual(len(module.includes), 2)
 
+    def test_comments_includes_and_string_literals_do_not_tokenize_code_again(self):
+        module = self.parse("""
+            #include <stdio.h>
+            // comment
+            const char *s = "str";
+        """)
+        # String literals from the AST are not obtained from tokens of the
+        # module.
+        module.string_literal_values
+
+        with mock.patch('clang.cindex.Cursor.get_tokens') as get_tokens_mock:
+            self.assertEqual(module.includes, ['#include <stdio.h>'])
+            self.assertEqual(module.comments, ['// comment'])
+            self.assertTrue(module.has_string_literal('str'))
+            self.assertFalse(module.has_string_literal('other'))
+
+        self.assertFalse(get_tokens_mock.called)
+
     def test_has_include_of_file_returns_true_when_include_exists(self):
         module = self.parse("""
             #include <stdio.h>
@@ -654,6 +698,21 @@ class ModuleTests(WithModuleTests):
         """)
         self.assertTrue(module.has_string_literal('$^()[]{}.*+?'))
 
+    def test_has_identifier_returns_true_when_there_is_such_identifier(self):
+        module = self.parse("""
+            #define LIMIT 10
+
+            int func(int arg) { return arg + LIMIT; }
+        """)
+        self.assertTrue(module.has_identifier('func'))
+        self.assertTrue(module.has_identifier('arg'))
+        self.assertTrue(module.has_identifier('LIMIT'))
+
+    def test_has_identifier_returns_false_for_keyword_or_missing_identifier(self):
+        module = self.parse('int func(void) { return 0; }')
+        self.assertFalse(module.has_identifier('return'))
+        self.assertFalse(module.has_identifier('other'))
+
     def test_has_string_literal_matching_returns_false_when_no_such_literal(self):
         module = self.parse('')
         self.assertFalse(module.has_string_literal_matching(r'.*'))
@@ -704,6 +763,17 @@ class ModuleTests(WithModuleTests):
         """)
         self.assertFalse(module.has_string_literal_matching(r'he[l]+o'))
 
+    def test_has_string_literal_matching_does_not_match_across_literals(self):
+        module = self.parse("""
+            int main() {
+                if (undefined_variable) {
+                    puts("hello");
+                    puts("world");
+                }
+            }
+        """)
+        self.assertFalse(module.has_string_literal_matching(r'hello.*world'))
+
     def test_has_string_literal_matching_properly_handles_caret_and_dollar_in_regexp(self):
         module = self.parse("""
             int main() {
@@ -1519,6 +1589,39 @@ class ModuleTests(WithModuleTests):
         """)
         self.assertTrue(module.has_no_empty_enums())
 
+    def test_find_all_returns_nodes_found_by_query(self):
+        module = self.parse("""
+            void f(int n) {
+                for (int i = 0; i < n; i++) {
+                    f(i);
+                }
+                f(n);
+            }
+        """)
+
+        found = module.find_all(calls('f').inside(loops()))
+
+        self.assertEqual([str(call) for call in found], ['f(i)'])
+
+    def test_find_all_memoizes_results_of_equal_queries(self):
+        module = self.parse('void f(void) { f(); }')
+        found = module.find_all(calls('f'))
+
+        with mock.patch.object(AstSnapshot, 'indexes_of_kinds') as indexes_mock:
+            self.assertIs(module.find_all(calls('f')), found)
+
+        self.assertFalse(indexes_mock.called)
+
+    def test_has_any_returns_true_when_query_finds_node(self):
+        module = self.parse('void f(void) { f(); }')
+
+        self.assertTrue(module.has_any(calls('f')))
+
+    def test_has_any_returns_false_when_query_finds_no_node(self):
+        module = self.parse('void f(void) { f(); }')
+
+        self.assertFalse(module.has_any(calls('g')))
+
     def test_dump_calls_dump_to_with_stdout(self):
         module = self.parse('')
         module.dump_to = mock.Mock()
@@ -0,0 +1,126 @@
+"""
+    Tests for the :mod:`regression_tests.parsers.c_parser.precompiled_headers`
+    module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from regression_tests.clang import INCLUDE_PATHS
+from regression_tests.parsers.c_parser import get_index
+from regression_tests.parsers.c_parser.precompiled_headers import get_precompiled_header
+from regression_tests.parsers.c_parser.precompiled_headers import get_standard_includes
+
+
+class GetStandardIncludesTests(unittest.TestCase):
+    """Tests for `get_standard_includes()`."""
+
+    def test_returns_includes_at_beginning_of_code(self):
+        CODE = """//
+// This file was generated by the decompiler.
+//
+
+#include <stdint.h>
+#  include<stdio.h>
+
+int main() {}
+"""
+        self.assertEqual(
+            get_standard_includes(CODE),
+            ['<stdint.h>', '<stdio.h>']
+        )
+
+    def test_stops_at_first_line_that_is_not_include(self):
+        CODE = """
+#include <stdint.h>
+int g;
+#include <stdio.h>
+"""
+        self.assertEqual(get_standard_includes(CODE), ['<stdint.h>'])
+
+    def test_stops_at_include_of_nonstandard_header(self):
+        CODE = """
+#include "header.h"
+#include <stdio.h>
+"""
+        self.assertEqual(get_standard_includes(CODE), [])
+
+
+class GetPrecompiledHeaderTests(unittest.TestCase):
+    """Tests for `get_precompiled_header()`."""
+
+    def setUp(self):
+        self.pch_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pch_cache_dir)
+        patcher = mock.patch(
+            'regression_tests.parsers.c_parser.precompiled_headers.PCH_CACHE_DIR',
+            self.pch_cache_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.args = ['-std=c99'] + ['-I{}'.format(path) for path in INCLUDE_PATHS]
+
+    def test_returns_none_when_code_does_not_include_standard_headers(self):
+        self.assertIsNone(
+            get_precompiled_header(get_index(), 'int g;', self.args)
+        )
+
+    def test_builds_header_only_once(self):
+        CODE = '#include <stddef.h>\nsize_t g;'
+
+        pch_path1 = get_precompiled_header(get_index(), CODE, self.args)
+        mtime = os.path.getmtime(pch_path1)
+        pch_path2 = get_precompiled_header(get_index(), CODE, self.args)
+
+        self.assertEqual(pch_path1, pch_path2)
+        self.assertEqual(os.path.getmtime(pch_path2), mtime)
+
+    def test_different_includes_have_different_headers(self):
+        pch_path1 = get_precompiled_header(
+            get_index(), '#include <stddef.h>', self.args
+        )
+        pch_path2 = get_precompiled_header(
+            get_index(), '#include <stdint.h>', self.args
+        )
+
+        self.assertNotEqual(pch_path1, pch_path2)
+
+    def test_returns_none_when_header_cannot_be_built(self):
+        self.assertIsNone(get_precompiled_header(
+            get_index(), '#include <nonexisting_header.h>', self.args
+        ))
+
+    def test_leaves_no_temporary_files_in_cache_dir(self):
+        pch_path = get_precompiled_header(
+            get_index(), '#include <stddef.h>', self.args
+        )
+
+        self.assertEqual(
+            os.listdir(self.pch_cache_dir),
+            [os.path.basename(pch_path)]
+        )
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'requires POSIX permissions')
+    def test_returns_none_when_cache_dir_is_writable_by_other_users(self):
+        os.chmod(self.pch_cache_dir, 0o777)
+
+        self.assertIsNone(get_precompiled_header(
+            get_index(), '#include <stddef.h>', self.args
+        ))
+        self.assertEqual(os.listdir(self.pch_cache_dir), [])
+
+    def test_creates_nonexisting_cache_dir_accessible_only_by_user(self):
+        pch_cache_dir = os.path.join(self.pch_cache_dir, 'pch')
+        with mock.patch(
+                'regression_tests.parsers.c_parser.precompiled_headers.PCH_CACHE_DIR',
+                pch_cache_dir):
+            pch_path = get_precompiled_header(
+                get_index(), '#include <stddef.h>', self.args
+            )
+
+        self.assertEqual(os.path.dirname(pch_path), pch_cache_dir)
+        if hasattr(os, 'getuid'):
+            self.assertEqual(os.stat(pch_cache_dir).st_mode & 0o777, 0o700)
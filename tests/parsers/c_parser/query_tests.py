@@ -0,0 +1,210 @@
+"""
+    Tests for the :mod:`regression_tests.parsers.c_parser.query` module.
+"""
+
+from regression_tests.parsers.c_parser.exprs.call_expr import CallExpr
+from regression_tests.parsers.c_parser.function import Function
+from regression_tests.parsers.c_parser.query import assign_ops
+from regression_tests.parsers.c_parser.query import calls
+from regression_tests.parsers.c_parser.query import do_while_loops
+from regression_tests.parsers.c_parser.query import for_loops
+from regression_tests.parsers.c_parser.query import funcs
+from regression_tests.parsers.c_parser.query import if_stmts
+from regression_tests.parsers.c_parser.query import loops
+from regression_tests.parsers.c_parser.query import return_stmts
+from regression_tests.parsers.c_parser.query import string_literals
+from regression_tests.parsers.c_parser.query import switch_stmts
+from regression_tests.parsers.c_parser.query import while_loops
+from regression_tests.parsers.c_parser.stmts.for_loop import ForLoop
+from tests.parsers.c_parser import WithModuleTests
+
+
+CODE = """
+#include <stdio.h>
+
+int g;
+
+void f(int n) {
+    for (int i = 0; i < n; i++) {
+        printf("%d\\n", i);
+        printf(("text"));
+    }
+    printf("%d", n);
+    g = 1;
+    g += 2;
+    if (n == 3) {
+        return;
+    }
+}
+
+int main(void) {
+    while (1) {
+        f(printf("%d\\n", 2));
+    }
+    do {
+        switch (g) {
+            default:
+                break;
+        }
+    } while (0);
+    return 0;
+}
+"""
+
+
+class QueryTests(WithModuleTests):
+    """Tests for `Query` and functions creating queries."""
+
+    def setUp(self):
+        self.module = self.parse(CODE)
+
+    def assert_finds(self, query, expected_strs):
+        self.assertEqual(
+            [str(node) for node in self.module.find_all(query)],
+            expected_strs
+        )
+
+    def test_funcs_finds_functions_with_given_names(self):
+        found = self.module.find_all(funcs('main'))
+
+        self.assertEqual(len(found), 1)
+        self.assertIsInstance(found[0], Function)
+        self.assertEqual(found[0].name, 'main')
+
+    def test_funcs_finds_all_functions_when_no_name_is_given(self):
+        self.assertEqual(
+            [func.name for func in self.module.find_all(funcs())],
+            ['f', 'main']
+        )
+
+    def test_calls_finds_calls_of_given_function_in_order(self):
+        found = self.module.find_all(calls('printf'))
+
+        self.assertTrue(all(isinstance(call, CallExpr) for call in found))
+        self.assertEqual(
+            [str(call) for call in found],
+            ['printf(%d\\n, i)', 'printf(text)', 'printf(%d, n)',
+             'printf(%d\\n, 2)']
+        )
+
+    def test_calls_finds_all_calls_when_no_name_is_given(self):
+        self.assertEqual(len(self.module.find_all(calls())), 5)
+
+    def test_calls_do_not_find_calls_from_included_files(self):
+        module = self.parse("""
+            #include <stdio.h>
+
+            int main(void) { return 0; }
+        """)
+
+        self.assertEqual(module.find_all(calls()), [])
+
+    def test_calls_unify_names_of_builtins(self):
+        module = self.parse("""
+            void *__builtin___memset_chk(void *, int, unsigned long, unsigned long);
+
+            void f(char *p) {
+                __builtin___memset_chk(p, 0, 1, 1);
+            }
+        """)
+
+        self.assertEqual(len(module.find_all(calls('memset'))), 1)
+
+    def test_string_literals_finds_literals_whose_value_fully_matches(self):
+        self.assert_finds(string_literals(r'%d.*'), ['%d\\n', '%d', '%d\\n'])
+        self.assert_finds(string_literals(r'%d'), ['%d'])
+
+    def test_string_literals_finds_all_literals_when_no_regexp_is_given(self):
+        self.assertEqual(len(self.module.find_all(string_literals())), 4)
+
+    def test_string_literals_do_not_find_literals_without_tokens(self):
+        # The expansion of NAN contains a string literal without tokens.
+        module = self.parse("""
+            #include <math.h>
+
+            float f = NAN;
+        """)
+
+        self.assertEqual(module.find_all(string_literals()), [])
+
+    def test_assign_ops_finds_assignments_and_compound_assignments(self):
+        self.assert_finds(assign_ops(), ['g = 1', 'g += 2'])
+
+    def test_statement_queries_find_statements_of_given_kinds(self):
+        found = self.module.find_all(for_loops())
+        self.assertEqual(len(found), 1)
+        self.assertIsInstance(found[0], ForLoop)
+        self.assertEqual(len(self.module.find_all(while_loops())), 1)
+        self.assertEqual(len(self.module.find_all(do_while_loops())), 1)
+        self.assertEqual(len(self.module.find_all(loops())), 3)
+        self.assertEqual(len(self.module.find_all(if_stmts())), 1)
+        self.assertEqual(len(self.module.find_all(switch_stmts())), 1)
+        self.assertEqual(len(self.module.find_all(return_stmts())), 2)
+
+    def test_with_arg_finds_calls_whose_arg_is_found_by_given_query(self):
+        self.assert_finds(
+            calls('printf').with_arg(0, string_literals('%d')),
+            ['printf(%d, n)']
+        )
+
+    def test_with_arg_skips_parentheses_and_implicit_casts(self):
+        self.assert_finds(
+            calls('printf').with_arg(0, string_literals('text')),
+            ['printf(text)']
+        )
+
+    def test_with_arg_does_not_find_calls_without_arg_on_given_position(self):
+        self.assertEqual(
+            self.module.find_all(calls('f').with_arg(1, calls())),
+            []
+        )
+
+    def test_with_arg_can_be_combined_with_other_arg(self):
+        self.assert_finds(
+            calls('f').with_arg(0, calls('printf').with_arg(0, string_literals())),
+            ['f(printf(%d\\n, 2))']
+        )
+
+    def test_inside_finds_only_nodes_inside_nodes_found_by_given_query(self):
+        self.assert_finds(
+            calls('printf').inside(loops()),
+            ['printf(%d\\n, i)', 'printf(text)', 'printf(%d\\n, 2)']
+        )
+
+    def test_inside_requires_all_given_containers(self):
+        self.assert_finds(
+            calls('printf').inside(loops(), funcs('main')),
+            ['printf(%d\\n, 2)']
+        )
+
+    def test_inside_with_nested_queries(self):
+        query = calls('printf').with_arg(
+            0, string_literals(r'%d.*')
+        ).inside(loops().inside(funcs('f')))
+
+        self.assert_finds(query, ['printf(%d\\n, i)'])
+
+    def test_refining_query_does_not_change_original_query(self):
+        query = calls('printf')
+
+        query.inside(loops())
+
+        self.assertEqual(len(self.module.find_all(query)), 4)
+
+    def test_equal_queries_are_equal_and_have_same_hash(self):
+        query1 = calls('printf').with_arg(0, string_literals('x')).inside(loops())
+        query2 = calls('printf').with_arg(0, string_literals('x')).inside(loops())
+
+        self.assertEqual(query1, query2)
+        self.assertEqual(hash(query1), hash(query2))
+
+    def test_different_queries_are_not_equal(self):
+        self.assertNotEqual(calls('printf'), calls('puts'))
+        self.assertNotEqual(calls('printf'), calls('printf').inside(loops()))
+        self.assertNotEqual(string_literals('a'), string_literals('b'))
+
+    def test_repr_contains_kinds_and_names(self):
+        self.assertEqual(
+            repr(calls('printf')),
+            "<Query kinds=['CALL_EXPR'] names=['printf']>"
+        )
@@ -131,3 +131,9 @@ class StatementTests(WithModuleTests):
         unsupported_node = mock.Mock()
         with self.assertRaisesRegex(AssertionError, r'.*unsupported.*'):
             Statement._from_clang_node(unsupported_node)
+
+    def test_statements_define_slots_so_their_instances_have_no_dict(self):
+        self.assert_defines_slots_in_all_subclasses(
+            Statement,
+            self.get_goto_stmt('goto abc; abc: ;')
+        )
@@ -0,0 +1,169 @@
+"""
+    Tests for the :mod:`regression_tests.parsers.c_parser.summary` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from regression_tests.parsers.c_parser import parse
+from regression_tests.parsers.c_parser.module import Module
+from regression_tests.parsers.c_parser.summary import SummarizedModule
+from regression_tests.parsers.c_parser.summary import get_summary_cache_dir
+from regression_tests.parsers.c_parser.summary import parse_cached
+from regression_tests.parsers.c_parser.summary import set_summary_cache_dir
+from regression_tests.parsers.c_parser.summary import summarize_module
+
+
+CODE = """
+#include <stdio.h>
+
+// A comment.
+struct node { int value; };
+struct { int x; } anonymous;
+union u { int i; float f; };
+enum e { A, B };
+enum empty_e {};
+
+int g = 1;
+const char *msg = "global string";
+
+int helper(int a, int b) {
+    return a + b;
+}
+
+int main(int argc, char **argv) {
+    int i;
+    for (i = 0; i < 10; i++) {
+        g += helper(i, argc);
+    }
+    while (g > 100) {
+        g--;
+    }
+    if (g == 0) {
+        goto end;
+    }
+    printf("result: %d", g);
+end:
+    return 0;
+}
+"""
+
+
+class SummarizedModuleTests(unittest.TestCase):
+    """Tests for `SummarizedModule`."""
+
+    def setUp(self):
+        self.module = parse(CODE, 'test.c')
+        self.summarized_module = SummarizedModule(
+            CODE,
+            'test.c',
+            summarize_module(self.module)
+        )
+
+    def test_is_module_equal_to_original_code(self):
+        self.assertIsInstance(self.summarized_module, Module)
+        self.assertEqual(self.summarized_module, CODE)
+
+    def test_answers_module_queries_same_as_parsed_module(self):
+        for query in ('file_name', 'global_var_names', 'global_var_count',
+                      'func_names', 'func_count', 'comments', 'includes',
+                      'string_literal_values', 'struct_names', 'struct_count',
+                      'unnamed_struct_count', 'union_names', 'union_count',
+                      'enum_names', 'enum_count', 'enum_item_names',
+                      'empty_enum_count'):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    getattr(self.summarized_module, query),
+                    getattr(self.module, query)
+                )
+        self.assertTrue(self.summarized_module.has_func('main'))
+        self.assertTrue(self.summarized_module.has_string_literal('result: %d'))
+        self.assertTrue(self.summarized_module.has_comment_matching('.*comment.*'))
+
+    def test_does_not_parse_code_when_answering_from_summary(self):
+        with mock.patch('regression_tests.parsers.c_parser.summary.parse') as parse_mock:
+            self.summarized_module.has_funcs('main', 'helper')
+            self.summarized_module.has_string_literal('not present')
+            self.summarized_module.func('main').calls('helper', 'printf')
+            self.summarized_module.funcs['main'].has_for_loops(
+                'for (i = 0; i < 10; i++)'
+            )
+
+        self.assertFalse(parse_mock.called)
+
+    def test_answers_function_queries_same_as_parsed_function(self):
+        func = self.module.funcs['main']
+        summarized_func = self.summarized_module.funcs['main']
+
+        self.assertEqual(summarized_func.name, func.name)
+        self.assertEqual(summarized_func.param_names, func.param_names)
+        self.assertEqual(summarized_func.called_func_names, func.called_func_names)
+        self.assertEqual(str(summarized_func), str(func))
+        self.assertEqual(repr(summarized_func), repr(func))
+        self.assertTrue(summarized_func.has_any_for_loops())
+        self.assertTrue(summarized_func.has_while_loops('while (g > 100)'))
+        self.assertTrue(summarized_func.has_goto_stmts('goto end'))
+        self.assertFalse(summarized_func.has_any_switch_stmts())
+
+    def test_parses_code_for_queries_summary_cannot_answer(self):
+        self.assertEqual(
+            str(self.summarized_module.global_vars['g'].type),
+            'int'
+        )
+        self.assertEqual(
+            str(self.summarized_module.funcs['main'].return_type),
+            'int'
+        )
+        self.assertEqual(len(self.summarized_module.funcs['main'].for_loops), 1)
+
+
+class ParseCachedTests(unittest.TestCase):
+    """Tests for `parse_cached()`."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.addCleanup(set_summary_cache_dir, get_summary_cache_dir())
+
+    def test_parses_code_when_cache_is_disabled(self):
+        set_summary_cache_dir(None)
+
+        module = parse_cached(CODE, 'test.c')
+
+        self.assertNotIsInstance(module, SummarizedModule)
+        self.assertEqual(module.func_names, ['helper', 'main'])
+
+    def test_stores_summary_and_uses_it_next_time(self):
+        set_summary_cache_dir(self.cache_dir)
+
+        module1 = parse_cached(CODE, 'test.c')
+        module2 = parse_cached(CODE, 'test.c')
+
+        self.assertNotIsInstance(module1, SummarizedModule)
+        self.assertIsInstance(module2, SummarizedModule)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(module2.func_names, ['helper', 'main'])
+
+    def test_does_not_use_summary_of_different_code(self):
+        set_summary_cache_dir(self.cache_dir)
+
+        parse_cached(CODE, 'test.c')
+        module = parse_cached(CODE + '\nint other;\n', 'test.c')
+
+        self.assertNotIsInstance(module, SummarizedModule)
+        self.assertIn('other', module.global_var_names)
+
+    def test_ignores_corrupted_summary(self):
+        set_summary_cache_dir(self.cache_dir)
+        parse_cached(CODE, 'test.c')
+        summary_name, = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, summary_name), 'w') as f:
+            f.write('{')
+
+        module = parse_cached(CODE, 'test.c')
+
+        self.assertNotIsInstance(module, SummarizedModule)
+        self.assertEqual(module.func_names, ['helper', 'main'])
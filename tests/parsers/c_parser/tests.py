@@ -2,11 +2,18 @@
     Tests for the :mod:`regression_tests.parsers.c_parser` package.
 """
 
+import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 
+from regression_tests.parsers.c_parser import get_index
 from regression_tests.parsers.c_parser import parse
 from regression_tests.parsers.c_parser import parse_file
+from regression_tests.parsers.c_parser import set_skip_function_bodies
+from regression_tests.parsers.c_parser.declarations_only import DeclarationsOnlyModule
+from regression_tests.utils.background import run_in_background
 
 
 class ParseTests(unittest.TestCase):
@@ -23,6 +30,87 @@ class ParseTests(unittest.TestCase):
         self.assertEqual(parsed_c_code.code, CODE)
 
 
+class ParseWithSkippedFunctionBodiesTests(unittest.TestCase):
+    """Tests for `parse()` with skipped bodies of functions."""
+
+    def setUp(self):
+        self.addCleanup(set_skip_function_bodies, False)
+
+    def test_returns_declarations_only_module_when_bodies_are_skipped(self):
+        module = parse('int main() {}', skip_function_bodies=True)
+        self.assertIsInstance(module, DeclarationsOnlyModule)
+
+    def test_does_not_skip_bodies_by_default(self):
+        module = parse('int main() {}')
+        self.assertNotIsInstance(module, DeclarationsOnlyModule)
+
+    def test_skips_bodies_when_set_as_default(self):
+        set_skip_function_bodies(True)
+
+        module = parse('int main() {}')
+
+        self.assertIsInstance(module, DeclarationsOnlyModule)
+
+    def test_explicit_argument_takes_precedence_over_default(self):
+        set_skip_function_bodies(True)
+
+        module = parse('int main() {}', skip_function_bodies=False)
+
+        self.assertNotIsInstance(module, DeclarationsOnlyModule)
+
+
+class ParseWithPrecompiledHeadersTests(unittest.TestCase):
+    """Tests for `parse()` of code including standard headers."""
+
+    CODE = """
+        #include <stdint.h>
+        #include <stddef.h>
+
+        int32_t g;
+        size_t func(void) { return 0; }
+    """
+
+    def setUp(self):
+        self.pch_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pch_cache_dir)
+        patcher = mock.patch(
+            'regression_tests.parsers.c_parser.precompiled_headers.PCH_CACHE_DIR',
+            self.pch_cache_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_standard_headers_are_precompiled(self):
+        module = parse(self.CODE)
+
+        self.assertEqual(len(os.listdir(self.pch_cache_dir)), 1)
+        self.assertFalse(module.has_parse_errors())
+        self.assertEqual(module.global_var_names, ['g'])
+        self.assertEqual(module.func_names, ['func'])
+
+    def test_code_is_parsed_when_precompiled_header_is_corrupted(self):
+        parse(self.CODE)
+        pch_name, = os.listdir(self.pch_cache_dir)
+        with open(os.path.join(self.pch_cache_dir, pch_name), 'wb') as f:
+            f.write(b'corrupted')
+
+        module = parse(self.CODE)
+
+        self.assertFalse(module.has_parse_errors())
+        self.assertEqual(module.func_names, ['func'])
+
+
+class GetIndexTests(unittest.TestCase):
+    """Tests for `get_index()`."""
+
+    def test_returns_same_index_when_called_twice(self):
+        self.assertIs(get_index(), get_index())
+
+    def test_returns_different_index_in_other_thread(self):
+        future = run_in_background(get_index)
+        self.assertIsNot(future.result(), get_index())
+
+
 class ParseFileTests(unittest.TestCase):
     """Tests for `parse_file()`."""
 
@@ -0,0 +1,119 @@
+"""
+    Tests for the :mod:`regression_tests.parsers.c_parser.token_table`
+    module.
+"""
+
+from clang import cindex
+
+from regression_tests.parsers.c_parser.token_table import get_token_table
+from tests.parsers.c_parser import WithModuleTests
+
+
+CODE = """// A comment.
+int main() {
+    return 1 + 2;
+}
+"""
+
+
+class TokenTableTests(WithModuleTests):
+    """Tests for `TokenTable`."""
+
+    def setUp(self):
+        self.module = self.parse(CODE)
+        self.table = get_token_table(self.module._tu)
+
+    def test_contains_all_tokens_with_their_offsets(self):
+        self.assertEqual(
+            self.table.spellings,
+            ['// A comment.', 'int', 'main', '(', ')', '{',
+             'return', '1', '+', '2', ';', '}']
+        )
+        for i in range(len(self.table)):
+            self.assertEqual(
+                CODE[self.table.start_offsets[i]:self.table.end_offsets[i]],
+                self.table.spellings[i]
+            )
+
+    def test_contains_kinds_of_tokens(self):
+        self.assertEqual(self.table.kinds[0], cindex.TokenKind.COMMENT.value)
+        self.assertEqual(self.table.kinds[1], cindex.TokenKind.KEYWORD.value)
+        self.assertEqual(self.table.kinds[8], cindex.TokenKind.PUNCTUATION.value)
+
+    def test_index_at_or_after_returns_correct_index(self):
+        plus_offset = CODE.index('+')
+        self.assertEqual(self.table.index_at_or_after(plus_offset), 8)
+        self.assertEqual(self.table.index_at_or_after(plus_offset - 1), 8)
+        self.assertEqual(self.table.index_at_or_after(len(CODE)), len(self.table))
+
+    def test_indexes_between_returns_indexes_of_tokens_between_offsets(self):
+        start = CODE.index('1 + 2')
+        self.assertEqual(
+            list(self.table.indexes_between(start, start + len('1 + 2'))),
+            [7, 8, 9]
+        )
+
+    def test_table_is_built_only_once_per_translation_unit(self):
+        self.assertIs(get_token_table(self.module._tu), self.table)
+
+
+class DerivedIndexesTests(WithModuleTests):
+    """Tests for indexes derived from tokens in `TokenTable`."""
+
+    def get_table(self, code):
+        return get_token_table(self.parse(code)._tu)
+
+    def test_comment_indexes_contain_indexes_of_comments(self):
+        table = self.get_table(CODE + '/* Another comment. */\n')
+        self.assertEqual(
+            [table.spellings[i] for i in table.comment_indexes],
+            ['// A comment.', '/* Another comment. */']
+        )
+
+    def test_include_ranges_contain_ranges_of_include_directives(self):
+        table = self.get_table("""
+            #include <stdio.h>
+            #include "file.h"
+            #define X 1
+        """)
+        self.assertEqual(
+            [[table.spellings[i] for i in r] for r in table.include_ranges],
+            [['#', 'include', '<', 'stdio', '.', 'h', '>'],
+             ['#', 'include', '"file.h"']]
+        )
+
+    def test_string_literal_indexes_contain_only_string_literals(self):
+        table = self.get_table("""
+            const char *s = "str";
+            const wchar_t *w = L"wide";
+            char c = 'c';
+            int i = 1;
+        """)
+        self.assertEqual(
+            [table.string_literal_value(i) for i in table.string_literal_indexes],
+            ['str', 'wide']
+        )
+
+    def test_string_literal_indexes_contain_literals_with_encoding_prefixes(self):
+        table = self.get_table("""
+            const char *s8 = u8"utf-8";
+            const void *s16 = u"utf-16";
+            const void *s32 = U"utf-32";
+        """)
+        self.assertEqual(
+            [table.string_literal_value(i) for i in table.string_literal_indexes],
+            ['utf-8', 'utf-16', 'utf-32']
+        )
+
+    def test_string_literal_value_at_returns_value_of_literal_at_offset(self):
+        table = self.get_table('const char *s = "str"; int i = 1;')
+        offset = table.start_offsets[table.string_literal_indexes[0]]
+
+        self.assertEqual(table.string_literal_value_at(offset), 'str')
+
+    def test_string_literal_value_at_returns_none_when_no_literal_starts_there(self):
+        table = self.get_table('const char *s = "str"; int i = 1;')
+        i = table.spellings.index('1')
+
+        self.assertIsNone(table.string_literal_value_at(table.start_offsets[i]))
+        self.assertIsNone(table.string_literal_value_at(1000))
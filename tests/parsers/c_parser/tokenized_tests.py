@@ -0,0 +1,278 @@
+"""
+    Tests for the :mod:`regression_tests.parsers.c_parser.tokenized` module.
+"""
+
+import unittest
+from unittest import mock
+
+from ply import lex
+
+from regression_tests.parsers.c_parser import parse
+from regression_tests.parsers.c_parser.module import Module
+from regression_tests.parsers.c_parser.tokenized import TokenizedModule
+from regression_tests.parsers.c_parser.tokenized import parse_tokenized
+from regression_tests.parsers.c_parser.tokenized import set_tokenized_mode
+from regression_tests.parsers.c_parser.tokenized import summarize_tokens
+from regression_tests.phases import OUTPUT_PARSING
+from regression_tests.phases import get_phase_durations
+from regression_tests.phases import reset_phase_durations
+
+
+CODE = r"""
+#include <stdio.h>
+#include "file.h" // An include.
+#define MSG "macro string"
+
+/* A multi-line
+   comment. */
+int g = 1;
+const char *msg = "global string";
+const wchar_t *wide = L"wide string";
+const char *utf8 = u8"utf-8 string";
+int (*callback)(int);
+struct node { int value; };
+__attribute__((noreturn)) void die(void);
+
+int helper(int a, int (*cb)(int)) {
+    if (a > 0x1F) {
+        printf("%d\n", a);
+    }
+    return cb(a);
+}
+
+int main(void) // The main function.
+{
+    char c = '"';
+    return helper(1, 0) + (int)1.5e-3f;
+}
+"""
+
+
+class SummarizeTokensTests(unittest.TestCase):
+    """Tests for `summarize_tokens()`."""
+
+    def setUp(self):
+        self.summary = summarize_tokens(CODE)
+
+    def test_contains_comments(self):
+        self.assertEqual(
+            self.summary['comments'],
+            ['// An include.', '/* A multi-line\n   comment. */',
+             '// The main function.']
+        )
+
+    def test_contains_includes(self):
+        self.assertEqual(
+            self.summary['includes'],
+            ['#include <stdio.h>', '#include "file.h"']
+        )
+
+    def test_contains_values_of_string_literals(self):
+        self.assertEqual(
+            self.summary['string_literal_values'],
+            {'file.h', 'macro string', 'global string', 'wide string',
+             'utf-8 string', '%d\\n'}
+        )
+
+    def test_contains_identifiers_but_not_keywords(self):
+        self.assertIn('printf', self.summary['identifiers'])
+        self.assertIn('MSG', self.summary['identifiers'])
+        self.assertNotIn('int', self.summary['identifiers'])
+        self.assertNotIn('return', self.summary['identifiers'])
+
+    def test_include_on_last_line_without_end_of_line_is_found(self):
+        summary = summarize_tokens('#include <stdlib.h>')
+
+        self.assertEqual(summary['includes'], ['#include <stdlib.h>'])
+
+    def test_directive_continued_on_next_line_is_part_of_directive(self):
+        summary = summarize_tokens('#define F \\\n "s"\n#include <a.h>')
+
+        self.assertEqual(summary['includes'], ['#include <a.h>'])
+        self.assertEqual(summary['string_literal_values'], {'s'})
+
+    def test_contains_values_of_string_literals_with_encoding_prefixes(self):
+        summary = summarize_tokens('u8"a" u"b" U"c" L"d" u8')
+
+        self.assertEqual(summary['string_literal_values'], {'a', 'b', 'c', 'd'})
+        self.assertEqual(summary['identifiers'], {'u8'})
+
+    @mock.patch('regression_tests.parsers.c_parser.tokenized._lexer', None)
+    def test_building_of_lexer_does_not_change_default_lexer_of_ply(self):
+        default_lexer = getattr(lex, 'lexer', None)
+
+        summarize_tokens(CODE)
+
+        self.assertIs(getattr(lex, 'lexer', None), default_lexer)
+
+
+class TokenizedModuleTests(unittest.TestCase):
+    """Tests for `TokenizedModule`."""
+
+    def setUp(self):
+        self.module = parse(CODE, 'test.c')
+        self.tokenized_module = TokenizedModule(CODE, 'test.c')
+
+    def test_is_module_equal_to_original_code(self):
+        self.assertIsInstance(self.tokenized_module, Module)
+        self.assertEqual(self.tokenized_module, CODE)
+
+    def test_answers_text_level_queries_same_as_parsed_module(self):
+        for query in ('file_name', 'comments', 'includes',
+                      '_string_literal_token_values'):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    getattr(self.tokenized_module, query),
+                    getattr(self.module, query)
+                )
+        for name in ('printf', 'MSG', 'cb', 'int', 'other'):
+            with self.subTest(name=name):
+                self.assertEqual(
+                    self.tokenized_module.has_identifier(name),
+                    self.module.has_identifier(name)
+                )
+
+    def test_does_not_parse_code_when_answering_text_level_queries(self):
+        with mock.patch('regression_tests.parsers.c_parser.tokenized.parse_cached') as parse_mock:
+            self.tokenized_module.has_comment_matching('.*main.*')
+            self.tokenized_module.has_include_of_file('stdio.h')
+            self.tokenized_module.has_string_literal('global string')
+            self.tokenized_module.has_string_literal_matching(r'%d.*')
+            self.tokenized_module.has_identifier('printf')
+            repr(self.tokenized_module)
+
+        self.assertFalse(parse_mock.called)
+
+    def test_answers_string_literal_queries(self):
+        self.assertTrue(self.tokenized_module.has_string_literal('global string'))
+        self.assertTrue(self.tokenized_module.has_string_literal_matching('glob.*'))
+        self.assertFalse(self.tokenized_module.has_string_literal('other'))
+
+    def test_answers_string_literal_queries_with_encoding_prefixes(self):
+        self.assertTrue(self.tokenized_module.has_string_literal('utf-8 string'))
+        self.assertEqual(
+            self.tokenized_module.has_string_literal('utf-8 string'),
+            self.module.has_string_literal('utf-8 string')
+        )
+
+    def test_answers_function_queries_from_parsed_module(self):
+        code = """
+#if 0
+int disabled(void) {}
+#endif
+#define DEFINE_FUNC(name) int name(void) { return 0; }
+DEFINE_FUNC(generated)
+int old_style(a) int a; { return a; }
+int main(void) __attribute__((unused)) { return 0; }
+"""
+        module = parse(code, 'test.c')
+        tokenized_module = TokenizedModule(code, 'test.c')
+
+        self.assertEqual(tokenized_module.func_names, module.func_names)
+        self.assertEqual(tokenized_module.func_count, module.func_count)
+        self.assertEqual(
+            tokenized_module.has_func('disabled'),
+            module.has_func('disabled')
+        )
+        self.assertEqual(
+            tokenized_module.has_funcs('generated', 'main'),
+            module.has_funcs('generated', 'main')
+        )
+        self.assertEqual(
+            tokenized_module.has_just_funcs(*module.func_names),
+            module.has_just_funcs(*module.func_names)
+        )
+        self.assertEqual(
+            tokenized_module.has_func_matching('gen.*'),
+            module.has_func_matching('gen.*')
+        )
+
+    def test_parses_code_for_queries_tokens_cannot_answer(self):
+        self.assertEqual(
+            self.tokenized_module.global_var_names,
+            self.module.global_var_names
+        )
+        self.assertEqual(
+            str(self.tokenized_module.funcs['main'].return_type),
+            'int'
+        )
+        self.assertEqual(
+            self.tokenized_module.string_literal_values,
+            self.module.string_literal_values
+        )
+        self.assertEqual(
+            self.tokenized_module.has_parse_errors(),
+            self.module.has_parse_errors()
+        )
+
+    def test_code_is_parsed_only_once(self):
+        with mock.patch(
+                'regression_tests.parsers.c_parser.tokenized.parse_cached',
+                return_value=self.module) as parse_mock:
+            self.tokenized_module.global_var_names
+            self.tokenized_module.funcs['main']
+
+        parse_mock.assert_called_once_with(CODE, 'test.c')
+
+    def test_prefetch_tokenizes_code_and_parses_it_in_background(self):
+        with mock.patch(
+                'regression_tests.parsers.c_parser.tokenized.summarize_tokens',
+                wraps=summarize_tokens) as summarize_mock, \
+                mock.patch(
+                    'regression_tests.parsers.c_parser.tokenized.parse_cached',
+                    return_value=self.module) as parse_mock:
+            self.tokenized_module.prefetch()
+            summarize_mock.assert_called_once_with(CODE)
+
+            self.tokenized_module._prefetched_parsed_module.result()
+            parse_mock.assert_called_once_with(CODE, 'test.c')
+
+            self.assertEqual(
+                self.tokenized_module.global_var_names,
+                self.module.global_var_names
+            )
+            self.tokenized_module.comments
+
+        parse_mock.assert_called_once_with(CODE, 'test.c')
+        summarize_mock.assert_called_once_with(CODE)
+
+    def test_all_public_attributes_of_module_are_defined(self):
+        token_level_attrs = {'code', 'has_comment_matching', 'has_include_of_file'}
+        for name in vars(Module):
+            if not name.startswith('_') and name not in token_level_attrs:
+                with self.subTest(name=name):
+                    self.assertIn(name, vars(TokenizedModule))
+
+    def test_delegated_attribute_has_documentation_of_module_attribute(self):
+        self.assertEqual(TokenizedModule.funcs.__doc__, Module.funcs.__doc__)
+
+    def test_parsing_of_code_is_measured_as_output_parsing(self):
+        reset_phase_durations()
+        self.addCleanup(reset_phase_durations)
+
+        self.tokenized_module.global_var_names
+
+        self.assertIn(OUTPUT_PARSING, get_phase_durations())
+
+
+class ParseTokenizedTests(unittest.TestCase):
+    """Tests for `parse_tokenized()`."""
+
+    def setUp(self):
+        self.addCleanup(set_tokenized_mode, True)
+
+    def test_returns_tokenized_module_when_tokenized_mode_is_enabled(self):
+        set_tokenized_mode(True)
+
+        module = parse_tokenized(CODE, 'test.c')
+
+        self.assertIsInstance(module, TokenizedModule)
+        self.assertEqual(module.file_name, 'test.c')
+
+    def test_parses_code_when_tokenized_mode_is_disabled(self):
+        set_tokenized_mode(False)
+
+        module = parse_tokenized(CODE, 'test.c')
+
+        self.assertNotIsInstance(module, TokenizedModule)
+        self.assertEqual(module.func_names, ['helper', 'main'])
@@ -113,6 +113,9 @@ class TypeTests(WithModuleTests):
         with self.assertRaisesRegex(AssertionError, r'.*unsupported.*'):
             Type._from_clang_type(unsupported_type)
 
+    def test_types_define_slots_so_their_instances_have_no_dict(self):
+        self.assert_defines_slots_in_all_subclasses(Type, self.get_type('int'))
+
     def test_is_same_as_returns_true_for_void_type_and_void(self):
         type = self.get_type('void')
         self.assertTrue(type.is_same_as('void'))
@@ -7,12 +7,14 @@ import unittest
 from regression_tests.parsers.c_parser.utils import IdentifiedObjectList
 from regression_tests.parsers.c_parser.utils import first_token
 from regression_tests.parsers.c_parser.utils import get_name
+from regression_tests.parsers.c_parser.utils import get_operator_token
 from regression_tests.parsers.c_parser.utils import has_token
 from regression_tests.parsers.c_parser.utils import has_token_in_position
 from regression_tests.parsers.c_parser.utils import has_tokens
 from regression_tests.parsers.c_parser.utils import nth_item
 from regression_tests.parsers.c_parser.utils import remove_whitespace
 from regression_tests.parsers.c_parser.utils import string_from_tokens
+from regression_tests.parsers.c_parser.utils import unify_called_func_name
 from regression_tests.parsers.c_parser.utils import underline
 from tests.parsers.c_parser import WithModuleTests
 
@@ -57,6 +59,31 @@ class HasTokenTests(WithModuleTests):
         self.assertTrue(has_token(expr_node, '+'))
 
 
+class GetOperatorTokenTests(WithModuleTests):
+    """Tests for `get_operator_token()`."""
+
+    def test_returns_operator_of_binary_operator(self):
+        expr_node = self.get_expr('1 + 2', 'int')._node
+        self.assertEqual(get_operator_token(expr_node), ('+', False))
+
+    def test_returns_operator_of_prefix_unary_operator(self):
+        expr_node = self.get_expr('-1', 'int')._node
+        self.assertEqual(get_operator_token(expr_node), ('-', True))
+
+    def test_returns_operator_of_postfix_unary_operator(self):
+        expr_node = self.get_expr('a++', 'int')._node
+        self.assertEqual(get_operator_token(expr_node), ('++', False))
+
+    def test_does_not_return_operator_of_operand(self):
+        expr_node = self.get_expr('(1 * 2) + (3 - 4)', 'int')._node
+        self.assertEqual(get_operator_token(expr_node), ('+', False))
+
+    def test_returns_none_when_node_has_no_translation_unit(self):
+        class FakeNode:
+            pass
+        self.assertIsNone(get_operator_token(FakeNode()))
+
+
 class HasTokenInPositionTests(WithModuleTests):
     """Tests for `has_token_in_position()`."""
 
@@ -116,6 +143,16 @@ class GetNameTests(unittest.TestCase):
         self.assertEqual(get_name(fake_obj), 'fake name')
 
 
+class UnifyCalledFuncNameTests(unittest.TestCase):
+    """Tests for `unify_called_func_name()`."""
+
+    def test_returns_name_of_function_for_builtin(self):
+        self.assertEqual(unify_called_func_name('__builtin___memset_chk'), 'memset')
+
+    def test_returns_same_name_for_other_function(self):
+        self.assertEqual(unify_called_func_name('printf'), 'printf')
+
+
 class UnderlineTests(unittest.TestCase):
     """Tests for `underline()`."""
 
@@ -2,8 +2,13 @@
     Tests for the :module`regression_tests.parsers.text_parser` module.
 """
 
+import os
+import re
+import shutil
+import tempfile
 import unittest
 
+from regression_tests.parsers.text_parser import MappedText
 from regression_tests.parsers.text_parser import Text
 from regression_tests.parsers.text_parser import parse
 
@@ -33,3 +38,54 @@ class TextTests(unittest.TestCase):
     def test_contains_returns_false_if_regexp_is_not_found(self):
         text = Text('')
         self.assertFalse(text.contains(r'test'))
+
+
+class MappedTextTests(unittest.TestCase):
+    """Tests for `MappedText`."""
+
+    def create_mapped_text(self, data):
+        dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dir)
+        path = os.path.join(dir, 'file.ll')
+        with open(path, 'wb') as f:
+            f.write(data)
+        return MappedText(path)
+
+    def test_contains_finds_regexp_without_decoding_ascii_text(self):
+        text = self.create_mapped_text(b'define i32 @main() {\n  ret i32 0\n}\n')
+
+        self.assertTrue(text.contains(r'define i32 @main\(\)'))
+        self.assertTrue(text.contains(re.compile(r'^  RET', re.I | re.M)))
+        self.assertFalse(text.contains(r'@func'))
+        self.assertIsNone(text._text)
+
+    def test_contains_decodes_text_when_it_is_not_ascii(self):
+        text = self.create_mapped_text('aéb'.encode('utf-8'))
+
+        self.assertTrue(text.contains(r'a.b'))
+
+    def test_contains_decodes_text_when_regexp_is_not_ascii(self):
+        text = self.create_mapped_text('aéb'.encode('utf-8'))
+
+        self.assertTrue(text.contains('é'))
+
+    def test_contains_converts_line_endings(self):
+        text = self.create_mapped_text(b'line1\r\nline2\r')
+
+        self.assertTrue(text.contains(r'line1\nline2\n'))
+
+    def test_in_operator_searches_in_text(self):
+        text = self.create_mapped_text(b'define i32 @main()')
+
+        self.assertIn('@main', text)
+        self.assertNotIn('@func', text)
+
+    def test_behaves_like_decoded_text(self):
+        text = self.create_mapped_text(b'line1\r\nline2\n')
+
+        self.assertEqual(text, 'line1\nline2\n')
+        self.assertEqual(str(text), 'line1\nline2\n')
+        self.assertEqual(len(text), 12)
+        self.assertEqual(text.split('\n'), ['line1', 'line2', ''])
+        self.assertEqual(text[:5], 'line1')
+        self.assertIsInstance(text.text, Text)
@@ -0,0 +1,93 @@
+"""
+    Tests for the :mod:`regression_tests.phases` module.
+"""
+
+import unittest
+from unittest import mock
+
+from regression_tests.phases import PhaseTimer
+from regression_tests.phases import get_phase_durations
+from regression_tests.phases import measure_phase
+from regression_tests.phases import reset_phase_durations
+
+
+@mock.patch('regression_tests.phases.time.perf_counter')
+class PhaseTimerTests(unittest.TestCase):
+    """Tests for `PhaseTimer`."""
+
+    def test_durations_are_empty_when_nothing_was_measured(self, _):
+        self.assertEqual(PhaseTimer().durations, {})
+
+    def test_measures_duration_of_single_phase(self, perf_counter):
+        perf_counter.side_effect = [1.0, 3.5]
+        timer = PhaseTimer()
+
+        with timer.phase('a'):
+            pass
+
+        self.assertEqual(timer.durations, {'a': 2.5})
+
+    def test_sums_durations_of_repeated_phase(self, perf_counter):
+        perf_counter.side_effect = [1.0, 2.0, 5.0, 7.0]
+        timer = PhaseTimer()
+
+        with timer.phase('a'):
+            pass
+        with timer.phase('a'):
+            pass
+
+        self.assertEqual(timer.durations, {'a': 3.0})
+
+    def test_excludes_nested_phase_from_enclosing_phase(self, perf_counter):
+        perf_counter.side_effect = [0.0, 1.0, 4.0, 6.0]
+        timer = PhaseTimer()
+
+        with timer.phase('outer'):
+            with timer.phase('inner'):
+                pass
+
+        self.assertEqual(timer.durations, {'outer': 3.0, 'inner': 3.0})
+
+    def test_measures_phase_even_when_exception_is_raised(self, perf_counter):
+        perf_counter.side_effect = [1.0, 2.0]
+        timer = PhaseTimer()
+
+        with self.assertRaises(RuntimeError):
+            with timer.phase('a'):
+                raise RuntimeError
+
+        self.assertEqual(timer.durations, {'a': 1.0})
+
+    def test_reset_forgets_measured_durations(self, perf_counter):
+        perf_counter.side_effect = [1.0, 2.0]
+        timer = PhaseTimer()
+        with timer.phase('a'):
+            pass
+
+        timer.reset()
+
+        self.assertEqual(timer.durations, {})
+
+
+class MeasurePhaseTests(unittest.TestCase):
+    """Tests for `measure_phase()`, `get_phase_durations()`, and
+    `reset_phase_durations()`.
+    """
+
+    def setUp(self):
+        reset_phase_durations()
+        self.addCleanup(reset_phase_durations)
+
+    def test_measured_phase_is_included_in_phase_durations(self):
+        with measure_phase('a'):
+            pass
+
+        self.assertIn('a', get_phase_durations())
+
+    def test_reset_phase_durations_forgets_measured_durations(self):
+        with measure_phase('a'):
+            pass
+
+        reset_phase_durations()
+
+        self.assertEqual(get_phase_durations(), {})
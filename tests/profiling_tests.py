@@ -0,0 +1,119 @@
+"""
+    Tests for the :mod:`regression_tests.profiling` module.
+"""
+
+import cProfile
+import io
+import shutil
+import tempfile
+import unittest
+
+from regression_tests.profiling import NoProfiler
+from regression_tests.profiling import create_profiler
+from regression_tests.profiling import merge_memoize_stats
+from regression_tests.profiling import merge_profiles
+from regression_tests.profiling import print_memoize_report
+from regression_tests.profiling import print_profile_report
+from regression_tests.profiling import save_memoize_stats
+from regression_tests.profiling import save_profile
+from regression_tests.utils import memoize
+
+
+def function_to_be_profiled():
+    return sum(range(10))
+
+
+@memoize
+def memoized_function(x):
+    return x
+
+
+class CreateProfilerTests(unittest.TestCase):
+    """Tests for `create_profiler()`."""
+
+    def test_returns_cprofile_profiler_when_enabled(self):
+        self.assertIsInstance(create_profiler(enabled=True), cProfile.Profile)
+
+    def test_returns_no_profiler_when_disabled(self):
+        self.assertIsInstance(create_profiler(enabled=False), NoProfiler)
+
+
+class ProfilesTests(unittest.TestCase):
+    """Tests for `save_profile()`, `merge_profiles()`, and
+    `print_profile_report()`.
+    """
+
+    def setUp(self):
+        self.profiles_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.profiles_dir)
+
+    def save_profile_of_function_call(self, name):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        function_to_be_profiled()
+        profiler.disable()
+        save_profile(profiler, self.profiles_dir, name)
+
+    def test_merge_profiles_returns_none_when_there_are_no_profiles(self):
+        self.assertIsNone(merge_profiles(self.profiles_dir))
+
+    def test_merge_profiles_merges_all_saved_profiles(self):
+        self.save_profile_of_function_call('1')
+        self.save_profile_of_function_call('2')
+
+        stats = merge_profiles(self.profiles_dir)
+
+        calls = [
+            call_stats[0] for func, call_stats in stats.stats.items()
+            if func[2] == 'function_to_be_profiled'
+        ]
+        self.assertEqual(calls, [2])
+
+    def test_print_profile_report_prints_profiled_functions(self):
+        self.save_profile_of_function_call('1')
+        stream = io.StringIO()
+
+        print_profile_report(merge_profiles(self.profiles_dir), stream=stream)
+
+        self.assertIn('function_to_be_profiled', stream.getvalue())
+
+
+class MemoizeStatsTests(unittest.TestCase):
+    """Tests for `save_memoize_stats()`, `merge_memoize_stats()`, and
+    `print_memoize_report()`.
+    """
+
+    def setUp(self):
+        self.profiles_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.profiles_dir)
+
+    def test_merge_memoize_stats_returns_empty_dict_when_there_are_no_stats(self):
+        self.assertEqual(merge_memoize_stats(self.profiles_dir), {})
+
+    def test_merge_memoize_stats_sums_all_saved_stats(self):
+        memoized_function(1)
+        memoized_function(1)
+        save_memoize_stats(self.profiles_dir, '1')
+        save_memoize_stats(self.profiles_dir, '2')
+
+        stats = merge_memoize_stats(self.profiles_dir)
+
+        func_stats = stats[memoized_function.__qualname__]
+        self.assertGreaterEqual(func_stats['hits'], 2)
+        self.assertEqual(func_stats['hits'] % 2, 0)
+
+    def test_print_memoize_report_prints_memoized_functions(self):
+        stats = {
+            'Foo.bar': {
+                'hits': 3,
+                'misses': 1,
+                'cached_entries': 1,
+                'cached_bytes': 28
+            }
+        }
+        stream = io.StringIO()
+
+        print_memoize_report(stats, stream=stream)
+
+        self.assertIn('Foo.bar', stream.getvalue())
+        self.assertIn('75.0%', stream.getvalue())
@@ -0,0 +1,238 @@
+"""
+    Tests for the :mod:`regression_tests.resource_limits` module.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from regression_tests.resource_limits import CgroupResourceLimiter
+from regression_tests.resource_limits import LimitedRun
+from regression_tests.resource_limits import ResourceLimiter
+from regression_tests.resource_limits import ResourceLimits
+from regression_tests.resource_limits import RlimitResourceLimiter
+from regression_tests.resource_limits import create_resource_limiter
+
+
+class ResourceLimitsTests(unittest.TestCase):
+    """Tests for `ResourceLimits`."""
+
+    def test_has_no_limits_by_default(self):
+        self.assertFalse(ResourceLimits().has_limits())
+
+    def test_has_limits_when_memory_limit_is_set(self):
+        self.assertTrue(ResourceLimits(memory_limit=1024).has_limits())
+
+    def test_has_limits_when_cpu_limit_is_set(self):
+        self.assertTrue(ResourceLimits(cpu_limit=1.5).has_limits())
+
+    def test_two_limits_with_same_values_are_equal(self):
+        self.assertEqual(
+            ResourceLimits(memory_limit=1024, cpu_limit=1),
+            ResourceLimits(memory_limit=1024, cpu_limit=1)
+        )
+
+    def test_repr_returns_correct_value(self):
+        self.assertEqual(
+            repr(ResourceLimits(memory_limit=1024)),
+            'ResourceLimits(memory_limit=1024, cpu_limit=None)'
+        )
+
+
+class CreateResourceLimiterTests(unittest.TestCase):
+    """Tests for `create_resource_limiter()`."""
+
+    def test_returns_limiter_without_limits_when_there_are_no_limits(self):
+        limiter = create_resource_limiter(ResourceLimits())
+        self.assertIs(type(limiter), ResourceLimiter)
+
+    @mock.patch('regression_tests.resource_limits.find_delegated_cgroup_dir',
+                return_value=None)
+    def test_returns_rlimit_limiter_when_cgroups_are_not_delegated(self, _):
+        limiter = create_resource_limiter(ResourceLimits(memory_limit=1024))
+        self.assertIsInstance(limiter, RlimitResourceLimiter)
+
+    @mock.patch('regression_tests.resource_limits.find_delegated_cgroup_dir',
+                return_value='/sys/fs/cgroup/user')
+    @mock.patch.object(CgroupResourceLimiter, 'setup', return_value=True)
+    def test_returns_cgroup_limiter_when_cgroups_are_delegated(self, *_):
+        limiter = create_resource_limiter(ResourceLimits(memory_limit=1024))
+        self.assertIsInstance(limiter, CgroupResourceLimiter)
+        self.assertEqual(limiter.cgroup_dir, '/sys/fs/cgroup/user')
+
+    @mock.patch('regression_tests.resource_limits.find_delegated_cgroup_dir',
+                return_value='/sys/fs/cgroup/user')
+    @mock.patch.object(CgroupResourceLimiter, 'setup', return_value=False)
+    def test_falls_back_to_rlimit_limiter_when_cgroup_setup_fails(self, *_):
+        limiter = create_resource_limiter(ResourceLimits(memory_limit=1024))
+        self.assertIsInstance(limiter, RlimitResourceLimiter)
+
+
+class ResourceLimiterTests(unittest.TestCase):
+    """Tests for `ResourceLimiter`."""
+
+    def test_new_run_returns_run_that_does_not_limit_anything(self):
+        run = ResourceLimiter(ResourceLimits()).new_run(timeout=10)
+
+        self.assertIsInstance(run, LimitedRun)
+        self.assertFalse(run.was_oom_killed())
+
+
+@mock.patch('regression_tests.resource_limits.resource')
+class RlimitResourceLimiterTests(unittest.TestCase):
+    """Tests for `RlimitResourceLimiter`."""
+
+    def test_applies_address_space_limit_when_memory_limit_is_set(self, resource):
+        limiter = RlimitResourceLimiter(ResourceLimits(memory_limit=1024))
+
+        limiter.new_run(timeout=10).apply_to_current_process()
+
+        resource.setrlimit.assert_called_once_with(
+            resource.RLIMIT_AS, (1024, 1024)
+        )
+
+    def test_applies_cpu_time_limit_computed_from_timeout(self, resource):
+        limiter = RlimitResourceLimiter(ResourceLimits(cpu_limit=1.5))
+
+        limiter.new_run(timeout=10).apply_to_current_process()
+
+        resource.setrlimit.assert_called_once_with(
+            resource.RLIMIT_CPU, (15, 16)
+        )
+
+    def test_does_not_apply_cpu_time_limit_without_timeout(self, resource):
+        limiter = RlimitResourceLimiter(ResourceLimits(cpu_limit=1.5))
+
+        limiter.new_run(timeout=None).apply_to_current_process()
+
+        self.assertFalse(resource.setrlimit.called)
+
+
+class CgroupResourceLimiterTests(unittest.TestCase):
+    """Tests for `CgroupResourceLimiter`."""
+
+    def setUp(self):
+        self.cgroup_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cgroup_dir)
+
+    def read_file(self, *path):
+        with open(os.path.join(*path)) as f:
+            return f.read()
+
+    def write_file(self, content, *path):
+        with open(os.path.join(*path), 'w') as f:
+            f.write(content)
+
+    def only_dir_in(self, path):
+        dirs = [d for d in os.listdir(path) if os.path.isdir(os.path.join(path, d))]
+        self.assertEqual(len(dirs), 1)
+        return os.path.join(path, dirs[0])
+
+    def test_setup_moves_current_process_to_leaf_and_enables_controllers(self):
+        limiter = CgroupResourceLimiter(ResourceLimits(memory_limit=1024), self.cgroup_dir)
+
+        self.assertTrue(limiter.setup())
+
+        self.assertEqual(
+            self.read_file(self.cgroup_dir, limiter.runner_cgroup_name, 'cgroup.procs'),
+            str(os.getpid())
+        )
+        self.assertEqual(
+            self.read_file(self.cgroup_dir, 'cgroup.subtree_control'),
+            '+memory +cpu'
+        )
+
+    def test_new_run_creates_cgroup_with_limits(self):
+        limiter = CgroupResourceLimiter(
+            ResourceLimits(memory_limit=1024, cpu_limit=1.5),
+            self.cgroup_dir
+        )
+
+        limiter.new_run(timeout=10)
+
+        run_cgroup_dir = self.only_dir_in(self.cgroup_dir)
+        self.assertEqual(self.read_file(run_cgroup_dir, 'memory.max'), '1024')
+        self.assertEqual(self.read_file(run_cgroup_dir, 'cpu.max'), '150000 100000')
+
+    def test_run_moves_current_process_into_its_cgroup(self):
+        limiter = CgroupResourceLimiter(ResourceLimits(memory_limit=1024), self.cgroup_dir)
+        run = limiter.new_run()
+
+        run.apply_to_current_process()
+
+        run_cgroup_dir = self.only_dir_in(self.cgroup_dir)
+        self.assertEqual(
+            self.read_file(run_cgroup_dir, 'cgroup.procs'),
+            str(os.getpid())
+        )
+
+    def test_run_was_oom_killed_when_memory_events_contain_oom_kill(self):
+        limiter = CgroupResourceLimiter(ResourceLimits(memory_limit=1024), self.cgroup_dir)
+        run = limiter.new_run()
+        run_cgroup_dir = self.only_dir_in(self.cgroup_dir)
+        self.write_file(
+            'low 0\nhigh 0\nmax 12\noom 1\noom_kill 1\n',
+            run_cgroup_dir, 'memory.events'
+        )
+
+        self.assertTrue(run.was_oom_killed())
+
+    def test_run_was_not_oom_killed_when_memory_events_contain_no_oom_kill(self):
+        limiter = CgroupResourceLimiter(ResourceLimits(memory_limit=1024), self.cgroup_dir)
+        run = limiter.new_run()
+        run_cgroup_dir = self.only_dir_in(self.cgroup_dir)
+        self.write_file(
+            'low 0\nhigh 0\nmax 0\noom 0\noom_kill 0\n',
+            run_cgroup_dir, 'memory.events'
+        )
+
+        self.assertFalse(run.was_oom_killed())
+
+    def test_setup_removes_stale_cgroups_of_runs_of_dead_processes(self):
+        process = subprocess.Popen(['true'])
+        process.wait()
+        stale_dir = os.path.join(self.cgroup_dir, 'tool-{}-0'.format(process.pid))
+        own_dir = os.path.join(self.cgroup_dir, 'tool-{}-0'.format(os.getpid()))
+        os.mkdir(stale_dir)
+        os.mkdir(own_dir)
+        limiter = CgroupResourceLimiter(ResourceLimits(memory_limit=1024), self.cgroup_dir)
+
+        self.assertTrue(limiter.setup())
+
+        self.assertFalse(os.path.exists(stale_dir))
+        self.assertTrue(os.path.exists(own_dir))
+
+    @mock.patch('regression_tests.resource_limits.os.rmdir')
+    def test_run_release_waits_until_cgroup_is_unpopulated_before_removing_it(self, rmdir_mock):
+        limiter = CgroupResourceLimiter(ResourceLimits(memory_limit=1024), self.cgroup_dir)
+        run = limiter.new_run()
+        run_cgroup_dir = self.only_dir_in(self.cgroup_dir)
+        self.write_file('', run_cgroup_dir, 'cgroup.kill')
+        self.write_file('populated 1\nfrozen 0\n', run_cgroup_dir, 'cgroup.events')
+
+        def exit_processes(_):
+            self.assertFalse(rmdir_mock.called)
+            self.write_file('populated 0\nfrozen 0\n', run_cgroup_dir, 'cgroup.events')
+
+        with mock.patch('regression_tests.resource_limits.time.sleep',
+                        side_effect=exit_processes) as sleep_mock:
+            run.release()
+
+        self.assertTrue(sleep_mock.called)
+        self.assertEqual(self.read_file(run_cgroup_dir, 'cgroup.kill'), '1')
+        rmdir_mock.assert_called_once_with(run_cgroup_dir)
+
+    @mock.patch('regression_tests.resource_limits.os.rmdir')
+    def test_run_release_waits_for_unpopulated_cgroup_only_for_limited_time(self, rmdir_mock):
+        limiter = CgroupResourceLimiter(ResourceLimits(memory_limit=1024), self.cgroup_dir)
+        run = limiter.new_run()
+        run.release_timeout = 0.05
+        run_cgroup_dir = self.only_dir_in(self.cgroup_dir)
+        self.write_file('populated 1\n', run_cgroup_dir, 'cgroup.events')
+
+        run.release()
+
+        rmdir_mock.assert_called_once_with(run_cgroup_dir)
@@ -0,0 +1,171 @@
+"""
+    Tests for the :mod:`regression_tests.run_journal` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from regression_tests.filesystem.directory import Directory
+from regression_tests.filesystem.file import File
+from regression_tests.run_journal import RunJournal
+from regression_tests.run_journal import compute_cache_key
+from regression_tests.run_journal import compute_tools_signature
+from regression_tests.test import Test
+from regression_tests.test_case import TestCase
+from regression_tests.test_module import TestModule
+from regression_tests.test_results import TestResults
+from regression_tests.test_settings import TestSettings
+
+
+class RunJournalTestsBase(unittest.TestCase):
+    """A base class for tests of the journal that need files on the disk."""
+
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root_dir)
+
+        self.tools_dir = Directory(os.path.join(self.root_dir, 'bin'))
+        self.tools_dir.create()
+        self.write_file(os.path.join('bin', 'retdec-decompiler'), 'tool')
+
+        self.tests_dir = Directory(os.path.join(self.root_dir, 'tests'))
+        test_dir = self.tests_dir.get_dir('test')
+        test_dir.create()
+        self.write_file(os.path.join('tests', 'test', 'test.py'), 'module')
+        self.write_file(os.path.join('tests', 'test', 'file.exe'), 'input')
+        self.test_case = TestCase(
+            TestModule(File('test.py', test_dir), self.tests_dir),
+            Test,
+            TestSettings(input='file.exe')
+        )
+
+    def write_file(self, rel_path, content):
+        with open(os.path.join(self.root_dir, rel_path), 'w') as f:
+            f.write(content)
+
+    def create_test_results(self, **kwargs):
+        return TestResults(
+            kwargs.get('module_name', 'test'),
+            kwargs.get('case_name', 'Test (file.exe)'),
+            datetime(2026, 10, 18, 10, 0, 0),
+            datetime(2026, 10, 18, 10, 0, 5),
+            kwargs.get('run_tests', 2),
+            kwargs.get('failed_tests', 1),
+            kwargs.get('skipped_tests', 0),
+            kwargs.get('output', 'output'),
+            kwargs.get('timeouted', False),
+            kwargs.get('phase_durations', {'tool execution': 4.0})
+        )
+
+
+class RunJournalTests(RunJournalTestsBase):
+    """Tests for `RunJournal`."""
+
+    def setUp(self):
+        super().setUp()
+        self.journal_path = os.path.join(self.root_dir, 'journal.jsonl')
+        self.journal = RunJournal(self.journal_path, self.tools_dir)
+
+    def record(self, test_results, keep_entries=False):
+        self.journal.open(keep_entries=keep_entries)
+        self.journal.record(self.test_case, test_results)
+        self.journal.close()
+
+    def test_load_returns_empty_dict_when_journal_does_not_exist(self):
+        self.assertEqual(self.journal.load(), {})
+
+    def test_load_returns_recorded_results_under_cache_key(self):
+        test_results = self.create_test_results(timeouted=True)
+
+        self.record(test_results)
+
+        loaded_results = self.journal.load()
+        self.assertEqual(
+            list(loaded_results.keys()),
+            [self.journal.cache_key(self.test_case)]
+        )
+        loaded_test_results = loaded_results[self.journal.cache_key(self.test_case)]
+        self.assertEqual(loaded_test_results.__dict__, test_results.__dict__)
+
+    def test_open_without_keep_entries_empties_journal(self):
+        self.record(self.create_test_results())
+
+        self.journal.open(keep_entries=False)
+        self.journal.close()
+
+        self.assertEqual(self.journal.load(), {})
+
+    def test_open_with_keep_entries_keeps_entries(self):
+        self.record(self.create_test_results())
+
+        self.journal.open(keep_entries=True)
+        self.journal.close()
+
+        self.assertEqual(len(self.journal.load()), 1)
+
+    def test_load_ignores_incomplete_entries(self):
+        self.record(self.create_test_results())
+        with open(self.journal_path, 'a') as f:
+            f.write('{"cache_key": "abc", "resu')
+
+        self.assertEqual(len(self.journal.load()), 1)
+
+
+class ComputeCacheKeyTests(RunJournalTestsBase):
+    """Tests for `compute_cache_key()` and `compute_tools_signature()`."""
+
+    def cache_key(self, runner_config=None):
+        return compute_cache_key(
+            self.test_case,
+            compute_tools_signature(self.tools_dir, runner_config)
+        )
+
+    def test_cache_key_is_same_when_nothing_changes(self):
+        self.assertEqual(self.cache_key(), self.cache_key())
+
+    def test_cache_key_changes_when_input_file_changes(self):
+        orig_cache_key = self.cache_key()
+
+        self.write_file(os.path.join('tests', 'test', 'file.exe'), 'new input')
+
+        self.assertNotEqual(self.cache_key(), orig_cache_key)
+
+    def test_cache_key_changes_when_tool_changes(self):
+        orig_cache_key = self.cache_key()
+
+        self.write_file(os.path.join('bin', 'retdec-decompiler'), 'new tool')
+
+        self.assertNotEqual(self.cache_key(), orig_cache_key)
+
+    def test_cache_key_changes_when_test_module_changes(self):
+        orig_cache_key = self.cache_key()
+
+        self.write_file(os.path.join('tests', 'test', 'test.py'), 'new module')
+
+        self.assertNotEqual(self.cache_key(), orig_cache_key)
+
+    def test_cache_key_changes_when_tool_in_subdirectory_changes(self):
+        self.tools_dir.get_dir('lib').create()
+        self.write_file(os.path.join('bin', 'lib', 'libretdec.so'), 'lib')
+        orig_cache_key = self.cache_key()
+
+        self.write_file(os.path.join('bin', 'lib', 'libretdec.so'), 'new lib')
+
+        self.assertNotEqual(self.cache_key(), orig_cache_key)
+
+    def test_cache_key_changes_when_result_affecting_option_changes(self):
+        orig_cache_key = self.cache_key({'assertions_timeout': '60'})
+
+        cache_key = self.cache_key({'assertions_timeout': '120'})
+
+        self.assertNotEqual(cache_key, orig_cache_key)
+
+    def test_cache_key_does_not_change_when_other_option_changes(self):
+        orig_cache_key = self.cache_key({'tests_procs': '4'})
+
+        cache_key = self.cache_key({'tests_procs': '8'})
+
+        self.assertEqual(cache_key, orig_cache_key)
@@ -0,0 +1,182 @@
+"""
+    Tests for the :mod:`regression_tests.run_status` module.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import urllib.request
+
+from regression_tests.run_status import RunStatus
+from regression_tests.run_status import StatusServer
+from regression_tests.run_status import StatusSnapshotWriter
+from regression_tests.run_status import write_status_snapshot
+
+
+class FakeClock:
+    """A clock whose time can be set manually."""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class RunStatusTests(unittest.TestCase):
+    """Tests for `RunStatus`."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.status = RunStatus(3, clock=self.clock)
+
+    def test_snapshot_of_new_status_has_all_test_cases_queued(self):
+        snapshot = self.status.snapshot()
+
+        self.assertEqual(snapshot['total'], 3)
+        self.assertEqual(snapshot['queued'], 3)
+        self.assertEqual(snapshot['completed'], 0)
+        self.assertEqual(snapshot['running'], [])
+        self.assertEqual(snapshot['workers'], [])
+
+    def test_snapshot_contains_running_test_case_with_its_pid_and_elapsed_time(self):
+        self.status.test_case_started('module.Case', 1234)
+        self.clock.time = 2.5
+
+        snapshot = self.status.snapshot()
+
+        self.assertEqual(snapshot['queued'], 2)
+        self.assertEqual(snapshot['running'], [{
+            'name': 'module.Case',
+            'pid': 1234,
+            'phase': 'tool',
+            'elapsed': 2.5,
+        }])
+
+    def test_starting_running_test_case_again_updates_only_its_phase(self):
+        self.status.test_case_started('module.Case', 1234)
+        self.clock.time = 1.0
+        self.status.test_case_started('module.Case', 1234, phase='assertions')
+        self.clock.time = 2.0
+
+        running = self.status.snapshot()['running']
+
+        self.assertEqual(running[0]['phase'], 'assertions')
+        self.assertEqual(running[0]['elapsed'], 2.0)
+
+    def test_finished_test_cases_are_counted(self):
+        self.status.test_case_started('module.Case1', 1234)
+        self.status.test_case_started('module.Case2', 5678)
+        self.status.test_case_finished('module.Case1', failed=False)
+        self.status.test_case_finished('module.Case2', failed=True)
+
+        snapshot = self.status.snapshot()
+
+        self.assertEqual(snapshot['completed'], 2)
+        self.assertEqual(snapshot['failed'], 1)
+        self.assertEqual(snapshot['queued'], 1)
+        self.assertEqual(snapshot['running'], [])
+
+    def test_resumed_test_cases_are_counted_as_completed(self):
+        self.status.test_cases_resumed(2, failed=1)
+
+        snapshot = self.status.snapshot()
+
+        self.assertEqual(snapshot['resumed'], 2)
+        self.assertEqual(snapshot['completed'], 2)
+        self.assertEqual(snapshot['failed'], 1)
+        self.assertEqual(snapshot['queued'], 1)
+
+    def test_utilization_of_worker_includes_finished_and_running_test_cases(self):
+        self.status.test_case_started('module.Case1', 1234)
+        self.clock.time = 4.0
+        self.status.test_case_finished('module.Case1', failed=False)
+        self.clock.time = 6.0
+        self.status.test_case_started('module.Case2', 1234)
+        self.clock.time = 8.0
+
+        workers = self.status.snapshot()['workers']
+
+        self.assertEqual(workers, [{
+            'pid': 1234,
+            'finished_test_cases': 1,
+            'busy': 6.0,
+            'utilization': 0.75,
+        }])
+
+
+class WriteStatusSnapshotTests(unittest.TestCase):
+    """Tests for `write_status_snapshot()`."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def test_writes_snapshot_as_json(self):
+        status = RunStatus(1)
+        path = os.path.join(self.dir, 'status.json')
+
+        write_status_snapshot(status, path)
+
+        with open(path) as f:
+            self.assertEqual(json.load(f)['total'], 1)
+        self.assertEqual(os.listdir(self.dir), ['status.json'])
+
+
+class StatusSnapshotWriterTests(unittest.TestCase):
+    """Tests for `StatusSnapshotWriter`."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'status.json')
+        self.status = RunStatus(3)
+        self.writer = StatusSnapshotWriter(self.status, self.path)
+        self.writer.polling_interval = 0.01
+        self.writer.start()
+        self.addCleanup(self.writer.stop)
+
+    def wait_for_snapshot(self):
+        deadline = time.monotonic() + 10
+        while not os.path.exists(self.path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_writes_snapshot_after_request(self):
+        self.writer.request()
+
+        self.wait_for_snapshot()
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)['total'], 3)
+
+    def test_request_does_not_wait_for_lock_of_status(self):
+        with self.status._lock:
+            self.writer.request()
+            time.sleep(0.05)
+            self.assertFalse(os.path.exists(self.path))
+
+        self.wait_for_snapshot()
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_does_not_write_snapshot_without_request(self):
+        time.sleep(0.05)
+
+        self.assertFalse(os.path.exists(self.path))
+
+
+class StatusServerTests(unittest.TestCase):
+    """Tests for `StatusServer`."""
+
+    def test_provides_snapshot_of_status_via_http(self):
+        status = RunStatus(5)
+        server = StatusServer(status, port=0)
+        server.start()
+        self.addCleanup(server.stop)
+
+        url = 'http://127.0.0.1:{}/'.format(server.port)
+        with urllib.request.urlopen(url, timeout=10) as response:
+            snapshot = json.loads(response.read().decode('utf-8'))
+
+        self.assertEqual(snapshot['total'], 5)
@@ -13,7 +13,8 @@ from regression_tests.test_results import TestsResults
 
 def create_test_results(module_name='module', case_name='Test (input.exe)',
                         start_date=datetime.now(), end_date=datetime.now(),
-                        run_tests=1, failed_tests=0, skipped_tests=0, output=''):
+                        run_tests=1, failed_tests=0, skipped_tests=0, output='',
+                        timeouted=False, phase_durations=None):
     """Creates a TestResults object from the given parameters."""
     return TestResults(
         module_name,
@@ -24,6 +25,8 @@ def create_test_results(module_name='module', case_name='Test (input.exe)',
         failed_tests,
         skipped_tests,
         output,
+        timeouted,
+        phase_durations,
     )
 
 
@@ -48,6 +51,22 @@ class TestResultsTests(unittest.TestCase):
         test_results = create_test_results(module_name='module', case_name='Case')
         self.assertEqual(test_results.full_name, 'module.Case')
 
+    def test_timeouted_returns_false_by_default(self):
+        test_results = create_test_results()
+        self.assertFalse(test_results.timeouted)
+
+    def test_timeouted_returns_correct_value(self):
+        test_results = create_test_results(timeouted=True)
+        self.assertTrue(test_results.timeouted)
+
+    def test_phase_durations_returns_empty_dict_by_default(self):
+        test_results = create_test_results()
+        self.assertEqual(test_results.phase_durations, {})
+
+    def test_phase_durations_returns_correct_value(self):
+        test_results = create_test_results(phase_durations={'assertions': 1.5})
+        self.assertEqual(test_results.phase_durations, {'assertions': 1.5})
+
     def test_start_date_returns_correct_value(self):
         START_DATE = datetime.now()
         test_results = create_test_results(start_date=START_DATE)
@@ -374,6 +393,19 @@ class TestsResultsTests(unittest.TestCase):
         ])
         self.assertEqual(tests_results.end_date, END_DATE_LAST)
 
+    def test_phase_durations_returns_durations_summed_over_all_tests(self):
+        tests_results = TestsResults([
+            create_test_results(phase_durations={'tool execution': 1.0}),
+            create_test_results(phase_durations={
+                'tool execution': 2.0,
+                'assertions': 0.5
+            }),
+        ])
+        self.assertEqual(
+            tests_results.phase_durations,
+            {'tool execution': 3.0, 'assertions': 0.5}
+        )
+
     def test_runtime_returns_correct_value_when_all_tests_ended(self):
         tests_results = TestsResults([
             create_test_results(
@@ -0,0 +1,45 @@
+"""
+    Tests for the :mod:`regression_tests.time_limit` module.
+"""
+
+import signal
+import time
+import unittest
+
+from regression_tests.time_limit import TimeLimitExceededError
+from regression_tests.time_limit import is_time_limit_supported
+from regression_tests.time_limit import time_limit
+
+
+@unittest.skipUnless(is_time_limit_supported(), 'requires SIGALRM')
+class TimeLimitTests(unittest.TestCase):
+    """Tests for `time_limit()`."""
+
+    def test_body_finishing_in_time_does_not_exceed_limit(self):
+        with time_limit(10) as limit:
+            pass
+
+        self.assertFalse(limit.expired)
+
+    def test_raises_exception_when_body_exceeds_limit(self):
+        with self.assertRaises(TimeLimitExceededError):
+            with time_limit(0.01) as limit:
+                time.sleep(10)
+
+        self.assertTrue(limit.expired)
+
+    def test_body_runs_without_limit_when_limit_is_none(self):
+        with time_limit(None) as limit:
+            self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+
+        self.assertIsNone(limit.seconds)
+        self.assertFalse(limit.expired)
+
+    def test_restores_original_signal_handler_after_body(self):
+        orig_handler = signal.getsignal(signal.SIGALRM)
+
+        with time_limit(10):
+            pass
+
+        self.assertEqual(signal.getsignal(signal.SIGALRM), orig_handler)
+        self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
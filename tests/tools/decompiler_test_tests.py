@@ -106,6 +106,17 @@ class DecompilerTestSetUpTests(WithDecompilerTestTests):
                 re.compile(r'.*decompiler.*failed.*END OF OUTPUT.*', re.DOTALL)):
             self.test.setUp()
 
+    def test_raises_assertion_error_mentioning_memory_limit_when_decompilation_was_oom_killed(self):
+        self.decompiler.name = 'decompiler'
+        self.decompiler.end_of_output.return_value = 'END OF OUTPUT'
+        type(self.decompiler).timeouted = mock.PropertyMock(return_value=0)
+        type(self.decompiler).return_code = mock.PropertyMock(return_value=-9)
+        type(self.decompiler).oom_killed = mock.PropertyMock(return_value=True)
+        with self.assertRaisesRegex(
+                AssertionError,
+                re.compile(r'.*decompiler failed.*memory limit.*END OF OUTPUT.*', re.DOTALL)):
+            self.test.setUp()
+
 
 class BaseCompilationAssertionsTests(WithDecompilerTestTests):
     """A base class for all assertions concerning compilation."""
@@ -3,14 +3,21 @@
 """
 
 import os
+import tempfile
 import unittest
 from unittest import mock
 
+from regression_tests.cmd_runner import CapturedOutput
+from regression_tests.cmd_runner import CmdResult
 from regression_tests.cmd_runner import CmdRunner
+from regression_tests.filesystem.compression import OutputCompressor
 from regression_tests.filesystem.directory import Directory
 from regression_tests.filesystem.file import File
+from regression_tests.filesystem.output_store import OutputStore
 from regression_tests.tools.tool_arguments import ToolArguments
+from regression_tests.tools.tool import Tool
 from regression_tests.tools.tool_runner import ToolRunner
+from regression_tests.tools.tool_runner import set_output_prefetching
 from regression_tests.tools.tool_test_settings import ToolTestSettings
 
 
@@ -25,7 +32,7 @@ class ToolRunnerTests(unittest.TestCase):
         self.tool_return_code = 0
         self.tool_timeout = 300
         self.tool_timeouted = False
-        self.cmd_runner.run_cmd.return_value = (
+        self.cmd_runner.run_cmd.return_value = CmdResult(
             self.tool_output,
             self.tool_return_code,
             self.tool_timeouted
@@ -80,7 +87,8 @@ class ToolRunnerTests(unittest.TestCase):
         self.cmd_runner.run_cmd.assert_called_once_with(
             [os.path.join(self.tools_dir.path, self.tool_name)] + self.tool_arguments.as_list,
             strip_shell_colors=True,
-            timeout=self.tool_timeout
+            timeout=self.tool_timeout,
+            output_file=os.path.join(self.tool_dir.path, 'tool.output')
         )
 
     def test_run_tool_stores_correct_log_to_correct_place(self):
@@ -123,3 +131,153 @@ class ToolRunnerTests(unittest.TestCase):
         self.assertEqual(tool.output, self.tool_output)
         self.assertEqual(tool.return_code, self.tool_return_code)
         self.assertEqual(tool.timeouted, self.tool_timeouted)
+
+    def test_run_tool_stores_log_mentioning_oom_kill_when_tool_was_oom_killed(self):
+        self.cmd_runner.run_cmd.return_value = CmdResult(
+            self.tool_output,
+            -9,
+            self.tool_timeouted,
+            oom_killed=True
+        )
+
+        tool = self.tool_runner.run_tool(
+            self.tool_name,
+            self.tool_arguments,
+            self.tool_dir,
+            self.tool_timeout
+        )
+
+        self.assertTrue(tool.oom_killed)
+        log = self.tool_dir.store_file.call_args[0][1]
+        self.assertTrue(log.endswith('# OOM killed:  yes\n'))
+
+    def test_run_tool_compresses_outputs_after_storing_log_when_compressor_is_given(self):
+        output_compressor = mock.Mock(spec_set=OutputCompressor)
+        self.tool_dir.store_file.side_effect = \
+            lambda *args: output_compressor.compress_outputs.assert_not_called()
+        tool_runner = ToolRunner(
+            self.cmd_runner,
+            self.tools_dir,
+            self.test_settings,
+            output_compressor
+        )
+
+        tool_runner.run_tool(
+            self.tool_name,
+            self.tool_arguments,
+            self.tool_dir,
+            self.tool_timeout
+        )
+
+        output_compressor.compress_outputs.assert_called_once_with(self.tool_dir)
+
+    def test_run_tool_stores_outputs_after_compressing_them_when_store_is_given(self):
+        output_compressor = mock.Mock(spec_set=OutputCompressor)
+        output_store = mock.Mock(spec_set=OutputStore)
+        output_store.store_outputs.side_effect = \
+            lambda dir: output_compressor.compress_outputs.assert_called_once_with(dir)
+        tool_runner = ToolRunner(
+            self.cmd_runner,
+            self.tools_dir,
+            self.test_settings,
+            output_compressor,
+            output_store
+        )
+
+        tool_runner.run_tool(
+            self.tool_name,
+            self.tool_arguments,
+            self.tool_dir,
+            self.tool_timeout
+        )
+
+        output_store.store_outputs.assert_called_once_with(self.tool_dir)
+
+    def test_run_tool_prefetches_outputs_before_compressing_them_when_enabled(self):
+        self.addCleanup(set_output_prefetching, False)
+        set_output_prefetching(True)
+        output_compressor = mock.Mock(spec_set=OutputCompressor)
+        tool_runner = ToolRunner(
+            self.cmd_runner,
+            self.tools_dir,
+            self.test_settings,
+            output_compressor
+        )
+
+        with mock.patch.object(Tool, 'prefetch_outputs', autospec=True) as prefetch_outputs_mock:
+            prefetch_outputs_mock.side_effect = \
+                lambda tool: output_compressor.compress_outputs.assert_not_called()
+            tool = tool_runner.run_tool(
+                self.tool_name,
+                self.tool_arguments,
+                self.tool_dir,
+                self.tool_timeout
+            )
+
+        prefetch_outputs_mock.assert_called_once_with(tool)
+
+    def test_run_tool_does_not_prefetch_outputs_when_disabled(self):
+        set_output_prefetching(False)
+
+        with mock.patch.object(Tool, 'prefetch_outputs') as prefetch_outputs_mock:
+            self.tool_runner.run_tool(
+                self.tool_name,
+                self.tool_arguments,
+                self.tool_dir,
+                self.tool_timeout
+            )
+
+        prefetch_outputs_mock.assert_not_called()
+
+
+class ToolRunnerCapturedOutputTests(unittest.TestCase):
+    """Tests for `ToolRunner` with outputs captured into files."""
+
+    def setUp(self):
+        self.tool_dir = Directory(tempfile.mkdtemp())
+        self.addCleanup(self.tool_dir.remove)
+        self.cmd_runner = mock.Mock(spec_set=CmdRunner)
+        self.cmd_runner.run_cmd.side_effect = self.run_cmd
+        self.tools_dir = mock.Mock()
+        self.tools_dir.path = '/path/to/retdec/bin'
+        self.tool_runner = ToolRunner(
+            self.cmd_runner,
+            self.tools_dir,
+            mock.Mock(spec_set=ToolTestSettings)
+        )
+
+    def run_cmd(self, cmd, output_file, **kwargs):
+        with open(output_file, 'wb') as f:
+            f.write(b'output')
+        captured_output = CapturedOutput(
+            output_file, 0, 6, '\n', '\n', ['', 'output', ''], 3
+        )
+        return CmdResult(captured_output, 0, False)
+
+    def run_tool(self):
+        return self.tool_runner.run_tool(
+            'tool',
+            ToolArguments(input_files=(File('file.exe', Directory('/test')),)),
+            self.tool_dir,
+            300
+        )
+
+    def test_captured_output_is_moved_into_log(self):
+        tool = self.run_tool()
+
+        self.assertEqual(
+            self.tool_dir.read_text_file(tool.log_file_name),
+            '# Command: tool file.exe\n'
+            '# Timeout: 300 seconds\n'
+            '\n'
+            'output\n'
+            '\n'
+            '# Return code: 0\n'
+            '# Timeouted:   no\n'
+        )
+        self.assertFalse(self.tool_dir.file_exists('tool.output'))
+
+    def test_output_of_tool_is_loaded_from_log(self):
+        tool = self.run_tool()
+
+        self.assertEqual(tool.output, '\noutput\n')
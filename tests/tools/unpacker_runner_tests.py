@@ -6,6 +6,7 @@ import os
 import unittest
 from unittest import mock
 
+from regression_tests.cmd_runner import CmdResult
 from regression_tests.cmd_runner import CmdRunner
 from regression_tests.tools.fileinfo_arguments import FileinfoArguments
 from regression_tests.tools.unpacker import Unpacker
@@ -71,7 +72,8 @@ class UnpackerRunnerTests(unittest.TestCase):
         self.test_settings.fileinfo_args = '--json --verbose'
         self.test_settings.fileinfo_timeout = 60
         self.tools_dir.path = 'bin'
-        self.cmd_runner.run_cmd.return_value = ('fileinfo output', 0, False)
+        self.unpacker_dir.path = 'outputs'
+        self.cmd_runner.run_cmd.return_value = CmdResult('fileinfo output', 0, False)
 
         unpacker = self.run_get_tool()
 
@@ -83,7 +85,8 @@ class UnpackerRunnerTests(unittest.TestCase):
                 '--verbose'
             ],
             strip_shell_colors=True,
-            timeout=60
+            timeout=60,
+            output_file=os.path.join('outputs', 'fileinfo.output')
         )
         self.assertEqual(unpacker.fileinfo.return_code, 0)
         self.assertEqual(unpacker.fileinfo.output, 'fileinfo output')
@@ -94,7 +97,9 @@ class UnpackerRunnerTests(unittest.TestCase):
         unpacker = mock.Mock()
         unpacker.name = 'unpacker'
         unpacker.output = 'unpacker output\n'
+        unpacker.captured_output = None
         unpacker.timeouted = False
+        unpacker.oom_killed = False
         unpacker.return_code = 0
         unpacker.args = UnpackerArguments(args='--unpacker-arg')
 
@@ -111,7 +116,7 @@ class UnpackerRunnerTests(unittest.TestCase):
             ''
         ])
 
-        self.assertEqual(log, expected_log)
+        self.assertEqual(''.join(log), expected_log)
 
     def test_create_log_returns_combined_log_when_fileinfo_run(self):
         self.test_settings.run_fileinfo = True
@@ -119,13 +124,17 @@ class UnpackerRunnerTests(unittest.TestCase):
         unpacker = mock.Mock()
         unpacker.name = 'unpacker'
         unpacker.output = 'unpacker output\n'
+        unpacker.captured_output = None
         unpacker.timeouted = False
+        unpacker.oom_killed = False
         unpacker.return_code = 0
         unpacker.args = UnpackerArguments(args='--unpacker-arg')
         unpacker.fileinfo = mock.Mock()
         unpacker.fileinfo.name = 'fileinfo'
         unpacker.fileinfo.output = 'fileinfo output\n'
+        unpacker.fileinfo.captured_output = None
         unpacker.fileinfo.timeouted = True
+        unpacker.fileinfo.oom_killed = False
         unpacker.fileinfo.return_code = 1
         unpacker.fileinfo.args = FileinfoArguments(args='--fileinfo-arg')
 
@@ -152,4 +161,4 @@ class UnpackerRunnerTests(unittest.TestCase):
             ''
         ])
 
-        self.assertEqual(log, expected_log)
+        self.assertEqual(''.join(log), expected_log)
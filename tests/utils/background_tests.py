@@ -0,0 +1,106 @@
+"""
+    Tests for the :mod:`regression_tests.utils.background` module.
+"""
+
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from regression_tests.utils.background import abandon_running_function
+from regression_tests.utils.background import has_abandoned_functions
+from regression_tests.utils.background import run_in_background
+from regression_tests.utils.background import wait_for_result
+
+
+class RunInBackgroundTests(unittest.TestCase):
+    """Tests for `run_in_background()`."""
+
+    def test_returns_future_of_result_of_function(self):
+        future = run_in_background(lambda x, y: x + y, 1, y=2)
+        self.assertEqual(future.result(), 3)
+
+    def test_runs_function_in_other_thread(self):
+        future = run_in_background(threading.current_thread)
+        self.assertIsNot(future.result(), threading.current_thread())
+
+    def test_exception_is_raised_when_result_is_obtained(self):
+        def raise_error():
+            raise ValueError('error')
+
+        future = run_in_background(raise_error)
+
+        with self.assertRaises(ValueError):
+            future.result()
+
+
+class WaitForResultTests(unittest.TestCase):
+    """Tests for `wait_for_result()`."""
+
+    def test_returns_result_of_function(self):
+        future = run_in_background(lambda: 'result')
+        self.assertEqual(wait_for_result(future), 'result')
+
+    @mock.patch('regression_tests.utils.background.abandon_running_function')
+    def test_abandons_running_function_when_waiting_is_interrupted(
+            self, abandon_running_function_mock):
+        future = mock.Mock(spec_set=Future)
+        future.result.side_effect = KeyboardInterrupt
+        future.done.return_value = False
+        future.cancel.return_value = False
+
+        with self.assertRaises(KeyboardInterrupt):
+            wait_for_result(future)
+
+        abandon_running_function_mock.assert_called_once_with()
+
+    @mock.patch('regression_tests.utils.background.abandon_running_function')
+    def test_cancels_function_that_has_not_started_when_waiting_is_interrupted(
+            self, abandon_running_function_mock):
+        future = mock.Mock(spec_set=Future)
+        future.result.side_effect = KeyboardInterrupt
+        future.done.return_value = False
+        future.cancel.return_value = True
+
+        with self.assertRaises(KeyboardInterrupt):
+            wait_for_result(future)
+
+        future.cancel.assert_called_once_with()
+        abandon_running_function_mock.assert_not_called()
+
+
+class AbandonRunningFunctionTests(unittest.TestCase):
+    """Tests for `abandon_running_function()`."""
+
+    def setUp(self):
+        # A function blocked until the end of the test.
+        started = threading.Event()
+        self.unblock = threading.Event()
+        self.addCleanup(self.unblock.set)
+
+        def block():
+            started.set()
+            self.unblock.wait()
+
+        self.blocked = run_in_background(block)
+        started.wait()
+
+    def test_functions_run_afterwards_are_not_blocked_by_abandoned_function(self):
+        abandon_running_function()
+
+        future = run_in_background(lambda: 'result')
+
+        self.assertEqual(future.result(timeout=5), 'result')
+        self.assertFalse(self.blocked.done())
+
+    def test_functions_waiting_for_abandoned_function_are_run(self):
+        future = run_in_background(lambda: 'result')
+
+        abandon_running_function()
+
+        self.assertEqual(future.result(timeout=5), 'result')
+
+    def test_abandoned_function_is_recorded(self):
+        abandon_running_function()
+
+        self.assertTrue(has_abandoned_functions())
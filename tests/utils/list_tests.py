@@ -3,6 +3,7 @@
 """
 
 import unittest
+from unittest import mock
 
 from regression_tests.utils.list import NamedObjectList
 from regression_tests.utils.list import StrPropertyList
@@ -104,6 +105,87 @@ class StrPropertyListTests(unittest.TestCase):
         with self.assertRaises(IndexError):
             del self.fake_props['X']
 
+    # Lookups by name
+
+    def test_getitem_by_name_returns_first_object_when_names_are_same(self):
+        other_fake_prop_a = StrPropertyObject('a')
+        self.fake_props.append(other_fake_prop_a)
+
+        self.assertIs(self.fake_props['a'], self.fake_prop_a)
+
+    def test_getitem_by_name_reflects_modifications_of_list(self):
+        self.fake_props['a']  # Builds the mapping of names into indexes.
+        fake_prop_d = StrPropertyObject('d')
+
+        self.fake_props.insert(0, fake_prop_d)
+        self.assertIs(self.fake_props['d'], fake_prop_d)
+        self.assertIs(self.fake_props['a'], self.fake_prop_a)
+
+        del self.fake_props['d']
+        with self.assertRaises(IndexError):
+            self.fake_props['d']
+        self.assertIs(self.fake_props['a'], self.fake_prop_a)
+
+        self.fake_props.reverse()
+        self.assertEqual(self.fake_props.index(self.fake_props['a']), 2)
+
+    def test_properties_are_not_read_again_on_repeated_lookups(self):
+        class CountingObject:
+            reads = 0
+
+            def __init__(self, name):
+                self.name = name
+
+            @property
+            def fake_property(self):
+                CountingObject.reads += 1
+                return self.name
+
+        fake_props = StrPropertyListChild(
+            CountingObject(name) for name in ('a', 'b', 'c')
+        )
+
+        fake_props['c']
+        fake_props['b']
+        fake_props['a']
+
+        self.assertEqual(CountingObject.reads, 3)
+
+    def test_getitem_by_name_works_when_properties_are_not_hashable(self):
+        class UnhashableStr(str):
+            __hash__ = None
+
+        fake_prop_x = StrPropertyObject(UnhashableStr('x'))
+        fake_props = StrPropertyListChild([self.fake_prop_a, fake_prop_x])
+
+        self.assertIs(fake_props['x'], fake_prop_x)
+        with self.assertRaises(IndexError):
+            fake_props['X']
+
+    def test_mapping_is_not_built_again_when_properties_are_not_hashable(self):
+        class UnhashableStr(str):
+            __hash__ = None
+
+        fake_props = StrPropertyListChild([
+            self.fake_prop_a,
+            StrPropertyObject(UnhashableStr('x'))
+        ])
+        fake_props['a']
+
+        with mock.patch.object(fake_props, '_build_indexes_by_key') as build_mock:
+            fake_props['x']
+            fake_props['a']
+
+        self.assertFalse(build_mock.called)
+
+    def test_getitem_by_unhashable_name_returns_correct_object(self):
+        class UnhashableStr(str):
+            __hash__ = None
+
+        self.assertIs(self.fake_props[UnhashableStr('b')], self.fake_prop_b)
+        with self.assertRaises(IndexError):
+            self.fake_props[UnhashableStr('d')]
+
 
 class Variable:
     """A dummy class to be used in :class:`NamedObjectList` tests."""
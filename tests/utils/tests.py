@@ -2,10 +2,13 @@
     Tests for the :mod:`regression_tests.utils` package.
 """
 
+import gc
 import unittest
+import weakref
 from unittest import mock
 
 from regression_tests.utils import copy_class
+from regression_tests.utils import get_memoize_stats
 from regression_tests.utils import overrides
 from regression_tests.utils import memoize
 
@@ -21,6 +24,75 @@ class MemoizeTests(unittest.TestCase):
         self.assertEqual(memoized_func(1), 1)
         func.assert_called_once_with(1)
 
+    def test_memoizes_results_of_methods_per_instance(self):
+        class Foo:
+            def __init__(self):
+                self.calls = 0
+
+            @memoize
+            def bar(self, x):
+                self.calls += 1
+                return x
+
+        foo1 = Foo()
+        foo2 = Foo()
+
+        self.assertEqual(foo1.bar(1), 1)
+        self.assertEqual(foo1.bar(1), 1)
+        self.assertEqual(foo2.bar(1), 1)
+        self.assertEqual(foo1.calls, 1)
+        self.assertEqual(foo2.calls, 1)
+
+    def test_cached_results_of_methods_are_released_together_with_instance(self):
+        class Result:
+            pass
+
+        class Foo:
+            @memoize
+            def bar(self):
+                return Result()
+
+        foo = Foo()
+        result = weakref.ref(foo.bar())
+
+        del foo
+        gc.collect()
+
+        self.assertIsNone(result())
+
+    def test_stats_contain_hits_misses_and_cached_entries(self):
+        class Foo:
+            @memoize
+            def bar(self, x):
+                return x
+
+        foo = Foo()
+        foo.bar(1)
+        foo.bar(1)
+        foo.bar(2)
+
+        stats = get_memoize_stats()[Foo.bar.__qualname__]
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['cached_entries'], 2)
+        self.assertGreater(stats['cached_bytes'], 0)
+
+    def test_stats_are_updated_when_cached_results_are_released(self):
+        class Foo:
+            @memoize
+            def bar(self):
+                return 1
+
+        foo = Foo()
+        foo.bar()
+
+        del foo
+        gc.collect()
+
+        stats = get_memoize_stats()[Foo.bar.__qualname__]
+        self.assertEqual(stats['cached_entries'], 0)
+        self.assertEqual(stats['cached_bytes'], 0)
+
 
 class OverridesTests(unittest.TestCase):
     """Tests for `overrides()`."""
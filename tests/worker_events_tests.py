@@ -0,0 +1,47 @@
+"""
+    Tests for the :mod:`regression_tests.worker_events` module.
+"""
+
+import multiprocessing as mp
+import threading
+import unittest
+
+from regression_tests.worker_events import WorkerEvents
+
+
+def put_event(worker_events, event):
+    worker_events.put(event)
+
+
+class WorkerEventsTests(unittest.TestCase):
+    """Tests for `WorkerEvents`."""
+
+    def setUp(self):
+        self.worker_events = WorkerEvents()
+
+    def test_is_empty_when_no_event_was_put(self):
+        self.assertTrue(self.worker_events.empty())
+
+    def test_returns_event_put_by_other_process(self):
+        process = mp.Process(
+            target=put_event,
+            args=(self.worker_events, ('started', 1, 123, None))
+        )
+        process.start()
+        process.join()
+
+        self.assertEqual(self.worker_events.get(), ('started', 1, 123, None))
+        self.assertTrue(self.worker_events.empty())
+
+    def test_event_is_not_put_while_lock_is_held(self):
+        with self.worker_events.lock:
+            thread = threading.Thread(
+                target=put_event,
+                args=(self.worker_events, 'event')
+            )
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(self.worker_events.empty())
+        thread.join()
+
+        self.assertEqual(self.worker_events.get(), 'event')
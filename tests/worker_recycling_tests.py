@@ -0,0 +1,41 @@
+"""
+    Tests for the :mod:`regression_tests.worker_recycling` module.
+"""
+
+import unittest
+
+from regression_tests.worker_recycling import get_current_rss
+from regression_tests.worker_recycling import should_retire_worker
+
+
+class GetCurrentRssTests(unittest.TestCase):
+    """Tests for `get_current_rss()`."""
+
+    def test_returns_positive_number_of_bytes(self):
+        self.assertGreater(get_current_rss(), 1024 * 1024)
+
+    def test_reflects_allocated_memory(self):
+        rss_before = get_current_rss()
+        data = bytearray(64 * 1024 * 1024)
+
+        self.assertGreater(get_current_rss(), rss_before + 32 * 1024 * 1024)
+        del data
+
+
+class ShouldRetireWorkerTests(unittest.TestCase):
+    """Tests for `should_retire_worker()`."""
+
+    def test_returns_false_when_rss_is_not_limited(self):
+        self.assertFalse(should_retire_worker(10, None, rss=1000))
+
+    def test_returns_false_when_rss_is_below_limit(self):
+        self.assertFalse(should_retire_worker(10, 1000, rss=999))
+
+    def test_returns_true_when_rss_exceeds_limit(self):
+        self.assertTrue(should_retire_worker(10, 1000, rss=1001))
+
+    def test_returns_false_when_worker_has_not_finished_any_test_case(self):
+        self.assertFalse(should_retire_worker(0, 1000, rss=1001))
+
+    def test_uses_current_rss_when_rss_is_not_given(self):
+        self.assertTrue(should_retire_worker(1, 1))